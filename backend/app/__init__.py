@@ -1,5 +1,7 @@
 # app/__init__.py - Updated app factory to work with the new run.py
 
+import os
+
 from flask import Flask
 from flask_jwt_extended import JWTManager
 from flask_cors import CORS
@@ -35,6 +37,8 @@ def initialize_extensions(app):
     This function should be called by run.py after loading configuration.
     """
 
+    from app.utils.startup_profile import startup_phase
+
     logger.info("Initializing Flask extensions...")
 
     # Initialize JWT Manager
@@ -52,21 +56,66 @@ def initialize_extensions(app):
     )
     logger.info(f"CORS initialized with origins: {cors_origins}")
 
+    # Compress large JSON responses
+    from app.utils.compression import init_app as init_compression
+
+    init_compression(app)
+
     # Set up JWT error handlers
     setup_jwt_handlers(jwt)
     logger.info("JWT error handlers configured")
 
     # Register blueprints
-    register_blueprints(app)
+    with startup_phase("register blueprints"):
+        register_blueprints(app)
     logger.info("Blueprints registered")
 
+    # CLI maintenance commands
+    from app.cli import register_commands
+
+    register_commands(app)
+
     # Set up database
-    setup_database(app)
+    with startup_phase("database setup"):
+        setup_database(app)
     logger.info("Database initialized")
 
+    # Read-your-writes pinning for replica routing
+    from database.routing import init_app as init_replica_routing
+
+    init_replica_routing(app)
+
+    # Under Gunicorn the app is built in the master before forking, and a
+    # thread started there never runs in a worker; gunicorn.conf.py starts
+    # background jobs after fork in one worker instead
+    if os.environ.get("BACKGROUND_JOBS_AFTER_FORK", "false").lower() != "true":
+        start_background_jobs(app)
+
     return app
 
 
+def start_background_jobs(app):
+    """Start the background jobs enabled in config in this process."""
+    # Due-date reminders in this process (otherwise: flask reminders run)
+    if app.config.get("REMINDERS_ENABLED"):
+        from app.utils.reminders import get_reminder_scheduler
+
+        get_reminder_scheduler().start()
+        logger.info("Reminder scheduler started")
+
+    # Expiry of abandoned sessions (otherwise: flask sessions sweep --loop)
+    if app.config.get("SESSION_SWEEP_ENABLED"):
+        from app.utils.session_sweeper import get_session_sweeper
+
+        get_session_sweeper().start()
+        logger.info("Session sweeper started")
+
+    # Events are published only here, so only this process serves streams
+    app.config["BACKGROUND_JOBS_RUNNING"] = bool(
+        app.config.get("REMINDERS_ENABLED") or app.config.get("SESSION_SWEEP_ENABLED")
+    )
+
+
 def setup_jwt_handlers(jwt):
     """Set up JWT error handlers and callbacks."""
 
@@ -92,21 +141,23 @@ def setup_jwt_handlers(jwt):
     def check_if_token_revoked(jwt_header, jwt_payload):
         """Check if token has been revoked."""
         try:
-            from database.models.user_token import UserToken
+            from app.services.auth_service import AuthService
+            from app.utils.batch import is_verified_batch_token
             from database.db import get_db_session
 
-            jti = jwt_payload["jti"]
+            # Sub-requests of a batch reuse the batch's own check
+            if is_verified_batch_token(jwt_payload):
+                return False
 
+            # Access tokens are usually answered from the token state cache;
+            # the session only connects on a cache miss or for refresh tokens
             with get_db_session() as session:
-                user_token = (
-                    session.query(UserToken).filter(UserToken.jti == jti).first()
-                )
-                is_revoked = bool(user_token and getattr(user_token, "revoked", False))
+                is_revoked = AuthService(session).is_token_revoked(jwt_payload)
 
-                if is_revoked:
-                    logger.info(f"Revoked token attempted access: {jti[:8]}...")
+            if is_revoked:
+                logger.info(f"Revoked token attempted access: {jwt_payload['jti'][:8]}...")
 
-                return is_revoked
+            return is_revoked
         except Exception as e:
             logger.error(f"Error checking token revocation: {e}")
             return False
@@ -118,66 +169,51 @@ def setup_jwt_handlers(jwt):
         return {"error": "Token has been revoked"}, 401
 
 
-def register_blueprints(app):
-    """Register all application blueprints."""
+# Blueprint registry: (name, module, attribute). Router modules are only
+# imported when their blueprint is enabled.
+BLUEPRINTS = [
+    ("auth", "app.routers.auth", "auth_bp"),
+    ("task", "app.routers.task", "task_bp"),
+    ("dashboard", "app.routers.dashboard", "dashboard_bp"),
+    ("group", "app.routers.group", "group_bp"),
+    ("tag", "app.routers.tag", "tag_bp"),
+    ("health", "app.routers.health", "health_bp"),
+    ("subtask", "app.routers.subtask", "subtask_bp"),
+    ("pomodoro", "app.routers.pomodoro", "pomodoro_bp"),
+    ("focus", "app.routers.focus", "focus_bp"),
+    ("sync", "app.routers.sync", "sync_bp"),
+    ("batch", "app.routers.batch", "batch_bp"),
+    ("archive", "app.routers.archive", "archive_bp"),
+    ("events", "app.routers.events", "events_bp"),
+]
 
-    try:
-        # Import and register auth blueprint
-        from app.routers.auth import auth_bp
 
-        app.register_blueprint(auth_bp)
-        logger.info("Auth blueprint registered")
-
-        # Import and register task blueprint
-        from app.routers.task import task_bp
-
-        app.register_blueprint(task_bp)
-        logger.info("Task blueprint registered")
-
-        # Import and register dashboard blueprint
-        from app.routers.dashboard import dashboard_bp
-
-        app.register_blueprint(dashboard_bp)
-        logger.info("Dashboard blueprint registered")
-
-        # Import and register group blueprint
-        from app.routers.group import group_bp
-
-        app.register_blueprint(group_bp)
-        logger.info("Group blueprint registered")
-
-        # Import and register tag blueprint
-        from app.routers.tag import tag_bp
-
-        app.register_blueprint(tag_bp)
-        logger.info("Tag blueprint registered")
-
-        # Import and register health blueprint
-        from app.routers.health import health_bp
-
-        app.register_blueprint(health_bp)
-        logger.info("Health blueprint registered")
-
-        # Import and register subtask blueprint
-        from app.routers.subtask import subtask_bp
-
-        app.register_blueprint(subtask_bp)
-        logger.info("Subtask blueprint registered")
+def register_blueprints(app):
+    """
+    Register application blueprints.
 
-        # New Pomodoro and Focus blueprints
-        from app.routers.pomodoro import pomodoro_bp
+    ENABLED_BLUEPRINTS (comma-separated names) limits registration to a
+    subset, e.g. for tests that only exercise one API; router modules for
+    disabled blueprints are never imported.
+    """
+    from importlib import import_module
+    from app.utils.startup_profile import startup_phase
 
-        app.register_blueprint(pomodoro_bp)
-        logger.info("Pomodoro blueprint registered")
+    enabled = app.config.get("ENABLED_BLUEPRINTS") or [name for name, _, _ in BLUEPRINTS]
 
-        from app.routers.focus import focus_bp
+    try:
+        for name, module_path, attribute in BLUEPRINTS:
+            if name not in enabled:
+                continue
 
-        app.register_blueprint(focus_bp)
-        logger.info("Focus blueprint registered")
+            with startup_phase(f"blueprint {name}"):
+                blueprint = getattr(import_module(module_path), attribute)
+                app.register_blueprint(blueprint)
+            logger.info(f"{name.capitalize()} blueprint registered")
 
     except ImportError as e:
         from logger import log_import_error
-        log_import_error(e, "blueprint modules (auth, dashboard, task, subtask, tag, group, analytics, pomodoro, focus)")
+        log_import_error(e, "blueprint modules (auth, dashboard, task, subtask, tag, group, analytics, pomodoro, focus, sync, batch, archive, events)")
         logger.error(f"Failed to import blueprint: {e}")
         raise
     except Exception as e:
@@ -250,7 +286,12 @@ def setup_database(app):
     This function is smart about when to create tables vs when to defer to migrations.
     """
     try:
-        from database.db import init_db, check_db_connection, get_table_names
+        from database.db import (
+            init_db,
+            check_db_connection,
+            get_table_names,
+            get_migration_status,
+        )
 
         # Always check connection first
         if not check_db_connection():
@@ -294,20 +335,27 @@ def setup_database(app):
                 # Optional: Check if migrations are up to date
                 # (This is just informational, don't auto-migrate)
                 try:
-                    import subprocess
-
-                    result = subprocess.run(
-                        ["alembic", "current"],
-                        capture_output=True,
-                        text=True,
-                        timeout=5,
-                    )
-                    if result.returncode == 0 and result.stdout:
-                        logger.info(f"Current migration: {result.stdout.strip()}")
-                    else:
-                        logger.info("Could not determine current migration status")
-                except (subprocess.TimeoutExpired, FileNotFoundError):
-                    logger.debug("Alembic not available for migration status check")
+                    status = get_migration_status()
+                    logger.info(f"Current migration: {', '.join(status['current']) or 'none'}")
+                    if not status["up_to_date"]:
+                        logger.warning(
+                            f"Database is not at the latest migration "
+                            f"(heads: {', '.join(status['heads'])}); run 'alembic upgrade head'"
+                        )
+                except Exception as e:
+                    logger.debug(f"Could not determine current migration status: {e}")
+
+                # Keep monthly session partitions ahead of the calendar
+                try:
+                    from database.db import get_db_session
+                    from database.partitions import ensure_partitions
+
+                    with get_db_session() as session:
+                        ensure_partitions(
+                            session, app.config.get("SESSION_PARTITION_MONTHS_AHEAD", 3)
+                        )
+                except Exception as e:
+                    logger.warning(f"Could not create session partitions: {e}")
 
             else:
                 # Edge case
@@ -335,9 +383,11 @@ def setup_database(app):
 def create_full_app():
     """Create and fully initialize the application."""
     from config.config import get_config, configure_jwt
+    from app.utils.startup_profile import startup_phase, log_startup_profile
 
     # Create basic app
-    app = create_app()
+    with startup_phase("create app"):
+        app = create_app()
 
     # Load configuration
     config = get_config()
@@ -347,7 +397,8 @@ def create_full_app():
     app = configure_jwt(app, config)
 
     # Initialize extensions and database
-    app = initialize_extensions(app)
+    with startup_phase("initialize extensions"):
+        app = initialize_extensions(app)
 
     # Register health check
     register_health_check(app)
@@ -368,4 +419,5 @@ def create_full_app():
         logger.info("=" * 50)
 
     logger.info("Application fully initialized and ready")
+    log_startup_profile()
     return app
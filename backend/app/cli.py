@@ -0,0 +1,233 @@
+"""
+Maintenance commands, run with the Flask CLI:
+
+    flask --app wsgi pomodoro rebuild-counters --days 7
+    flask --app wsgi sync compact
+    flask --app wsgi sessions retention --keep-months 24
+    flask --app wsgi sessions sweep --loop
+    flask --app wsgi tasks archive
+    flask --app wsgi streaks backfill
+    flask --app wsgi reminders run
+    flask --app wsgi tokens purge
+"""
+from datetime import UTC, datetime, timedelta
+
+import click
+from flask import current_app
+from flask.cli import AppGroup
+
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+pomodoro_cli = AppGroup("pomodoro", help="Pomodoro maintenance commands.")
+sync_cli = AppGroup("sync", help="Delta sync maintenance commands.")
+sessions_cli = AppGroup("sessions", help="Session history partition and expiry commands.")
+tasks_cli = AppGroup("tasks", help="Task archive commands.")
+streaks_cli = AppGroup("streaks", help="Streak maintenance commands.")
+reminders_cli = AppGroup("reminders", help="Due-date reminder commands.")
+tokens_cli = AppGroup("tokens", help="Stored token maintenance commands.")
+
+
+@pomodoro_cli.command("rebuild-counters")
+@click.option("--days", default=1, show_default=True, help="Rebuild this many days back, including today.")
+@click.option("--user-id", type=int, default=None, help="Only rebuild this user's counters.")
+def rebuild_pomodoro_counters(days, user_id):
+    """Rebuild daily Pomodoro counters from session history."""
+    from database.db import get_db_session
+    from database.repositories.pomodoro_daily_counter_repository import (
+        PomodoroDailyCounterRepository,
+    )
+
+    end_date = datetime.now(UTC).date()
+    start_date = end_date - timedelta(days=max(days, 1) - 1)
+
+    with get_db_session() as session:
+        rows = PomodoroDailyCounterRepository(session).rebuild(start_date, end_date, user_id)
+
+    click.echo(f"Rebuilt {rows} daily counter rows for {start_date} to {end_date}")
+
+
+@sync_cli.command("compact")
+@click.option(
+    "--tombstone-days",
+    type=int,
+    default=None,
+    help="Purge tombstones older than this many days [default: SYNC_TOMBSTONE_RETENTION_DAYS].",
+)
+@click.option("--user-id", type=int, default=None, help="Only compact this user's change log.")
+def compact_change_log(tombstone_days, user_id):
+    """Drop superseded change log entries and expired tombstones."""
+    from database.db import get_db_session
+    from database.repositories.change_log_repository import ChangeLogRepository
+
+    if tombstone_days is None:
+        tombstone_days = current_app.config.get("SYNC_TOMBSTONE_RETENTION_DAYS", 30)
+
+    with get_db_session() as session:
+        repo = ChangeLogRepository(session)
+        superseded = repo.compact(user_id)
+        purged = repo.purge_tombstones(
+            datetime.now(UTC) - timedelta(days=tombstone_days), user_id
+        )
+
+    click.echo(f"Removed {superseded} superseded entries and {purged} expired tombstones")
+
+
+@sessions_cli.command("ensure-partitions")
+@click.option(
+    "--months-ahead",
+    type=int,
+    default=None,
+    help="Create partitions this many months ahead [default: SESSION_PARTITION_MONTHS_AHEAD].",
+)
+def ensure_session_partitions(months_ahead):
+    """Create missing monthly session partitions."""
+    from database.db import get_db_session
+    from database.partitions import ensure_partitions
+
+    if months_ahead is None:
+        months_ahead = current_app.config.get("SESSION_PARTITION_MONTHS_AHEAD", 3)
+
+    with get_db_session() as session:
+        created = ensure_partitions(session, months_ahead)
+
+    click.echo(f"Created {len(created)} partitions" + (f": {', '.join(created)}" if created else ""))
+
+
+@sessions_cli.command("retention")
+@click.option(
+    "--keep-months",
+    type=int,
+    default=None,
+    help="Keep this many full months besides the current one [default: SESSION_RETENTION_MONTHS].",
+)
+@click.option("--detach", is_flag=True, help="Detach old partitions instead of dropping them.")
+def apply_session_retention(keep_months, detach):
+    """Drop (or detach) session partitions past the retention window."""
+    from database.db import get_db_session
+    from database.partitions import apply_retention
+
+    if keep_months is None:
+        keep_months = current_app.config.get("SESSION_RETENTION_MONTHS", 0)
+    if keep_months < 1:
+        click.echo("Session retention is disabled (SESSION_RETENTION_MONTHS=0)")
+        return
+
+    with get_db_session() as session:
+        removed = apply_retention(session, keep_months, detach=detach)
+
+    action = "Detached" if detach else "Dropped"
+    click.echo(f"{action} {len(removed)} partitions" + (f": {', '.join(removed)}" if removed else ""))
+
+
+@sessions_cli.command("sweep")
+@click.option("--loop", is_flag=True, help="Keep sweeping every SESSION_SWEEP_INTERVAL_SECONDS.")
+def sweep_sessions(loop):
+    """End Pomodoro and focus sessions whose client went away."""
+    from app.utils.session_sweeper import get_session_sweeper
+
+    sweeper = get_session_sweeper()
+    if loop:
+        try:
+            sweeper.run_forever()
+        except KeyboardInterrupt:
+            sweeper.stop()
+        click.echo(f"Ended {sweeper.get_metrics()['reaped_total']} sessions")
+        return
+
+    reaped = sweeper.sweep()
+    click.echo(
+        f"Ended {sum(reaped.values())} sessions: "
+        + ", ".join(f"{key}={count}" for key, count in reaped.items())
+    )
+
+
+@tasks_cli.command("archive")
+@click.option(
+    "--days",
+    type=int,
+    default=None,
+    help="Archive finished tasks untouched this many days [default: TASK_ARCHIVE_AFTER_DAYS].",
+)
+@click.option(
+    "--batch-size",
+    type=int,
+    default=None,
+    help="Tasks moved per transaction [default: TASK_ARCHIVE_BATCH_SIZE].",
+)
+@click.option("--max-batches", type=int, default=None, help="Stop after this many batches.")
+@click.option("--user-id", type=int, default=None, help="Only archive this user's tasks.")
+def archive_tasks(days, batch_size, max_batches, user_id):
+    """Move finished tasks with their subtasks and tags to the archive."""
+    from app.services.task_archive_service import TaskArchiveService
+    from database.db import get_db_session
+
+    if days is None:
+        days = current_app.config.get("TASK_ARCHIVE_AFTER_DAYS", 180)
+    if batch_size is None:
+        batch_size = current_app.config.get("TASK_ARCHIVE_BATCH_SIZE", 500)
+
+    total, batches = 0, 0
+    while max_batches is None or batches < max_batches:
+        # One transaction per batch keeps locks short on large backlogs
+        with get_db_session() as session:
+            success, message, moved = TaskArchiveService(session).archive_batch(
+                days, batch_size, user_id
+            )
+        if not success:
+            raise click.UsageError(message)
+        total, batches = total + moved, batches + 1
+        if moved < batch_size:
+            break
+
+    click.echo(f"Archived {total} tasks in {batches} batches")
+
+
+@streaks_cli.command("backfill")
+@click.option("--user-id", type=int, default=None, help="Only backfill this user's streaks.")
+def backfill_streaks(user_id):
+    """Rebuild streaks from task and session history."""
+    from app.services.streak_service import StreakService
+    from database.db import get_db_session
+
+    with get_db_session() as session:
+        _, message, _ = StreakService(session).backfill(user_id)
+
+    click.echo(message)
+
+
+@reminders_cli.command("run")
+def run_reminders():
+    """Run the due-date reminder scheduler in the foreground."""
+    from app.utils.reminders import get_reminder_scheduler
+
+    scheduler = get_reminder_scheduler()
+    try:
+        scheduler.run_forever()
+    except KeyboardInterrupt:
+        scheduler.stop()
+    click.echo(f"Sent {scheduler.get_metrics()['fired']} reminders")
+
+
+@tokens_cli.command("purge")
+def purge_tokens():
+    """Delete expired and revoked refresh tokens."""
+    from database.db import get_db_session
+    from database.repositories.user_token_repository import UserTokenRepository
+
+    with get_db_session() as session:
+        deleted = UserTokenRepository(session).delete_expired_tokens()
+
+    click.echo(f"Deleted {deleted} expired or revoked tokens")
+
+
+def register_commands(app):
+    """Register CLI command groups on the app."""
+    app.cli.add_command(pomodoro_cli)
+    app.cli.add_command(sync_cli)
+    app.cli.add_command(sessions_cli)
+    app.cli.add_command(tasks_cli)
+    app.cli.add_command(streaks_cli)
+    app.cli.add_command(reminders_cli)
+    app.cli.add_command(tokens_cli)
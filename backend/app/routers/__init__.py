@@ -4,24 +4,36 @@ API routes package initialization.
 This module exposes the blueprints for API routes.
 """
 
-from .auth import auth_bp
-from .dashboard import dashboard_bp
-from .focus import focus_bp
-from .group import group_bp
-from .health import health_bp
-from .pomodoro import pomodoro_bp
-from .subtask import subtask_bp
-from .tag import tag_bp
-from .task import task_bp
-
-__all__ = [
-    "auth_bp",
-    "dashboard_bp",
-    "focus_bp",
-    "group_bp",
-    "health_bp",
-    "pomodoro_bp",
-    "subtask_bp",
-    "tag_bp",
-    "task_bp",
-]
+from importlib import import_module
+
+# Public name -> submodule. Submodules are imported on first access so that
+# importing one of them doesn't pull in the whole package.
+_EXPORTS = {
+    "archive_bp": ".archive",
+    "auth_bp": ".auth",
+    "batch_bp": ".batch",
+    "dashboard_bp": ".dashboard",
+    "events_bp": ".events",
+    "focus_bp": ".focus",
+    "group_bp": ".group",
+    "health_bp": ".health",
+    "pomodoro_bp": ".pomodoro",
+    "subtask_bp": ".subtask",
+    "sync_bp": ".sync",
+    "tag_bp": ".tag",
+    "task_bp": ".task",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
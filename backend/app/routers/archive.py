@@ -0,0 +1,114 @@
+"""
+Task archive API endpoints.
+
+Finished tasks are moved here by `flask --app wsgi tasks archive`; they can be
+searched, read and restored to the task list.
+"""
+
+from flask import Blueprint, jsonify, request
+from flask_jwt_extended import jwt_required, get_jwt_identity
+from pydantic import ValidationError
+
+from app.schemas.archive import ArchiveSearchRequest
+from app.services.task_archive_service import TaskArchiveService
+from database.db import get_db_session
+from database.routing import get_read_session
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+archive_bp = Blueprint("archive", __name__, url_prefix="/api/archive")
+
+
+@archive_bp.route("/tasks", methods=["GET"])
+@jwt_required()
+def search_archived_tasks():
+    """
+    Search archived tasks, most recently archived first.
+
+    Query params:
+        search: text to match in title or description
+        status: comma-separated task statuses
+        archived_from, archived_to: ISO datetimes bounding archived_at
+        page, page_size: pagination (page_size at most 100)
+    """
+    try:
+        user_id = int(get_jwt_identity())
+        search_request = ArchiveSearchRequest(**request.args.to_dict())
+
+        with get_read_session(user_id) as session:
+            archive_service = TaskArchiveService(session)
+            _, _, result = archive_service.search_archive(
+                user_id,
+                search=search_request.search,
+                statuses=search_request.status,
+                archived_from=search_request.archived_from,
+                archived_to=search_request.archived_to,
+                page=search_request.page,
+                page_size=search_request.page_size,
+            )
+            return (
+                jsonify(
+                    {
+                        "tasks": [task.to_dict() for task in result["tasks"]],
+                        "pagination": {
+                            "total_count": result["total_count"],
+                            "page": result["page"],
+                            "page_size": result["page_size"],
+                            "total_pages": result["total_pages"],
+                            "has_next": result["has_next"],
+                            "has_prev": result["has_prev"],
+                        },
+                    }
+                ),
+                200,
+            )
+
+    except ValidationError as e:
+        logger.warning(f"Validation error searching archive: {e}")
+        return (
+            jsonify(
+                {
+                    "error": "Invalid search parameters",
+                    "details": e.errors(include_url=False, include_context=False),
+                }
+            ),
+            400,
+        )
+    except Exception:
+        logger.exception("Error searching archived tasks")
+        return jsonify({"error": "Internal server error"}), 500
+
+
+@archive_bp.route("/tasks/<int:task_id>", methods=["GET"])
+@jwt_required()
+def get_archived_task(task_id: int):
+    """Get an archived task with its subtasks and tags."""
+    try:
+        user_id = int(get_jwt_identity())
+        with get_read_session(user_id) as session:
+            archive_service = TaskArchiveService(session)
+            success, message, task = archive_service.get_archived_task(user_id, task_id)
+            if not success:
+                return jsonify({"error": message}), 404
+            return jsonify(task), 200
+    except Exception as e:
+        logger.exception("Error getting archived task")
+        return jsonify({"error": str(e)}), 500
+
+
+@archive_bp.route("/tasks/<int:task_id>/restore", methods=["POST"])
+@jwt_required()
+def restore_archived_task(task_id: int):
+    """Move an archived task back to the task list."""
+    try:
+        user_id = int(get_jwt_identity())
+        with get_db_session() as session:
+            archive_service = TaskArchiveService(session)
+            success, message = archive_service.restore_task(user_id, task_id)
+            if not success:
+                return jsonify({"error": message}), 404
+            return jsonify({"message": message, "task_id": task_id}), 200
+    except Exception as e:
+        logger.exception("Error restoring archived task")
+        return jsonify({"error": str(e)}), 500
@@ -29,6 +29,8 @@ from app.schemas import (
     RefreshTokenRequest,
 )
 from app.services import AuthService
+from app.utils.password_hasher import PasswordHasherBusyError
+from app.utils.rate_limit import rate_limit
 from database.models.user import User
 from database.db import get_db_session
 
@@ -40,6 +42,7 @@ auth_bp = Blueprint("auth", __name__, url_prefix="/api/auth")
 
 
 @auth_bp.route("/register", methods=["POST"])
+@rate_limit("register")
 def register():
     """Register a new user and issue tokens."""
     try:
@@ -114,12 +117,16 @@ def register():
     except ValidationError as e:
         logger.warning(f"Validation error during registration: {str(e)}")
         return jsonify({"error": e.errors()}), 400
+    except PasswordHasherBusyError:
+        logger.warning("Password hasher saturated during registration")
+        return jsonify({"error": "Server is busy, please try again shortly"}), 503, {"Retry-After": "1"}
     except Exception as e:
         logger.error(f"Unexpected error during registration: {str(e)}")
         return jsonify({"error": "An unexpected error occurred"}), 500
 
 
 @auth_bp.route("/login", methods=["POST"])
+@rate_limit("login")
 def login():
     """Login a user."""
     try:
@@ -246,6 +253,9 @@ def login():
     except ValueError as e:
         logger.warning(f"Value error during login: {str(e)}")
         return jsonify({"error": str(e)}), 401
+    except PasswordHasherBusyError:
+        logger.warning("Password hasher saturated during login")
+        return jsonify({"error": "Server is busy, please try again shortly"}), 503, {"Retry-After": "1"}
     except Exception as e:
         logger.error(f"Unexpected error during login: {str(e)}")
         return jsonify({"error": "An unexpected error occurred"}), 500
@@ -363,6 +373,7 @@ def get_current_user():
 
 
 @auth_bp.route("/refresh", methods=["POST"])
+@rate_limit("refresh")
 @jwt_required(refresh=True)
 def refresh():
     """Refresh a user's access token."""
@@ -0,0 +1,82 @@
+import time
+
+from flask import Blueprint, current_app, jsonify, request
+from flask_jwt_extended import get_jwt, get_jwt_identity, jwt_required
+from pydantic import ValidationError
+
+from app.schemas.batch import BatchRequest
+from app.utils.batch import BatchContext, dispatch, end_batch, start_batch, validate_path
+from database.db import shared_session_scope
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+batch_bp = Blueprint("batch", __name__, url_prefix="/api/batch")
+
+
+@batch_bp.route("/", methods=["POST"])
+@batch_bp.route("", methods=["POST"])
+@jwt_required()
+def run_batch():
+    """
+    Run several API requests in one round trip.
+
+    Body:
+        requests: list of {id?, method, path, query?, body?}
+        on_error: "continue" (default) or "abort"
+
+    Sub-requests run in order as the caller, sharing one database
+    transaction. With "continue" a failing sub-request only rolls back its
+    own writes; with "abort" the first failure (status >= 400) rolls back
+    the whole batch and the remaining sub-requests are skipped with 424.
+    """
+    try:
+        batch_request = BatchRequest(**(request.get_json(silent=True) or {}))
+    except (ValidationError, TypeError) as e:
+        return jsonify({"error": "Invalid batch request", "details": str(e)}), 400
+
+    max_requests = current_app.config.get("BATCH_MAX_REQUESTS", 20)
+    if len(batch_request.requests) > max_requests:
+        return jsonify({"error": f"A batch can contain at most {max_requests} requests"}), 400
+
+    for sub_request in batch_request.requests:
+        error = validate_path(sub_request.path)
+        if error:
+            return jsonify({"error": error, "path": sub_request.path}), 400
+
+    user_id = int(get_jwt_identity())
+    token = start_batch(BatchContext(user_id=user_id, jti=get_jwt()["jti"]))
+    started = time.perf_counter()
+    responses = []
+    failed = False
+    try:
+        with shared_session_scope() as session:
+            for index, sub_request in enumerate(batch_request.requests):
+                request_id = sub_request.id if sub_request.id is not None else index
+                if failed:
+                    responses.append({
+                        "id": request_id,
+                        "status": 424,
+                        "body": {"error": "Skipped after an earlier sub-request failed"},
+                        "duration_ms": 0.0,
+                    })
+                    continue
+
+                result = dispatch(
+                    sub_request.method, sub_request.path, sub_request.query, sub_request.body
+                )
+                responses.append({"id": request_id, **result})
+
+                if batch_request.on_error == "abort" and result["status"] >= 400:
+                    failed = True
+                    session.rollback()
+    finally:
+        end_batch(token)
+
+    duration_ms = round((time.perf_counter() - started) * 1000, 2)
+    logger.debug(f"Batch of {len(responses)} requests for user {user_id} took {duration_ms}ms")
+    return jsonify({
+        "responses": responses,
+        "rolled_back": failed,
+        "duration_ms": duration_ms,
+    }), 200
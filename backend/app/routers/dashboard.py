@@ -1,10 +1,12 @@
 from flask import Blueprint, jsonify, request
 from flask_jwt_extended import get_jwt_identity, jwt_required
-from database.db import get_db_session
+from database.routing import get_read_session
 
 from datetime import date, timedelta
 from app.services.pomodoro_service import PomodoroService
 from app.services.focus_service import FocusService
+from app.services.streak_service import StreakService, get_daily_goals
+from database.models.user_streak import StreakMetric
 
 from typing import List, Dict, Any
 
@@ -181,7 +183,7 @@ def get_productivity_overview():
         if days < 1 or days > 365:
             return jsonify({"error": "Days must be between 1 and 365"}), 400
 
-        with get_db_session() as session:
+        with get_read_session(user_id) as session:
             pomodoro_service = PomodoroService(session)
             focus_service = FocusService(session)
 
@@ -254,7 +256,7 @@ def get_dashboard_data():
     try:
         user_id = int(get_jwt_identity())
 
-        with get_db_session() as session:
+        with get_read_session(user_id) as session:
             # Get services
             pomodoro_service = PomodoroService(session)
             focus_service = FocusService(session)
@@ -403,7 +405,7 @@ def get_productivity_patterns():
         if days < 7 or days > 365:
             return jsonify({"error": "Days must be between 7 and 365"}), 400
 
-        with get_db_session() as session:
+        with get_read_session(user_id) as session:
             pomodoro_service = PomodoroService(session)
             focus_service = FocusService(session)
 
@@ -462,7 +464,7 @@ def get_goal_progress():
             start_date = end_date - timedelta(days=29)  # Last 30 days
             days = 30
 
-        with get_db_session() as session:
+        with get_read_session(user_id) as session:
             pomodoro_service = PomodoroService(session)
             focus_service = FocusService(session)
 
@@ -470,9 +472,9 @@ def get_goal_progress():
             pomodoro_stats = pomodoro_service.get_statistics(user_id, days)
             focus_stats = focus_service.get_focus_statistics(user_id, days)
 
-            # Calculate goal progress (these would come from user preferences)
-            daily_pomodoro_goal = 8  # This should come from user settings
-            daily_focus_time_goal = 4  # hours, should come from user settings
+            daily_goals = get_daily_goals()
+            daily_pomodoro_goal = daily_goals[StreakMetric.POMODORO_GOAL]
+            daily_focus_time_goal = daily_goals[StreakMetric.FOCUS_GOAL] / 60  # hours
 
             if timeframe == "day":
                 today_summary = pomodoro_service.get_daily_summary(user_id, end_date)
@@ -552,6 +554,8 @@ def get_goal_progress():
                     },
                 }
 
+            _, _, goals["streaks"] = StreakService(session).get_streaks(user_id)
+
             return jsonify(goals), 200
 
     except Exception as e:
@@ -570,7 +574,7 @@ def get_personalized_insights():
         if days < 7 or days > 365:
             return jsonify({"error": "Days must be between 7 and 365"}), 400
 
-        with get_db_session() as session:
+        with get_read_session(user_id) as session:
             pomodoro_service = PomodoroService(session)
             focus_service = FocusService(session)
 
@@ -619,7 +623,7 @@ def get_period_comparison():
         if comparison_days < 7 or comparison_days > 365:
             return jsonify({"error": "Comparison days must be between 7 and 365"}), 400
 
-        with get_db_session() as session:
+        with get_read_session(user_id) as session:
             pomodoro_service = PomodoroService(session)
             focus_service = FocusService(session)
 
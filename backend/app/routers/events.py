@@ -0,0 +1,76 @@
+import json
+import queue
+
+from flask import Blueprint, Response, current_app, jsonify
+from flask_jwt_extended import jwt_required, get_jwt_identity
+
+from app.utils.events import SSESink, get_event_dispatcher
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+events_bp = Blueprint("events", __name__, url_prefix="/api/events")
+
+
+@events_bp.route("/stream", methods=["GET"])
+@jwt_required()
+def stream_events():
+    """
+    Stream the user's events (task.due reminders, session.expired) as
+    server-sent events.
+
+    Only events produced in this server process are streamed, so the
+    stream is refused (503) by processes that don't run the background jobs:
+    with several Gunicorn workers only the one holding the background jobs
+    lock serves it (see gunicorn.conf.py). Use the webhook sink there.
+    """
+    user_id = int(get_jwt_identity())
+    sink = get_event_dispatcher().sinks.get("sse")
+    if not isinstance(sink, SSESink):
+        return jsonify({"error": "Event stream is not enabled"}), 404
+
+    if not current_app.config.get("BACKGROUND_JOBS_RUNNING"):
+        return (
+            jsonify(
+                {
+                    "error": "Events are not published by this server process; "
+                    "the event stream is only served where the background jobs run"
+                }
+            ),
+            503,
+        )
+
+    if not sink.has_capacity():
+        return jsonify({"error": "Too many open event streams, try again later"}), 503
+
+    heartbeat = current_app.config.get("EVENT_STREAM_HEARTBEAT_SECONDS", 15)
+
+    def generate():
+        # Subscribe only once the stream is read, so a response that is built
+        # but never sent doesn't leave a queue behind
+        subscriber = sink.subscribe(user_id)
+        if subscriber is None:
+            yield 'event: error\ndata: {"error": "Too many open event streams"}\n\n'
+            return
+        try:
+            yield "retry: 5000\n\n"
+            while True:
+                try:
+                    event = subscriber.get(timeout=heartbeat)
+                except queue.Empty:
+                    # Comment line keeps proxies from closing an idle stream
+                    yield ": keepalive\n\n"
+                    continue
+                yield (
+                    f"id: {event.id}\n"
+                    f"event: {event.type}\n"
+                    f"data: {json.dumps(event.to_dict())}\n\n"
+                )
+        finally:
+            sink.unsubscribe(user_id, subscriber)
+
+    return Response(
+        generate(),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -16,10 +16,12 @@ from app.schemas.pomodoro import (
 )
 from app.services.focus_service import FocusService
 from database.db import get_db_session
+from database.routing import get_read_session
 from database.models.focus_session import (
     FocusMode,
     FocusSessionStatus,
 )
+from database.repositories.focus_session_repository import SCORE_COLUMNS
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -27,6 +29,9 @@ logger = logging.getLogger(__name__)
 # Create Blueprint
 focus_bp = Blueprint("focus", __name__, url_prefix="/api/focus")
 
+# Offline clients may send queued interruptions in one request
+MAX_INTERRUPTIONS_PER_REQUEST = 100
+
 
 @focus_bp.route("/sessions", methods=["POST"])
 @jwt_required()
@@ -208,7 +213,7 @@ def abandon_focus_session(session_id: str):
 @focus_bp.route("/sessions/<session_id>/interruption", methods=["POST"])
 @jwt_required()
 def log_focus_interruption(session_id: str):
-    """Log an interruption during a Focus session."""
+    """Log an interruption during a Focus session (or a list of them)."""
     try:
         user_id = int(get_jwt_identity())
         data = request.get_json()
@@ -216,15 +221,20 @@ def log_focus_interruption(session_id: str):
         if not data:
             return jsonify({"error": "Interruption data is required"}), 400
 
-        interruption_request = FocusInterruptionRequest(**data)
+        entries = data if isinstance(data, list) else [data]
+        if len(entries) > MAX_INTERRUPTIONS_PER_REQUEST:
+            return (
+                jsonify({"error": f"At most {MAX_INTERRUPTIONS_PER_REQUEST} interruptions per request"}),
+                400,
+            )
+        interruptions = [FocusInterruptionRequest(**entry).model_dump() for entry in entries]
 
         with get_db_session() as session:
             focus_service = FocusService(session)
-            success, message = focus_service.log_interruption(
+            success, message = focus_service.log_interruptions(
                 user_id=user_id,
                 session_id=session_id,
-                is_self_interruption=interruption_request.is_self_interruption,
-                interruption_note=interruption_request.interruption_note,
+                interruptions=interruptions,
             )
 
             if not success:
@@ -243,6 +253,28 @@ def log_focus_interruption(session_id: str):
         return jsonify({"error": str(e)}), 500
 
 
+@focus_bp.route("/interruptions/analytics", methods=["GET"])
+@jwt_required()
+def get_focus_interruption_analytics():
+    """Get focus interruptions by type and by hour of day."""
+    try:
+        user_id = int(get_jwt_identity())
+        days = request.args.get("days", 30, type=int)
+
+        if days < 1 or days > 365:
+            return jsonify({"error": "Days must be between 1 and 365"}), 400
+
+        with get_read_session(user_id) as session:
+            focus_service = FocusService(session)
+            analytics = focus_service.get_interruption_analytics(user_id, days)
+
+            return jsonify(analytics), 200
+
+    except Exception as e:
+        logger.exception("Error getting focus interruption analytics")
+        return jsonify({"error": str(e)}), 500
+
+
 # === FOCUS SESSION RETRIEVAL ENDPOINTS ===
 
 
@@ -383,7 +415,7 @@ def get_focus_statistics():
         if days < 1 or days > 365:
             return jsonify({"error": "Days must be between 1 and 365"}), 400
 
-        with get_db_session() as session:
+        with get_read_session(user_id) as session:
             focus_service = FocusService(session)
             statistics = focus_service.get_focus_statistics(user_id, days)
 
@@ -408,7 +440,7 @@ def get_focus_mode_analysis():
         if days < 1 or days > 365:
             return jsonify({"error": "Days must be between 1 and 365"}), 400
 
-        with get_db_session() as session:
+        with get_read_session(user_id) as session:
             focus_service = FocusService(session)
             mode_analysis = focus_service.get_focus_mode_analysis(user_id, days)
 
@@ -433,7 +465,7 @@ def get_productivity_insights():
         if days < 1 or days > 365:
             return jsonify({"error": "Days must be between 1 and 365"}), 400
 
-        with get_db_session() as session:
+        with get_read_session(user_id) as session:
             focus_service = FocusService(session)
             insights = focus_service.get_productivity_insights(user_id, days)
 
@@ -458,7 +490,7 @@ def get_flow_state_analysis():
         if days < 1 or days > 365:
             return jsonify({"error": "Days must be between 1 and 365"}), 400
 
-        with get_db_session() as session:
+        with get_read_session(user_id) as session:
             focus_service = FocusService(session)
             flow_analysis = focus_service.get_flow_state_analysis(user_id, days)
 
@@ -505,7 +537,7 @@ def get_longest_sessions():
         if limit < 1 or limit > 50:
             return jsonify({"error": "Limit must be between 1 and 50"}), 400
 
-        with get_db_session() as session:
+        with get_read_session(user_id) as session:
             focus_service = FocusService(session)
             longest_sessions = focus_service.focus_repo.get_longest_sessions(
                 user_id, limit
@@ -528,6 +560,71 @@ def get_longest_sessions():
         return jsonify({"error": str(e)}), 500
 
 
+@focus_bp.route("/sessions/top", methods=["GET"])
+@jwt_required()
+def get_top_sessions():
+    """Get the user's best focus sessions by a stored score."""
+    try:
+        user_id = int(get_jwt_identity())
+        metric = request.args.get("metric", "productivity_score")
+        limit = request.args.get("limit", 10, type=int)
+        days = request.args.get("days", type=int)
+
+        if metric not in SCORE_COLUMNS:
+            return (
+                jsonify({"error": f"Metric must be one of: {', '.join(SCORE_COLUMNS)}"}),
+                400,
+            )
+        if limit < 1 or limit > 50:
+            return jsonify({"error": "Limit must be between 1 and 50"}), 400
+        if days is not None and (days < 1 or days > 365):
+            return jsonify({"error": "Days must be between 1 and 365"}), 400
+
+        with get_read_session(user_id) as session:
+            focus_service = FocusService(session)
+            top_sessions = focus_service.focus_repo.get_top_sessions(
+                user_id, metric, limit, days
+            )
+
+            # Convert while session is active
+            session_responses = [s.to_dict() for s in top_sessions]
+            return (
+                jsonify(
+                    {
+                        "sessions": session_responses,
+                        "count": len(session_responses),
+                        "metric": metric,
+                    }
+                ),
+                200,
+            )
+
+    except Exception as e:
+        logger.exception("Error getting top sessions")
+        return jsonify({"error": str(e)}), 500
+
+
+@focus_bp.route("/analysis/scores", methods=["GET"])
+@jwt_required()
+def get_score_analysis():
+    """Get average productivity score and efficiency ratio over a period."""
+    try:
+        user_id = int(get_jwt_identity())
+        days = request.args.get("days", 30, type=int)
+
+        if days < 1 or days > 365:
+            return jsonify({"error": "Days must be between 1 and 365"}), 400
+
+        with get_read_session(user_id) as session:
+            focus_service = FocusService(session)
+            score_analysis = focus_service.get_score_analysis(user_id, days)
+            return jsonify(score_analysis), 200
+
+    except Exception as e:
+        logger.exception("Error getting score analysis")
+        return jsonify({"error": str(e)}), 500
+
+
 @focus_bp.route("/sessions/flow-state", methods=["GET"])
 @jwt_required()
 def get_flow_state_sessions():
@@ -539,7 +636,7 @@ def get_flow_state_sessions():
         if days < 1 or days > 365:
             return jsonify({"error": "Days must be between 1 and 365"}), 400
 
-        with get_db_session() as session:
+        with get_read_session(user_id) as session:
             focus_service = FocusService(session)
             flow_sessions = focus_service.focus_repo.get_flow_state_sessions(
                 user_id, days
@@ -645,7 +742,7 @@ def get_weekly_focus_sessions():
         start_of_week = today - timedelta(days=today.weekday())
         end_of_week = start_of_week + timedelta(days=6)
 
-        with get_db_session() as session:
+        with get_read_session(user_id) as session:
             focus_service = FocusService(session)
             sessions = focus_service.get_user_focus_sessions(
                 user_id=user_id,
@@ -1,5 +1,6 @@
 from flask import Blueprint, jsonify
-from database.db import check_db_connection, get_pool_status
+from database.db import check_db_connection, get_pool_status, get_all_pool_status
+from database.routing import get_replica_health
 from logger import get_logger
 
 logger = get_logger(__name__)
@@ -33,21 +34,34 @@ def db_health():
 
 @health_bp.route('/pool', methods=['GET'])
 def pool_status():
-    """Get detailed connection pool status."""
+    """Get detailed connection pool status for the primary and each replica."""
     try:
-        pool_info = get_pool_status()
-        if pool_info is None:
+        engines = get_all_pool_status()
+        if not engines:
             return jsonify({'error': 'Failed to retrieve pool status'}), 500
         
-        # Add warnings if pool is running low
+        replica_health = get_replica_health()
+        
+        # Add warnings if any pool is running low
         warnings = []
-        if pool_info['checked_out'] > pool_info['size'] * 0.8:
-            warnings.append('Pool utilization is high')
-        if pool_info['pool_limit_reached']:
-            warnings.append('Pool limit reached - new connections will timeout')
+        for name, info in engines.items():
+            if info['checked_out'] > info['size'] * 0.8:
+                warnings.append(f'{name}: pool utilization is high')
+            if info['pool_limit_reached']:
+                warnings.append(f'{name}: pool limit reached - new connections will timeout')
+            metrics = info.get('metrics')
+            if metrics and metrics['checkout_wait_ms']['p95'] >= metrics['wait_alert_ms']:
+                warnings.append(f'{name}: slow connection checkouts (p95 above alert threshold)')
+            if metrics and metrics['timeouts']:
+                warnings.append(f'{name}: {metrics["timeouts"]} checkouts timed out')
+            if name in replica_health:
+                info['routing'] = replica_health[name]
+                if not replica_health[name]['healthy']:
+                    warnings.append(f'{name}: unhealthy, reads failing over to primary')
         
         return jsonify({
-            'pool_info': pool_info,
+            'pool_info': engines['primary'],
+            'engines': engines,
             'warnings': warnings,
             'status': 'warning' if warnings else 'healthy'
         })
@@ -56,4 +70,44 @@ def pool_status():
         return jsonify({
             'error': str(e),
             'status': 'error'
-        }), 500
\ No newline at end of file
+        }), 500
+
+@health_bp.route('/auth', methods=['GET'])
+def auth_health():
+    """Get password hasher pool metrics (queue depth, rejections, latency) and profile cache stats."""
+    from app.utils.password_hasher import get_password_hasher
+    from app.utils.profile_cache import get_user_profile_cache
+
+    metrics = get_password_hasher().get_metrics()
+    saturated = metrics['in_flight'] >= metrics['max_pending']
+    return jsonify({
+        'password_hasher': metrics,
+        'user_profile_cache': get_user_profile_cache().get_stats(),
+        'status': 'warning' if saturated or metrics['rejected'] else 'healthy'
+    })
+
+@health_bp.route('/events', methods=['GET'])
+def events_health():
+    """Get event dispatcher and reminder scheduler metrics."""
+    from app.utils.events import get_event_dispatcher
+    from app.utils.reminders import get_reminder_scheduler
+
+    dispatcher = get_event_dispatcher().get_metrics()
+    reminders = get_reminder_scheduler().get_metrics()
+    failing = any(dispatcher['failed'].values()) or dispatcher['dropped']
+    return jsonify({
+        'dispatcher': dispatcher,
+        'reminders': reminders,
+        'status': 'warning' if failing else 'healthy'
+    })
+
+@health_bp.route('/sessions', methods=['GET'])
+def sessions_health():
+    """Get session sweeper metrics (runs, sessions ended per kind and outcome)."""
+    from app.utils.session_sweeper import get_session_sweeper
+
+    metrics = get_session_sweeper().get_metrics()
+    return jsonify({
+        'sweeper': metrics,
+        'status': 'warning' if metrics['errors'] else 'healthy'
+    })
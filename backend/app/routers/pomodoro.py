@@ -16,6 +16,7 @@ from app.schemas.pomodoro import (
 )
 from app.services.pomodoro_service import PomodoroService
 from database.db import get_db_session
+from database.routing import get_read_session
 from database.models.pomodoro_session import PomodoroSessionType, PomodoroSessionStatus
 
 # Set up logging
@@ -24,6 +25,9 @@ logger = logging.getLogger(__name__)
 # Create Blueprint
 pomodoro_bp = Blueprint("pomodoro", __name__, url_prefix="/api/pomodoro")
 
+# Offline clients may send queued interruptions in one request
+MAX_INTERRUPTIONS_PER_REQUEST = 100
+
 
 @pomodoro_bp.route("/sessions", methods=["POST"])
 @jwt_required()
@@ -198,7 +202,7 @@ def abandon_session(session_id: str):
 @pomodoro_bp.route("/sessions/<session_id>/interruption", methods=["POST"])
 @jwt_required()
 def log_interruption(session_id: str):
-    """Log an interruption during a Pomodoro session."""
+    """Log an interruption during a Pomodoro session (or a list of them)."""
     try:
         user_id = int(get_jwt_identity())
         data = request.get_json()
@@ -206,16 +210,20 @@ def log_interruption(session_id: str):
         if not data:
             return jsonify({"error": "Interruption data is required"}), 400
 
-        interruption_request = InterruptionLogRequest(**data)
+        entries = data if isinstance(data, list) else [data]
+        if len(entries) > MAX_INTERRUPTIONS_PER_REQUEST:
+            return (
+                jsonify({"error": f"At most {MAX_INTERRUPTIONS_PER_REQUEST} interruptions per request"}),
+                400,
+            )
+        interruptions = [InterruptionLogRequest(**entry).model_dump() for entry in entries]
 
         with get_db_session() as session:
             pomodoro_service = PomodoroService(session)
-            success, message = pomodoro_service.log_interruption(
+            success, message = pomodoro_service.log_interruptions(
                 user_id=user_id,
                 session_id=session_id,
-                interruption_type=interruption_request.interruption_type,
-                interruption_duration=interruption_request.interruption_duration,
-                description=interruption_request.description,
+                interruptions=interruptions,
             )
 
             if not success:
@@ -234,6 +242,28 @@ def log_interruption(session_id: str):
         return jsonify({"error": str(e)}), 500
 
 
+@pomodoro_bp.route("/interruptions/analytics", methods=["GET"])
+@jwt_required()
+def get_interruption_analytics():
+    """Get interruptions by type and by hour of day."""
+    try:
+        user_id = int(get_jwt_identity())
+        days = request.args.get("days", 30, type=int)
+
+        if days < 1 or days > 365:
+            return jsonify({"error": "Days must be between 1 and 365"}), 400
+
+        with get_read_session(user_id) as session:
+            pomodoro_service = PomodoroService(session)
+            analytics = pomodoro_service.get_interruption_analytics(user_id, days)
+
+            return jsonify(analytics), 200
+
+    except Exception as e:
+        logger.exception("Error getting interruption analytics")
+        return jsonify({"error": str(e)}), 500
+
+
 @pomodoro_bp.route("/sessions/active", methods=["GET"])
 @jwt_required()
 def get_active_session():
@@ -390,7 +420,7 @@ def get_statistics():
         if days < 1 or days > 365:
             return jsonify({"error": "Days must be between 1 and 365"}), 400
 
-        with get_db_session() as session:
+        with get_read_session(user_id) as session:
             pomodoro_service = PomodoroService(session)
             statistics = pomodoro_service.get_statistics(user_id, days)
 
@@ -415,7 +445,7 @@ def get_productivity_patterns():
         if days < 1 or days > 365:
             return jsonify({"error": "Days must be between 1 and 365"}), 400
 
-        with get_db_session() as session:
+        with get_read_session(user_id) as session:
             pomodoro_service = PomodoroService(session)
             patterns = pomodoro_service.get_productivity_patterns(user_id, days)
 
@@ -441,7 +471,7 @@ def get_weekly_sessions():
         start_of_week = today - timedelta(days=today.weekday())
         end_of_week = start_of_week + timedelta(days=6)
 
-        with get_db_session() as session:
+        with get_read_session(user_id) as session:
             pomodoro_service = PomodoroService(session)
             sessions = pomodoro_service.get_user_sessions(
                 user_id=user_id,
@@ -0,0 +1,44 @@
+from flask import Blueprint, current_app, jsonify, request
+from flask_jwt_extended import jwt_required, get_jwt_identity
+
+from app.services.sync_service import SyncService
+from database.routing import get_read_session
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+sync_bp = Blueprint("sync", __name__, url_prefix="/api/sync")
+
+
+@sync_bp.route("/", methods=["GET"])
+@sync_bp.route("", methods=["GET"])
+@jwt_required()
+def get_changes():
+    """
+    Get tasks, subtasks, tags and groups changed after a sequence number.
+
+    Query params:
+        since: last `seq` the client applied (0 for a first sync)
+        limit: maximum change log entries to read (default SYNC_PAGE_SIZE)
+    """
+    try:
+        user_id = int(get_jwt_identity())
+        since = request.args.get("since", 0, type=int)
+        max_limit = current_app.config.get("SYNC_MAX_PAGE_SIZE", 1000)
+        limit = request.args.get(
+            "limit", current_app.config.get("SYNC_PAGE_SIZE", 500), type=int
+        )
+
+        if limit < 1 or limit > max_limit:
+            return jsonify({"error": f"Limit must be between 1 and {max_limit}"}), 400
+
+        with get_read_session(user_id) as session:
+            sync_service = SyncService(session)
+            success, message, data = sync_service.get_changes(user_id, since, limit)
+            if not success:
+                return jsonify({"error": message}), 400
+            return jsonify(data), 200
+
+    except Exception as e:
+        logger.exception("Error getting sync changes")
+        return jsonify({"error": str(e)}), 500
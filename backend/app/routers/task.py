@@ -15,6 +15,7 @@ from app.schemas.task import (
 from app.services.task_service import TaskService
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from database.db import get_db_session
+from database.routing import get_read_session
 from logger import get_logger
 
 # Set up logging
@@ -84,6 +85,26 @@ def get_tasks():
         return jsonify({"error": "Internal server error"}), 500
 
 
+@task_bp.route("/counters", methods=["GET"])
+@jwt_required()
+def get_task_counters():
+    """Get task counts for Today, Overdue, Starred, My Day, each group and each tag."""
+    try:
+        user_id = int(get_jwt_identity())
+
+        with get_read_session(user_id) as session:
+            task_service = TaskService(session)
+            counters = task_service.get_task_counters(user_id)
+
+        response = jsonify(counters)
+        # Counters only change with the change sequence or the date
+        response.set_etag(f"{counters['seq']}-{counters['date']}")
+        return response.make_conditional(request)
+    except Exception as e:
+        logger.exception("Error getting task counters")
+        return jsonify({"error": "Failed to get task counters"}), 500
+
+
 @task_bp.route("/today", methods=["GET"])
 @jwt_required()
 def get_today_tasks():
@@ -240,10 +261,13 @@ def get_tasks_by_tags():
             return jsonify({"error": "Tag list cannot be empty"}), 400
 
         tags_list = [t.strip() for t in tags_param.split(",")]
+        match = request.args.get("match", "all")
+        if match not in ("all", "any"):
+            return jsonify({"error": "Match must be 'all' or 'any'"}), 400
 
         with get_db_session() as session:
             task_service = TaskService(session)
-            tasks = task_service.get_tasks_by_tags(user_id, tags_list)
+            tasks = task_service.get_tasks_by_tags(user_id, tags_list, match)
 
             return (
                 jsonify(
@@ -23,6 +23,10 @@ from .subtask import SubtaskCreateRequest, SubtaskUpdateRequest, SubtaskResponse
 
 from .dashboard import DashboardFilterRequest
 
+from .batch import BatchRequest, BatchSubRequest
+
+from .archive import ArchiveSearchRequest
+
 from .pomodoro import (
     FocusSessionCreateRequest,
     FocusSessionUpdateRequest,
@@ -82,4 +86,7 @@ __all__ = [
     "SessionFilterRequest",
     "FocusFilterRequest",
     "DashboardFilterRequest",
+    "BatchRequest",
+    "BatchSubRequest",
+    "ArchiveSearchRequest",
 ]
@@ -0,0 +1,51 @@
+"""
+Task archive schemas.
+"""
+
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel, field_validator
+
+from database.models.task import TaskStatus
+
+
+class ArchiveSearchRequest(BaseModel):
+    """Schema for searching archived tasks."""
+
+    page: int = 1
+    page_size: int = 25
+
+    search: Optional[str] = None
+    status: Optional[List[TaskStatus]] = None
+    archived_from: Optional[datetime] = None
+    archived_to: Optional[datetime] = None
+
+    @field_validator("page")
+    @classmethod
+    def validate_page(cls, v):
+        if v < 1:
+            raise ValueError("Page must be greater than 0")
+        return v
+
+    @field_validator("page_size")
+    @classmethod
+    def validate_page_size(cls, v):
+        if v < 1 or v > 100:
+            raise ValueError("Page size must be between 1 and 100")
+        return v
+
+    @field_validator("status", mode="before")
+    @classmethod
+    def parse_status(cls, v):
+        if isinstance(v, str):
+            # Handle comma-separated values
+            return [s.strip() for s in v.split(",") if s.strip()] or None
+        return v
+
+    @field_validator("search")
+    @classmethod
+    def parse_search(cls, v):
+        if isinstance(v, str):
+            return v.strip() if v.strip() else None
+        return v
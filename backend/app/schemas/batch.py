@@ -0,0 +1,21 @@
+"""
+Batch request schemas.
+"""
+
+from pydantic import BaseModel, Field
+from typing import Any, Dict, List, Literal, Optional, Union
+
+
+class BatchSubRequest(BaseModel):
+    id: Optional[Union[str, int]] = None
+    method: Literal["GET", "POST", "PUT", "PATCH", "DELETE"] = "GET"
+    path: str
+    query: Optional[Dict[str, Any]] = None
+    body: Optional[Any] = None
+
+
+class BatchRequest(BaseModel):
+    requests: List[BatchSubRequest] = Field(min_length=1)
+    # "continue": every sub-request runs and commits independently
+    # "abort": stop at the first failure and roll back the whole batch
+    on_error: Literal["continue", "abort"] = "continue"
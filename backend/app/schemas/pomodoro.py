@@ -1,4 +1,4 @@
-from datetime import date, datetime
+from datetime import UTC, date, datetime
 from typing import Any, Dict, List, Optional
 from pydantic import BaseModel, field_validator
 
@@ -14,6 +14,13 @@ from database.models.pomodoro_session import (
 )
 
 
+def _to_naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Convert a client timestamp to naive UTC, like the session columns; naive input is taken as UTC."""
+    if value is not None and value.tzinfo is not None:
+        return value.astimezone(UTC).replace(tzinfo=None)
+    return value
+
+
 class PomodoroSessionCreateRequest(BaseModel):
     session_type: PomodoroSessionType
     task_id: Optional[int] = None
@@ -49,6 +56,12 @@ class InterruptionLogRequest(BaseModel):
     interruption_type: InterruptionType
     interruption_duration: int
     description: Optional[str] = None
+    occurred_at: Optional[datetime] = None  # defaults to now; set when sending a batch
+
+    @field_validator("occurred_at")
+    @classmethod
+    def validate_occurred_at(cls, value):
+        return _to_naive_utc(value)
 
 
 class PomodoroSessionResponse(BaseModel):
@@ -132,6 +145,13 @@ class FocusSessionUpdateRequest(BaseModel):
 class FocusInterruptionRequest(BaseModel):
     is_self_interruption: bool = True
     interruption_note: Optional[str] = None
+    interruption_duration: int = 0
+    occurred_at: Optional[datetime] = None  # defaults to now; set when sending a batch
+
+    @field_validator("occurred_at")
+    @classmethod
+    def validate_occurred_at(cls, value):
+        return _to_naive_utc(value)
 
 
 class FocusSessionResponse(BaseModel):
@@ -177,6 +177,11 @@ class TaskFilterRequest(BaseModel):
     search: Optional[str] = None
     due_date_from: Optional[date] = None
     due_date_to: Optional[date] = None
+    # Tag names: tasks must have all of `tags`, at least one of `tags_any`
+    # and none of `tags_none`
+    tags: Optional[List[str]] = None
+    tags_any: Optional[List[str]] = None
+    tags_none: Optional[List[str]] = None
 
     @field_validator("page")
     @classmethod
@@ -231,6 +236,14 @@ class TaskFilterRequest(BaseModel):
             return v.strip()
         return v
 
+    @field_validator("tags", "tags_any", "tags_none", mode="before")
+    @classmethod
+    def parse_tags(cls, v):
+        if isinstance(v, str):
+            # Handle comma-separated values
+            return [t.strip() for t in v.split(",") if t.strip()] or None
+        return v
+
     @field_validator("starred", "completed", "overdue")
     @classmethod
     def parse_boolean(cls, v):
@@ -272,6 +285,12 @@ class TaskFilterRequest(BaseModel):
             filters["overdue"] = self.overdue
         if self.search is not None:
             filters["search"] = self.search
+        if self.tags is not None:
+            filters["tags"] = self.tags
+        if self.tags_any is not None:
+            filters["tags_any"] = self.tags_any
+        if self.tags_none is not None:
+            filters["tags_none"] = self.tags_none
 
         # Handle date range
         if self.due_date_from is not None or self.due_date_to is not None:
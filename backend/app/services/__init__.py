@@ -4,23 +4,34 @@ Services package for business logic.
 Services implement business logic and use repositories for data access.
 """
 
-from .auth_service import AuthService
-from .dashboard_service import DashboardService
-from .focus_service import FocusService
-from .group_service import GroupService
-from .pomodoro_service import PomodoroService
-from .subtask_service import SubtaskService
-from .tag_service import TagService
-from .task_service import TaskService
-
-
-__all__ = [
-    "AuthService",
-    "TaskService",
-    "TagService",
-    "GroupService",
-    "SubtaskService",
-    "DashboardService",
-    "PomodoroService",
-    "FocusService",
-]
+from importlib import import_module
+
+# Public name -> submodule. Submodules are imported on first access so that
+# importing one of them doesn't pull in the whole package.
+_EXPORTS = {
+    "AuthService": ".auth_service",
+    "TaskService": ".task_service",
+    "TagService": ".tag_service",
+    "GroupService": ".group_service",
+    "SubtaskService": ".subtask_service",
+    "DashboardService": ".dashboard_service",
+    "PomodoroService": ".pomodoro_service",
+    "FocusService": ".focus_service",
+    "SyncService": ".sync_service",
+    "TaskArchiveService": ".task_archive_service",
+    "StreakService": ".streak_service",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -1,15 +1,34 @@
 from database.models.user import User
 from typing import Any, Tuple, Optional, Dict
-import bcrypt
 from datetime import datetime, UTC
 from sqlalchemy.orm import Session
 from logger import get_logger
+from app.utils.cache import TTLCache
+from app.utils.password_hasher import get_password_hasher
+from app.utils.profile_cache import UserProfile, get_user_profile_cache
 from database.repositories.user_repository import UserRepository
 from database.repositories.user_token_repository import UserTokenRepository
 
 # Set up logging
 logger = get_logger(__name__)
 
+# user_id -> (token_epoch, is_active), or None for unknown users
+_token_state_cache: Optional[TTLCache] = None
+
+
+def get_token_state_cache() -> TTLCache:
+    """Get the process-wide token state cache configured from app config."""
+    global _token_state_cache
+    if _token_state_cache is None:
+        from config.config import get_config
+
+        config = get_config()
+        _token_state_cache = TTLCache(
+            maxsize=config.AUTH_TOKEN_STATE_CACHE_SIZE,
+            ttl=config.AUTH_TOKEN_STATE_CACHE_SECONDS,
+        )
+    return _token_state_cache
+
 
 class AuthService:
     def __init__(self, session: Session):
@@ -57,16 +76,35 @@ class AuthService:
 
     @staticmethod
     def hash_password(password: str) -> str:
-        """Hash a password."""
-        return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+        """Hash a password (in the password hasher's process pool)."""
+        return get_password_hasher().hash(password)
 
     def verify_password(self, email: str, password: str) -> bool:
         """Verify user password."""
         user = self.user_repo.get_user_by_email(email)
-        if not user:
-            return False
+        return self.check_user_password(user, password)
+
+    def check_user_password(self, user: Optional[User], password: str) -> bool:
+        """
+        Verify a password for an already-loaded user.
 
-        return bcrypt.checkpw(password.encode("utf-8"), user.psw_hash.encode("utf-8"))
+        Unknown users are checked against a dummy hash so the response time
+        doesn't reveal whether the email exists.
+        """
+        return get_password_hasher().verify(password, user.psw_hash if user else None)
+
+    def _rehash_if_needed(self, user: User, password: str) -> None:
+        """Upgrade a hash made with an outdated work factor after a successful login."""
+        hasher = get_password_hasher()
+        if not hasher.needs_rehash(user.psw_hash):
+            return
+
+        try:
+            user.psw_hash = hasher.hash(password)
+            logger.info(f"Rehashed password for user {user.id} with {hasher.rounds} rounds")
+        except Exception as e:
+            # Not worth failing a valid login over
+            logger.warning(f"Failed to rehash password for user {user.id}: {str(e)}")
 
     def register_user(
         self, email: str, password: str, display_name: str
@@ -101,7 +139,7 @@ class AuthService:
 
         # Create tokens
         access_token = self.token_repo.create_access_token(
-            created_user.id, self.access_token_expire_minutes
+            created_user.id, self.access_token_expire_minutes, created_user.token_epoch or 0
         )
         refresh_token = self.token_repo.create_refresh_token(
             created_user.id, self.refresh_token_expire_minutes
@@ -119,29 +157,28 @@ class AuthService:
 
     def login_user(self, email: str, password: str) -> Tuple[bool, str, Optional[Dict]]:
         """Login a user."""
-        # TODO: add rate limiting
+        # Per-IP and per-email limits are enforced in the route (app.utils.rate_limit)
 
-        # Get user
+        # Get user (single lookup; the password check reuses it)
         user = self.user_repo.get_user_by_email(email)
+        password_ok = self.check_user_password(user, password)
+
         if not user:
             logger.warning(f"Login attempt with non-existent email: {email}")
             return False, "Invalid email or password", None
 
-        # Verify password
-        if not self.verify_password(email, password):
+        if not password_ok:
             logger.warning(f"Login failed for user: {email}")
             return False, "Invalid email or password", None
 
-        # Cleanup existing tokens (single session approach)
-        try:
-            self.token_repo.revoke_all_tokens(user.id, "access")
-            self.token_repo.revoke_all_tokens(user.id, "refresh")
-        except Exception as e:
-            logger.warning(f"Failed to revoke tokens for user: {email}: {str(e)}")
+        self._rehash_if_needed(user, password)
+
+        # Revoke existing tokens (single session approach)
+        token_epoch = self.revoke_user_tokens(user.id)
 
         # Create new tokens
         access_token = self.token_repo.create_access_token(
-            user.id, self.access_token_expire_minutes
+            user.id, self.access_token_expire_minutes, token_epoch
         )
         refresh_token = self.token_repo.create_refresh_token(
             user.id, self.refresh_token_expire_minutes
@@ -172,8 +209,7 @@ class AuthService:
             return False, "User not found"
 
         # Revoke all tokens
-        self.token_repo.revoke_all_tokens(user_id, "access")
-        self.token_repo.revoke_all_tokens(user_id, "refresh")
+        self.revoke_user_tokens(user_id)
         logger.info(f"User {user_id} logged out successfully")
         return True, "Logout successful"
 
@@ -190,17 +226,75 @@ class AuthService:
             logger.warning(f"User not found during token refresh: {user_id}")
             return None
 
+        if not user.is_active:
+            logger.warning(f"Inactive user attempted token refresh: {user_id}")
+            return None
+
         # Create new access token
         new_access_token = self.token_repo.create_access_token(
-            user.id, self.access_token_expire_minutes
+            user.id, self.access_token_expire_minutes, user.token_epoch or 0
         )
 
         logger.info(f"Access token refreshed successfully for user: {user.id}")
         return new_access_token
 
-    def verify_user_session(self, user_id: int) -> Tuple[bool, Optional[User]]:
-        """Verify user session."""
-        user = self.user_repo.get(user_id)
+    def revoke_user_tokens(self, user_id: int) -> int:
+        """
+        Revoke every token a user holds and return their new token epoch.
+
+        Refresh token rows are deleted; access tokens are revoked by bumping
+        the epoch they embed.
+        """
+        self.token_repo.revoke_all_tokens(user_id, "refresh")
+        token_epoch = self.user_repo.bump_token_epoch(user_id) or 0
+        # Other processes pick the new epoch up once their cached entry expires
+        get_token_state_cache().delete(user_id)
+        get_user_profile_cache().invalidate(user_id)
+        return token_epoch
+
+    def get_token_state(self, user_id: int) -> Optional[Tuple[int, bool]]:
+        """Get a user's (token_epoch, is_active), cached for a few seconds."""
+        return get_token_state_cache().get_or_load(
+            user_id, lambda: self.user_repo.get_token_state(user_id)
+        )
+
+    def is_token_revoked(self, jwt_payload: Dict[str, Any]) -> bool:
+        """
+        Check a decoded JWT against revocation state.
+
+        Refresh tokens must have a live row. Access tokens are valid while
+        their embedded epoch matches the user's current one, which is usually
+        answered from cache without touching the database.
+        """
+        if jwt_payload.get("type") == "refresh":
+            return self.token_repo.is_token_revoked(jwt_payload["jti"])
+
+        epoch = jwt_payload.get("epoch")
+        if epoch is None:
+            # Issued before epochs existed
+            return True
+
+        user_id = int(jwt_payload["sub"])
+        state = self.get_token_state(user_id)
+        if state is not None and epoch > state[0]:
+            # Token is newer than our cached entry (another process bumped the epoch)
+            get_token_state_cache().delete(user_id)
+            state = self.get_token_state(user_id)
+
+        if state is None:
+            return True
+        token_epoch, is_active = state
+        return not is_active or epoch < token_epoch
+
+    def get_user_profile(self, user_id: int) -> Optional[UserProfile]:
+        """Get a user's cached profile snapshot, or None for unknown users."""
+        return get_user_profile_cache().get(
+            user_id, lambda: self.user_repo.get_profile(user_id)
+        )
+
+    def verify_user_session(self, user_id: int) -> Tuple[bool, Optional[UserProfile]]:
+        """Verify user session against the cached profile snapshot."""
+        user = self.get_user_profile(user_id)
         if not user:
             logger.warning(f"User not found during session verification: {user_id}")
             return False, None
@@ -220,9 +314,7 @@ class AuthService:
             return False, "User not found"
 
         # Verify old password
-        if not bcrypt.checkpw(
-            old_password.encode("utf-8"), user.psw_hash.encode("utf-8")
-        ):
+        if not self.check_user_password(user, old_password):
             return False, "Current password is incorrect"
 
         # Validate new password
@@ -235,8 +327,7 @@ class AuthService:
         self.user_repo.update_user(user)
 
         # Revoke all existing tokens to force re-login
-        self.token_repo.revoke_all_tokens(user_id, "access")
-        self.token_repo.revoke_all_tokens(user_id, "refresh")
+        self.revoke_user_tokens(user_id)
 
         logger.info(f"Password changed successfully for user: {user_id}")
         return True, "Password changed successfully"
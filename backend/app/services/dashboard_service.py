@@ -1,11 +1,14 @@
 from typing import Dict, Any, List, Union
 from datetime import datetime, timedelta
+from app.services.streak_service import StreakService
+from database.models.user_streak import StreakMetric
 from database.repositories.task_repository import TaskRepository
 
 
 class DashboardService:
     def __init__(self, session):
         self.task_repo = TaskRepository(session)
+        self.streak_service = StreakService(session)
 
     def get_dashboard_data(self, user_id: int) -> Dict[str, Any]:
         return {
@@ -138,22 +141,7 @@ class DashboardService:
 
     def _get_completion_streak(self, user_id: int) -> int:
         """Get current completion streak in days."""
-        # Simple implementation - count consecutive days with completed tasks
-        current_date = datetime.now().date()
-        streak = 0
-
-        for i in range(30):  # Check last 30 days
-            check_date = current_date - timedelta(days=i)
-            completed = self.task_repo.count_completed_tasks_by_date(
-                user_id, check_date
-            )
-
-            if completed > 0:
-                streak += 1
-            else:
-                break
-
-        return streak
+        return self.streak_service.get_current_streak(user_id, StreakMetric.TASK_COMPLETION)
 
     def _get_focus_trend(self, user_id: int, days: int = 7) -> List[Dict[str, Any]]:
         """Get focus trend for charts."""
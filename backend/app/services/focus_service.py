@@ -1,17 +1,24 @@
 # backend/app/services/focus_service.py
 
 from typing import List, Optional, Tuple, Dict, Any
-from datetime import datetime, date, UTC
+from datetime import datetime, date, timedelta, UTC
 from sqlalchemy.orm import Session
 import json
 
+from app.services.streak_service import StreakService
+from app.utils.profile_cache import get_user_profile_cache
 from database.models.focus_session import (
     FocusSession,
     FocusMode,
     FocusSessionStatus,
     DistractionLevel,
 )
+from database.models.interruption_event import InterruptionSource
+from database.models.pomodoro_session import InterruptionType
 from database.repositories.focus_session_repository import FocusSessionRepository
+from database.repositories.interruption_event_repository import (
+    InterruptionEventRepository,
+)
 from database.repositories.task_repository import TaskRepository
 from database.repositories.user_repository import UserRepository
 
@@ -26,8 +33,10 @@ class FocusService:
     def __init__(self, session: Session):
         """Initialize the service with database session."""
         self.focus_repo = FocusSessionRepository(session)
+        self.interruption_repo = InterruptionEventRepository(session)
         self.task_repo = TaskRepository(session)
         self.user_repo = UserRepository(session)
+        self.streak_service = StreakService(session)
 
     # Session Management
     def start_focus_session(
@@ -52,14 +61,17 @@ class FocusService:
                 None,
             )
 
-        # Get user for preferences
-        user = self.user_repo.get(user_id)
+        # Cached profile snapshot for preferences
+        user = get_user_profile_cache().get(
+            user_id, lambda: self.user_repo.get_profile(user_id)
+        )
         if not user:
             return False, "User not found", None
 
         # Validate task if provided
         if task_id:
-            task = self.task_repo.get_task_by_id(task_id)
+            # Only optimal_session_length is read; no need for tags and subtasks
+            task = self.task_repo.get(task_id)
             if not task or task.user_id != user_id:
                 return False, "Task not found or doesn't belong to user", None
 
@@ -210,6 +222,7 @@ class FocusService:
         # Update task progress if applicable
         if session.task_id and session.actual_duration:
             self._update_task_focus_time(session.task_id, session.actual_duration)
+        self.streak_service.record_focus_completed(user_id, completed_session.actual_duration or 0)
 
         logger.info(f"Completed focus session {session_id} for user {user_id}")
         return True, "Focus session completed successfully", completed_session
@@ -239,8 +252,30 @@ class FocusService:
         session_id: str,
         is_self_interruption: bool = True,
         interruption_note: Optional[str] = None,
+        interruption_duration: int = 0,
+        occurred_at: Optional[datetime] = None,
     ) -> Tuple[bool, str]:
         """Log an interruption during a focus session."""
+        return self.log_interruptions(
+            user_id,
+            session_id,
+            [
+                {
+                    "is_self_interruption": is_self_interruption,
+                    "interruption_note": interruption_note,
+                    "interruption_duration": interruption_duration,
+                    "occurred_at": occurred_at,
+                }
+            ],
+        )
+
+    def log_interruptions(
+        self, user_id: int, session_id: str, interruptions: List[Dict[str, Any]]
+    ) -> Tuple[bool, str]:
+        """Log one or more interruptions during a focus session with a single insert."""
+        if not interruptions:
+            return False, "No interruptions to log"
+
         session = self.focus_repo.get(session_id)
         if not session or session.user_id != user_id:
             return False, "Focus session not found"
@@ -248,31 +283,56 @@ class FocusService:
         if session.status != FocusSessionStatus.IN_PROGRESS:
             return False, "Focus session is not in progress"
 
-        # Update interruption counts
-        session.interruption_count += 1
-        if is_self_interruption:
-            session.self_interruption_count += 1
-        else:
-            session.external_interruption_count += 1
-
-        # Log the interruption with timestamp
-        if interruption_note:
-            interruption_entry = {
-                "timestamp": datetime.now(UTC).isoformat(),
-                "type": "self" if is_self_interruption else "external",
-                "note": interruption_note,
+        now = datetime.now(UTC).replace(tzinfo=None)
+        events = [
+            {
+                "user_id": user_id,
+                "focus_session_id": session.id,
+                "interruption_type": (
+                    InterruptionType.INTERNAL
+                    if entry.get("is_self_interruption", True)
+                    else InterruptionType.EXTERNAL
+                ),
+                "duration": entry.get("interruption_duration") or 0,
+                "occurred_at": entry.get("occurred_at") or now,
+                "note": entry.get("interruption_note"),
             }
+            for entry in interruptions
+        ]
+        self.interruption_repo.bulk_create(events)
 
-            # Add to session notes
-            if session.session_notes:
-                session.session_notes += f"\n[Interruption] {interruption_entry}"
-            else:
-                session.session_notes = f"[Interruption] {interruption_entry}"
+        # Update interruption counts
+        self_interruptions = sum(
+            1 for event in events if event["interruption_type"] == InterruptionType.INTERNAL
+        )
+        session.interruption_count += len(events)
+        session.self_interruption_count += self_interruptions
+        session.external_interruption_count += len(events) - self_interruptions
 
         self.focus_repo.update_session(session)
 
-        logger.info(f"Logged interruption for focus session {session_id}")
-        return True, "Interruption logged"
+        logger.info(f"Logged {len(events)} interruption(s) for focus session {session_id}")
+        if len(events) == 1:
+            return True, "Interruption logged"
+        return True, f"{len(events)} interruptions logged"
+
+    def get_interruption_analytics(self, user_id: int, days: int = 30) -> Dict[str, Any]:
+        """Interruptions by type and by hour of day over the last N days."""
+        start = datetime.combine(date.today() - timedelta(days=days), datetime.min.time())
+        by_type = self.interruption_repo.get_counts_by_type(
+            user_id, start, source=InterruptionSource.FOCUS
+        )
+        return {
+            "by_type": by_type,
+            "by_hour": self.interruption_repo.get_counts_by_hour(
+                user_id, start, source=InterruptionSource.FOCUS
+            ),
+            "total_interruptions": sum(row["count"] for row in by_type),
+            "total_duration": sum(row["total_duration"] for row in by_type),
+            "days_analyzed": days,
+            "period_start": start.date().isoformat(),
+            "period_end": date.today().isoformat(),
+        }
 
     # Session Retrieval
     def get_active_focus_session(self, user_id: int) -> Optional[FocusSession]:
@@ -381,9 +441,13 @@ class FocusService:
         """Get personalized productivity insights and recommendations."""
         return self.focus_repo.get_productivity_insights(user_id, days)
 
+    def get_score_analysis(self, user_id: int, days: int = 30) -> Dict[str, Any]:
+        """Average stored productivity scores and efficiency ratios over a period."""
+        return self.focus_repo.get_score_averages(user_id, days)
+
     def get_flow_state_analysis(self, user_id: int, days: int = 30) -> Dict[str, Any]:
         """Analyze flow state patterns and triggers."""
-        flow_sessions = self.focus_repo.get_flow_state_sessions(user_id, days)
+        flow_sessions = self.focus_repo.get_flow_state_sessions(user_id, days, profile="stats")
 
         if not flow_sessions:
             return {
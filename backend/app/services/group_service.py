@@ -1,6 +1,8 @@
 from typing import List, Optional, Tuple
 from sqlalchemy.orm import Session
 
+from database.models.change_log import ChangeEntityType, ChangeOperation
+from database.repositories.change_log_repository import ChangeLogRepository
 from database.repositories.group_repository import GroupRepository
 from database.models.group import Group
 
@@ -10,6 +12,7 @@ from app.schemas.group import GroupCreateRequest, GroupUpdateRequest
 class GroupService:
     def __init__(self, session: Session):
         self.group_repository = GroupRepository(session)
+        self.change_log_repo = ChangeLogRepository(session)
 
     def get_all_groups_for_user(self, user_id: int) -> Tuple[bool, str, List[Group]]:
         groups = self.group_repository.get_all_groups_for_user(user_id)
@@ -22,6 +25,9 @@ class GroupService:
         group_data["user_id"] = group_create_request.user_id
         group = Group(**group_data)
         created_group = self.group_repository.create_group(group)
+        self.change_log_repo.record_change(
+            created_group.user_id, ChangeEntityType.GROUP, created_group.id
+        )
         return True, "Group created successfully", created_group
 
     def update_group(
@@ -43,6 +49,9 @@ class GroupService:
                 setattr(existing_group, key, value)
 
         updated_group = self.group_repository.update_group(existing_group)
+        self.change_log_repo.record_change(
+            existing_group.user_id, ChangeEntityType.GROUP, existing_group.id
+        )
         return True, "Group updated successfully", updated_group
 
     def delete_group(self, group_id: int) -> Tuple[bool, str]:
@@ -55,5 +64,13 @@ class GroupService:
         if not existing_group:
             return False, "Group not found"
 
+        # Deleting the group nulls group_id on its tasks; the ORM loads them
+        # for that anyway, so read their ids first and record them as changed
+        task_ids = [task.id for task in existing_group.tasks]
         self.group_repository.delete_group(existing_group)
+        self.change_log_repo.record_changes(
+            existing_group.user_id,
+            [(ChangeEntityType.GROUP, group_id, ChangeOperation.DELETE)]
+            + [(ChangeEntityType.TASK, task_id, ChangeOperation.UPSERT) for task_id in task_ids],
+        )
         return True, "Group deleted successfully"
@@ -2,11 +2,20 @@ from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime, timedelta, date, UTC
 
 from sqlalchemy.orm import Session
+from app.services.streak_service import StreakService
+from app.utils.profile_cache import get_user_profile_cache
 from database.repositories.pomodoro_session_repository import (
     PomodoroSessionRepository,
 )
+from database.repositories.interruption_event_repository import (
+    InterruptionEventRepository,
+)
+from database.repositories.pomodoro_daily_counter_repository import (
+    PomodoroDailyCounterRepository,
+)
 from database.repositories.task_repository import TaskRepository
 from database.repositories.user_repository import UserRepository
+from database.models.interruption_event import InterruptionSource
 from database.models.pomodoro_session import (
     InterruptionType,
     PomodoroSession,
@@ -21,8 +30,11 @@ logger = get_logger(__name__)
 class PomodoroService:
     def __init__(self, session: Session):
         self.pomodoro_repo = PomodoroSessionRepository(session)
+        self.counter_repo = PomodoroDailyCounterRepository(session)
+        self.interruption_repo = InterruptionEventRepository(session)
         self.task_repo = TaskRepository(session)
         self.user_repo = UserRepository(session)
+        self.streak_service = StreakService(session)
 
     def start_session(
         self,
@@ -43,8 +55,10 @@ class PomodoroService:
                 None,
             )
 
-        # Get user to determine default durations
-        user = self.user_repo.get(user_id)
+        # Cached profile snapshot for default durations (no user query when warm)
+        user = get_user_profile_cache().get(
+            user_id, lambda: self.user_repo.get_profile(user_id)
+        )
         if not user:
             return False, "User not found", None
 
@@ -60,15 +74,16 @@ class PomodoroService:
                 planned_duration = 25 * 60  # Default 25 minutes
 
         # Validate task if provided
-        if task_id:
-            task = self.task_repo.get_task_by_id(task_id)
-            if not task or task.user_id != user_id:
-                return False, "Task not found or doesn't belong to user", None
-
-        # Calculate session sequence for the day
-        today_sessions = self.pomodoro_repo.get_daily_sessions(user_id, date.today())
-        work_sessions_today = len(
-            [s for s in today_sessions if s.session_type == PomodoroSessionType.WORK]
+        if task_id and not self.task_repo.is_owned_by(task_id, user_id):
+            return False, "Task not found or doesn't belong to user", None
+
+        # Calculate session sequence for the day (counts this session if it is work)
+        start_time = datetime.now(UTC)
+        work_started = self.counter_repo.record_session_started(
+            user_id, start_time.date(), session_type, start_time
+        )
+        work_sessions_today = (
+            work_started - 1 if session_type == PomodoroSessionType.WORK else work_started
         )
         session_sequence = (
             work_sessions_today + 1
@@ -83,11 +98,11 @@ class PomodoroService:
             session_type=session_type,
             status=PomodoroSessionStatus.IN_PROGRESS,
             planned_duration=planned_duration,
-            start_time=datetime.now(UTC),
+            start_time=start_time,
             location=location,
             ambient_sound_used=ambient_sound_used,
             session_sequence=session_sequence,
-            sessions_until_long_break=user.sessions_until_long_break
+            session_until_long_break=user.sessions_until_long_break
             - (work_sessions_today % user.sessions_until_long_break),
         )
 
@@ -168,9 +183,18 @@ class PomodoroService:
             completed_session.energy_after = energy_after
             completed_session = self.pomodoro_repo.update_session(completed_session)
 
-        # Update task progress if this was a work session
-        if session.session_type == PomodoroSessionType.WORK and session.task_id:
-            self._update_task_progress(session.task_id)
+        counter_day = (completed_session.start_time or completed_session.completed_at).date()
+        self.counter_repo.record_session_completed(
+            user_id, counter_day, completed_session.session_type
+        )
+
+        # Update task progress and goal streaks if this was a work session
+        if session.session_type == PomodoroSessionType.WORK:
+            if session.task_id:
+                self._update_task_progress(session.task_id)
+            self.streak_service.record_pomodoro_completed(
+                user_id, completed_session.actual_duration or 0
+            )
 
         logger.info(f"Completed session {session_id} for user {user_id}")
         return True, "Session completed successfully", completed_session
@@ -201,8 +225,29 @@ class PomodoroService:
         interruption_type: InterruptionType,
         interruption_duration: int,
         description: Optional[str] = None,
+        occurred_at: Optional[datetime] = None,
     ) -> Tuple[bool, str]:
         """Log an interruption during a session."""
+        return self.log_interruptions(
+            user_id,
+            session_id,
+            [
+                {
+                    "interruption_type": interruption_type,
+                    "interruption_duration": interruption_duration,
+                    "description": description,
+                    "occurred_at": occurred_at,
+                }
+            ],
+        )
+
+    def log_interruptions(
+        self, user_id: int, session_id: str, interruptions: List[Dict[str, Any]]
+    ) -> Tuple[bool, str]:
+        """Log one or more interruptions during a session with a single insert."""
+        if not interruptions:
+            return False, "No interruptions to log"
+
         session = self.pomodoro_repo.get(session_id)
         if not session or session.user_id != user_id:
             return False, "Session not found"
@@ -210,31 +255,50 @@ class PomodoroService:
         if session.status != PomodoroSessionStatus.IN_PROGRESS:
             return False, "Session is not in progress"
 
-        # Update interruption data
-        session.interruption_count += 1
-        session.interruption_total_time += interruption_duration
-        session.interruption_type = interruption_type
-
-        # Add to distractions log (JSON format)
-        if description:
-            interruption_entry = {
-                "timestamp": datetime.now(UTC).isoformat(),
-                "type": interruption_type.value,
-                "duration": interruption_duration,
-                "description": description,
+        now = datetime.now(UTC).replace(tzinfo=None)
+        events = [
+            {
+                "user_id": user_id,
+                "pomodoro_session_id": session.id,
+                "interruption_type": entry["interruption_type"],
+                "duration": entry.get("interruption_duration") or 0,
+                "occurred_at": entry.get("occurred_at") or now,
+                "note": entry.get("description"),
             }
+            for entry in interruptions
+        ]
+        self.interruption_repo.bulk_create(events)
 
-            # Update distractions log (would need proper JSON handling)
-            if session.distractions_log:
-                # Parse existing log and append
-                pass
-            else:
-                session.distractions_log = str([interruption_entry])
-
+        # Keep the per-session summary columns current
+        session.interruption_count += len(events)
+        session.interruption_total_time += sum(event["duration"] for event in events)
+        session.interruption_type = max(events, key=lambda event: event["occurred_at"])[
+            "interruption_type"
+        ]
         self.pomodoro_repo.update_session(session)
 
-        logger.info(f"Logged interruption for session {session_id}")
-        return True, "Interruption logged"
+        logger.info(f"Logged {len(events)} interruption(s) for session {session_id}")
+        if len(events) == 1:
+            return True, "Interruption logged"
+        return True, f"{len(events)} interruptions logged"
+
+    def get_interruption_analytics(self, user_id: int, days: int = 30) -> Dict[str, Any]:
+        """Interruptions by type and by hour of day over the last N days."""
+        start = datetime.combine(date.today() - timedelta(days=days), datetime.min.time())
+        by_type = self.interruption_repo.get_counts_by_type(
+            user_id, start, source=InterruptionSource.POMODORO
+        )
+        return {
+            "by_type": by_type,
+            "by_hour": self.interruption_repo.get_counts_by_hour(
+                user_id, start, source=InterruptionSource.POMODORO
+            ),
+            "total_interruptions": sum(row["count"] for row in by_type),
+            "total_duration": sum(row["total_duration"] for row in by_type),
+            "days_analyzed": days,
+            "period_start": start.date().isoformat(),
+            "period_end": date.today().isoformat(),
+        }
 
     # Session Retrieval
     def get_active_session(self, user_id: int) -> Optional[PomodoroSession]:
@@ -314,21 +378,17 @@ class PomodoroService:
     # Smart Recommendations
     def get_next_session_recommendation(self, user_id: int) -> Dict[str, Any]:
         """Recommend the next session type and duration."""
-        # Get today's sessions
-        today_sessions = self.pomodoro_repo.get_daily_sessions(user_id, date.today())
-        completed_work_sessions = [
-            s
-            for s in today_sessions
-            if s.session_type == PomodoroSessionType.WORK
-            and s.status == PomodoroSessionStatus.COMPLETED
-        ]
+        # Today's counters (one row) instead of today's sessions
+        counter = self.counter_repo.get_counter(user_id, datetime.now(UTC).date())
 
-        user = self.user_repo.get(user_id)
+        user = get_user_profile_cache().get(
+            user_id, lambda: self.user_repo.get_profile(user_id)
+        )
         if not user:
             return {"error": "User not found"}
 
         # Determine next session type based on completed work sessions
-        work_session_count = len(completed_work_sessions)
+        work_session_count = counter.work_completed if counter else 0
 
         if work_session_count == 0:
             # First session of the day
@@ -346,8 +406,7 @@ class PomodoroService:
             }
         else:
             # Check if last session was work or break
-            last_session = today_sessions[-1] if today_sessions else None
-            if last_session and last_session.session_type == PomodoroSessionType.WORK:
+            if counter and counter.last_session_type == PomodoroSessionType.WORK:
                 # Recommend break after work
                 recommendation = {
                     "session_type": PomodoroSessionType.SHORT_BREAK.value,
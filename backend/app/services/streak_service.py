@@ -0,0 +1,80 @@
+from datetime import UTC, date, datetime
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from database.models.user_streak import StreakMetric
+from database.repositories.streak_repository import StreakRepository
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def get_daily_goals() -> Dict[StreakMetric, int]:
+    """Daily goal per streak metric, from app config."""
+    from config.config import get_config
+
+    config = get_config()
+    return {
+        StreakMetric.TASK_COMPLETION: 1,
+        StreakMetric.POMODORO_GOAL: config.DAILY_POMODORO_GOAL,
+        StreakMetric.FOCUS_GOAL: config.DAILY_FOCUS_GOAL_MINUTES,
+    }
+
+
+class StreakService:
+    """Service for daily streaks: task completion, Pomodoro goal and focus goal."""
+
+    def __init__(self, session: Session):
+        self.streak_repo = StreakRepository(session)
+
+    def _record(self, user_id: int, metric: StreakMetric, amount: int) -> None:
+        if amount <= 0:
+            return
+        day = datetime.now(UTC).date()
+        self.streak_repo.record(user_id, metric, day, amount, get_daily_goals()[metric])
+
+    def record_task_completed(self, user_id: int) -> None:
+        self._record(user_id, StreakMetric.TASK_COMPLETION, 1)
+
+    def record_pomodoro_completed(self, user_id: int, focus_seconds: int) -> None:
+        """Count a completed work session toward the Pomodoro and focus goals."""
+        self._record(user_id, StreakMetric.POMODORO_GOAL, 1)
+        self._record(user_id, StreakMetric.FOCUS_GOAL, focus_seconds // 60)
+
+    def record_focus_completed(self, user_id: int, focus_seconds: int) -> None:
+        self._record(user_id, StreakMetric.FOCUS_GOAL, focus_seconds // 60)
+
+    def get_current_streak(self, user_id: int, metric: StreakMetric) -> int:
+        streak = self.streak_repo.get_streak(user_id, metric)
+        return streak.current_as_of(datetime.now(UTC).date()) if streak else 0
+
+    def get_streaks(self, user_id: int) -> Tuple[bool, str, Dict[str, Dict[str, Any]]]:
+        """Get every streak of a user, with today's progress toward each goal."""
+        today = datetime.now(UTC).date()
+        goals = get_daily_goals()
+        stored = {streak.metric: streak for streak in self.streak_repo.get_streaks(user_id)}
+
+        streaks = {}
+        for metric, goal in goals.items():
+            if metric in stored:
+                data = stored[metric].to_dict(today)
+            else:
+                data = {
+                    "metric": metric.value,
+                    "current_streak": 0,
+                    "longest_streak": 0,
+                    "last_active_date": None,
+                    "active_today": False,
+                    "today_progress": 0,
+                }
+            data["daily_goal"] = goal
+            streaks[metric.value] = data
+        return True, "Streaks retrieved successfully", streaks
+
+    def backfill(self, user_id: Optional[int] = None, today: Optional[date] = None) -> Tuple[bool, str, int]:
+        """Rebuild streaks from task and session history."""
+        rows = self.streak_repo.backfill(
+            get_daily_goals(), today or datetime.now(UTC).date(), user_id
+        )
+        return True, f"Backfilled {rows} streaks", rows
@@ -2,6 +2,8 @@ from typing import List, Dict, Optional, Tuple, Any
 from sqlalchemy.orm import Session
 
 from app.services.task_service import TaskService
+from database.models.change_log import ChangeEntityType, ChangeOperation
+from database.repositories.change_log_repository import ChangeLogRepository
 from database.repositories.subtask_repository import SubtaskRepository
 from database.models.subtask import Subtask
 from database.repositories.task_repository import TaskRepository
@@ -11,6 +13,7 @@ class SubtaskService:
     def __init__(self, session: Session):
         self.subtask_repo = SubtaskRepository(session)
         self.task_repo = TaskRepository(session)
+        self.change_log_repo = ChangeLogRepository(session)
 
     def get_subtask_by_id(self, subtask_id: int) -> Subtask:
         return self.subtask_repo.get(subtask_id)
@@ -18,11 +21,8 @@ class SubtaskService:
     def get_subtasks_by_task_id(
         self, task_id: int, user_id: int
     ) -> Tuple[bool, str, List[Subtask]]:
-        task = self.task_repo.get_task_by_id(task_id)
-        if not task:
+        if not self.task_repo.is_owned_by(task_id, user_id):
             return False, "Task not found", []
-        if task.user_id != user_id:
-            return False, "You are not authorized to access this task", []
         return (
             True,
             "Fetched subtasks successfully",
@@ -32,25 +32,28 @@ class SubtaskService:
     def create_subtask(
         self, subtask: Subtask, user_id: int
     ) -> Tuple[bool, str, Optional[Subtask]]:
-        task = self.task_repo.get_task_by_id(subtask.task_id)
-        if not task:
+        if not self.task_repo.is_owned_by(subtask.task_id, user_id):
             return False, "Task not found", None
-        if task.user_id != user_id:
-            return False, "You are not authorized to access this task", None
+        created_subtask = self.subtask_repo.create_subtask(subtask)
+        # The parent task's serialized form carries its subtask counts
+        self.change_log_repo.record_changes(
+            user_id,
+            [
+                (ChangeEntityType.SUBTASK, created_subtask.id, ChangeOperation.UPSERT),
+                (ChangeEntityType.TASK, subtask.task_id, ChangeOperation.UPSERT),
+            ],
+        )
         return (
             True,
             "Subtask created successfully",
-            self.subtask_repo.create_subtask(subtask),
+            created_subtask,
         )
 
     def update_subtask(
         self, subtask: Subtask, user_id: int
     ) -> Tuple[bool, str, Optional[Subtask]]:
-        task = self.task_repo.get_task_by_id(subtask.task_id)
-        if not task:
+        if not self.task_repo.is_owned_by(subtask.task_id, user_id):
             return False, "Task not found", None
-        if task.user_id != user_id:
-            return False, "You are not authorized to access this task", None
 
         # Store original completion status to check if it changed
         original_subtask = self.subtask_repo.get(subtask.id)
@@ -59,6 +62,7 @@ class SubtaskService:
         )
 
         updated_subtask = self.subtask_repo.update_subtask(subtask)
+        self.change_log_repo.record_change(user_id, ChangeEntityType.SUBTASK, subtask.id)
 
         # If completion status changed, update parent task status
         if (
@@ -77,14 +81,20 @@ class SubtaskService:
         )
 
     def delete_subtask(self, subtask: Subtask, user_id: int) -> Tuple[bool, str]:
-        task = self.task_repo.get_task_by_id(subtask.task_id)
-        if not task:
+        if not self.task_repo.is_owned_by(subtask.task_id, user_id):
             return False, "Task not found"
-        if task.user_id != user_id:
-            return False, "You are not authorized to access this task"
 
         task_id = subtask.task_id
+        subtask_id = subtask.id
         result = self.subtask_repo.delete_subtask(subtask)
+        # The parent task's subtask counts change even when its status doesn't
+        self.change_log_repo.record_changes(
+            user_id,
+            [
+                (ChangeEntityType.SUBTASK, subtask_id, ChangeOperation.DELETE),
+                (ChangeEntityType.TASK, task_id, ChangeOperation.UPSERT),
+            ],
+        )
 
         task_service = TaskService(self.subtask_repo.session)
         task_service.update_task_status_based_on_subtasks(task_id)
@@ -94,27 +104,29 @@ class SubtaskService:
     def reorder_subtasks(
         self, user_id: int, task_id: int, subtask_positions: Dict[int, int]
     ) -> Tuple[bool, int]:
-        task = self.task_repo.get_task_by_id(task_id)
-        if not task:
+        # Ownership is part of each UPDATE; nothing updated means no such task
+        updated_ids = self.subtask_repo.reorder_subtasks(subtask_positions, user_id, task_id)
+        if not updated_ids:
             return False, 0
-        if task.user_id != user_id:
-            return False, 0
-        return self.subtask_repo.reorder_subtasks(subtask_positions)
+        self.change_log_repo.record_changes(
+            user_id,
+            [(ChangeEntityType.SUBTASK, subtask_id, ChangeOperation.UPSERT) for subtask_id in updated_ids],
+        )
+        return True, len(updated_ids)
 
     def bulk_toggle_completed(
         self, subtask_ids: List[int], task_id: int, completed: bool, user_id: int
     ) -> Tuple[bool, int]:
-        subtask = self.subtask_repo.get(subtask_ids[0])
-        if not subtask:
-            return False, 0
-        task = self.task_repo.get_task_by_id(subtask.task_id)
-        if not task or task.user_id != user_id:
-            return False, 0
-
-        if subtask.task_id != task_id:
+        # Only ids of this task's subtasks, and only if the user owns it, are updated
+        updated_ids = self.subtask_repo.bulk_toggle_completed(
+            subtask_ids, completed, user_id, task_id
+        )
+        if not updated_ids:
             return False, 0
-
-        result = self.subtask_repo.bulk_toggle_completed(subtask_ids, completed)
+        self.change_log_repo.record_changes(
+            user_id,
+            [(ChangeEntityType.SUBTASK, subtask_id, ChangeOperation.UPSERT) for subtask_id in updated_ids],
+        )
 
         # Update parent task status after bulk toggle
         from app.services.task_service import TaskService
@@ -122,28 +134,23 @@ class SubtaskService:
         task_service = TaskService(self.subtask_repo.session)
         task_service.update_task_status_based_on_subtasks(task_id)
 
-        return result
+        return True, len(updated_ids)
 
     def delete_subtasks_by_ids(
         self, subtask_ids: List[int], task_id: int, user_id: int
     ) -> Tuple[bool, int]:
-        subtask = self.subtask_repo.get(subtask_ids[0])
-        if not subtask:
+        deleted_ids = self.subtask_repo.delete_subtasks_by_ids(subtask_ids, user_id, task_id)
+        if not deleted_ids:
             return False, 0
-        if subtask.task_id != task_id:
-            return False, 0
-        task = self.task_repo.get_task_by_id(subtask.task_id)
-        if not task or task.user_id != user_id:
-            return False, 0
-        return self.subtask_repo.delete_subtasks_by_ids(subtask_ids)
+        changes = [(ChangeEntityType.SUBTASK, subtask_id, ChangeOperation.DELETE) for subtask_id in deleted_ids]
+        changes.append((ChangeEntityType.TASK, task_id, ChangeOperation.UPSERT))
+        self.change_log_repo.record_changes(user_id, changes)
+        return True, len(deleted_ids)
 
     def get_completion_count(
         self, task_id: int, user_id: int
     ) -> Tuple[bool, int, int, float]:
-        task = self.task_repo.get_task_by_id(task_id)
-        if not task:
-            return False, 0, 0, 0
-        if task.user_id != user_id:
+        if not self.task_repo.is_owned_by(task_id, user_id):
             return False, 0, 0, 0
 
         completed, total, completion_percentage = (
@@ -162,12 +169,12 @@ class SubtaskService:
         subtask = self.subtask_repo.get(subtask_id)
         if not subtask:
             return False, "Subtask not found", None
-        task = self.task_repo.get_task_by_id(subtask.task_id)
-        if not task or task.user_id != user_id:
+        if not self.task_repo.is_owned_by(subtask.task_id, user_id):
             return False, "You are not authorized to update this subtask", None
 
         subtask.is_completed = not subtask.is_completed
         updated_subtask = self.subtask_repo.update_subtask(subtask)
+        self.change_log_repo.record_change(user_id, ChangeEntityType.SUBTASK, subtask_id)
 
         # Update parent task status after toggle
         from app.services.task_service import TaskService
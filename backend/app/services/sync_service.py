@@ -0,0 +1,138 @@
+from typing import Any, Dict, List, Tuple
+
+from sqlalchemy.orm import Session, selectinload
+
+from app.schemas.group import GroupResponse
+from app.schemas.tag import TagResponse
+from database.models.change_log import ChangeEntityType, ChangeOperation
+from database.models.group import Group
+from database.models.subtask import Subtask
+from database.models.tag import Tag
+from database.models.task import Task
+from database.models.tasktag import TaskTag
+from database.repositories.change_log_repository import ChangeLogRepository
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+# Response key for each entity type
+ENTITY_KEYS = {
+    ChangeEntityType.TASK: "tasks",
+    ChangeEntityType.SUBTASK: "subtasks",
+    ChangeEntityType.TAG: "tags",
+    ChangeEntityType.GROUP: "groups",
+}
+
+
+class SyncService:
+    """Service for delta sync of tasks, subtasks, tags and groups."""
+
+    def __init__(self, session: Session):
+        self.session = session
+        self.change_log_repo = ChangeLogRepository(session)
+
+    def get_changes(
+        self, user_id: int, since: int, limit: int
+    ) -> Tuple[bool, str, Dict[str, Any]]:
+        """
+        Get what changed for a user after sequence number `since`.
+
+        Each entity appears at most once per page: as its current state if it
+        still exists, otherwise as a deleted id. When the cursor is older
+        than the user's floor (tombstones were purged) or newer than their
+        last sequence, `full_resync` is set and the client should refetch
+        everything and continue from the returned `seq`.
+        """
+        if since < 0:
+            return False, "since must be a non-negative sequence number", {}
+
+        state = self.change_log_repo.get_state(user_id)
+        last_seq = state.last_seq if state else 0
+        floor_seq = state.floor_seq if state else 0
+
+        if since < floor_seq or since > last_seq:
+            return True, "Full resync required", {
+                "seq": last_seq,
+                "has_more": False,
+                "full_resync": True,
+                "changes": self._empty_changes(),
+            }
+
+        entries = self.change_log_repo.get_changes_since(user_id, since, limit + 1)
+        has_more = len(entries) > limit
+        entries = entries[:limit]
+
+        latest: Dict[ChangeEntityType, Dict[int, ChangeOperation]] = {
+            entity_type: {} for entity_type in ENTITY_KEYS
+        }
+        for entry in entries:
+            latest[entry.entity_type][entry.entity_id] = entry.operation
+
+        changes = self._empty_changes()
+        for entity_type, operations in latest.items():
+            upsert_ids = [
+                entity_id
+                for entity_id, operation in operations.items()
+                if operation == ChangeOperation.UPSERT
+            ]
+            loaded = self._load(entity_type, user_id, upsert_ids)
+            bucket = changes[ENTITY_KEYS[entity_type]]
+            bucket["upserted"] = [loaded[entity_id] for entity_id in upsert_ids if entity_id in loaded]
+            # An upserted entity that no longer exists was deleted after this page
+            bucket["deleted"] = sorted(
+                entity_id for entity_id in operations if entity_id not in loaded
+            )
+
+        return True, "Changes fetched successfully", {
+            "seq": entries[-1].seq if entries else last_seq,
+            "has_more": has_more,
+            "full_resync": False,
+            "changes": changes,
+        }
+
+    @staticmethod
+    def _empty_changes() -> Dict[str, Dict[str, List]]:
+        return {key: {"upserted": [], "deleted": []} for key in ENTITY_KEYS.values()}
+
+    def _load(
+        self, entity_type: ChangeEntityType, user_id: int, ids: List[int]
+    ) -> Dict[int, Dict[str, Any]]:
+        """Serialize the user's current entities of one type, by id, in one query."""
+        if not ids:
+            return {}
+
+        if entity_type == ChangeEntityType.TASK:
+            rows = (
+                self.session.query(Task)
+                .options(
+                    selectinload(Task.subtasks),
+                    selectinload(Task.tags).joinedload(TaskTag.tag),
+                )
+                .filter(Task.id.in_(ids), Task.user_id == user_id)
+                .all()
+            )
+            return {task.id: task.to_dict() for task in rows}
+
+        if entity_type == ChangeEntityType.SUBTASK:
+            rows = (
+                self.session.query(Subtask)
+                .join(Task, Subtask.task_id == Task.id)
+                .filter(Subtask.id.in_(ids), Task.user_id == user_id)
+                .all()
+            )
+            return {subtask.id: subtask.to_dict() for subtask in rows}
+
+        if entity_type == ChangeEntityType.TAG:
+            rows = (
+                self.session.query(Tag)
+                .filter(Tag.id.in_(ids), Tag.user_id == user_id)
+                .all()
+            )
+            return {tag.id: TagResponse.model_validate(tag).model_dump() for tag in rows}
+
+        rows = (
+            self.session.query(Group)
+            .filter(Group.id.in_(ids), Group.user_id == user_id)
+            .all()
+        )
+        return {group.id: GroupResponse.model_validate(group).model_dump() for group in rows}
@@ -1,15 +1,57 @@
-from typing import List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 from sqlalchemy.orm import Session
 
+from app.utils.cache import TTLCache
+from database.models.change_log import ChangeEntityType, ChangeOperation
+from database.repositories.change_log_repository import ChangeLogRepository
 from database.repositories.tag_repository import TagRepository
 from database.models.tag import Tag
 
 from app.schemas.tag import TagCreateRequest, TagUpdateRequest
 
+# user_id -> {tag name: tag id}
+_tag_name_cache: Optional[TTLCache] = None
+
+
+def get_tag_name_cache() -> TTLCache:
+    """Get the process-wide tag name cache configured from app config."""
+    global _tag_name_cache
+    if _tag_name_cache is None:
+        from config.config import get_config
+
+        config = get_config()
+        _tag_name_cache = TTLCache(
+            maxsize=config.TAG_NAME_CACHE_SIZE,
+            ttl=config.TAG_NAME_CACHE_SECONDS,
+        )
+    return _tag_name_cache
+
 
 class TagService:
     def __init__(self, session: Session):
         self.tag_repository = TagRepository(session)
+        self.change_log_repo = ChangeLogRepository(session)
+
+    def resolve_tag_names(self, user_id: int, names: Iterable[str]) -> Dict[str, int]:
+        """
+        Look up the ids of a user's tags by name; unknown names are left out.
+
+        Served from the tag name cache. A name missing from a cached map
+        triggers one reload, so tags created through another process are
+        found straight away.
+        """
+        names = set(names)
+        if not names:
+            return {}
+
+        cache = get_tag_name_cache()
+        tag_ids = cache.get_or_load(
+            user_id, lambda: self.tag_repository.get_tag_ids_by_name(user_id)
+        )
+        if not names <= tag_ids.keys():
+            tag_ids = self.tag_repository.get_tag_ids_by_name(user_id)
+            cache.set(user_id, tag_ids)
+        return {name: tag_ids[name] for name in names if name in tag_ids}
 
     def get_all_tags_for_user(self, user_id: int) -> Tuple[bool, str, List[Tag]]:
         tags = self.tag_repository.get_all_tags_for_user(user_id)
@@ -20,6 +62,10 @@ class TagService:
         tag_data["user_id"] = tag_create_request.user_id
         tag = Tag(**tag_data)
         created_tag = self.tag_repository.create_tag(tag)
+        self.change_log_repo.record_change(
+            created_tag.user_id, ChangeEntityType.TAG, created_tag.id
+        )
+        get_tag_name_cache().delete(created_tag.user_id)
         return True, "Tag created successfully", created_tag
 
     def update_tag(
@@ -41,6 +87,10 @@ class TagService:
                 setattr(existing_tag, key, value)
 
         updated_tag = self.tag_repository.update_tag(existing_tag)
+        self.change_log_repo.record_change(
+            existing_tag.user_id, ChangeEntityType.TAG, existing_tag.id
+        )
+        get_tag_name_cache().delete(existing_tag.user_id)
         return True, "Tag updated successfully", updated_tag
 
     def delete_tag(self, tag_id: int) -> Tuple[bool, str]:
@@ -52,4 +102,8 @@ class TagService:
             return False, "Tag not found"
 
         self.tag_repository.delete_tag(existing_tag)
+        self.change_log_repo.record_change(
+            existing_tag.user_id, ChangeEntityType.TAG, tag_id, ChangeOperation.DELETE
+        )
+        get_tag_name_cache().delete(existing_tag.user_id)
         return True, "Tag deleted successfully"
@@ -0,0 +1,91 @@
+from datetime import UTC, datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from database.models.change_log import ChangeEntityType, ChangeOperation
+from database.models.task import TaskStatus
+from database.repositories.change_log_repository import ChangeLogRepository
+from database.repositories.task_archive_repository import MovedTask, TaskArchiveRepository
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class TaskArchiveService:
+    """Service for moving finished tasks to and from the cold archive."""
+
+    def __init__(self, session: Session):
+        self.session = session
+        self.archive_repo = TaskArchiveRepository(session)
+        self.change_log_repo = ChangeLogRepository(session)
+
+    def _record(self, moved: List[MovedTask], operation: ChangeOperation) -> None:
+        """Tell synced clients the moved tasks and subtasks appeared or went away."""
+        changes_by_user: Dict[int, list] = {}
+        for user_id, task_id, subtask_ids in moved:
+            changes = changes_by_user.setdefault(user_id, [])
+            changes.extend(
+                (ChangeEntityType.SUBTASK, subtask_id, operation) for subtask_id in subtask_ids
+            )
+            changes.append((ChangeEntityType.TASK, task_id, operation))
+        for user_id, changes in changes_by_user.items():
+            self.change_log_repo.record_changes(user_id, changes)
+
+    def archive_batch(
+        self, older_than_days: int, batch_size: int, user_id: Optional[int] = None
+    ) -> Tuple[bool, str, int]:
+        """
+        Archive one batch of finished tasks untouched for `older_than_days`.
+
+        Commit after each batch and call again until it returns 0.
+        """
+        if older_than_days < 1:
+            return False, "older_than_days must be at least 1", 0
+
+        before = datetime.now(UTC) - timedelta(days=older_than_days)
+        task_ids = self.archive_repo.get_archivable_task_ids(before, batch_size, user_id)
+        moved = self.archive_repo.archive_tasks(task_ids)
+        self._record(moved, ChangeOperation.DELETE)
+        return True, f"Archived {len(moved)} tasks", len(moved)
+
+    def search_archive(
+        self,
+        user_id: int,
+        search: Optional[str] = None,
+        statuses: Optional[List[TaskStatus]] = None,
+        archived_from: Optional[datetime] = None,
+        archived_to: Optional[datetime] = None,
+        page: int = 1,
+        page_size: int = 25,
+    ) -> Tuple[bool, str, Dict[str, Any]]:
+        """Search a user's archived tasks."""
+        result = self.archive_repo.search(
+            user_id, search, statuses, archived_from, archived_to, page, page_size
+        )
+        return True, "Archived tasks retrieved successfully", result
+
+    def get_archived_task(
+        self, user_id: int, task_id: int
+    ) -> Tuple[bool, str, Optional[Dict[str, Any]]]:
+        """Get an archived task with its subtasks and tags."""
+        task = self.archive_repo.get_archived_task(user_id, task_id)
+        if not task:
+            return False, "Archived task not found", None
+
+        data = task.to_dict()
+        data["subtasks"] = [s.to_dict() for s in self.archive_repo.get_archived_subtasks(task_id)]
+        data["tags"] = [
+            {"id": tag.id, "name": tag.name, "color": tag.color}
+            for tag in self.archive_repo.get_archived_tags(task_id)
+        ]
+        return True, "Archived task retrieved successfully", data
+
+    def restore_task(self, user_id: int, task_id: int) -> Tuple[bool, str]:
+        """Move an archived task back to the user's task list."""
+        moved = self.archive_repo.restore_tasks(user_id, [task_id])
+        if not moved:
+            return False, "Archived task not found"
+
+        self._record(moved, ChangeOperation.UPSERT)
+        return True, "Task restored successfully"
@@ -3,14 +3,36 @@ from logger import get_logger
 from typing import Any, Dict, List, Optional, Tuple
 
 from app.schemas.task import TaskCreateRequest, TaskUpdateRequest
+from app.services.streak_service import StreakService
+from app.services.tag_service import TagService
+from app.utils.cache import TTLCache
+from database.models.change_log import ChangeEntityType, ChangeOperation
 from database.models.task import Task, TaskPriority, TaskStatus
 from database.models.tasktag import TaskTag
-from database.repositories.task_repository import TaskRepository
+from database.repositories.task_repository import TagFilter, TaskRepository
 from database.repositories.subtask_repository import SubtaskRepository
+from database.repositories.change_log_repository import ChangeLogRepository
 from sqlalchemy.orm import Session
 
 logger = get_logger(__name__)
 
+# (user_id, change sequence, day) -> sidebar counters
+_task_counters_cache: Optional[TTLCache] = None
+
+
+def get_task_counters_cache() -> TTLCache:
+    """Get the process-wide task counters cache configured from app config."""
+    global _task_counters_cache
+    if _task_counters_cache is None:
+        from config.config import get_config
+
+        config = get_config()
+        _task_counters_cache = TTLCache(
+            maxsize=config.TASK_COUNTERS_CACHE_SIZE,
+            ttl=config.TASK_COUNTERS_CACHE_SECONDS,
+        )
+    return _task_counters_cache
+
 
 class TaskService:
     """Service for task management."""
@@ -19,10 +41,60 @@ class TaskService:
         """Initialize the service with the Task model."""
         self.task_repo = TaskRepository(session)
         self.subtask_repo = SubtaskRepository(session)
-
-    def get_all_tasks_for_user(self, user_id: int, **kwargs) -> Dict[str, Any]:
+        self.change_log_repo = ChangeLogRepository(session)
+        self.tag_service = TagService(session)
+        self.streak_service = StreakService(session)
+
+    def build_tag_filter(
+        self,
+        user_id: int,
+        all_of: Optional[List[str]] = None,
+        any_of: Optional[List[str]] = None,
+        none_of: Optional[List[str]] = None,
+    ) -> TagFilter:
+        """Resolve tag names into a TagFilter of the user's tag ids."""
+        all_of, any_of, none_of = all_of or [], any_of or [], none_of or []
+        tag_ids = self.tag_service.resolve_tag_names(user_id, [*all_of, *any_of, *none_of])
+
+        tag_filter = TagFilter(
+            all_of=[tag_ids[name] for name in all_of if name in tag_ids],
+            any_of=[tag_ids[name] for name in any_of if name in tag_ids],
+            none_of=[tag_ids[name] for name in none_of if name in tag_ids],
+        )
+        # A task can't carry a tag that doesn't exist
+        if len(tag_filter.all_of) < len(set(all_of)) or (any_of and not tag_filter.any_of):
+            tag_filter.matches_nothing = True
+        return tag_filter
+
+    def get_all_tasks_for_user(
+        self, user_id: int, filters: Optional[Dict[str, Any]] = None, **kwargs
+    ) -> Dict[str, Any]:
         """Get all tasks for a user."""
-        return self.task_repo.get_all_tasks_for_user(user_id, **kwargs)
+        if filters and any(filters.get(key) for key in ("tags", "tags_any", "tags_none")):
+            filters = dict(filters)
+            filters["tag_filter"] = self.build_tag_filter(
+                user_id,
+                all_of=filters.pop("tags", None),
+                any_of=filters.pop("tags_any", None),
+                none_of=filters.pop("tags_none", None),
+            )
+        return self.task_repo.get_all_tasks_for_user(user_id, filters, **kwargs)
+
+    def get_task_counters(self, user_id: int) -> Dict[str, Any]:
+        """
+        Get counts for the sidebar views, each group and each tag.
+
+        Cached under the user's change log sequence: any task, tag or group
+        change bumps it, so a cached entry is never stale. The day is part of
+        the key because Today and Overdue move at midnight (UTC).
+        """
+        state = self.change_log_repo.get_state(user_id)
+        seq = state.last_seq if state else 0
+        today = datetime.now(UTC).date()
+        counters = get_task_counters_cache().get_or_load(
+            (user_id, seq, today), lambda: self.task_repo.get_counters(user_id, today)
+        )
+        return {"seq": seq, "date": today.isoformat(), **counters}
 
     def get_today_tasks(self, user_id: int) -> List[Task]:
         """Get all tasks for a user."""
@@ -50,9 +122,15 @@ class TaskService:
         """Get all tasks for a user by status."""
         return self.task_repo.get_tasks_by_statuses(user_id, status_list)
 
-    def get_tasks_by_tags(self, user_id: int, tags_list: List[str]) -> List[Task]:
-        """Get all tasks for a user by tag."""
-        return self.task_repo.get_tasks_by_tags(user_id, tags_list)
+    def get_tasks_by_tags(
+        self, user_id: int, tags_list: List[str], match: str = "all"
+    ) -> List[Task]:
+        """Get a user's tasks having all (or, with match="any", some) of the tags."""
+        if match == "any":
+            tag_filter = self.build_tag_filter(user_id, any_of=tags_list)
+        else:
+            tag_filter = self.build_tag_filter(user_id, all_of=tags_list)
+        return self.task_repo.get_tasks_by_tags(user_id, tag_filter)
 
     def get_tasks_by_group(self, user_id: int, group_id: int) -> List[Task]:
         """Get all tasks for a user by group."""
@@ -75,7 +153,7 @@ class TaskService:
 
         task = Task(**task_data)
 
-        logger.info(f"Task: {task}")
+        logger.debug(f"Task: {task}")
 
         # Create the task first
         task = self.task_repo.create_task(task)
@@ -86,6 +164,7 @@ class TaskService:
                 task_tag = TaskTag(task_id=task.id, tag_id=tag_id)
                 self.task_repo.session.add(task_tag)
 
+        self.change_log_repo.record_change(task.user_id, ChangeEntityType.TASK, task.id)
         return True, "Task created successfully", task
 
     def update_task(
@@ -100,6 +179,7 @@ class TaskService:
             return False, "You are not authorized to update this task", None
 
         task_data = task_update_request.model_dump(exclude_unset=True)
+        was_completed = task.status == TaskStatus.COMPLETED
 
         # Extract tag_ids before updating the task
         tag_ids = task_data.pop("tag_ids", None)
@@ -132,6 +212,9 @@ class TaskService:
                 self.task_repo.session.add(task_tag)
 
         updated_task = self.task_repo.update_task(task)
+        if not was_completed and updated_task.status == TaskStatus.COMPLETED:
+            self.streak_service.record_task_completed(user_id)
+        self.change_log_repo.record_change(user_id, ChangeEntityType.TASK, task_id)
         return True, "Task updated successfully", updated_task
 
     def delete_task(self, task_id: int, user_id: int) -> Tuple[bool, str]:
@@ -142,9 +225,15 @@ class TaskService:
         if task.user_id != user_id:
             return False, "You are not authorized to delete this task"
 
+        # Subtasks go with the task, so clients get tombstones for them too
+        changes = [
+            (ChangeEntityType.SUBTASK, subtask.id, ChangeOperation.DELETE)
+            for subtask in task.subtasks
+        ]
+        changes.append((ChangeEntityType.TASK, task_id, ChangeOperation.DELETE))
+
         self.task_repo.delete_task(task)
-        # Explicitly commit the transaction
-        self.task_repo.session.commit()
+        self.change_log_repo.record_changes(user_id, changes)
         return True, "Task deleted successfully"
 
     def toggle_task_completion(
@@ -171,6 +260,9 @@ class TaskService:
 
         # Toggle all subtasks to match parent task completion status
         self.toggle_all_subtasks_completion(task_id, not was_completed)
+        if not was_completed:
+            self.streak_service.record_task_completed(user_id)
+        self.change_log_repo.record_change(user_id, ChangeEntityType.TASK, task_id)
 
         return True, "Task completion toggled successfully", updated_task
 
@@ -187,11 +279,13 @@ class TaskService:
 
         task.starred = not task.starred
         updated_task = self.task_repo.update_task(task)
+        self.change_log_repo.record_change(user_id, ChangeEntityType.TASK, task_id)
         return True, "Task star toggled successfully", updated_task
 
     def update_task_status_based_on_subtasks(self, task_id: int) -> None:
         """Update task status based on subtask completion."""
-        task = self.task_repo.get_task_by_id(task_id)
+        # Plain primary-key load; the status update needs no tags or subtasks
+        task = self.task_repo.get(task_id)
         if not task:
             return
 
@@ -218,6 +312,7 @@ class TaskService:
             if task.status != TaskStatus.COMPLETED:
                 task.status = TaskStatus.COMPLETED
                 task.completed_at = datetime.now(UTC)
+                self.streak_service.record_task_completed(task.user_id)
         else:
             # Some subtasks completed, mark as in-progress
             if task.status not in [TaskStatus.COMPLETED, TaskStatus.IN_PROGRESS]:
@@ -226,6 +321,7 @@ class TaskService:
 
         # Save the updated task
         self.task_repo.update_task(task)
+        self.change_log_repo.record_change(task.user_id, ChangeEntityType.TASK, task_id)
 
     def toggle_all_subtasks_completion(self, task_id: int, completed: bool) -> None:
         """Toggle all subtasks completion status when parent task is toggled."""
@@ -233,7 +329,16 @@ class TaskService:
         subtasks = self.subtask_repo.get_subtasks_by_task_id(task_id)
 
         # Update all subtasks to match parent task completion status
+        changed_ids = []
         for subtask in subtasks:
             if subtask.is_completed != completed:
                 subtask.is_completed = completed
                 self.subtask_repo.update_subtask(subtask)
+                changed_ids.append(subtask.id)
+
+        if changed_ids:
+            task = self.task_repo.get(task_id)
+            self.change_log_repo.record_changes(
+                task.user_id,
+                [(ChangeEntityType.SUBTASK, subtask_id, ChangeOperation.UPSERT) for subtask_id in changed_ids],
+            )
@@ -0,0 +1,116 @@
+"""
+In-process dispatch of batched API requests.
+
+A batch request is authenticated once; its sub-requests are then run
+through the normal Flask dispatch (routing, decorators, error handlers)
+with the caller's cookies and headers. While a batch is running its
+token is remembered so the blocklist check is not repeated for every
+sub-request.
+"""
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+
+from flask import current_app, request
+from werkzeug.test import EnvironBuilder
+
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+# Outer request headers forwarded to every sub-request
+FORWARDED_HEADERS = (
+    "Cookie",
+    "Authorization",
+    "X-CSRF-TOKEN",
+    "X-Forwarded-For",
+    "User-Agent",
+    "Accept-Language",
+)
+
+# Paths that can't be batched: the batch endpoint itself, auth routes, whose
+# Set-Cookie headers would never reach the client, and the event stream
+EXCLUDED_PREFIXES = ("/api/batch", "/api/auth", "/api/events")
+
+
+@dataclass(frozen=True)
+class BatchContext:
+    user_id: int
+    jti: str
+
+
+_current_batch: ContextVar[Optional[BatchContext]] = ContextVar("current_batch", default=None)
+
+
+def get_current_batch() -> Optional[BatchContext]:
+    """Get the batch being dispatched, if any."""
+    return _current_batch.get()
+
+
+def is_verified_batch_token(jwt_payload: dict) -> bool:
+    """True if the token was already checked by the enclosing batch request."""
+    batch = _current_batch.get()
+    return batch is not None and batch.jti == jwt_payload.get("jti")
+
+
+def start_batch(context: BatchContext):
+    """Mark a batch as running; pass the result to end_batch()."""
+    return _current_batch.set(context)
+
+
+def end_batch(token) -> None:
+    _current_batch.reset(token)
+
+
+def validate_path(path: str) -> Optional[str]:
+    """Return an error message if the path can't be batched."""
+    parts = urlsplit(path)
+    if parts.scheme or parts.netloc or not parts.path.startswith("/api/"):
+        return "Path must be an /api/ path on this server"
+    if parts.path.startswith(EXCLUDED_PREFIXES):
+        return f"{parts.path} can't be called from a batch"
+    return None
+
+
+def dispatch(method: str, path: str, query: Optional[Dict[str, Any]], body: Any) -> Dict[str, Any]:
+    """
+    Run one sub-request and return its status, body and duration.
+
+    Exceptions are turned into a 500 result so one failing sub-request
+    never aborts the others.
+    """
+    app = current_app._get_current_object()
+    parts = urlsplit(path)
+    headers = {name: request.headers[name] for name in FORWARDED_HEADERS if name in request.headers}
+
+    builder = EnvironBuilder(
+        path=parts.path,
+        method=method,
+        query_string=query if query else parts.query,
+        json=body if body is not None and method != "GET" else None,
+        headers=headers,
+        environ_base={"REMOTE_ADDR": request.remote_addr},
+    )
+    started = time.perf_counter()
+    try:
+        with app.request_context(builder.get_environ()):
+            response = app.full_dispatch_request()
+            if response.mimetype == "text/event-stream":
+                status, data = 400, {"error": "Streaming responses can't be batched"}
+            elif response.is_json:
+                status, data = response.status_code, response.get_json(silent=True)
+            else:
+                status, data = response.status_code, response.get_data(as_text=True)
+    except Exception as e:
+        logger.exception(f"Batch sub-request {method} {path} failed")
+        status, data = 500, {"error": str(e)}
+    finally:
+        builder.close()
+
+    return {
+        "status": status,
+        "body": data,
+        "duration_ms": round((time.perf_counter() - started) * 1000, 2),
+    }
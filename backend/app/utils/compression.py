@@ -0,0 +1,201 @@
+"""
+Response compression negotiated from ``Accept-Encoding``.
+
+gzip is always available; brotli (``br``) and zstandard (``zstd``) are used
+when the ``brotli`` / ``zstandard`` packages are installed. Small responses
+are sent as-is, since compressing them costs more CPU than the bytes saved.
+Streamed responses are compressed chunk by chunk and flushed after each
+chunk, so server-sent events still arrive as they are produced.
+"""
+import zlib
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+from flask import request
+
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+try:
+    import brotli
+except ImportError:  # optional dependency
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # optional dependency
+    zstandard = None
+
+
+class GzipEncoder:
+    def __init__(self, level: int):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        """Emit everything compressed so far without ending the stream."""
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class BrotliEncoder:
+    def __init__(self, level: int):
+        self._compressor = brotli.Compressor(quality=level)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class ZstdEncoder:
+    def __init__(self, level: int):
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_FINISH)
+
+
+def _installed_encoders() -> Dict[str, Callable]:
+    encoders = {"gzip": GzipEncoder}
+    if brotli is not None:
+        encoders["br"] = BrotliEncoder
+    if zstandard is not None:
+        encoders["zstd"] = ZstdEncoder
+    return encoders
+
+
+ENCODERS = _installed_encoders()
+
+
+def parse_accept_encoding(header: Optional[str]) -> Dict[str, float]:
+    """Map each coding in an Accept-Encoding header to its q-value."""
+    weights: Dict[str, float] = {}
+    for part in (header or "").split(","):
+        coding, _, params = part.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        weights[coding] = q
+    return weights
+
+
+def negotiate(header: Optional[str], preferred: List[str]) -> Optional[str]:
+    """
+    Pick a content coding for an Accept-Encoding header.
+
+    Codings the client rates highest win; ties go to the earliest entry of
+    `preferred`. Returns None when the response should not be compressed.
+    """
+    weights = parse_accept_encoding(header)
+    best, best_q = None, 0.0
+    for coding in preferred:
+        q = weights.get(coding, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = coding, q
+    return best
+
+
+def compress_stream(chunks: Iterable[bytes], encoder) -> Iterator[bytes]:
+    """Compress an iterable of chunks, flushing after each one."""
+    for chunk in chunks:
+        if isinstance(chunk, str):
+            chunk = chunk.encode("utf-8")
+        data = encoder.compress(chunk) + encoder.flush()
+        if data:
+            yield data
+    yield encoder.finish()
+
+
+class ResponseCompressor:
+    """after_request hook that compresses eligible responses."""
+
+    def __init__(
+        self,
+        algorithms: List[str],
+        levels: Dict[str, int],
+        min_size: int,
+        mimetypes: List[str],
+    ):
+        missing = [name for name in algorithms if name not in ENCODERS]
+        if missing:
+            logger.info(f"Compression codings not installed, skipping: {', '.join(missing)}")
+        self.algorithms = [name for name in algorithms if name in ENCODERS]
+        self.levels = levels
+        self.min_size = min_size
+        self.mimetypes = set(mimetypes)
+
+    def new_encoder(self, coding: str):
+        return ENCODERS[coding](self.levels[coding])
+
+    def __call__(self, response):
+        if response.mimetype not in self.mimetypes:
+            return response
+        response.vary.add("Accept-Encoding")
+
+        if (
+            request.method == "HEAD"
+            or response.status_code < 200
+            or response.status_code in (204, 206, 304)
+            or "Content-Encoding" in response.headers
+            or response.direct_passthrough
+        ):
+            return response
+
+        coding = negotiate(request.headers.get("Accept-Encoding"), self.algorithms)
+        if coding is None:
+            return response
+
+        encoder = self.new_encoder(coding)
+        if response.is_streamed:
+            response.response = compress_stream(response.response, encoder)
+            response.headers.pop("Content-Length", None)
+        else:
+            data = response.get_data()
+            if len(data) < self.min_size:
+                return response
+            response.set_data(encoder.compress(data) + encoder.finish())
+
+        response.headers["Content-Encoding"] = coding
+        etag = response.headers.get("ETag")
+        if etag and not etag.startswith("W/"):
+            response.headers["ETag"] = f"W/{etag}"
+        return response
+
+
+def init_app(app) -> None:
+    """Compress responses per the COMPRESS_* settings."""
+    if not app.config.get("COMPRESS_ENABLED", True):
+        logger.info("Response compression disabled")
+        return
+
+    compressor = ResponseCompressor(
+        algorithms=app.config.get("COMPRESS_ALGORITHMS", ["zstd", "br", "gzip"]),
+        levels=app.config.get("COMPRESS_LEVELS", {"gzip": 6, "br": 4, "zstd": 3}),
+        min_size=app.config.get("COMPRESS_MIN_SIZE", 1024),
+        mimetypes=app.config.get("COMPRESS_MIMETYPES", ["application/json"]),
+    )
+    app.after_request(compressor)
+    logger.info(f"Response compression enabled: {', '.join(compressor.algorithms)}")
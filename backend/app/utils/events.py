@@ -0,0 +1,290 @@
+"""
+In-process event dispatch.
+
+Background jobs (the due-date reminder scheduler, for one) publish ``Event``
+objects to the process-wide ``EventDispatcher``. Events are queued and handed
+to each sink from a single delivery thread, so a slow webhook never holds up
+the producer. Sinks:
+
+- ``SSESink``: per-user queues read by ``GET /api/events/stream``
+- ``WebhookSink``: POSTs each event as JSON, signed with HMAC-SHA256 when a
+  secret is set
+- ``LocalSink``: keeps events in a list, a stand-in for tests
+
+Which sinks are active comes from ``EVENT_SINKS``.
+"""
+import hashlib
+import hmac
+import json
+import os
+import queue
+import threading
+import urllib.request
+import uuid
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any, Dict, List, Optional
+
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class Event:
+    """Something that happened to one user's data."""
+
+    type: str
+    user_id: int
+    data: Dict[str, Any]
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "type": self.type,
+            "user_id": self.user_id,
+            "data": self.data,
+            "created_at": self.created_at.isoformat(),
+        }
+
+
+class EventSink:
+    """Receives every dispatched event."""
+
+    def send(self, event: Event) -> None:
+        raise NotImplementedError
+
+
+class LocalSink(EventSink):
+    """Keeps delivered events in memory."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._events: List[Event] = []
+
+    def send(self, event: Event) -> None:
+        with self._lock:
+            self._events.append(event)
+
+    @property
+    def events(self) -> List[Event]:
+        with self._lock:
+            return list(self._events)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._events.clear()
+
+
+class SSESink(EventSink):
+    """
+    Fans events out to the open event streams of their user.
+
+    Each open stream holds a server thread for as long as it is open, so
+    `max_subscribers` caps the streams per process.
+    """
+
+    def __init__(self, max_queue: int = 100, max_subscribers: Optional[int] = None):
+        self.max_queue = max_queue
+        self.max_subscribers = max_subscribers
+        self._lock = threading.Lock()
+        self._subscribers: Dict[int, List[queue.Queue]] = {}
+        self.dropped = 0
+
+    def has_capacity(self) -> bool:
+        return self.max_subscribers is None or self.subscriber_count < self.max_subscribers
+
+    def subscribe(self, user_id: int) -> Optional[queue.Queue]:
+        """Open a stream queue for a user, or return None when at max_subscribers."""
+        subscriber = queue.Queue(maxsize=self.max_queue)
+        with self._lock:
+            count = sum(len(subscribers) for subscribers in self._subscribers.values())
+            if self.max_subscribers is not None and count >= self.max_subscribers:
+                return None
+            self._subscribers.setdefault(user_id, []).append(subscriber)
+        return subscriber
+
+    def unsubscribe(self, user_id: int, subscriber: queue.Queue) -> None:
+        with self._lock:
+            subscribers = self._subscribers.get(user_id, [])
+            if subscriber in subscribers:
+                subscribers.remove(subscriber)
+            if not subscribers:
+                self._subscribers.pop(user_id, None)
+
+    def send(self, event: Event) -> None:
+        with self._lock:
+            subscribers = list(self._subscribers.get(event.user_id, []))
+        for subscriber in subscribers:
+            try:
+                subscriber.put_nowait(event)
+            except queue.Full:
+                # A stalled client loses events rather than growing without bound
+                self.dropped += 1
+
+    @property
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return sum(len(subscribers) for subscribers in self._subscribers.values())
+
+
+class WebhookSink(EventSink):
+    """POSTs events as JSON to a URL."""
+
+    def __init__(self, url: str, secret: Optional[str] = None, timeout: float = 5.0):
+        self.url = url
+        self.secret = secret
+        self.timeout = timeout
+
+    def send(self, event: Event) -> None:
+        body = json.dumps(event.to_dict()).encode("utf-8")
+        headers = {"Content-Type": "application/json", "X-FlowDo-Event": event.type}
+        if self.secret:
+            digest = hmac.new(self.secret.encode("utf-8"), body, hashlib.sha256).hexdigest()
+            headers["X-FlowDo-Signature"] = f"sha256={digest}"
+        request = urllib.request.Request(self.url, data=body, headers=headers, method="POST")
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            response.read()
+
+
+class EventDispatcher:
+    """Bounded queue of events delivered to every sink by a background thread."""
+
+    def __init__(self, max_queue: int = 1000):
+        self.max_queue = max_queue
+        self.sinks: Dict[str, EventSink] = {}
+
+        self._queue: Optional[queue.Queue] = None
+        self._thread: Optional[threading.Thread] = None
+        self._thread_pid: Optional[int] = None
+        self._lock = threading.Lock()
+
+        # Metrics
+        self._dispatched = 0
+        self._dropped = 0
+        self._delivered: Dict[str, int] = {}
+        self._failed: Dict[str, int] = {}
+
+    def add_sink(self, name: str, sink: EventSink) -> None:
+        self.sinks[name] = sink
+        self._delivered.setdefault(name, 0)
+        self._failed.setdefault(name, 0)
+
+    def _get_queue(self) -> queue.Queue:
+        """Start the delivery thread lazily, and again in each forked worker process."""
+        pid = os.getpid()
+        if self._thread is None or self._thread_pid != pid:
+            with self._lock:
+                if self._thread is None or self._thread_pid != pid:
+                    self._queue = queue.Queue(maxsize=self.max_queue)
+                    self._thread = threading.Thread(
+                        target=self._deliver_forever,
+                        args=(self._queue,),
+                        name="event-dispatcher",
+                        daemon=True,
+                    )
+                    self._thread.start()
+                    self._thread_pid = pid
+        return self._queue
+
+    def _deliver_forever(self, events: queue.Queue) -> None:
+        while True:
+            event = events.get()
+            try:
+                self._deliver(event)
+            finally:
+                events.task_done()
+
+    def _deliver(self, event: Event) -> None:
+        for name, sink in list(self.sinks.items()):
+            try:
+                sink.send(event)
+            except Exception as e:
+                with self._lock:
+                    self._failed[name] += 1
+                logger.warning(f"Event sink {name} failed for {event.type} {event.id}: {e}")
+            else:
+                with self._lock:
+                    self._delivered[name] += 1
+
+    def dispatch(self, event: Event) -> bool:
+        """Queue an event for delivery; returns False if the queue is full."""
+        try:
+            self._get_queue().put_nowait(event)
+        except queue.Full:
+            with self._lock:
+                self._dropped += 1
+            logger.warning(f"Event queue full, dropped {event.type} for user {event.user_id}")
+            return False
+        with self._lock:
+            self._dispatched += 1
+        return True
+
+    def flush(self) -> None:
+        """Wait until every queued event has been delivered."""
+        if self._queue is not None and self._thread_pid == os.getpid():
+            self._queue.join()
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Report queue depth and per-sink delivery counters."""
+        with self._lock:
+            metrics = {
+                "sinks": list(self.sinks),
+                "queue_depth": self._queue.qsize() if self._queue is not None else 0,
+                "max_queue": self.max_queue,
+                "dispatched": self._dispatched,
+                "dropped": self._dropped,
+                "delivered": dict(self._delivered),
+                "failed": dict(self._failed),
+            }
+        sse = self.sinks.get("sse")
+        if isinstance(sse, SSESink):
+            metrics["sse_subscribers"] = sse.subscriber_count
+            metrics["sse_max_subscribers"] = sse.max_subscribers
+            metrics["sse_dropped"] = sse.dropped
+        return metrics
+
+
+_dispatcher: Optional[EventDispatcher] = None
+_dispatcher_lock = threading.Lock()
+
+
+def get_event_dispatcher() -> EventDispatcher:
+    """Get the process-wide event dispatcher with the sinks named in EVENT_SINKS."""
+    global _dispatcher
+    if _dispatcher is None:
+        with _dispatcher_lock:
+            if _dispatcher is None:
+                from config.config import get_config
+
+                config = get_config()
+                dispatcher = EventDispatcher(max_queue=config.EVENT_QUEUE_SIZE)
+                for name in config.EVENT_SINKS:
+                    if name == "sse":
+                        dispatcher.add_sink(
+                            name,
+                            SSESink(
+                                max_queue=config.EVENT_STREAM_QUEUE_SIZE,
+                                max_subscribers=config.EVENT_STREAM_MAX_STREAMS,
+                            ),
+                        )
+                    elif name == "webhook":
+                        if not config.EVENT_WEBHOOK_URL:
+                            logger.warning("EVENT_WEBHOOK_URL is not set, webhook sink disabled")
+                            continue
+                        dispatcher.add_sink(
+                            name,
+                            WebhookSink(
+                                config.EVENT_WEBHOOK_URL,
+                                secret=config.EVENT_WEBHOOK_SECRET,
+                                timeout=config.EVENT_WEBHOOK_TIMEOUT,
+                            ),
+                        )
+                    elif name == "local":
+                        dispatcher.add_sink(name, LocalSink())
+                    else:
+                        logger.warning(f"Unknown event sink {name!r}, skipping")
+                _dispatcher = dispatcher
+    return _dispatcher
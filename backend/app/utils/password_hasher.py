@@ -0,0 +1,181 @@
+"""
+Password hashing off the request thread.
+
+bcrypt is deliberately CPU-expensive; running it inline lets a login burst
+pin every worker thread. ``PasswordHasher`` runs hashing and verification in a
+small process pool instead, caps how many operations may be queued at once
+(extra callers wait briefly, then get ``PasswordHasherBusyError``) and keeps
+queue-depth metrics. The bcrypt work factor comes from ``BCRYPT_ROUNDS``;
+hashes made with a different factor are reported by ``needs_rehash`` so they
+can be upgraded on the next successful login.
+"""
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, Optional
+
+import bcrypt
+
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class PasswordHasherBusyError(RuntimeError):
+    """Raised when too many hashing operations are already queued."""
+
+
+def _hash_password(password: str, rounds: int) -> str:
+    """Hash a password (runs in a pool process)."""
+    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(rounds)).decode("utf-8")
+
+
+def _check_password(password: str, password_hash: str) -> bool:
+    """Check a password against a hash (runs in a pool process)."""
+    return bcrypt.checkpw(password.encode("utf-8"), password_hash.encode("utf-8"))
+
+
+def hash_rounds(password_hash: str) -> Optional[int]:
+    """Extract the work factor from a bcrypt hash ("$2b$12$...")."""
+    try:
+        return int(password_hash.split("$")[2])
+    except (AttributeError, IndexError, ValueError):
+        return None
+
+
+class PasswordHasher:
+    """Bounded process pool for bcrypt work."""
+
+    def __init__(
+        self,
+        rounds: int = 12,
+        workers: int = 2,
+        max_pending: int = 8,
+        queue_timeout: float = 5.0,
+    ):
+        self.rounds = rounds
+        self.workers = workers
+        self.max_pending = max(max_pending, workers)
+        self.queue_timeout = queue_timeout
+
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_pid: Optional[int] = None
+        self._lock = threading.Lock()
+
+        # Metrics
+        self._in_flight = 0
+        self._peak_in_flight = 0
+        self._completed = 0
+        self._rejected = 0
+        self._total_seconds = 0.0
+
+        # Verifying against this when the user doesn't exist keeps response
+        # times the same for known and unknown emails
+        self._dummy_hash = _hash_password("flowdo-dummy-password", rounds)
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """Create the pool lazily, and again in each forked worker process."""
+        pid = os.getpid()
+        if self._pool is None or self._pool_pid != pid:
+            with self._lock:
+                if self._pool is None or self._pool_pid != pid:
+                    # forkserver children start from a clean process, not a copy
+                    # of this multi-threaded one
+                    method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+                    self._pool = ProcessPoolExecutor(
+                        max_workers=self.workers,
+                        mp_context=multiprocessing.get_context(method),
+                    )
+                    self._pool_pid = pid
+        return self._pool
+
+    def _run(self, func, *args):
+        """Run a bcrypt call in the pool, respecting the pending-work cap."""
+        if self.workers <= 0:
+            return func(*args)
+
+        if not self._slots.acquire(timeout=self.queue_timeout):
+            with self._lock:
+                self._rejected += 1
+            logger.warning(
+                f"Password hasher saturated: {self.max_pending} operations pending, request rejected"
+            )
+            raise PasswordHasherBusyError("Too many password operations in progress")
+
+        started = time.perf_counter()
+        with self._lock:
+            self._in_flight += 1
+            self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+        try:
+            return self._get_pool().submit(func, *args).result()
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+                self._completed += 1
+                self._total_seconds += time.perf_counter() - started
+            self._slots.release()
+
+    def hash(self, password: str) -> str:
+        """Hash a password with the configured work factor."""
+        return self._run(_hash_password, password, self.rounds)
+
+    def verify(self, password: str, password_hash: Optional[str]) -> bool:
+        """Verify a password; an empty hash is checked against a dummy hash and fails."""
+        if not password_hash:
+            self._run(_check_password, password, self._dummy_hash)
+            return False
+        return self._run(_check_password, password, password_hash)
+
+    def needs_rehash(self, password_hash: str) -> bool:
+        """Check whether a hash was made with a different work factor."""
+        return hash_rounds(password_hash) != self.rounds
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Report pool size, queue depth and throughput counters."""
+        with self._lock:
+            in_flight = self._in_flight
+            return {
+                "rounds": self.rounds,
+                "workers": self.workers,
+                "max_pending": self.max_pending,
+                "in_flight": in_flight,
+                "queue_depth": max(0, in_flight - self.workers),
+                "peak_in_flight": self._peak_in_flight,
+                "completed": self._completed,
+                "rejected": self._rejected,
+                "avg_ms": round(self._total_seconds / self._completed * 1000, 2)
+                if self._completed
+                else 0.0,
+            }
+
+    def shutdown(self) -> None:
+        """Stop the worker processes."""
+        with self._lock:
+            if self._pool is not None and self._pool_pid == os.getpid():
+                self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+_hasher: Optional[PasswordHasher] = None
+_hasher_lock = threading.Lock()
+
+
+def get_password_hasher() -> PasswordHasher:
+    """Get the process-wide password hasher configured from app config."""
+    global _hasher
+    if _hasher is None:
+        with _hasher_lock:
+            if _hasher is None:
+                from config.config import get_config
+
+                config = get_config()
+                _hasher = PasswordHasher(
+                    rounds=config.BCRYPT_ROUNDS,
+                    workers=config.BCRYPT_POOL_WORKERS,
+                    max_pending=config.BCRYPT_MAX_PENDING,
+                    queue_timeout=config.BCRYPT_QUEUE_TIMEOUT,
+                )
+    return _hasher
@@ -0,0 +1,186 @@
+"""
+Cached user profile snapshots.
+
+Timer actions (starting a Pomodoro or focus session, the next-session
+recommendation) and session verification only need a user's durations, goals
+and active flag. ``UserProfileCache`` keeps those as frozen ``UserProfile``
+snapshots in a per-process ``TTLCache``, optionally backed by a shared Redis
+store (``USER_PROFILE_CACHE_URL``) so a worker that misses locally can skip
+the database too.
+
+Snapshots are invalidated when a user's settings, password or token epoch
+change; other workers see the change once their local entry expires
+(``USER_PROFILE_CACHE_SECONDS``).
+"""
+import json
+import threading
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Optional
+
+from app.utils.cache import TTLCache
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+_MISSING = object()
+
+
+@dataclass(frozen=True)
+class UserProfile:
+    """Immutable snapshot of the user columns read outside of auth flows."""
+
+    id: int
+    email: str
+    display_name: str
+    is_active: bool
+    token_epoch: int
+    work_duration: Optional[int]
+    short_break_duration: Optional[int]
+    long_break_duration: Optional[int]
+    sessions_until_long_break: Optional[int]
+    default_focu_mode: Optional[str]
+    auto_start_breaks: Optional[bool]
+    distraction_blocking_enabled: Optional[bool]
+    daily_pomodoro_goal: Optional[int]
+    daily_focus_time_goal: Optional[int]
+
+    @classmethod
+    def from_row(cls, row: Any) -> "UserProfile":
+        """Build a snapshot from a UserRepository.get_profile() row."""
+        return cls(**row._mapping)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class RedisProfileStore:
+    """Shared snapshot store backed by Redis (requires the optional `redis` package)."""
+
+    def __init__(self, url: str, ttl: float, prefix: str = "flowdo:profile:"):
+        import redis  # optional dependency
+
+        self.client = redis.Redis.from_url(url, socket_timeout=0.2, socket_connect_timeout=0.2)
+        self.ttl = ttl
+        self.prefix = prefix
+
+    def get(self, user_id: int) -> Optional[UserProfile]:
+        raw = self.client.get(f"{self.prefix}{user_id}")
+        return UserProfile(**json.loads(raw)) if raw else None
+
+    def set(self, profile: UserProfile) -> None:
+        self.client.set(
+            f"{self.prefix}{profile.id}",
+            json.dumps(profile.to_dict()),
+            px=int(self.ttl * 1000),
+        )
+
+    def delete(self, user_id: int) -> None:
+        self.client.delete(f"{self.prefix}{user_id}")
+
+
+def create_profile_store(url: str, ttl: float) -> Optional[RedisProfileStore]:
+    """Create the shared store for a storage URL, or None to cache per process only."""
+    if url and url.startswith(("redis://", "rediss://")):
+        try:
+            store = RedisProfileStore(url, ttl)
+            store.client.ping()
+            return store
+        except Exception as e:
+            logger.warning(f"User profile store {url} unavailable, caching per process: {e}")
+    return None
+
+
+class UserProfileCache:
+    """Per-process cache of UserProfile snapshots with an optional shared store."""
+
+    def __init__(
+        self,
+        maxsize: int = 10000,
+        ttl: float = 60.0,
+        shared: Optional[RedisProfileStore] = None,
+    ):
+        self.local = TTLCache(maxsize=maxsize, ttl=ttl)
+        self.shared = shared
+        self._lock = threading.Lock()
+        self.shared_hits = 0
+        self.shared_errors = 0
+
+    def _shared_call(self, method: str, *args: Any) -> Any:
+        """Call the shared store; it is only an optimization, so errors are logged."""
+        try:
+            return getattr(self.shared, method)(*args)
+        except Exception as e:
+            with self._lock:
+                self.shared_errors += 1
+            logger.warning(f"User profile store {method} failed: {e}")
+            return None
+
+    def get(self, user_id: int, loader: Callable[[], Any]) -> Optional[UserProfile]:
+        """
+        Get a user's snapshot, or None for unknown users.
+
+        `loader` returns a UserRepository.get_profile() row and only runs when
+        neither the local cache nor the shared store has the user.
+        """
+        profile = self.local.get(user_id, _MISSING)
+        if profile is not _MISSING:
+            return profile
+
+        if self.shared is not None:
+            profile = self._shared_call("get", user_id)
+            if profile is not None:
+                with self._lock:
+                    self.shared_hits += 1
+                self.local.set(user_id, profile)
+                return profile
+
+        row = loader()
+        profile = UserProfile.from_row(row) if row is not None else None
+        # Unknown users are cached locally only
+        self.local.set(user_id, profile)
+        if profile is not None and self.shared is not None:
+            self._shared_call("set", profile)
+        return profile
+
+    def invalidate(self, user_id: int) -> None:
+        """Drop a user's snapshot after their profile, password or token epoch changed."""
+        self.local.delete(user_id)
+        if self.shared is not None:
+            self._shared_call("delete", user_id)
+
+    def clear(self) -> None:
+        """Drop every locally cached snapshot."""
+        self.local.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Report local hit rate and shared store usage."""
+        stats = self.local.get_stats()
+        with self._lock:
+            stats.update(
+                shared=self.shared is not None,
+                shared_hits=self.shared_hits,
+                shared_errors=self.shared_errors,
+            )
+        return stats
+
+
+_profile_cache: Optional[UserProfileCache] = None
+_profile_cache_lock = threading.Lock()
+
+
+def get_user_profile_cache() -> UserProfileCache:
+    """Get the process-wide user profile cache configured from app config."""
+    global _profile_cache
+    if _profile_cache is None:
+        with _profile_cache_lock:
+            if _profile_cache is None:
+                from config.config import get_config
+
+                config = get_config()
+                ttl = config.USER_PROFILE_CACHE_SECONDS
+                _profile_cache = UserProfileCache(
+                    maxsize=config.USER_PROFILE_CACHE_SIZE,
+                    ttl=ttl,
+                    shared=create_profile_store(config.USER_PROFILE_CACHE_URL, ttl),
+                )
+    return _profile_cache
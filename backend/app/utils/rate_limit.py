@@ -0,0 +1,407 @@
+"""
+Rate limiting for authentication endpoints.
+
+Requests are checked against counters before any request parsing beyond the
+email field, password hashing or database work happens, so abusive traffic is
+rejected cheaply:
+
+* Token buckets smooth per-IP request rates while allowing short bursts.
+* Sliding-window counters cap events (e.g. failed logins per email) over a
+  period; once the cap is hit the key is locked out for a fixed duration.
+
+Counters live in a ``RateLimitStore``. ``MemoryStore`` keeps them in process
+(per worker); ``RedisStore`` shares them across workers and hosts. The store is
+chosen from ``RATELIMIT_STORAGE_URL`` ("memory://" or "redis://...").
+"""
+import math
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from functools import wraps
+from typing import Callable, Dict, Optional, Tuple
+
+from logger import get_logger, log_security_event
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class RateLimitResult:
+    """Outcome of a rate-limit check."""
+
+    allowed: bool
+    remaining: int = 0
+    retry_after: float = 0.0
+
+
+class RateLimitStore(ABC):
+    """Counter storage interface."""
+
+    @abstractmethod
+    def token_bucket(self, key: str, capacity: int, refill_per_second: float) -> RateLimitResult:
+        """Take one token from a bucket that refills continuously."""
+
+    @abstractmethod
+    def sliding_window(self, key: str, limit: int, window_seconds: float) -> RateLimitResult:
+        """Count one event in a sliding window, allowing at most `limit` per window."""
+
+    @abstractmethod
+    def peek_window(self, key: str, limit: int, window_seconds: float) -> RateLimitResult:
+        """Check a sliding window without counting an event."""
+
+    @abstractmethod
+    def lock(self, key: str, seconds: float) -> None:
+        """Lock a key out for `seconds`."""
+
+    @abstractmethod
+    def locked_for(self, key: str) -> float:
+        """Seconds left on a lockout (0 when not locked)."""
+
+    @abstractmethod
+    def reset(self, key: str, window_seconds: Optional[float] = None) -> None:
+        """
+        Clear all counters and lockouts for a key; `window_seconds` is the
+        size of the key's sliding window, if it has one.
+        """
+
+
+class MemoryStore(RateLimitStore):
+    """
+    In-process store.
+
+    Sliding windows use the two-bucket approximation (current fixed window
+    plus the previous one weighted by overlap), so each key costs O(1) memory
+    no matter how many events it sees.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic, max_keys: int = 100000):
+        self.clock = clock
+        self.max_keys = max_keys
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+        self._windows: Dict[str, Tuple[int, int, int]] = {}
+        self._locks: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def _evict_if_full(self, table: dict) -> None:
+        # Oldest-inserted keys go first; a full table means an attack or a
+        # very busy node, and losing an old counter only loosens a limit
+        if len(table) >= self.max_keys:
+            for key in list(table)[: max(1, self.max_keys // 10)]:
+                table.pop(key, None)
+
+    def token_bucket(self, key, capacity, refill_per_second):
+        now = self.clock()
+        with self._lock:
+            tokens, updated = self._buckets.get(key, (float(capacity), now))
+            tokens = min(capacity, tokens + (now - updated) * refill_per_second)
+            if tokens >= 1:
+                if key not in self._buckets:
+                    self._evict_if_full(self._buckets)
+                self._buckets[key] = (tokens - 1, now)
+                return RateLimitResult(True, int(tokens - 1))
+            self._buckets[key] = (tokens, now)
+        retry_after = (1 - tokens) / refill_per_second if refill_per_second > 0 else math.inf
+        return RateLimitResult(False, 0, retry_after)
+
+    def _window_count(self, key, window_seconds, now) -> Tuple[float, int, int, int]:
+        current_window = int(now // window_seconds)
+        window_id, current, previous = self._windows.get(key, (current_window, 0, 0))
+        if window_id != current_window:
+            previous = current if window_id == current_window - 1 else 0
+            current = 0
+        elapsed_fraction = (now % window_seconds) / window_seconds
+        estimated = current + previous * (1 - elapsed_fraction)
+        return estimated, current_window, current, previous
+
+    def sliding_window(self, key, limit, window_seconds):
+        now = self.clock()
+        with self._lock:
+            estimated, window_id, current, previous = self._window_count(key, window_seconds, now)
+            if estimated + 1 > limit:
+                self._windows[key] = (window_id, current, previous)
+                return RateLimitResult(False, 0, window_seconds - (now % window_seconds))
+            if key not in self._windows:
+                self._evict_if_full(self._windows)
+            self._windows[key] = (window_id, current + 1, previous)
+        return RateLimitResult(True, int(limit - estimated - 1))
+
+    def peek_window(self, key, limit, window_seconds):
+        now = self.clock()
+        with self._lock:
+            estimated, _, _, _ = self._window_count(key, window_seconds, now)
+        if estimated >= limit:
+            return RateLimitResult(False, 0, window_seconds - (now % window_seconds))
+        return RateLimitResult(True, int(limit - estimated))
+
+    def lock(self, key, seconds):
+        with self._lock:
+            self._evict_if_full(self._locks)
+            self._locks[key] = self.clock() + seconds
+
+    def locked_for(self, key):
+        with self._lock:
+            until = self._locks.get(key)
+            if until is None:
+                return 0.0
+            remaining = until - self.clock()
+            if remaining <= 0:
+                self._locks.pop(key, None)
+                return 0.0
+            return remaining
+
+    def reset(self, key, window_seconds=None):
+        with self._lock:
+            self._buckets.pop(key, None)
+            self._windows.pop(key, None)
+            self._locks.pop(key, None)
+
+
+class RedisStore(RateLimitStore):
+    """Shared store backed by Redis (requires the optional `redis` package)."""
+
+    _TOKEN_BUCKET = """
+    local state = redis.call('HMGET', KEYS[1], 'tokens', 'updated')
+    local capacity = tonumber(ARGV[1])
+    local rate = tonumber(ARGV[2])
+    local now = tonumber(ARGV[3])
+    local tokens = tonumber(state[1]) or capacity
+    local updated = tonumber(state[2]) or now
+    tokens = math.min(capacity, tokens + (now - updated) * rate)
+    local allowed = 0
+    if tokens >= 1 then
+        tokens = tokens - 1
+        allowed = 1
+    end
+    redis.call('HSET', KEYS[1], 'tokens', tokens, 'updated', now)
+    redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 1)
+    return {allowed, tostring(tokens)}
+    """
+
+    def __init__(
+        self,
+        url: str,
+        prefix: str = "flowdo:ratelimit:",
+        clock: Callable[[], float] = time.time,
+        client=None,
+    ):
+        if client is None:
+            import redis  # optional dependency
+
+            client = redis.Redis.from_url(url, socket_timeout=0.2, socket_connect_timeout=0.2)
+        self.client = client
+        self.prefix = prefix
+        self.clock = clock
+        self._token_bucket = self.client.register_script(self._TOKEN_BUCKET)
+
+    def token_bucket(self, key, capacity, refill_per_second):
+        allowed, tokens = self._token_bucket(
+            keys=[f"{self.prefix}tb:{key}"], args=[capacity, refill_per_second, self.clock()]
+        )
+        tokens = float(tokens)
+        if allowed:
+            return RateLimitResult(True, int(tokens))
+        return RateLimitResult(False, 0, (1 - tokens) / refill_per_second)
+
+    def _window_keys(self, key, window_seconds, now):
+        window_id = int(now // window_seconds)
+        base = f"{self.prefix}sw:{key}:"
+        return base + str(window_id), base + str(window_id - 1)
+
+    def _estimate(self, current, previous, window_seconds, now):
+        elapsed_fraction = (now % window_seconds) / window_seconds
+        return int(current or 0) + int(previous or 0) * (1 - elapsed_fraction)
+
+    def sliding_window(self, key, limit, window_seconds):
+        now = self.clock()
+        current_key, previous_key = self._window_keys(key, window_seconds, now)
+        pipe = self.client.pipeline()
+        pipe.incr(current_key)
+        pipe.expire(current_key, int(window_seconds * 2) + 1)
+        pipe.get(previous_key)
+        current, _, previous = pipe.execute()
+        # The increment already happened; estimate the count before it
+        estimated = self._estimate(int(current) - 1, previous, window_seconds, now)
+        if estimated + 1 > limit:
+            self.client.decr(current_key)
+            return RateLimitResult(False, 0, window_seconds - (now % window_seconds))
+        return RateLimitResult(True, int(limit - estimated - 1))
+
+    def peek_window(self, key, limit, window_seconds):
+        now = self.clock()
+        current, previous = self.client.mget(*self._window_keys(key, window_seconds, now))
+        estimated = self._estimate(current, previous, window_seconds, now)
+        if estimated >= limit:
+            return RateLimitResult(False, 0, window_seconds - (now % window_seconds))
+        return RateLimitResult(True, int(limit - estimated))
+
+    def lock(self, key, seconds):
+        self.client.set(f"{self.prefix}lock:{key}", 1, px=int(seconds * 1000))
+
+    def locked_for(self, key):
+        ttl = self.client.pttl(f"{self.prefix}lock:{key}")
+        return ttl / 1000 if ttl and ttl > 0 else 0.0
+
+    def reset(self, key, window_seconds=None):
+        # Delete the exact key names; only the current and previous window
+        # count, older ones are left to expire
+        names = [f"{self.prefix}tb:{key}", f"{self.prefix}lock:{key}"]
+        if window_seconds:
+            names.extend(self._window_keys(key, window_seconds, self.clock()))
+        self.client.delete(*names)
+
+
+def create_store(url: str) -> RateLimitStore:
+    """Create a store from a storage URL, falling back to memory if Redis is unavailable."""
+    if url and url.startswith(("redis://", "rediss://")):
+        try:
+            store = RedisStore(url)
+            store.client.ping()
+            return store
+        except Exception as e:
+            logger.warning(f"Rate limit store {url} unavailable, using in-memory counters: {e}")
+    return MemoryStore()
+
+
+class RateLimiter:
+    """Rate-limit rules for the authentication endpoints."""
+
+    def __init__(self, store: RateLimitStore, config):
+        self.store = store
+        self.config = config
+
+    def _fail_safe(self, check: Callable[[], RateLimitResult]) -> RateLimitResult:
+        # A broken shared store must not take logins down with it
+        try:
+            return check()
+        except Exception as e:
+            logger.error(f"Rate limit check failed, allowing request: {e}")
+            return RateLimitResult(True)
+
+    def check_ip(self, scope: str, ip: str) -> RateLimitResult:
+        """Per-IP token bucket for an endpoint scope (login, register, refresh)."""
+        burst, per_second = self.config.RATELIMIT_RULES[scope]
+        return self._fail_safe(lambda: self.store.token_bucket(f"{scope}:ip:{ip}", burst, per_second))
+
+    def check_email_lockout(self, email: str) -> RateLimitResult:
+        """Reject logins for an email that is locked out after repeated failures."""
+        def check():
+            locked_for = self.store.locked_for(f"login:email:{email}")
+            if locked_for > 0:
+                return RateLimitResult(False, 0, locked_for)
+            return RateLimitResult(True)
+
+        return self._fail_safe(check)
+
+    def record_login_failure(self, email: str, ip: str) -> None:
+        """Count a failed login and lock the email out once the limit is reached."""
+        key = f"login:email:{email}"
+        window = self.config.AUTH_LOCKOUT_DURATION.total_seconds()
+
+        def record():
+            result = self.store.sliding_window(
+                f"{key}:failures", self.config.AUTH_MAX_LOGIN_ATTEMPTS, window
+            )
+            if not result.allowed or result.remaining == 0:
+                self.store.lock(key, window)
+                log_security_event(
+                    "login_lockout",
+                    {"email": email, "remote_addr": ip, "lockout_seconds": window},
+                )
+            return result
+
+        self._fail_safe(record)
+
+    def record_login_success(self, email: str) -> None:
+        """Clear failure counters after a successful login."""
+        window = self.config.AUTH_LOCKOUT_DURATION.total_seconds()
+        try:
+            self.store.reset(f"login:email:{email}:failures", window)
+        except Exception as e:
+            logger.error(f"Failed to reset login counters: {e}")
+
+
+_limiter: Optional[RateLimiter] = None
+_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Get the process-wide rate limiter configured from app config."""
+    global _limiter
+    if _limiter is None:
+        with _limiter_lock:
+            if _limiter is None:
+                from config.config import get_config
+
+                config = get_config()
+                _limiter = RateLimiter(create_store(config.RATELIMIT_STORAGE_URL), config)
+    return _limiter
+
+
+def _client_ip() -> str:
+    from flask import current_app, request
+
+    if current_app.config.get("RATELIMIT_TRUST_PROXY"):
+        forwarded = request.headers.get("X-Forwarded-For", "")
+        if forwarded:
+            return forwarded.split(",")[0].strip()
+    return request.remote_addr or "unknown"
+
+
+def _too_many_requests(result: RateLimitResult, message: str):
+    from flask import jsonify
+
+    retry_after = max(1, math.ceil(result.retry_after))
+    return jsonify({"error": message, "retry_after": retry_after}), 429, {"Retry-After": str(retry_after)}
+
+
+def rate_limit(scope: str):
+    """
+    Apply auth rate limits to a route.
+
+    Put it above ``@jwt_required`` so limits are enforced before token
+    verification. For the "login" scope, failed attempts are also counted per
+    email, and a locked-out email is rejected before its password is checked.
+    """
+
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            from flask import current_app, request
+
+            if not current_app.config.get("RATELIMIT_ENABLED", True):
+                return view(*args, **kwargs)
+
+            limiter = get_rate_limiter()
+            ip = _client_ip()
+
+            result = limiter.check_ip(scope, ip)
+            if not result.allowed:
+                logger.warning(f"Rate limit exceeded for {scope} from {ip}")
+                return _too_many_requests(result, "Too many requests, please slow down")
+
+            email = None
+            if scope == "login":
+                payload = request.get_json(silent=True) or {}
+                email = str(payload.get("email", "")).strip().lower() or None
+                if email:
+                    lockout = limiter.check_email_lockout(email)
+                    if not lockout.allowed:
+                        return _too_many_requests(
+                            lockout, "Too many failed login attempts, please try again later"
+                        )
+
+            response = view(*args, **kwargs)
+
+            if email:
+                status = response[1] if isinstance(response, tuple) else getattr(response, "status_code", 200)
+                if status in (400, 401):
+                    limiter.record_login_failure(email, ip)
+                elif status == 200:
+                    limiter.record_login_success(email)
+
+            return response
+
+        return wrapper
+
+    return decorator
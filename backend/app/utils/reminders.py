@@ -0,0 +1,324 @@
+"""
+Due-date reminders.
+
+``ReminderScheduler`` keeps the reminders of the next window of due dates in a
+min-heap keyed by fire time (``due_date - REMINDER_LEAD_MINUTES``) and sleeps
+until the earliest one. The window is loaded with one range scan of open tasks
+by due date; the next window is loaded when the scheduler reaches the end of
+the current one. In between, task creates, edits, completions and deletes are
+picked up by tailing the change log, so only the changed tasks are re-read.
+Change log ids are allocated before commit, so each poll also re-reads the
+last ``change_overlap`` ids to catch entries that committed late.
+
+Reminders are published as ``task.due`` events through the event dispatcher.
+Due dates are naive UTC. Reminders that fell due while no scheduler was
+running are not sent afterwards.
+"""
+import heapq
+import threading
+import time
+from datetime import UTC, datetime, timedelta
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from app.utils.events import Event, EventDispatcher
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+REMINDER_EVENT = "task.due"
+
+
+def _utcnow() -> datetime:
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+class ReminderScheduler:
+    """Min-heap of upcoming due-date reminders fed by windowed range scans."""
+
+    def __init__(
+        self,
+        dispatcher: EventDispatcher,
+        lead: timedelta = timedelta(minutes=15),
+        window: timedelta = timedelta(hours=1),
+        batch_size: int = 1000,
+        poll_seconds: float = 10.0,
+        change_overlap: int = 1000,
+        session_factory: Optional[Callable] = None,
+    ):
+        self.dispatcher = dispatcher
+        self.lead = lead
+        self.window = window
+        self.batch_size = batch_size
+        self.poll_seconds = poll_seconds
+        self.change_overlap = change_overlap
+        self._session_factory = session_factory
+
+        # Heap of (fire_at, task_id); _scheduled holds the live entry per task
+        # and entries that no longer match it are skipped when popped
+        self._heap: List[Tuple[datetime, int]] = []
+        self._scheduled: Dict[int, Tuple[datetime, int, str, datetime]] = {}
+        # Everything due up to _fired_until has been sent; the heap covers
+        # fire times up to _horizon
+        self._fired_until = _utcnow()
+        self._horizon = self._fired_until
+        self._change_cursor: Optional[int] = None
+        # Change ids already applied within the overlap behind the cursor
+        self._seen_changes: Set[int] = set()
+
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        # Metrics
+        self._fired = 0
+        self._loads = 0
+        self._rows_loaded = 0
+        self._last_load_ms = 0.0
+        self._changes_applied = 0
+        self._max_lag_ms = 0.0
+
+    # Heap
+
+    def fill(self, rows: Iterable[Any], horizon: datetime) -> None:
+        """
+        Replace the heap with `rows` (id, user_id, title, due_date), which
+        must hold every open task whose reminder fires up to `horizon`.
+        """
+        with self._lock:
+            self._heap = []
+            self._scheduled = {}
+            self._horizon = horizon
+            for row in rows:
+                entry = self._push(row)
+                if entry is not None:
+                    self._heap.append(entry)
+            heapq.heapify(self._heap)
+
+    def _push(self, row: Any) -> Optional[Tuple[datetime, int]]:
+        task_id, user_id, title, due_date = row
+        fire_at = due_date - self.lead
+        if fire_at <= self._fired_until or fire_at > self._horizon:
+            return None
+        self._scheduled[task_id] = (fire_at, user_id, title, due_date)
+        return fire_at, task_id
+
+    def schedule(self, row: Any) -> bool:
+        """Add or move a task's reminder; returns False if it falls outside the loaded window."""
+        with self._lock:
+            self._scheduled.pop(row[0], None)
+            entry = self._push(row)
+            if entry is None:
+                return False
+            heapq.heappush(self._heap, entry)
+            return True
+
+    def cancel(self, task_id: int) -> None:
+        """Drop a task's reminder; its heap entry is discarded when popped."""
+        with self._lock:
+            self._scheduled.pop(task_id, None)
+
+    def fire_due(self, now: Optional[datetime] = None) -> int:
+        """Dispatch every reminder whose fire time has passed; returns how many were sent."""
+        now = now or _utcnow()
+        due = []
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now:
+                fire_at, task_id = heapq.heappop(self._heap)
+                entry = self._scheduled.get(task_id)
+                if entry is None or entry[0] != fire_at:
+                    continue  # cancelled or rescheduled
+                del self._scheduled[task_id]
+                due.append((task_id, entry))
+            self._fired_until = max(self._fired_until, min(now, self._horizon))
+
+        for task_id, (fire_at, user_id, title, due_date) in due:
+            self.dispatcher.dispatch(
+                Event(
+                    type=REMINDER_EVENT,
+                    user_id=user_id,
+                    data={
+                        "task_id": task_id,
+                        "title": title,
+                        "due_date": due_date.isoformat(),
+                        "lead_minutes": int(self.lead.total_seconds() // 60),
+                    },
+                )
+            )
+            lag_ms = (now - fire_at).total_seconds() * 1000
+            with self._lock:
+                self._fired += 1
+                self._max_lag_ms = max(self._max_lag_ms, lag_ms)
+        return len(due)
+
+    def next_fire_time(self) -> Optional[datetime]:
+        with self._lock:
+            while self._heap:
+                fire_at, task_id = self._heap[0]
+                entry = self._scheduled.get(task_id)
+                if entry is not None and entry[0] == fire_at:
+                    return fire_at
+                heapq.heappop(self._heap)
+            return None
+
+    # Database
+
+    def _session(self):
+        if self._session_factory is not None:
+            return self._session_factory()
+        from database.db import get_db_session
+
+        return get_db_session()
+
+    def load_window(self, session) -> int:
+        """Load reminders for the next window of due dates; returns the number loaded."""
+        from database.repositories.task_repository import TaskRepository
+
+        started = time.perf_counter()
+        start = self._fired_until + self.lead
+        end = start + self.window
+        task_repo = TaskRepository(session)
+        rows = task_repo.get_open_due_between(start, end, self.batch_size)
+        horizon_due = end
+        if len(rows) == self.batch_size:
+            # Stop the window before the last due date so none of its ties are cut off
+            last = rows[-1].due_date
+            kept = [row for row in rows if row.due_date < last]
+            if kept:
+                rows, horizon_due = kept, kept[-1].due_date
+            else:
+                # The whole batch shares one due date; the next window starts
+                # after it, so load every task due then
+                rows, horizon_due = task_repo.get_open_due_at(last), last
+        self.fill(rows, horizon_due - self.lead)
+
+        with self._lock:
+            self._loads += 1
+            self._rows_loaded += len(rows)
+            self._last_load_ms = (time.perf_counter() - started) * 1000
+        logger.debug(f"Loaded {len(rows)} reminders due up to {horizon_due.isoformat()}")
+        return len(rows)
+
+    def apply_changes(self, session) -> int:
+        """Reschedule tasks changed since the last poll; returns the number of changes read."""
+        from database.models.change_log import ChangeEntityType
+        from database.repositories.change_log_repository import ChangeLogRepository
+        from database.repositories.task_repository import TaskRepository
+
+        change_repo = ChangeLogRepository(session)
+        if self._change_cursor is None:
+            self._change_cursor = change_repo.get_last_id()
+            return 0
+
+        # Re-read the overlap behind the cursor: an entry with a lower id can
+        # commit after a higher one was read
+        low = max(self._change_cursor - self.change_overlap, 0)
+        rows = change_repo.get_entity_changes_after(
+            low, ChangeEntityType.TASK, self.batch_size + len(self._seen_changes)
+        )
+        changes = [change for change in rows if change.id not in self._seen_changes]
+        if rows:
+            self._change_cursor = max(self._change_cursor, rows[-1].id)
+        low = max(self._change_cursor - self.change_overlap, 0)
+        self._seen_changes = {
+            change_id for change_id in self._seen_changes if change_id > low
+        } | {change.id for change in changes if change.id > low}
+        if not changes:
+            return 0
+
+        task_ids = list({change.entity_id for change in changes})
+        for task_id in task_ids:
+            self.cancel(task_id)
+        for row in TaskRepository(session).get_open_due_by_ids(task_ids):
+            self.schedule(row)
+
+        with self._lock:
+            self._changes_applied += len(changes)
+        return len(changes)
+
+    def tick(self, now: Optional[datetime] = None) -> float:
+        """Poll for changes, load the next window if needed and fire due reminders; returns seconds to sleep."""
+        now = now or _utcnow()
+        with self._session() as session:
+            self.apply_changes(session)
+            while now >= self._horizon:
+                self.fire_due(now)
+                self.load_window(session)
+        self.fire_due(now)
+
+        wait = self.poll_seconds
+        next_fire = self.next_fire_time()
+        if next_fire is not None:
+            wait = min(wait, max((next_fire - _utcnow()).total_seconds(), 0))
+        return wait
+
+    # Background thread
+
+    def run_forever(self) -> None:
+        """Run ticks until stop() is called."""
+        logger.info(
+            f"Reminder scheduler started (lead {self.lead}, window {self.window})"
+        )
+        wait = 0.0
+        while not self._stop.wait(wait):
+            try:
+                wait = self.tick()
+            except Exception as e:
+                logger.error(f"Reminder scheduler tick failed: {e}")
+                wait = self.poll_seconds
+        logger.info("Reminder scheduler stopped")
+
+    def start(self) -> None:
+        """Run the scheduler in a daemon thread."""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self.run_forever, name="reminder-scheduler", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Report heap size, window position and firing counters."""
+        with self._lock:
+            return {
+                "running": self._thread is not None and self._thread.is_alive(),
+                "scheduled": len(self._scheduled),
+                "heap_size": len(self._heap),
+                "fired_until": self._fired_until.isoformat(),
+                "horizon": self._horizon.isoformat(),
+                "fired": self._fired,
+                "window_loads": self._loads,
+                "rows_loaded": self._rows_loaded,
+                "last_load_ms": round(self._last_load_ms, 2),
+                "changes_applied": self._changes_applied,
+                "max_lag_ms": round(self._max_lag_ms, 2),
+            }
+
+
+_scheduler: Optional[ReminderScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_reminder_scheduler() -> ReminderScheduler:
+    """Get the process-wide reminder scheduler configured from app config."""
+    global _scheduler
+    if _scheduler is None:
+        with _scheduler_lock:
+            if _scheduler is None:
+                from app.utils.events import get_event_dispatcher
+                from config.config import get_config
+
+                config = get_config()
+                _scheduler = ReminderScheduler(
+                    get_event_dispatcher(),
+                    lead=timedelta(minutes=config.REMINDER_LEAD_MINUTES),
+                    window=timedelta(minutes=config.REMINDER_WINDOW_MINUTES),
+                    batch_size=config.REMINDER_BATCH_SIZE,
+                    poll_seconds=config.REMINDER_POLL_SECONDS,
+                    change_overlap=config.REMINDER_CHANGE_OVERLAP,
+                )
+    return _scheduler
@@ -0,0 +1,258 @@
+"""
+Expiry of abandoned Pomodoro and focus sessions.
+
+A session stays in progress or paused until its client reports back; if the
+client goes away it blocks ``start_session`` and skews statistics. The
+sweeper ends such sessions once they are past their length plus
+``SESSION_EXPIRY_GRACE_MINUTES``:
+
+- in progress Pomodoro past its planned duration (plus recorded
+  interruptions): completed, credited with the planned duration
+- in progress focus session past its maximum duration (plus pauses):
+  completed, credited with the maximum duration
+- paused sessions past the same point: abandoned
+
+Each pass reads candidates with a (status, start_time) range scan in
+batches, ends each batch with one UPDATE guarded by the old status (so
+several sweepers, or a client finishing the session at the same moment,
+never double count), and publishes a ``session.expired`` event per session
+once the batch has committed.
+"""
+import threading
+import time
+from collections import Counter
+from datetime import UTC, datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional
+
+from app.utils.events import Event, EventDispatcher
+from database.models.focus_session import FocusSessionStatus
+from database.models.pomodoro_session import PomodoroSessionStatus, PomodoroSessionType
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+SESSION_EXPIRED_EVENT = "session.expired"
+
+# (kind, status found, status set)
+EXPIRY_RULES = [
+    ("pomodoro", PomodoroSessionStatus.IN_PROGRESS, PomodoroSessionStatus.COMPLETED),
+    ("pomodoro", PomodoroSessionStatus.PAUSED, PomodoroSessionStatus.ABANDONED),
+    ("focus", FocusSessionStatus.IN_PROGRESS, FocusSessionStatus.COMPLETED),
+    ("focus", FocusSessionStatus.PAUSED, FocusSessionStatus.ABANDONED),
+]
+
+
+def _utcnow() -> datetime:
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+def session_deadline(kind: str, row: Any, grace: timedelta) -> datetime:
+    """When a session read by get_started_before() expires."""
+    if kind == "pomodoro":
+        length = (row.planned_duration or 0) + (row.interruption_total_time or 0)
+    else:
+        length = (row.maximum_duration or 0) + (row.pause_duration or 0)
+    return row.start_time + timedelta(seconds=length) + grace
+
+
+class SessionSweeper:
+    """Background loop that ends sessions whose client went away."""
+
+    def __init__(
+        self,
+        dispatcher: EventDispatcher,
+        grace: timedelta = timedelta(minutes=30),
+        interval_seconds: float = 60.0,
+        batch_size: int = 500,
+        session_factory: Optional[Callable] = None,
+    ):
+        self.dispatcher = dispatcher
+        self.grace = grace
+        self.interval_seconds = interval_seconds
+        self.batch_size = batch_size
+        self._session_factory = session_factory
+
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        # Metrics
+        self._runs = 0
+        self._errors = 0
+        self._scanned = 0
+        self._reaped: Counter = Counter()
+        self._last_run_at: Optional[datetime] = None
+        self._last_run_ms = 0.0
+        self._last_reaped = 0
+
+    def _session(self):
+        if self._session_factory is not None:
+            return self._session_factory()
+        from database.db import get_db_session
+
+        return get_db_session()
+
+    def _expire_batch(self, session, kind, status, outcome, rows, before, now) -> List[Any]:
+        """End the expired sessions among `rows` and apply their side effects."""
+        from app.services.streak_service import StreakService
+        from database.repositories.focus_session_repository import FocusSessionRepository
+        from database.repositories.pomodoro_daily_counter_repository import (
+            PomodoroDailyCounterRepository,
+        )
+        from database.repositories.pomodoro_session_repository import PomodoroSessionRepository
+        from database.repositories.task_repository import TaskRepository
+
+        expired = {row.id: row for row in rows if session_deadline(kind, row, self.grace) <= now}
+        if not expired:
+            return []
+
+        repo_class = PomodoroSessionRepository if kind == "pomodoro" else FocusSessionRepository
+        changed_ids = repo_class(session).expire_sessions(list(expired), status, outcome, before, now)
+        changed = [expired[session_id] for session_id in changed_ids]
+        if outcome.value != "completed" or not changed:
+            return changed
+
+        # Completed sessions count like ones the client completed
+        streaks = StreakService(session)
+        if kind == "focus":
+            for row in changed:
+                streaks.record_focus_completed(row.user_id, row.maximum_duration or 0)
+            return changed
+
+        counters = PomodoroDailyCounterRepository(session)
+        per_day = Counter((row.user_id, row.start_time.date(), row.session_type) for row in changed)
+        for (user_id, day, session_type), count in per_day.items():
+            counters.record_session_completed(user_id, day, session_type, count)
+
+        work = [row for row in changed if row.session_type == PomodoroSessionType.WORK]
+        TaskRepository(session).add_completed_pomodoros(
+            Counter(row.task_id for row in work if row.task_id)
+        )
+        for row in work:
+            streaks.record_pomodoro_completed(row.user_id, row.planned_duration or 0)
+        return changed
+
+    def sweep(self, now: Optional[datetime] = None) -> Dict[str, int]:
+        """Expire every overdue session; returns the number ended per kind and outcome."""
+        from database.repositories.focus_session_repository import FocusSessionRepository
+        from database.repositories.pomodoro_session_repository import PomodoroSessionRepository
+
+        started = time.perf_counter()
+        now = now or _utcnow()
+        # No session can be overdue before its grace period has passed
+        before = now - self.grace
+        reaped: Counter = Counter({f"{kind}_{outcome.value}": 0 for kind, _, outcome in EXPIRY_RULES})
+        scanned = 0
+
+        for kind, status, outcome in EXPIRY_RULES:
+            key = f"{kind}_{outcome.value}"
+            repo_class = PomodoroSessionRepository if kind == "pomodoro" else FocusSessionRepository
+            after = None
+            while True:
+                with self._session() as session:
+                    rows = repo_class(session).get_started_before(
+                        status, before, after, self.batch_size
+                    )
+                    changed = self._expire_batch(session, kind, status, outcome, rows, before, now)
+                # Published only once the batch has committed
+                for row in changed:
+                    self.dispatcher.dispatch(
+                        Event(
+                            type=SESSION_EXPIRED_EVENT,
+                            user_id=row.user_id,
+                            data={
+                                "kind": kind,
+                                "session_id": row.id,
+                                "uuid": row.uuid,
+                                "status": outcome.value,
+                                "start_time": row.start_time.isoformat(),
+                            },
+                        )
+                    )
+                scanned += len(rows)
+                reaped[key] += len(changed)
+                if len(rows) < self.batch_size:
+                    break
+                after = (rows[-1].start_time, rows[-1].id)
+
+        total = sum(reaped.values())
+        with self._lock:
+            self._runs += 1
+            self._scanned += scanned
+            self._reaped.update(reaped)
+            self._last_run_at = now
+            self._last_run_ms = (time.perf_counter() - started) * 1000
+            self._last_reaped = total
+        if total:
+            logger.info(f"Session sweep ended {total} sessions: {dict(+reaped)}")
+        return dict(reaped)
+
+    def run_forever(self) -> None:
+        """Sweep every interval_seconds until stop() is called."""
+        logger.info(
+            f"Session sweeper started (every {self.interval_seconds}s, grace {self.grace})"
+        )
+        while True:
+            try:
+                self.sweep()
+            except Exception as e:
+                with self._lock:
+                    self._errors += 1
+                logger.error(f"Session sweep failed: {e}")
+            if self._stop.wait(self.interval_seconds):
+                break
+        logger.info("Session sweeper stopped")
+
+    def start(self) -> None:
+        """Run the sweeper in a daemon thread."""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self.run_forever, name="session-sweeper", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Report sweep runs, timing and sessions ended per kind and outcome."""
+        with self._lock:
+            return {
+                "running": self._thread is not None and self._thread.is_alive(),
+                "interval_seconds": self.interval_seconds,
+                "grace_minutes": self.grace.total_seconds() / 60,
+                "runs": self._runs,
+                "errors": self._errors,
+                "last_run_at": self._last_run_at.isoformat() if self._last_run_at else None,
+                "last_run_ms": round(self._last_run_ms, 2),
+                "last_run_reaped": self._last_reaped,
+                "scanned": self._scanned,
+                "reaped": dict(self._reaped),
+                "reaped_total": sum(self._reaped.values()),
+            }
+
+
+_sweeper: Optional[SessionSweeper] = None
+_sweeper_lock = threading.Lock()
+
+
+def get_session_sweeper() -> SessionSweeper:
+    """Get the process-wide session sweeper configured from app config."""
+    global _sweeper
+    if _sweeper is None:
+        with _sweeper_lock:
+            if _sweeper is None:
+                from app.utils.events import get_event_dispatcher
+                from config.config import get_config
+
+                config = get_config()
+                _sweeper = SessionSweeper(
+                    get_event_dispatcher(),
+                    grace=timedelta(minutes=config.SESSION_EXPIRY_GRACE_MINUTES),
+                    interval_seconds=config.SESSION_SWEEP_INTERVAL_SECONDS,
+                    batch_size=config.SESSION_SWEEP_BATCH_SIZE,
+                )
+    return _sweeper
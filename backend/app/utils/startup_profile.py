@@ -0,0 +1,128 @@
+"""
+Startup profiling.
+
+Two complementary views of where boot time goes:
+
+* Phase timings: with ``STARTUP_PROFILE=true`` the app factory times each
+  startup phase and each blueprint import via ``startup_phase()`` and logs a
+  summary once the app is ready.
+* Per-module import timings: ``python -m app.utils.startup_profile`` boots the
+  app in a child interpreter under ``-X importtime`` and prints the slowest
+  modules by self and cumulative import time.
+
+Usage:
+    STARTUP_PROFILE=true python run.py
+    python -m app.utils.startup_profile --top 30 --target "import wsgi"
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent.parent
+
+_phases: List[Tuple[str, float]] = []
+
+
+def is_enabled() -> bool:
+    """Check whether startup profiling was requested."""
+    return os.environ.get("STARTUP_PROFILE", "false").lower() == "true"
+
+
+@contextmanager
+def startup_phase(name: str):
+    """Time a startup phase when profiling is enabled."""
+    if not is_enabled():
+        yield
+        return
+
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        _phases.append((name, (time.perf_counter() - started) * 1000))
+
+
+def log_startup_profile() -> None:
+    """Log recorded phase timings, slowest first."""
+    if not is_enabled() or not _phases:
+        return
+
+    logger.info("Startup profile (ms):")
+    for name, elapsed in sorted(_phases, key=lambda phase: phase[1], reverse=True):
+        logger.info(f"  {elapsed:9.1f}  {name}")
+    _phases.clear()
+
+
+def parse_importtime(output: str) -> List[Dict[str, object]]:
+    """Parse `python -X importtime` stderr into per-module records."""
+    records = []
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        try:
+            self_us, cumulative_us, module = line[len("import time:"):].split("|")
+            records.append(
+                {
+                    "module": module.strip(),
+                    "self_ms": int(self_us) / 1000,
+                    "cumulative_ms": int(cumulative_us) / 1000,
+                }
+            )
+        except ValueError:
+            continue
+    return records
+
+
+def profile_imports(target: str) -> List[Dict[str, object]]:
+    """Run `target` in a fresh interpreter under -X importtime."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", target],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+        env=dict(os.environ, STARTUP_PROFILE="true"),
+    )
+    return parse_importtime(result.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-module import time profile")
+    parser.add_argument(
+        "--target",
+        default="from app import create_full_app; create_full_app()",
+        help="Python statement to profile",
+    )
+    parser.add_argument("--top", type=int, default=25)
+    parser.add_argument(
+        "--prefix",
+        default="",
+        help="Only show modules starting with this prefix (e.g. 'app.')",
+    )
+    args = parser.parse_args()
+
+    records = [r for r in profile_imports(args.target) if r["module"].startswith(args.prefix)]
+    if not records:
+        print("No import timings captured")
+        return
+
+    total_ms = sum(r["self_ms"] for r in records)
+    print(f"{len(records)} modules imported, {total_ms:.1f} ms total self time\n")
+
+    for key in ("cumulative_ms", "self_ms"):
+        print(f"Top {args.top} by {key.replace('_ms', '')} time:")
+        for record in sorted(records, key=lambda r: r[key], reverse=True)[: args.top]:
+            print(f"  {record[key]:9.1f} ms  {record['module']}")
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+"""
+Request latency with logging off, synchronous at INFO, and queued at INFO.
+
+Each mode runs in its own interpreter (logging is configured once per
+process). A small Flask app serves an endpoint that logs a few INFO lines,
+like a typical service call does, and is driven from several threads
+concurrently so handler lock contention and file I/O show up in the tail.
+
+Usage (from the backend directory):
+    python benchmarks/logging_overhead.py
+    python benchmarks/logging_overhead.py --requests 5000 --threads 16 --lines 10
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+MODES = {
+    "off": {"LOG_LEVEL": "INFO", "LOG_ASYNC": "false", "BENCH_DISABLE_LOGGING": "1"},
+    "sync": {"LOG_LEVEL": "INFO", "LOG_ASYNC": "false"},
+    "async": {"LOG_LEVEL": "INFO", "LOG_ASYNC": "true"},
+}
+
+
+def run_mode(args) -> dict:
+    """Child process: serve and measure requests under the current logging setup."""
+    sys.path.insert(0, str(BACKEND_DIR))
+    import logging
+
+    from flask import Flask
+    from logger import get_logger, setup_logging, stop_logging
+
+    setup_logging()
+    if os.environ.get("BENCH_DISABLE_LOGGING"):
+        logging.disable(logging.CRITICAL)
+
+    log = get_logger("database.repositories.benchmark")
+    app = Flask(__name__)
+
+    @app.route("/work")
+    def work():
+        for i in range(args.lines):
+            log.info(f"Loaded row {i} for user 42 in repository call")
+        return {"ok": True}
+
+    def worker(count):
+        client = app.test_client()
+        latencies = []
+        for _ in range(count):
+            started = time.perf_counter()
+            client.get("/work")
+            latencies.append((time.perf_counter() - started) * 1000)
+        return latencies
+
+    per_thread = args.requests // args.threads
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.threads) as pool:
+        results = list(pool.map(worker, [per_thread] * args.threads))
+    elapsed = time.perf_counter() - started
+    stop_logging()
+
+    latencies = sorted(latency for result in results for latency in result)
+    count = len(latencies)
+    return {
+        "requests": count,
+        "rps": round(count / elapsed, 1),
+        "p50_ms": round(latencies[count // 2], 3),
+        "p95_ms": round(latencies[int(count * 0.95) - 1], 3),
+        "p99_ms": round(latencies[int(count * 0.99) - 1], 3),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Logging overhead benchmark")
+    parser.add_argument("--requests", type=int, default=4000)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--lines", type=int, default=5, help="INFO lines logged per request")
+    parser.add_argument("--mode", choices=list(MODES), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        print(json.dumps(run_mode(args)))
+        return
+
+    print(f"{'mode':>8} | {'requests':>8} | {'rps':>9} | {'p50_ms':>8} | {'p95_ms':>8} | {'p99_ms':>8}")
+    with tempfile.TemporaryDirectory() as log_dir:
+        for mode, overrides in MODES.items():
+            env = dict(os.environ, FLASK_ENV="production", LOG_DIR=log_dir, **overrides)
+            output = subprocess.run(
+                [sys.executable, __file__, "--mode", mode,
+                 "--requests", str(args.requests), "--threads", str(args.threads),
+                 "--lines", str(args.lines)],
+                cwd=BACKEND_DIR, env=env, capture_output=True, text=True, check=True,
+            ).stdout.strip().splitlines()[-1]
+            result = json.loads(output)
+            print(f"{mode:>8} | {result['requests']:>8} | {result['rps']:>9} | "
+                  f"{result['p50_ms']:>8} | {result['p95_ms']:>8} | {result['p99_ms']:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+"""
+Response compression: bytes on the wire and CPU cost per endpoint.
+
+Builds payloads shaped like the largest API responses (task list with
+embedded tags and subtask metadata, a week of Pomodoro sessions, the
+dashboard document), serializes them the way `jsonify` does, and compresses
+each with every installed coding at a few levels. Reports compressed size,
+ratio and CPU time per response.
+
+Usage (from the backend directory):
+    python benchmarks/response_compression.py
+    python benchmarks/response_compression.py --tasks 500 --sessions 400 --repeat 200
+"""
+import argparse
+import json
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.utils.compression import ENCODERS  # noqa: E402
+
+LEVELS = {"gzip": [1, 6, 9], "br": [1, 4, 11], "zstd": [1, 3, 10]}
+NOW = datetime(2026, 10, 19, 9, 0)
+
+
+def task_list(count: int) -> list:
+    random.seed(1)
+    tags = [{"id": i, "name": name, "color": color} for i, (name, color) in enumerate(
+        [("work", "blue"), ("home", "green"), ("urgent", "red"), ("reading", "purple")], start=1
+    )]
+    tasks = []
+    for i in range(count):
+        subtasks = random.randint(0, 8)
+        completed = random.randint(0, subtasks)
+        tasks.append({
+            "id": i + 1,
+            "title": f"Task {i + 1}: {random.choice(['Write', 'Review', 'Plan', 'Fix'])} the {random.choice(['report', 'budget', 'release', 'slides'])}",
+            "description": "Some notes about the task " * random.randint(0, 4) or None,
+            "priority": random.choice(["low", "medium", "high", "urgent"]),
+            "status": random.choice(["pending", "in_progress", "completed"]),
+            "due_date": (NOW + timedelta(days=random.randint(-5, 30))).isoformat(),
+            "completed_at": None,
+            "is_in_my_day": random.random() < 0.2,
+            "starred": random.random() < 0.1,
+            "user_id": 1,
+            "group_id": random.choice([None, 1, 2, 3]),
+            "created_at": (NOW - timedelta(days=random.randint(0, 90))).isoformat(),
+            "updated_at": NOW.isoformat(),
+            "tags": random.sample(tags, random.randint(0, 3)),
+            "has_subtasks": subtasks > 0,
+            "subtask_count": subtasks,
+            "completed_subtask_count": completed,
+            "subtask_completion_percentage": round(completed / subtasks * 100, 1) if subtasks else 0,
+            "estimated_focus_time": random.choice([None, 1500, 3000]),
+            "actual_focus_time": random.randint(0, 5000),
+            "total_focus_time_hours": 0.5,
+            "complexity_level": random.choice([None, "low", "medium", "high"]),
+            "requires_deep_focus": random.random() < 0.3,
+            "optimal_session_length": None,
+            "pomodoro_completion_percentage": 0.0,
+            "focus_time_completion_percentage": 0.0,
+        })
+    return tasks
+
+
+def session_list(count: int) -> list:
+    random.seed(2)
+    sessions = []
+    for i in range(count):
+        start = NOW - timedelta(minutes=30 * i)
+        sessions.append({
+            "id": i + 1,
+            "user_id": 1,
+            "task_id": random.randint(1, 50),
+            "session_type": random.choice(["work", "short_break", "long_break"]),
+            "status": random.choice(["completed", "interrupted"]),
+            "planned_duration": 1500,
+            "actual_duration": random.randint(600, 1500),
+            "start_time": start.isoformat(),
+            "end_time": (start + timedelta(minutes=25)).isoformat(),
+            "interruption_count": random.randint(0, 3),
+            "productivity_score": round(random.uniform(2, 5), 1),
+            "notes": None,
+            "created_at": start.isoformat(),
+            "updated_at": start.isoformat(),
+        })
+    return sessions
+
+
+def dashboard() -> dict:
+    random.seed(3)
+    days = [(NOW - timedelta(days=d)).date().isoformat() for d in range(30)]
+    return {
+        "summary": {"total_tasks": 240, "completed_tasks": 131, "completion_rate": 54.6, "streak": 6},
+        "daily_completions": [{"date": d, "completed": random.randint(0, 12)} for d in days],
+        "focus_by_day": [{"date": d, "minutes": random.randint(0, 300)} for d in days],
+        "priority_breakdown": {p: random.randint(5, 80) for p in ["low", "medium", "high", "urgent"]},
+        "upcoming": task_list(20),
+    }
+
+
+def measure(body: bytes, coding: str, level: int, repeat: int):
+    """Return (compressed size, CPU milliseconds per response)."""
+    started = time.process_time()
+    for _ in range(repeat):
+        encoder = ENCODERS[coding](level)
+        compressed = encoder.compress(body) + encoder.finish()
+    cpu_ms = (time.process_time() - started) * 1000 / repeat
+    return len(compressed), cpu_ms
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Response compression size and CPU cost")
+    parser.add_argument("--tasks", type=int, default=300, help="tasks in the task list payload")
+    parser.add_argument("--sessions", type=int, default=200, help="sessions in the weekly list payload")
+    parser.add_argument("--repeat", type=int, default=50, help="compressions per measurement")
+    args = parser.parse_args()
+
+    payloads = {
+        "GET /api/tasks": task_list(args.tasks),
+        "GET /api/pomodoro/sessions (week)": session_list(args.sessions),
+        "GET /api/dashboard": dashboard(),
+    }
+
+    print(f"installed codings: {', '.join(ENCODERS)}\n")
+    for endpoint, payload in payloads.items():
+        # Same separators as Flask's compact JSON output
+        body = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        print(f"{endpoint}: {len(body):,} bytes uncompressed")
+        print(f"  {'coding':>8} | {'level':>5} | {'bytes':>9} | {'ratio':>6} | {'cpu ms':>7}")
+        for coding in ENCODERS:
+            for level in LEVELS[coding]:
+                size, cpu_ms = measure(body, coding, level, args.repeat)
+                print(
+                    f"  {coding:>8} | {level:>5} | {size:>9,} | "
+                    f"{len(body) / size:>5.1f}x | {cpu_ms:>7.3f}"
+                )
+        print()
+
+
+if __name__ == "__main__":
+    main()
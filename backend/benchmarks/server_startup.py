@@ -0,0 +1,160 @@
+#!/usr/bin/env python
+"""
+Startup and throughput benchmark: Flask dev server vs. Gunicorn.
+
+Starts each server, measures how long it takes to answer its first request
+(and, for Gunicorn, until every worker has booted), then drives a fixed
+request load against a lightweight endpoint and reports throughput and
+latency percentiles.
+
+Usage (from the backend directory):
+    python benchmarks/server_startup.py
+    python benchmarks/server_startup.py --target gunicorn --workers 4 --threads 8
+    python benchmarks/server_startup.py --duration 30 --concurrency 32 --path /api/health/db
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+
+def wait_until_ready(url: str, timeout: float) -> float:
+    """Poll a URL until it answers; return seconds waited."""
+    started = time.perf_counter()
+    while time.perf_counter() - started < timeout:
+        try:
+            with urllib.request.urlopen(url, timeout=1) as response:
+                if response.status < 500:
+                    return time.perf_counter() - started
+        except (urllib.error.URLError, ConnectionError, OSError):
+            pass
+        time.sleep(0.05)
+    raise TimeoutError(f"Server did not become ready within {timeout}s")
+
+
+def run_load(url: str, duration: float, concurrency: int) -> dict:
+    """Hit a URL from `concurrency` threads for `duration` seconds."""
+    deadline = time.perf_counter() + duration
+    latencies, errors = [], [0]
+    lock = threading.Lock()
+
+    def worker():
+        local = []
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            try:
+                with urllib.request.urlopen(url, timeout=10) as response:
+                    response.read()
+                local.append((time.perf_counter() - started) * 1000)
+            except Exception:
+                with lock:
+                    errors[0] += 1
+        with lock:
+            latencies.extend(local)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for _ in range(concurrency):
+            pool.submit(worker)
+
+    latencies.sort()
+    count = len(latencies)
+    return {
+        "requests": count,
+        "errors": errors[0],
+        "rps": round(count / duration, 1),
+        "p50_ms": round(statistics.median(latencies), 2) if count else None,
+        "p95_ms": round(latencies[int(count * 0.95) - 1], 2) if count else None,
+        "p99_ms": round(latencies[int(count * 0.99) - 1], 2) if count else None,
+    }
+
+
+def start_server(target: str, port: int, args) -> subprocess.Popen:
+    """Start the dev server or Gunicorn on the given port."""
+    env = dict(os.environ, PORT=str(port), PYTHONUNBUFFERED="1")
+    if target == "dev":
+        command = [sys.executable, "run.py"]
+    else:
+        env["WEB_CONCURRENCY"] = str(args.workers)
+        env["GUNICORN_THREADS"] = str(args.threads)
+        env["GUNICORN_ACCESS_LOG"] = "/dev/null"
+        command = [sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py", "wsgi:app"]
+
+    return subprocess.Popen(
+        command,
+        cwd=BACKEND_DIR,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+
+
+def benchmark(target: str, args) -> dict:
+    """Boot one server, load it, and shut it down."""
+    port = args.port
+    base_url = f"http://127.0.0.1:{port}"
+    started = time.perf_counter()
+    process = start_server(target, port, args)
+
+    # Watch the server log for worker boot messages
+    worker_ready_times = []
+
+    def watch_stderr():
+        for line in process.stderr:
+            if "ready (threads=" in line:
+                worker_ready_times.append(time.perf_counter() - started)
+
+    threading.Thread(target=watch_stderr, daemon=True).start()
+
+    try:
+        first_response = wait_until_ready(base_url + args.path, args.boot_timeout)
+        time.sleep(args.warmup)
+        load = run_load(base_url + args.path, args.duration, args.concurrency)
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=15)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+    result = {"target": target, "first_response_s": round(first_response, 2), **load}
+    if worker_ready_times:
+        result["workers_booted"] = len(worker_ready_times)
+        result["all_workers_ready_s"] = round(max(worker_ready_times), 2)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--target", choices=["dev", "gunicorn", "both"], default="both")
+    parser.add_argument("--port", type=int, default=5055)
+    parser.add_argument("--path", default="/api/health/")
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--warmup", type=float, default=1)
+    parser.add_argument("--boot-timeout", type=float, default=60)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--threads", type=int, default=4)
+    args = parser.parse_args()
+
+    targets = ["dev", "gunicorn"] if args.target == "both" else [args.target]
+    results = [benchmark(target, args) for target in targets]
+
+    columns = ["target", "first_response_s", "all_workers_ready_s", "requests",
+               "errors", "rps", "p50_ms", "p95_ms", "p99_ms"]
+    print(" | ".join(f"{c:>18}" for c in columns))
+    for result in results:
+        print(" | ".join(f"{str(result.get(c, '-')):>18}" for c in columns))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+#!/usr/bin/env python
+"""
+Session partitioning: query latency and retention cost, heap vs monthly partitions.
+
+Builds two copies of a multi-year synthetic session history in a scratch
+schema on PostgreSQL: a plain table, and a table range partitioned by month
+on start_time (the layout of pomodoro_sessions / focus_sessions). Reports how
+many partitions each typical query touches, its latency on both layouts, and
+the cost of removing old history with DELETE versus DROP of whole partitions.
+
+Usage (from the backend directory; needs a PostgreSQL database you can write to):
+    python benchmarks/session_partitioning.py --url postgresql://localhost/flowdo_bench
+    python benchmarks/session_partitioning.py --users 2000 --years 4 --per-day 6
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+from datetime import date
+
+from sqlalchemy import create_engine, text
+
+SCHEMA = "bench_partitioning"
+TODAY = date(2026, 10, 19)
+
+QUERIES = {
+    "last 7 days (history list)": (
+        "SELECT * FROM {table} WHERE user_id = :user_id "
+        "AND start_time >= CAST(:today AS date) - 7 ORDER BY start_time DESC LIMIT 100"
+    ),
+    "30-day statistics": (
+        "SELECT status, COUNT(*), SUM(actual_duration) FROM {table} "
+        "WHERE user_id = :user_id AND start_time >= CAST(:today AS date) - 30 GROUP BY status"
+    ),
+    "active session (31-day lookback)": (
+        "SELECT * FROM {table} WHERE user_id = :user_id "
+        "AND start_time >= CAST(:today AS date) - 31 AND status IN ('in_progress', 'paused') LIMIT 1"
+    ),
+    "unbounded (all history)": (
+        "SELECT COUNT(*) FROM {table} WHERE user_id = :user_id AND status = 'completed'"
+    ),
+}
+
+
+def add_months(month: date, count: int) -> date:
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def build(conn, users: int, years: int, per_day: int) -> date:
+    """Create both tables and fill them; returns the first month of history."""
+    first = add_months(date(TODAY.year, TODAY.month, 1), -12 * years)
+    columns = """
+        id BIGINT NOT NULL,
+        user_id INTEGER NOT NULL,
+        status TEXT NOT NULL,
+        planned_duration INTEGER NOT NULL,
+        actual_duration INTEGER,
+        start_time TIMESTAMP NOT NULL,
+        end_time TIMESTAMP
+    """
+    conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+    conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+    conn.execute(text(f"CREATE TABLE {SCHEMA}.heap ({columns}, PRIMARY KEY (id))"))
+    conn.execute(text(
+        f"CREATE TABLE {SCHEMA}.partitioned ({columns}, PRIMARY KEY (id, start_time)) "
+        f"PARTITION BY RANGE (start_time)"
+    ))
+    month = first
+    while month <= add_months(TODAY, 1):
+        conn.execute(text(
+            f"CREATE TABLE {SCHEMA}.partitioned_p{month:%Y_%m} PARTITION OF {SCHEMA}.partitioned "
+            f"FOR VALUES FROM ('{month}') TO ('{add_months(month, 1)}')"
+        ))
+        month = add_months(month, 1)
+
+    conn.execute(text(f"""
+        INSERT INTO {SCHEMA}.heap
+        SELECT
+            row_number() OVER (),
+            u,
+            (ARRAY['completed', 'completed', 'completed', 'abandoned', 'interrupted'])[1 + (random() * 4)::int],
+            1500,
+            600 + (random() * 900)::int,
+            d + make_interval(mins => (480 + random() * 720)::int),
+            NULL
+        FROM generate_series(1, :users) u,
+             generate_series(CAST(:first AS timestamp), CAST(:today AS timestamp), interval '1 day') d,
+             generate_series(1, :per_day) n
+    """), {"users": users, "first": first, "today": TODAY, "per_day": per_day})
+    conn.execute(text(f"UPDATE {SCHEMA}.heap SET end_time = start_time + make_interval(secs => actual_duration)"))
+    conn.execute(text(f"INSERT INTO {SCHEMA}.partitioned SELECT * FROM {SCHEMA}.heap"))
+    for table in ("heap", "partitioned"):
+        conn.execute(text(f"CREATE INDEX ON {SCHEMA}.{table} (user_id, start_time)"))
+        conn.execute(text(f"ANALYZE {SCHEMA}.{table}"))
+    return first
+
+
+def partitions_scanned(conn, sql: str, params: dict) -> int:
+    plan = conn.execute(text(f"EXPLAIN (FORMAT JSON) {sql}"), params).scalar()
+
+    def walk(node):
+        own = 1 if node.get("Relation Name", "").startswith("partitioned_p") else 0
+        return own + sum(walk(child) for child in node.get("Plans", []))
+
+    return walk(plan[0]["Plan"])
+
+
+def time_query(conn, sql: str, params: dict, repeat: int) -> float:
+    """Median latency in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        conn.execute(text(sql), params).all()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Heap vs monthly partitioned session tables")
+    parser.add_argument("--url", default=os.environ.get("DATABASE_URL"), help="PostgreSQL URL [default: $DATABASE_URL]")
+    parser.add_argument("--users", type=int, default=500, help="synthetic users")
+    parser.add_argument("--years", type=int, default=3, help="years of history per user")
+    parser.add_argument("--per-day", type=int, default=4, help="sessions per user per day")
+    parser.add_argument("--keep-months", type=int, default=12, help="retention window for the delete benchmark")
+    parser.add_argument("--repeat", type=int, default=20, help="runs per query")
+    args = parser.parse_args()
+
+    if not args.url or not args.url.startswith("postgresql"):
+        sys.exit("A PostgreSQL --url (or DATABASE_URL) is required")
+
+    engine = create_engine(args.url)
+    with engine.begin() as conn:
+        started = time.perf_counter()
+        first = build(conn, args.users, args.years, args.per_day)
+        rows = conn.execute(text(f"SELECT COUNT(*) FROM {SCHEMA}.heap")).scalar()
+        print(f"{rows:,} sessions from {first} to {TODAY} built in {time.perf_counter() - started:.1f}s\n")
+
+    params = {"user_id": args.users // 2, "today": TODAY}
+    print(f"{'query':<34} | {'partitions':>10} | {'heap ms':>8} | {'partitioned ms':>14}")
+    with engine.connect() as conn:
+        for name, sql in QUERIES.items():
+            heap_sql, part_sql = sql.format(table=f"{SCHEMA}.heap"), sql.format(table=f"{SCHEMA}.partitioned")
+            print(
+                f"{name:<34} | {partitions_scanned(conn, part_sql, params):>10} | "
+                f"{time_query(conn, heap_sql, params, args.repeat):>8.2f} | "
+                f"{time_query(conn, part_sql, params, args.repeat):>14.2f}"
+            )
+
+    cutoff = add_months(date(TODAY.year, TODAY.month, 1), -args.keep_months)
+    print(f"\nretention: remove everything before {cutoff}")
+    with engine.begin() as conn:
+        started = time.perf_counter()
+        deleted = conn.execute(
+            text(f"DELETE FROM {SCHEMA}.heap WHERE start_time < :cutoff"), {"cutoff": cutoff}
+        ).rowcount
+        print(f"  heap DELETE:        {deleted:>10,} rows in {(time.perf_counter() - started) * 1000:>9.1f} ms")
+
+    with engine.begin() as conn:
+        started = time.perf_counter()
+        month, dropped = first, 0
+        while month < cutoff:
+            conn.execute(text(f"DROP TABLE {SCHEMA}.partitioned_p{month:%Y_%m}"))
+            month, dropped = add_months(month, 1), dropped + 1
+        print(f"  partition DROP:     {dropped:>10,} parts in {(time.perf_counter() - started) * 1000:>9.1f} ms")
+
+    with engine.begin() as conn:
+        conn.execute(text(f"DROP SCHEMA {SCHEMA} CASCADE"))
+
+
+if __name__ == "__main__":
+    main()
@@ -11,10 +11,8 @@ ENV_PATH = ROOT_DIR / '.env'
 # Load environment variables from .env file
 load_dotenv(ENV_PATH)
 
-# Create logs directory if it doesn't exist
-LOGS_DIR = ROOT_DIR / 'logs'
-if not LOGS_DIR.exists():
-    LOGS_DIR.mkdir(parents=True)
+# Logs directory (created by logger.setup_logging() when file logging starts)
+LOGS_DIR = Path(os.environ.get("LOG_DIR", ROOT_DIR / 'logs'))
 
 class Config:
     """Base configuration for the application."""
@@ -32,6 +30,28 @@ class Config:
     DB_PORT = os.environ.get("DB_PORT", "5432")
     DB_NAME = os.environ.get("DB_NAME", "flowdo")
     
+    # Read replicas (comma-separated SQLAlchemy URLs); empty means primary only
+    DB_REPLICA_URLS = [
+        url.strip() for url in os.environ.get("DB_REPLICA_URLS", "").split(",") if url.strip()
+    ]
+    # Keep a user's reads on the primary for this long after they write
+    DB_REPLICA_STICKY_SECONDS = int(os.environ.get("DB_REPLICA_STICKY_SECONDS", 5))
+    # How long a failed replica is skipped before it is tried again
+    DB_REPLICA_RETRY_SECONDS = int(os.environ.get("DB_REPLICA_RETRY_SECONDS", 30))
+    
+    # Connection pool settings (per worker process)
+    DB_POOL_SIZE = int(os.environ.get("DB_POOL_SIZE", 10))
+    DB_MAX_OVERFLOW = int(os.environ.get("DB_MAX_OVERFLOW", 15))
+    DB_POOL_TIMEOUT = int(os.environ.get("DB_POOL_TIMEOUT", 20))
+    DB_POOL_RECYCLE = int(os.environ.get("DB_POOL_RECYCLE", 3600))
+    # Total connection budget shared by all workers (0 = no cap)
+    DB_MAX_CONNECTIONS = int(os.environ.get("DB_MAX_CONNECTIONS", 0))
+    WEB_CONCURRENCY = int(os.environ.get("WEB_CONCURRENCY", 1))
+    # Warn when a request waits this long for a pooled connection
+    DB_POOL_WAIT_ALERT_MS = float(os.environ.get("DB_POOL_WAIT_ALERT_MS", 100))
+    # Report suggested pool sizes from observed concurrency in /api/health/pool
+    DB_POOL_AUTOTUNE = os.environ.get("DB_POOL_AUTOTUNE", "false").lower() == "true"
+    
     # SQLAlchemy settings
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     
@@ -84,8 +104,16 @@ class Config:
     JWT_SESSION_ACCESS_TOKEN_EXPIRES = timedelta(minutes=int(os.environ.get("JWT_SESSION_ACCESS_TOKEN_EXPIRES", 30)))  # 30 minutes
     JWT_SESSION_REFRESH_TOKEN_EXPIRES = timedelta(hours=int(os.environ.get("JWT_SESSION_REFRESH_TOKEN_EXPIRES", 4)))    # 4 hours
     
-    # Rate Limiting Configuration (optional, for future implementation)
+    # Rate limiting for auth endpoints ("memory://" per process, or "redis://..." shared)
+    RATELIMIT_ENABLED = os.environ.get("RATELIMIT_ENABLED", "true").lower() == "true"
     RATELIMIT_STORAGE_URL = os.environ.get("RATELIMIT_STORAGE_URL", "memory://")
+    RATELIMIT_TRUST_PROXY = os.environ.get("RATELIMIT_TRUST_PROXY", "false").lower() == "true"  # key by X-Forwarded-For
+    # Per-IP token buckets: scope -> (burst, requests per second)
+    RATELIMIT_RULES = {
+        "login": (int(os.environ.get("RATELIMIT_LOGIN_BURST", 10)), float(os.environ.get("RATELIMIT_LOGIN_RATE", 0.2))),
+        "register": (int(os.environ.get("RATELIMIT_REGISTER_BURST", 5)), float(os.environ.get("RATELIMIT_REGISTER_RATE", 0.01))),
+        "refresh": (int(os.environ.get("RATELIMIT_REFRESH_BURST", 30)), float(os.environ.get("RATELIMIT_REFRESH_RATE", 1))),
+    }
     
     # CORS settings
     CORS_ORIGINS = os.environ.get("CORS_ORIGINS", "http://localhost:3000").split(",")
@@ -96,14 +124,103 @@ class Config:
     LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s'
     LOG_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
     LOG_FILE = LOGS_DIR / 'app.log'
+    # Write logs from a background thread so request threads never block on I/O
+    LOG_ASYNC = os.environ.get("LOG_ASYNC", "true").lower() == "true"
+    LOG_QUEUE_SIZE = int(os.environ.get("LOG_QUEUE_SIZE", 10000))
+    LOG_BATCH_SIZE = int(os.environ.get("LOG_BATCH_SIZE", 100))
+    # Fraction of sub-WARNING records kept per logger, e.g. "database.db.connections=0.1"
+    LOG_SAMPLE_RATES = os.environ.get("LOG_SAMPLE_RATES", "sqlalchemy.pool=0.05,database.db.connections=0.1")
     
     # Application root directory
     BASE_DIR = ROOT_DIR
     
+    # Blueprints to register (comma-separated names); empty registers all
+    ENABLED_BLUEPRINTS = [
+        name.strip() for name in os.environ.get("ENABLED_BLUEPRINTS", "").split(",") if name.strip()
+    ]
+    
     # Auth-specific settings
     AUTH_TOKEN_REFRESH_THRESHOLD = timedelta(minutes=int(os.environ.get("AUTH_TOKEN_REFRESH_THRESHOLD", 5)))  # Refresh when 5 min left
-    AUTH_MAX_LOGIN_ATTEMPTS = int(os.environ.get("AUTH_MAX_LOGIN_ATTEMPTS", 5))  # Rate limiting
+    AUTH_MAX_LOGIN_ATTEMPTS = int(os.environ.get("AUTH_MAX_LOGIN_ATTEMPTS", 5))  # Failed logins per email per lockout window
     AUTH_LOCKOUT_DURATION = timedelta(minutes=int(os.environ.get("AUTH_LOCKOUT_DURATION", 15)))  # Account lockout
+    # Per-process cache of users' token epochs; a revoked access token may be accepted this long by other workers
+    AUTH_TOKEN_STATE_CACHE_SECONDS = float(os.environ.get("AUTH_TOKEN_STATE_CACHE_SECONDS", 5))
+    AUTH_TOKEN_STATE_CACHE_SIZE = int(os.environ.get("AUTH_TOKEN_STATE_CACHE_SIZE", 10000))
+    
+    # Per-process cache of user profile snapshots (durations, goals, is_active) read by timer
+    # actions; "redis://..." adds a store shared by all workers
+    USER_PROFILE_CACHE_SECONDS = float(os.environ.get("USER_PROFILE_CACHE_SECONDS", 60))
+    USER_PROFILE_CACHE_SIZE = int(os.environ.get("USER_PROFILE_CACHE_SIZE", 10000))
+    USER_PROFILE_CACHE_URL = os.environ.get("USER_PROFILE_CACHE_URL", "")
+    
+    # Per-process cache of users' tag name -> id maps used by tag filters
+    TAG_NAME_CACHE_SECONDS = float(os.environ.get("TAG_NAME_CACHE_SECONDS", 60))
+    TAG_NAME_CACHE_SIZE = int(os.environ.get("TAG_NAME_CACHE_SIZE", 10000))
+    # Per-process cache of sidebar counters, keyed by the user's change sequence
+    TASK_COUNTERS_CACHE_SECONDS = float(os.environ.get("TASK_COUNTERS_CACHE_SECONDS", 300))
+    TASK_COUNTERS_CACHE_SIZE = int(os.environ.get("TASK_COUNTERS_CACHE_SIZE", 10000))
+    
+    # Delta sync (GET /api/sync)
+    SYNC_PAGE_SIZE = int(os.environ.get("SYNC_PAGE_SIZE", 500))  # change log entries per page
+    SYNC_MAX_PAGE_SIZE = int(os.environ.get("SYNC_MAX_PAGE_SIZE", 1000))
+    SYNC_TOMBSTONE_RETENTION_DAYS = int(os.environ.get("SYNC_TOMBSTONE_RETENTION_DAYS", 30))  # older cursors must resync
+    
+    # Cold task archive (flask --app wsgi tasks archive)
+    TASK_ARCHIVE_AFTER_DAYS = int(os.environ.get("TASK_ARCHIVE_AFTER_DAYS", 180))  # finished tasks untouched this long
+    TASK_ARCHIVE_BATCH_SIZE = int(os.environ.get("TASK_ARCHIVE_BATCH_SIZE", 500))  # tasks per transaction
+    
+    # Daily goals behind the Pomodoro and focus streaks
+    DAILY_POMODORO_GOAL = int(os.environ.get("DAILY_POMODORO_GOAL", 8))  # completed work sessions
+    DAILY_FOCUS_GOAL_MINUTES = int(os.environ.get("DAILY_FOCUS_GOAL_MINUTES", 240))  # Pomodoro work + focus sessions
+    
+    # Due-date reminders (sent as task.due events; see EVENT_SINKS)
+    REMINDERS_ENABLED = os.environ.get("REMINDERS_ENABLED", "false").lower() == "true"  # run the scheduler in the server process
+    REMINDER_LEAD_MINUTES = int(os.environ.get("REMINDER_LEAD_MINUTES", 15))  # remind this long before the due date
+    REMINDER_WINDOW_MINUTES = int(os.environ.get("REMINDER_WINDOW_MINUTES", 60))  # due dates loaded per range scan
+    REMINDER_BATCH_SIZE = int(os.environ.get("REMINDER_BATCH_SIZE", 1000))  # rows per range scan / change log poll
+    REMINDER_POLL_SECONDS = float(os.environ.get("REMINDER_POLL_SECONDS", 10))  # change log polling interval
+    REMINDER_CHANGE_OVERLAP = int(os.environ.get("REMINDER_CHANGE_OVERLAP", 1000))  # change log ids re-read behind the cursor
+    
+    # Expiry of Pomodoro and focus sessions whose client went away (session.expired events)
+    SESSION_SWEEP_ENABLED = os.environ.get("SESSION_SWEEP_ENABLED", "false").lower() == "true"  # run the sweeper in the server process
+    SESSION_SWEEP_INTERVAL_SECONDS = float(os.environ.get("SESSION_SWEEP_INTERVAL_SECONDS", 60))
+    SESSION_SWEEP_BATCH_SIZE = int(os.environ.get("SESSION_SWEEP_BATCH_SIZE", 500))  # sessions per scan and UPDATE
+    SESSION_EXPIRY_GRACE_MINUTES = int(os.environ.get("SESSION_EXPIRY_GRACE_MINUTES", 30))  # past planned/maximum duration
+    
+    # In-process events ("sse" feeds GET /api/events/stream, "local" keeps them in memory)
+    EVENT_SINKS = [name.strip() for name in os.environ.get("EVENT_SINKS", "sse").split(",") if name.strip()]
+    EVENT_QUEUE_SIZE = int(os.environ.get("EVENT_QUEUE_SIZE", 1000))  # events waiting for delivery
+    EVENT_STREAM_QUEUE_SIZE = int(os.environ.get("EVENT_STREAM_QUEUE_SIZE", 100))  # per open stream
+    # Each open stream holds one of the GUNICORN_THREADS threads of its worker
+    EVENT_STREAM_MAX_STREAMS = int(os.environ.get("EVENT_STREAM_MAX_STREAMS", 2))  # per process
+    EVENT_STREAM_HEARTBEAT_SECONDS = float(os.environ.get("EVENT_STREAM_HEARTBEAT_SECONDS", 15))
+    EVENT_WEBHOOK_URL = os.environ.get("EVENT_WEBHOOK_URL")  # needs "webhook" in EVENT_SINKS
+    EVENT_WEBHOOK_SECRET = os.environ.get("EVENT_WEBHOOK_SECRET")  # signs the body (X-FlowDo-Signature)
+    EVENT_WEBHOOK_TIMEOUT = float(os.environ.get("EVENT_WEBHOOK_TIMEOUT", 5))
+    
+    # Monthly session partitions (PostgreSQL only)
+    SESSION_PARTITION_MONTHS_AHEAD = int(os.environ.get("SESSION_PARTITION_MONTHS_AHEAD", 3))  # created at startup
+    SESSION_RETENTION_MONTHS = int(os.environ.get("SESSION_RETENTION_MONTHS", 0))  # 0 keeps all session history
+    
+    # Batch requests (POST /api/batch)
+    BATCH_MAX_REQUESTS = int(os.environ.get("BATCH_MAX_REQUESTS", 20))  # sub-requests per batch
+    
+    # Response compression ("br" and "zstd" need the brotli / zstandard packages)
+    COMPRESS_ENABLED = os.environ.get("COMPRESS_ENABLED", "true").lower() == "true"
+    COMPRESS_ALGORITHMS = os.environ.get("COMPRESS_ALGORITHMS", "zstd,br,gzip").split(",")  # preference order
+    COMPRESS_LEVELS = {
+        "gzip": int(os.environ.get("COMPRESS_GZIP_LEVEL", 6)),
+        "br": int(os.environ.get("COMPRESS_BR_LEVEL", 4)),
+        "zstd": int(os.environ.get("COMPRESS_ZSTD_LEVEL", 3)),
+    }
+    COMPRESS_MIN_SIZE = int(os.environ.get("COMPRESS_MIN_SIZE", 1024))  # bytes; smaller bodies are sent as-is
+    COMPRESS_MIMETYPES = ["application/json", "text/event-stream"]
+    
+    # Password hashing (bcrypt work factor and process pool)
+    BCRYPT_ROUNDS = int(os.environ.get("BCRYPT_ROUNDS", 12))
+    BCRYPT_POOL_WORKERS = int(os.environ.get("BCRYPT_POOL_WORKERS", min(2, os.cpu_count() or 1)))  # 0 = hash inline
+    BCRYPT_MAX_PENDING = int(os.environ.get("BCRYPT_MAX_PENDING", 8))  # queued + running operations
+    BCRYPT_QUEUE_TIMEOUT = float(os.environ.get("BCRYPT_QUEUE_TIMEOUT", 5))  # seconds to wait for a slot
     
     # Email settings (for password reset, etc.)
     MAIL_SERVER = os.environ.get("MAIL_SERVER", "localhost")
@@ -120,6 +237,9 @@ class DevelopmentConfig(Config):
     DEBUG = True
     LOG_LEVEL = "DEBUG"
     DB_NAME = os.environ.get("DB_NAME", "flowdo_dev")
+    DB_POOL_SIZE = int(os.environ.get("DB_POOL_SIZE", 5))
+    DB_MAX_OVERFLOW = int(os.environ.get("DB_MAX_OVERFLOW", 5))
+    DB_POOL_AUTOTUNE = os.environ.get("DB_POOL_AUTOTUNE", "true").lower() == "true"
     
     # Development-specific JWT settings
     JWT_COOKIE_SECURE = False  # Allow non-HTTPS in development
@@ -138,6 +258,8 @@ class TestingConfig(Config):
     TESTING = True
     DEBUG = True
     DB_NAME = os.environ.get("TEST_DB_NAME", "flowdo_test")
+    DB_POOL_SIZE = int(os.environ.get("DB_POOL_SIZE", 2))
+    DB_MAX_OVERFLOW = int(os.environ.get("DB_MAX_OVERFLOW", 3))
     
     # Testing-specific settings
     JWT_COOKIE_SECURE = False
@@ -147,8 +269,18 @@ class TestingConfig(Config):
     # Disable CSRF for easier testing
     JWT_COOKIE_CSRF_PROTECT = False
     
-    # In-memory rate limiting for tests
+    # Tests log in repeatedly from one address
+    RATELIMIT_ENABLED = os.environ.get("RATELIMIT_ENABLED", "false").lower() == "true"
     RATELIMIT_STORAGE_URL = "memory://"
+    # Query budgets clear the per-process profile cache; a shared store would keep it warm
+    USER_PROFILE_CACHE_URL = ""
+    
+    # Cheap, inline password hashing for tests
+    BCRYPT_ROUNDS = 4
+    BCRYPT_POOL_WORKERS = 0
+    
+    # Keep events in memory instead of streaming or posting them
+    EVENT_SINKS = ["local"]
 
 
 class ProductionConfig(Config):
@@ -163,6 +295,7 @@ class ProductionConfig(Config):
     DB_HOST = os.environ.get("DB_HOST") or "db"
     DB_PORT = os.environ.get("DB_PORT") or "5432"
     DB_NAME = os.environ.get("DB_NAME") or "flowdo_prod"
+    DB_POOL_TIMEOUT = int(os.environ.get("DB_POOL_TIMEOUT", 10))
     
     # JWT settings for production
     JWT_SECRET_KEY = os.environ.get("JWT_SECRET_KEY") or SECRET_KEY
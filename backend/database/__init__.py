@@ -7,18 +7,28 @@ models, migrations, and session management.
 
 from .db import (
     Base,
-    engine,
+    get_engine,
     get_db_session,
     init_db,
     init_app,
     check_db_connection,
 )
+from .routing import get_read_session
 
 __all__ = [
     "Base",
     "engine",
+    "get_engine",
     "get_db_session",
     "init_db",
     "init_app",
     "check_db_connection",
+    "get_read_session",
 ]
+
+
+def __getattr__(name):
+    """Resolve `database.engine` lazily so importing the package doesn't create it."""
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,43 +3,61 @@ Core database setup module following Flask-SQLAlchemy best practices.
 """
 
 from logger import get_logger
-import subprocess
-from typing import Dict, Any, List
+import threading
+from contextvars import ContextVar
+from typing import Dict, Any, List, Optional
 from sqlalchemy import create_engine, inspect, text, event
-from sqlalchemy.orm import sessionmaker, declarative_base
-from sqlalchemy.engine import Engine
-from sqlalchemy.pool import QueuePool
+from sqlalchemy.orm import sessionmaker, declarative_base, Session as SASession
+from sqlalchemy.engine import Engine, make_url
 from contextlib import contextmanager
 
 from config.config import get_config
+from database.pool_metrics import (
+    InstrumentedQueuePool,
+    attach_metrics,
+    get_pool_metrics,
+    resolve_pool_settings,
+    suggest_pool_size,
+)
 
 # Set up logging
 logger = get_logger(__name__)
+# Per-connection events are high-frequency; kept on a child logger so they can be sampled
+connection_logger = get_logger(f"{__name__}.connections")
 
 # Get config
 config = get_config()
 
 
 # Create engine with optimized settings
-def create_db_engine():
-    """Create SQLAlchemy engine with proper configuration"""
+def create_db_engine(url: Optional[str] = None, name: str = "primary"):
+    """
+    Create SQLAlchemy engine with proper configuration.
+
+    Args:
+        url: Database URL; defaults to the primary database from config
+        name: Engine name used in logs and pool status ("primary", "replica-1", ...)
+    """
+    url = url or config.SQLALCHEMY_DATABASE_URI
     logger.info(
-        f"Creating database engine with URL: {config.DB_HOST}:{config.DB_PORT}/{config.DB_NAME}"
+        f"Creating {name} database engine with URL: "
+        f"{make_url(url).render_as_string(hide_password=True)}"
     )
 
+    pool_settings = resolve_pool_settings(config)
+    logger.info(f"Pool settings for {name}: {pool_settings}")
+
     engine_args: Dict[str, Any] = {
         "pool_pre_ping": True,
-        "pool_recycle": 3600,
         "echo": False,
         "echo_pool": config.DEBUG,  # Enable pool logging in debug mode
-        "poolclass": QueuePool,
-        "pool_size": 10,  # Increased from 5
-        "max_overflow": 15,  # Increased from 10
-        "pool_timeout": 20,  # Reduced from 30
+        "poolclass": InstrumentedQueuePool,
         "connect_args": {"connect_timeout": 10},
+        **pool_settings,
     }
 
-    engine = create_engine(config.SQLALCHEMY_DATABASE_URI, **engine_args)
+    engine = create_engine(url, **engine_args)
+    attach_metrics(engine, name, config.DB_POOL_WAIT_ALERT_MS)
 
     # Set PostgreSQL-specific settings
     @event.listens_for(engine, "connect")
@@ -53,22 +71,12 @@ def create_db_engine():
     @event.listens_for(engine, "connect")
     def log_connection_created(dbapi_connection, connection_record):
         """Log when a new connection is created."""
-        logger.info(f"Connection created: {id(dbapi_connection)}")
-
-    @event.listens_for(engine, "checkout")
-    def log_connection_checkout(dbapi_connection, connection_record, connection_proxy):
-        """Log when a connection is checked out from the pool."""
-        logger.debug(f"Connection checkout: {id(dbapi_connection)}")
-
-    @event.listens_for(engine, "checkin")
-    def log_connection_checkin(dbapi_connection, connection_record):
-        """Log when a connection is checked back into the pool."""
-        logger.debug(f"Connection checkin: {id(dbapi_connection)}")
+        connection_logger.debug(f"Connection created: {id(dbapi_connection)}")
 
     @event.listens_for(engine, "close")
     def log_connection_close(dbapi_connection, connection_record):
         """Log when a connection is closed."""
-        logger.info(f"Connection closed: {id(dbapi_connection)}")
+        connection_logger.debug(f"Connection closed: {id(dbapi_connection)}")
 
     @event.listens_for(engine, "invalidate")
     def log_connection_invalidate(dbapi_connection, connection_record, exception):
@@ -80,16 +88,83 @@ def create_db_engine():
     return engine
 
 
-# Create engine
-engine = create_db_engine()
-
-# Create session factory
-Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Engines are created on first use rather than at import time, so importing
+# models, repositories or routers (e.g. during test collection) stays cheap.
+_engine: Optional[Engine] = None
+_replica_engines: Optional[Dict[str, Engine]] = None
+_engine_lock = threading.Lock()
+
+# Create session factory (bound to the primary engine on first use)
+Session = sessionmaker(autocommit=False, autoflush=False)
+
+
+def get_engine() -> Engine:
+    """Get the primary engine, creating it on first use."""
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = create_db_engine()
+                Session.configure(bind=_engine)
+    return _engine
+
+
+def get_replica_engines() -> Dict[str, Engine]:
+    """Get read replica engines keyed by name ("replica-1", ...), creating them on first use."""
+    global _replica_engines
+    if _replica_engines is None:
+        with _engine_lock:
+            if _replica_engines is None:
+                _replica_engines = {
+                    f"replica-{index}": create_db_engine(url, name=f"replica-{index}")
+                    for index, url in enumerate(config.DB_REPLICA_URLS, start=1)
+                }
+    return _replica_engines
+
+
+def __getattr__(name):
+    """Keep `from database.db import engine` working without creating it at import."""
+    if name == "engine":
+        return get_engine()
+    if name == "replica_engines":
+        return get_replica_engines()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Create base model class
 Base = declarative_base()
 
 
+# Session shared by everything inside shared_session_scope() (batch requests)
+_shared_session: ContextVar[Optional[SASession]] = ContextVar("shared_session", default=None)
+
+
+def get_shared_session() -> Optional[SASession]:
+    """Get the session of the enclosing shared_session_scope(), if any."""
+    return _shared_session.get()
+
+
+@contextmanager
+def shared_session_scope():
+    """
+    Make get_db_session() reuse one session and transaction.
+
+    Each get_db_session() block inside the scope runs in its own savepoint,
+    so a block that raises only rolls back its own writes. Everything is
+    committed when the scope exits cleanly.
+    """
+    session = Session(bind=get_engine())
+    token = _shared_session.set(session)
+    try:
+        yield session
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        _shared_session.reset(token)
+        session.close()
+
+
 @contextmanager
 def get_db_session():
     """
@@ -97,13 +172,28 @@ def get_db_session():
 
     This is the primary way to get database sessions.
     Each request should use this to get a fresh session.
+    Inside shared_session_scope() the shared session is returned instead,
+    wrapped in a savepoint.
 
     Usage:
         with get_db_session() as session:
             service = SomeService(session)
             # ... use service
     """
-    session = Session()
+    shared = _shared_session.get()
+    if shared is not None:
+        savepoint = shared.begin_nested()
+        try:
+            yield shared
+            if savepoint.is_active:
+                savepoint.commit()
+        except Exception:
+            if savepoint.is_active:
+                savepoint.rollback()
+            raise
+        return
+
+    session = Session(bind=get_engine())
     try:
         yield session
         session.commit()
@@ -129,13 +219,13 @@ def init_db():
     import database.models.user_token
 
     # Create tables
-    Base.metadata.create_all(bind=engine)
+    Base.metadata.create_all(bind=get_engine())
 
 
 def check_db_connection():
     """Check if database connection is working."""
     try:
-        with engine.connect() as conn:
+        with get_engine().connect() as conn:
             conn.execute(text("SELECT 1"))
         return True
     except Exception as e:
@@ -143,10 +233,26 @@ def check_db_connection():
         return False
 
 
-def get_pool_status():
-    """Get current connection pool status."""
+def dispose_engines():
+    """
+    Drop pooled connections inherited from a parent process.
+
+    Call this in each worker right after fork: sharing a socket between
+    processes corrupts the connection, so every worker must open its own.
+    ``close=False`` leaves the parent's connections untouched.
+    """
+    # Only dispose engines that exist; don't create them just to dispose them
+    targets = [_engine] if _engine is not None else []
+    targets.extend((_replica_engines or {}).values())
+    for target in targets:
+        target.dispose(close=False)
+    logger.debug("Disposed inherited database connections after fork")
+
+
+def get_pool_status(target: Optional[Engine] = None):
+    """Get current connection pool status for an engine (primary by default)."""
     try:
-        pool = engine.pool
+        pool = (target or get_engine()).pool
 
         # Safely get pool metrics with hasattr checks
         size = getattr(pool, "size", lambda: 0)() if hasattr(pool, "size") else 0
@@ -158,15 +264,19 @@ def get_pool_status():
         overflow = (
             getattr(pool, "overflow", lambda: 0)() if hasattr(pool, "overflow") else 0
         )
+        # overflow() is negative until the pool has opened `size` connections
+        max_overflow = getattr(pool, "_max_overflow", 0)
+        capacity = size + max(0, max_overflow)
 
         return {
             "size": size,
             "checked_out": checked_out,
             "overflow": overflow,
+            "max_overflow": max_overflow,
             "total_connections": size + overflow,
             "available_connections": max(0, size - checked_out),
             "pool_limit_reached": (
-                checked_out >= (size + overflow) if size > 0 else False
+                checked_out >= capacity if size > 0 else False
             ),
         }
     except Exception as e:
@@ -182,12 +292,71 @@ def get_pool_status():
         }
 
 
+def get_all_pool_status() -> Dict[str, Dict[str, Any]]:
+    """
+    Get connection pool status for the primary and every replica engine.
+
+    Each entry includes checkout wait / hold time histograms and, when
+    DB_POOL_AUTOTUNE is enabled, a suggested pool size.
+    """
+    status = {}
+    for name, target in [("primary", get_engine()), *get_replica_engines().items()]:
+        info = get_pool_status(target)
+        metrics = get_pool_metrics(name)
+        if metrics:
+            info["metrics"] = metrics.snapshot()
+            if config.DB_POOL_AUTOTUNE:
+                settings = resolve_pool_settings(config)
+                info["autotune"] = suggest_pool_size(
+                    metrics, settings["pool_size"], settings["max_overflow"]
+                )
+        status[name] = info
+    return status
+
+
 def get_table_names() -> List[str]:
     """Get a list of all tables in the database."""
-    inspector = inspect(engine)
+    inspector = inspect(get_engine())
     return inspector.get_table_names()
 
 
+def _alembic_config():
+    """Load alembic.ini from the backend directory."""
+    from alembic.config import Config as AlembicConfig
+
+    alembic_cfg = AlembicConfig(str(config.BASE_DIR / "alembic.ini"))
+    alembic_cfg.set_main_option(
+        "script_location", str(config.BASE_DIR / "database" / "migrations")
+    )
+    return alembic_cfg
+
+
+def get_migration_heads() -> List[str]:
+    """Get head revisions from the migration scripts, without shelling out to alembic."""
+    from alembic.script import ScriptDirectory
+
+    return list(ScriptDirectory.from_config(_alembic_config()).get_heads())
+
+
+def get_migration_status() -> Dict[str, Any]:
+    """
+    Compare the database's current revision with the migration heads.
+
+    Uses Alembic's Python API in-process instead of running `alembic current`.
+    """
+    from alembic.runtime.migration import MigrationContext
+
+    heads = get_migration_heads()
+    with get_engine().connect() as conn:
+        current = list(MigrationContext.configure(conn).get_current_heads())
+
+    return {
+        "current": current,
+        "heads": heads,
+        "up_to_date": set(current) == set(heads),
+    }
+
+
 def setup_alembic_version():
     """
     Set up the alembic_version table for an existing database.
@@ -203,35 +372,27 @@ def setup_alembic_version():
 
             # Get the latest migration version
             try:
-                result = subprocess.run(
-                    ["alembic", "heads"], capture_output=True, text=True, check=True
-                )
-                if result.stdout:
-                    # Extract version from output
-                    version_line = [
-                        line for line in result.stdout.split("\n") if line.strip()
-                    ]
-                    if version_line:
-                        version = version_line[0].split(" ")[0].strip()
-
-                        # Create alembic_version table manually
-                        with engine.connect() as conn:
-                            conn.execute(
-                                text(
-                                    "CREATE TABLE IF NOT EXISTS alembic_version (version_num VARCHAR(32) PRIMARY KEY);"
-                                )
-                            )
-                            conn.execute(
-                                text(
-                                    f"INSERT INTO alembic_version (version_num) VALUES ('{version}');"
-                                )
+                heads = get_migration_heads()
+                if heads:
+                    version = heads[0]
+
+                    # Create alembic_version table manually
+                    with get_engine().connect() as conn:
+                        conn.execute(
+                            text(
+                                "CREATE TABLE IF NOT EXISTS alembic_version (version_num VARCHAR(32) PRIMARY KEY);"
                             )
-                            conn.commit()
-
-                        logger.info(
-                            f"Created alembic_version table with version: {version}"
                         )
-                        return True
+                        conn.execute(
+                            text(
+                                "INSERT INTO alembic_version (version_num) VALUES (:version);"
+                            ),
+                            {"version": version},
+                        )
+                        conn.commit()
+
+                    logger.info(f"Created alembic_version table with version: {version}")
+                    return True
             except Exception as e:
                 logger.error(f"Failed to set up alembic_version table: {str(e)}")
 
@@ -0,0 +1,37 @@
+"""add user token epoch
+
+Revision ID: 3f1a7c2d9e04
+Revises: bc65c393bca8
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f1a7c2d9e04'
+down_revision: Union[str, None] = 'bc65c393bca8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('token_epoch', sa.Integer(), server_default='0', nullable=False))
+
+    # Access tokens are no longer stored; only refresh tokens keep a row
+    op.execute("DELETE FROM user_tokens WHERE token_type = 'access' OR revoked = true")
+
+    with op.batch_alter_table('user_tokens', schema=None) as batch_op:
+        batch_op.create_index('ix_user_tokens_user_id_token_type', ['user_id', 'token_type'], unique=False)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('user_tokens', schema=None) as batch_op:
+        batch_op.drop_index('ix_user_tokens_user_id_token_type')
+
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.drop_column('token_epoch')
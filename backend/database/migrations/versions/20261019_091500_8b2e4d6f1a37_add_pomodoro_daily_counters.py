@@ -0,0 +1,69 @@
+"""add pomodoro daily counters
+
+Revision ID: 8b2e4d6f1a37
+Revises: 3f1a7c2d9e04
+Create Date: 2026-10-19 09:15:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8b2e4d6f1a37'
+down_revision: Union[str, None] = '3f1a7c2d9e04'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('pomodoro_daily_counters',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('work_started', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('work_completed', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('short_breaks_completed', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('long_breaks_completed', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('last_session_type', postgresql.ENUM('work', 'short_break', 'long_break', name='pomodoro_session_type', create_type=False), nullable=True),
+    sa.Column('last_session_at', sa.DateTime(), nullable=True),
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('user_id', 'day', name='uq_pomodoro_daily_counters_user_day')
+    )
+    with op.batch_alter_table('pomodoro_daily_counters', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_pomodoro_daily_counters_id'), ['id'], unique=False)
+
+    # Backfill from existing sessions
+    op.execute("""
+        INSERT INTO pomodoro_daily_counters (
+            user_id, day, work_started, work_completed, short_breaks_completed,
+            long_breaks_completed, last_session_type, last_session_at, created_at, updated_at
+        )
+        SELECT
+            user_id,
+            start_time::date,
+            COUNT(*) FILTER (WHERE session_type = 'work'),
+            COUNT(*) FILTER (WHERE session_type = 'work' AND status = 'completed'),
+            COUNT(*) FILTER (WHERE session_type = 'short_break' AND status = 'completed'),
+            COUNT(*) FILTER (WHERE session_type = 'long_break' AND status = 'completed'),
+            (ARRAY_AGG(session_type ORDER BY start_time DESC))[1],
+            MAX(start_time),
+            NOW(),
+            NOW()
+        FROM pomodoro_sessions
+        WHERE start_time IS NOT NULL
+        GROUP BY user_id, start_time::date
+    """)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('pomodoro_daily_counters', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_pomodoro_daily_counters_id'))
+
+    op.drop_table('pomodoro_daily_counters')
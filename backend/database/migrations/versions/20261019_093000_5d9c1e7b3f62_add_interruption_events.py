@@ -0,0 +1,54 @@
+"""add interruption events
+
+Revision ID: 5d9c1e7b3f62
+Revises: 8b2e4d6f1a37
+Create Date: 2026-10-19 09:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d9c1e7b3f62'
+down_revision: Union[str, None] = '8b2e4d6f1a37'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('interruption_events',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('pomodoro_session_id', sa.Integer(), nullable=True),
+    sa.Column('focus_session_id', sa.Integer(), nullable=True),
+    sa.Column('interruption_type', postgresql.ENUM('internal', 'external', 'technical', 'emergency', name='interruption_type', create_type=False), nullable=False),
+    sa.Column('duration', sa.Integer(), nullable=False),
+    sa.Column('occurred_at', sa.DateTime(), nullable=False),
+    sa.Column('note', sa.Text(), nullable=True),
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.CheckConstraint('(pomodoro_session_id IS NULL) <> (focus_session_id IS NULL)', name='ck_interruption_events_one_session'),
+    sa.ForeignKeyConstraint(['focus_session_id'], ['focus_sessions.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['pomodoro_session_id'], ['pomodoro_sessions.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('interruption_events', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_interruption_events_id'), ['id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_interruption_events_pomodoro_session_id'), ['pomodoro_session_id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_interruption_events_focus_session_id'), ['focus_session_id'], unique=False)
+        batch_op.create_index('ix_interruption_events_user_id_occurred_at', ['user_id', 'occurred_at'], unique=False)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('interruption_events', schema=None) as batch_op:
+        batch_op.drop_index('ix_interruption_events_user_id_occurred_at')
+        batch_op.drop_index(batch_op.f('ix_interruption_events_focus_session_id'))
+        batch_op.drop_index(batch_op.f('ix_interruption_events_pomodoro_session_id'))
+        batch_op.drop_index(batch_op.f('ix_interruption_events_id'))
+
+    op.drop_table('interruption_events')
@@ -0,0 +1,67 @@
+"""add change log and sync state
+
+Revision ID: a4f7c2e9b158
+Revises: 5d9c1e7b3f62
+Create Date: 2026-10-19 09:45:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4f7c2e9b158'
+down_revision: Union[str, None] = '5d9c1e7b3f62'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('sync_state',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('last_seq', sa.BigInteger(), server_default='0', nullable=False),
+    sa.Column('floor_seq', sa.BigInteger(), server_default='0', nullable=False),
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('user_id')
+    )
+    with op.batch_alter_table('sync_state', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_sync_state_id'), ['id'], unique=False)
+
+    op.create_table('change_log',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('seq', sa.BigInteger(), nullable=False),
+    sa.Column('entity_type', sa.Enum('task', 'subtask', 'tag', 'group', name='change_entity_type'), nullable=False),
+    sa.Column('entity_id', sa.Integer(), nullable=False),
+    sa.Column('operation', sa.Enum('upsert', 'delete', name='change_operation'), nullable=False),
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('user_id', 'seq', name='uq_change_log_user_seq')
+    )
+    with op.batch_alter_table('change_log', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_change_log_id'), ['id'], unique=False)
+        batch_op.create_index('ix_change_log_user_entity', ['user_id', 'entity_type', 'entity_id'], unique=False)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('change_log', schema=None) as batch_op:
+        batch_op.drop_index('ix_change_log_user_entity')
+        batch_op.drop_index(batch_op.f('ix_change_log_id'))
+
+    op.drop_table('change_log')
+
+    with op.batch_alter_table('sync_state', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_sync_state_id'))
+
+    op.drop_table('sync_state')
+
+    sa.Enum(name='change_operation').drop(op.get_bind(), checkfirst=True)
+    sa.Enum(name='change_entity_type').drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,29 @@
+"""add task_tags composite indexes
+
+Revision ID: c81e5b3a7d29
+Revises: a4f7c2e9b158
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c81e5b3a7d29'
+down_revision: Union[str, None] = 'a4f7c2e9b158'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('task_tags', schema=None) as batch_op:
+        batch_op.create_index('ix_task_tags_tag_id_task_id', ['tag_id', 'task_id'], unique=False)
+        batch_op.create_index('ix_task_tags_task_id_tag_id', ['task_id', 'tag_id'], unique=False)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('task_tags', schema=None) as batch_op:
+        batch_op.drop_index('ix_task_tags_task_id_tag_id')
+        batch_op.drop_index('ix_task_tags_tag_id_task_id')
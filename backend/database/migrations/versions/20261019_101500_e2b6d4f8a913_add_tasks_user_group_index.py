@@ -0,0 +1,27 @@
+"""add tasks (user_id, group_id) index
+
+Revision ID: e2b6d4f8a913
+Revises: c81e5b3a7d29
+Create Date: 2026-10-19 10:15:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2b6d4f8a913'
+down_revision: Union[str, None] = 'c81e5b3a7d29'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('tasks', schema=None) as batch_op:
+        batch_op.create_index('ix_tasks_user_id_group_id', ['user_id', 'group_id'], unique=False)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('tasks', schema=None) as batch_op:
+        batch_op.drop_index('ix_tasks_user_id_group_id')
@@ -0,0 +1,138 @@
+"""partition session tables by month
+
+Revision ID: f3a9d1c6b852
+Revises: e2b6d4f8a913
+Create Date: 2026-10-19 10:30:00.000000
+
+pomodoro_sessions and focus_sessions become range partitioned on
+start_time, one partition per calendar month plus a default partition.
+PostgreSQL requires the partition key in every unique constraint, so the
+primary key becomes (id, start_time) and uuid is unique per start_time;
+ids still come from the same sequence and uuids are still random, so
+neither is reused in practice. Foreign keys can't point at a partitioned
+table's id alone, so interruption_events loses its session foreign keys.
+
+"""
+from datetime import date, datetime
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3a9d1c6b852'
+down_revision: Union[str, None] = 'e2b6d4f8a913'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# table -> interruption_events column referencing it
+SESSION_TABLES = {
+    'pomodoro_sessions': 'pomodoro_session_id',
+    'focus_sessions': 'focus_session_id',
+}
+MONTHS_AHEAD = 3
+
+
+def _add_months(month: date, count: int) -> date:
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _create_partitions(table: str, first: date, last: date) -> None:
+    month = date(first.year, first.month, 1)
+    while month <= last:
+        upper = _add_months(month, 1)
+        op.execute(
+            f"CREATE TABLE {table}_p{month:%Y_%m} PARTITION OF {table} "
+            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{upper.isoformat()}')"
+        )
+        month = upper
+    op.execute(f"CREATE TABLE {table}_default PARTITION OF {table} DEFAULT")
+
+
+def _partition(table: str, event_column: str) -> None:
+    old = f'{table}_unpartitioned'
+    op.execute(
+        f"ALTER TABLE interruption_events "
+        f"DROP CONSTRAINT IF EXISTS interruption_events_{event_column}_fkey"
+    )
+    op.execute(f"ALTER TABLE {table} RENAME TO {old}")
+    op.execute(f"ALTER INDEX {table}_pkey RENAME TO {old}_pkey")
+    op.execute(f"ALTER INDEX {table}_uuid_key RENAME TO {old}_uuid_key")
+    op.execute(f"DROP INDEX ix_{table}_id")
+    op.execute(f"ALTER SEQUENCE {table}_id_seq OWNED BY NONE")
+
+    # Sessions are always started with a start_time; cover legacy rows
+    op.execute(f"UPDATE {old} SET start_time = created_at WHERE start_time IS NULL")
+
+    op.execute(f"""
+        CREATE TABLE {table} (
+            LIKE {old} INCLUDING DEFAULTS,
+            PRIMARY KEY (id, start_time),
+            UNIQUE (uuid, start_time),
+            FOREIGN KEY (user_id) REFERENCES users (id),
+            FOREIGN KEY (task_id) REFERENCES tasks (id)
+        ) PARTITION BY RANGE (start_time)
+    """)
+
+    today = datetime.utcnow().date()
+    oldest = op.get_bind().execute(sa.text(f"SELECT MIN(start_time) FROM {old}")).scalar()
+    first = min(oldest.date(), today) if oldest else today
+    _create_partitions(table, first, _add_months(today, MONTHS_AHEAD))
+
+    op.execute(f"INSERT INTO {table} SELECT * FROM {old}")
+    op.execute(f"DROP TABLE {old}")
+    op.execute(f"ALTER SEQUENCE {table}_id_seq OWNED BY {table}.id")
+
+    with op.batch_alter_table(table, schema=None) as batch_op:
+        batch_op.create_index(batch_op.f(f'ix_{table}_id'), ['id'], unique=False)
+        batch_op.create_index(f'ix_{table}_user_id_start_time', ['user_id', 'start_time'], unique=False)
+    op.execute(f"ANALYZE {table}")
+
+
+def _unpartition(table: str, event_column: str) -> None:
+    old = f'{table}_partitioned'
+    op.execute(f"ALTER TABLE {table} RENAME TO {old}")
+    op.execute(f"ALTER INDEX {table}_pkey RENAME TO {old}_pkey")
+    op.execute(f"DROP INDEX ix_{table}_id")
+    op.execute(f"DROP INDEX ix_{table}_user_id_start_time")
+    op.execute(f"ALTER SEQUENCE {table}_id_seq OWNED BY NONE")
+
+    op.execute(f"""
+        CREATE TABLE {table} (
+            LIKE {old} INCLUDING DEFAULTS,
+            PRIMARY KEY (id),
+            UNIQUE (uuid),
+            FOREIGN KEY (user_id) REFERENCES users (id),
+            FOREIGN KEY (task_id) REFERENCES tasks (id)
+        )
+    """)
+    op.execute(f"ALTER TABLE {table} ALTER COLUMN start_time DROP NOT NULL")
+    op.execute(f"INSERT INTO {table} SELECT * FROM {old}")
+    op.execute(f"DROP TABLE {old}")
+    op.execute(f"ALTER SEQUENCE {table}_id_seq OWNED BY {table}.id")
+
+    with op.batch_alter_table(table, schema=None) as batch_op:
+        batch_op.create_index(batch_op.f(f'ix_{table}_id'), ['id'], unique=False)
+
+    # Events whose sessions were dropped by retention can't satisfy the key again
+    op.execute(f"""
+        DELETE FROM interruption_events e
+        WHERE e.{event_column} IS NOT NULL
+          AND NOT EXISTS (SELECT 1 FROM {table} s WHERE s.id = e.{event_column})
+    """)
+    op.execute(
+        f"ALTER TABLE interruption_events ADD CONSTRAINT interruption_events_{event_column}_fkey "
+        f"FOREIGN KEY ({event_column}) REFERENCES {table} (id) ON DELETE CASCADE"
+    )
+
+
+def upgrade() -> None:
+    for table, event_column in SESSION_TABLES.items():
+        _partition(table, event_column)
+
+
+def downgrade() -> None:
+    for table, event_column in SESSION_TABLES.items():
+        _unpartition(table, event_column)
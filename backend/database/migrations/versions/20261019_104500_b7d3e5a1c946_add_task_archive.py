@@ -0,0 +1,108 @@
+"""add task archive tables
+
+Revision ID: b7d3e5a1c946
+Revises: f3a9d1c6b852
+Create Date: 2026-10-19 10:45:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d3e5a1c946'
+down_revision: Union[str, None] = 'f3a9d1c6b852'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('archived_tasks',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('title', sa.String(length=255), nullable=False),
+    sa.Column('description', sa.String(length=255), nullable=True),
+    sa.Column('priority', postgresql.ENUM('low', 'medium', 'high', 'urgent', name='task_priority', create_type=False), nullable=False),
+    sa.Column('status', postgresql.ENUM('pending', 'in_progress', 'completed', 'archived', 'cancelled', name='task_status', create_type=False), nullable=False),
+    sa.Column('due_date', sa.DateTime(), nullable=True),
+    sa.Column('completed_at', sa.DateTime(), nullable=True),
+    sa.Column('is_in_my_day', sa.Boolean(), nullable=True),
+    sa.Column('starred', sa.Boolean(), nullable=True),
+    sa.Column('estimated_pomodoros', sa.Integer(), nullable=True),
+    sa.Column('completed_pomodoros', sa.Integer(), nullable=True),
+    sa.Column('estimated_focus_time', sa.Integer(), nullable=True),
+    sa.Column('actual_focus_time', sa.Integer(), nullable=True),
+    sa.Column('complexity_level', sa.Integer(), nullable=True),
+    sa.Column('requires_deep_focus', sa.Boolean(), nullable=True),
+    sa.Column('optimal_session_length', sa.Integer(), nullable=True),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('group_id', sa.Integer(), nullable=True),
+    sa.Column('archived_at', sa.DateTime(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('archived_tasks', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_archived_tasks_id'), ['id'], unique=False)
+        batch_op.create_index('ix_archived_tasks_user_id_archived_at', ['user_id', 'archived_at'], unique=False)
+
+    op.create_table('archived_subtasks',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('title', sa.String(length=255), nullable=False),
+    sa.Column('description', sa.String(length=255), nullable=True),
+    sa.Column('is_completed', sa.Boolean(), nullable=False),
+    sa.Column('position', sa.Integer(), nullable=False),
+    sa.Column('task_id', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('archived_subtasks', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_archived_subtasks_id'), ['id'], unique=False)
+        batch_op.create_index('ix_archived_subtasks_task_id', ['task_id'], unique=False)
+
+    op.create_table('archived_task_tags',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('task_id', sa.Integer(), nullable=False),
+    sa.Column('tag_id', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('archived_task_tags', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_archived_task_tags_id'), ['id'], unique=False)
+        batch_op.create_index('ix_archived_task_tags_task_id', ['task_id'], unique=False)
+
+    # Finding archivable tasks, and skipping those referenced by sessions
+    with op.batch_alter_table('tasks', schema=None) as batch_op:
+        batch_op.create_index('ix_tasks_status_updated_at', ['status', 'updated_at'], unique=False)
+    with op.batch_alter_table('pomodoro_sessions', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_pomodoro_sessions_task_id'), ['task_id'], unique=False)
+    with op.batch_alter_table('focus_sessions', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_focus_sessions_task_id'), ['task_id'], unique=False)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('focus_sessions', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_focus_sessions_task_id'))
+    with op.batch_alter_table('pomodoro_sessions', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_pomodoro_sessions_task_id'))
+    with op.batch_alter_table('tasks', schema=None) as batch_op:
+        batch_op.drop_index('ix_tasks_status_updated_at')
+
+    with op.batch_alter_table('archived_task_tags', schema=None) as batch_op:
+        batch_op.drop_index('ix_archived_task_tags_task_id')
+        batch_op.drop_index(batch_op.f('ix_archived_task_tags_id'))
+    op.drop_table('archived_task_tags')
+
+    with op.batch_alter_table('archived_subtasks', schema=None) as batch_op:
+        batch_op.drop_index('ix_archived_subtasks_task_id')
+        batch_op.drop_index(batch_op.f('ix_archived_subtasks_id'))
+    op.drop_table('archived_subtasks')
+
+    with op.batch_alter_table('archived_tasks', schema=None) as batch_op:
+        batch_op.drop_index('ix_archived_tasks_user_id_archived_at')
+        batch_op.drop_index(batch_op.f('ix_archived_tasks_id'))
+    op.drop_table('archived_tasks')
@@ -0,0 +1,47 @@
+"""add user streaks
+
+Revision ID: c2e8f4a7d913
+Revises: b7d3e5a1c946
+Create Date: 2026-10-19 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c2e8f4a7d913'
+down_revision: Union[str, None] = 'b7d3e5a1c946'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('user_streaks',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('metric', sa.Enum('task_completion', 'pomodoro_goal', 'focus_goal', name='streak_metric'), nullable=False),
+    sa.Column('current_streak', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('longest_streak', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('last_active_date', sa.Date(), nullable=True),
+    sa.Column('progress_date', sa.Date(), nullable=True),
+    sa.Column('progress', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('user_id', 'metric', name='uq_user_streaks_user_metric')
+    )
+    with op.batch_alter_table('user_streaks', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_user_streaks_id'), ['id'], unique=False)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('user_streaks', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_user_streaks_id'))
+
+    op.drop_table('user_streaks')
+
+    sa.Enum(name='streak_metric').drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,28 @@
+"""add open task due date index
+
+Revision ID: d5b1a9e3c724
+Revises: c2e8f4a7d913
+Create Date: 2026-10-19 11:15:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5b1a9e3c724'
+down_revision: Union[str, None] = 'c2e8f4a7d913'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('tasks', schema=None) as batch_op:
+        batch_op.create_index('ix_tasks_open_due_date', ['due_date'], unique=False, postgresql_where=sa.text("status IN ('pending', 'in_progress')"))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('tasks', schema=None) as batch_op:
+        batch_op.drop_index('ix_tasks_open_due_date', postgresql_where=sa.text("status IN ('pending', 'in_progress')"))
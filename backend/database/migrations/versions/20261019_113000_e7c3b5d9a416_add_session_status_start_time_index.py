@@ -0,0 +1,34 @@
+"""add session status start time indexes
+
+Revision ID: e7c3b5d9a416
+Revises: d5b1a9e3c724
+Create Date: 2026-10-19 11:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7c3b5d9a416'
+down_revision: Union[str, None] = 'd5b1a9e3c724'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# On PostgreSQL the session tables are partitioned; an index created on the
+# parent is created on every partition, including ones added later
+TABLES = ("pomodoro_sessions", "focus_sessions")
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.create_index(f'ix_{table}_status_start_time', ['status', 'start_time'], unique=False)
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.drop_index(f'ix_{table}_status_start_time')
@@ -0,0 +1,70 @@
+"""add stored focus session scores
+
+Revision ID: a4d8f2c6e913
+Revises: e7c3b5d9a416
+Create Date: 2026-10-19 11:45:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4d8f2c6e913'
+down_revision: Union[str, None] = 'e7c3b5d9a416'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('focus_sessions', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('productivity_score', sa.Float(), nullable=True))
+        batch_op.add_column(sa.Column('efficiency_ratio', sa.Float(), nullable=True))
+
+    # Backfill with the same rules as FocusSession.calculate_productivity_score()
+    # and calculate_efficiency_ratio(); zero ratings count as unset
+    op.execute("""
+        UPDATE focus_sessions SET
+            productivity_score = CASE
+                WHEN COALESCE(focus_intensity, 0) <> 0
+                    OR COALESCE(overall_satisfaction, 0) <> 0
+                    OR COALESCE(flow_state_achieved, false)
+                THEN (
+                    COALESCE(focus_intensity, 0) * 0.3
+                    + COALESCE(overall_satisfaction, 0) * 0.3
+                    + CASE WHEN COALESCE(flow_state_achieved, false) THEN 1.0 ELSE 0 END
+                    + CASE distraction_level
+                        WHEN 'minimal' THEN 1.0
+                        WHEN 'low' THEN 0.8
+                        WHEN 'moderate' THEN 0.6
+                        WHEN 'high' THEN 0.4
+                        WHEN 'overwhelming' THEN 0.2
+                        ELSE 0
+                    END
+                ) / (
+                    CASE WHEN COALESCE(focus_intensity, 0) <> 0 THEN 0.3 ELSE 0 END
+                    + CASE WHEN COALESCE(overall_satisfaction, 0) <> 0 THEN 0.3 ELSE 0 END
+                    + CASE WHEN COALESCE(flow_state_achieved, false) THEN 0.2 ELSE 0 END
+                    + CASE WHEN distraction_level IS NOT NULL THEN 0.2 ELSE 0 END
+                )
+            END,
+            efficiency_ratio = CASE
+                WHEN COALESCE(planned_duration, 0) <> 0 AND actual_duration > 0
+                THEN (actual_duration - COALESCE(pause_duration, 0))::float / actual_duration
+            END
+    """)
+
+    # Per-user ranking and averages; on PostgreSQL these reach every partition
+    with op.batch_alter_table('focus_sessions', schema=None) as batch_op:
+        batch_op.create_index('ix_focus_sessions_user_id_productivity_score', ['user_id', 'productivity_score'], unique=False)
+        batch_op.create_index('ix_focus_sessions_user_id_efficiency_ratio', ['user_id', 'efficiency_ratio'], unique=False)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('focus_sessions', schema=None) as batch_op:
+        batch_op.drop_index('ix_focus_sessions_user_id_efficiency_ratio')
+        batch_op.drop_index('ix_focus_sessions_user_id_productivity_score')
+        batch_op.drop_column('efficiency_ratio')
+        batch_op.drop_column('productivity_score')
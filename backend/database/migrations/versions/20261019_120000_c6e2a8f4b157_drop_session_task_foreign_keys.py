@@ -0,0 +1,38 @@
+"""drop session task foreign keys
+
+Revision ID: c6e2a8f4b157
+Revises: a4d8f2c6e913
+Create Date: 2026-10-19 12:00:00.000000
+
+Sessions are history: their task may move to the archive (keeping its id)
+and back, so task_id no longer references tasks. On the partitioned session
+tables, dropping the constraint on the parent drops it on every partition.
+
+Downgrading recreates the constraints, which fails while sessions point at
+archived tasks; restore those first.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c6e2a8f4b157'
+down_revision: Union[str, None] = 'a4d8f2c6e913'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ("pomodoro_sessions", "focus_sessions")
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.execute(f"ALTER TABLE {table} DROP CONSTRAINT IF EXISTS {table}_task_id_fkey")
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.execute(
+            f"ALTER TABLE {table} ADD CONSTRAINT {table}_task_id_fkey "
+            f"FOREIGN KEY (task_id) REFERENCES tasks (id)"
+        )
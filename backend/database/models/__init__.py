@@ -17,9 +17,14 @@ from .pomodoro_session import (
 )
 from .focus_session import FocusSession, FocusMode, FocusSessionStatus, DistractionLevel
 from .pomodoro_stats import PomodoroStats, StatsTimeframe
+from .pomodoro_daily_counter import PomodoroDailyCounter
+from .interruption_event import InterruptionEvent, InterruptionSource
+from .change_log import ChangeLogEntry, ChangeEntityType, ChangeOperation, SyncState
 from .subtask import Subtask
 from .tag import Tag
 from .tasktag import TaskTag
+from .task_archive import ArchivedTask, ArchivedSubtask, ArchivedTaskTag
+from .user_streak import UserStreak, StreakMetric
 from .user_token import UserToken
 
 __all__ = [
@@ -32,6 +37,13 @@ __all__ = [
     "PomodoroSessionStatus",
     "InterruptionType",
     "PomodoroStats",
+    "PomodoroDailyCounter",
+    "InterruptionEvent",
+    "InterruptionSource",
+    "ChangeLogEntry",
+    "ChangeEntityType",
+    "ChangeOperation",
+    "SyncState",
     "FocusSession",
     "FocusMode",
     "FocusSessionStatus",
@@ -40,5 +52,10 @@ __all__ = [
     "Subtask",
     "Tag",
     "TaskTag",
+    "ArchivedTask",
+    "ArchivedSubtask",
+    "ArchivedTaskTag",
+    "UserStreak",
+    "StreakMetric",
     "UserToken",
 ]
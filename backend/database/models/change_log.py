@@ -0,0 +1,79 @@
+from enum import Enum
+from sqlalchemy import (
+    BigInteger,
+    ForeignKey,
+    Index,
+    Integer,
+    UniqueConstraint,
+    Enum as SQLEnum,
+)
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import BaseModel
+
+
+class ChangeEntityType(str, Enum):
+    TASK = "task"
+    SUBTASK = "subtask"
+    TAG = "tag"
+    GROUP = "group"
+
+
+class ChangeOperation(str, Enum):
+    UPSERT = "upsert"
+    DELETE = "delete"
+
+
+class SyncState(BaseModel):
+    """
+    A user's change sequence.
+
+    `last_seq` is the newest sequence number handed out; `floor_seq` is the
+    oldest cursor that can still be served incrementally (tombstones at or
+    below it have been purged).
+    """
+
+    __tablename__ = "sync_state"
+
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), unique=True)
+    last_seq: Mapped[int] = mapped_column(BigInteger, default=0, server_default="0")
+    floor_seq: Mapped[int] = mapped_column(BigInteger, default=0, server_default="0")
+
+    def __repr__(self) -> str:
+        return f"<SyncState user={self.user_id} seq={self.last_seq}>"
+
+
+class ChangeLogEntry(BaseModel):
+    """
+    One create, update or delete of a task, subtask, tag or group.
+
+    Only the entity's identity is stored; the sync endpoint loads current
+    state when it serves the change.
+    """
+
+    __tablename__ = "change_log"
+    __table_args__ = (
+        UniqueConstraint("user_id", "seq", name="uq_change_log_user_seq"),
+        Index("ix_change_log_user_entity", "user_id", "entity_type", "entity_id"),
+    )
+
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"))
+    seq: Mapped[int] = mapped_column(BigInteger)
+    entity_type: Mapped[ChangeEntityType] = mapped_column(
+        SQLEnum(
+            ChangeEntityType,
+            name="change_entity_type",
+            values_callable=lambda enum: [e.value for e in enum],
+        ),
+    )
+    entity_id: Mapped[int] = mapped_column(Integer)
+    operation: Mapped[ChangeOperation] = mapped_column(
+        SQLEnum(
+            ChangeOperation,
+            name="change_operation",
+            values_callable=lambda enum: [e.value for e in enum],
+        ),
+    )
+
+    def __repr__(self) -> str:
+        return f"<ChangeLogEntry {self.seq} {self.operation} {self.entity_type}:{self.entity_id}>"
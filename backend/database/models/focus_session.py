@@ -9,6 +9,7 @@ from sqlalchemy import (
     String,
     Integer,
     ForeignKey,
+    Index,
     Boolean,
     Enum as SQLEnum,
     Text,
@@ -47,12 +48,22 @@ class DistractionLevel(str, Enum):
 
 class FocusSession(BaseModel):
     __tablename__ = "focus_sessions"
+    __table_args__ = (
+        Index("ix_focus_sessions_user_id_start_time", "user_id", "start_time"),
+        # The session sweeper scans active sessions by start time
+        Index("ix_focus_sessions_status_start_time", "status", "start_time"),
+        # Per-user ranking and averages of the stored scores
+        Index("ix_focus_sessions_user_id_productivity_score", "user_id", "productivity_score"),
+        Index("ix_focus_sessions_user_id_efficiency_ratio", "user_id", "efficiency_ratio"),
+    )
 
     uuid: Mapped[str] = mapped_column(
         String(36), default=lambda: str(uuid.uuid4()), unique=True
     )
     user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"))
-    task_id: Mapped[int] = mapped_column(Integer, ForeignKey("tasks.id"), nullable=True)
+    # Not a foreign key: sessions are history, and their task may move to the
+    # archive (keeping its id) and back
+    task_id: Mapped[int] = mapped_column(Integer, nullable=True, index=True)
 
     focus_mode: Mapped[FocusMode] = mapped_column(
         SQLEnum(
@@ -83,7 +94,8 @@ class FocusSession(BaseModel):
     actual_duration: Mapped[int] = mapped_column(Integer, nullable=True)
 
     # timing information
-    start_time: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    # partition key on PostgreSQL, one partition per month (database/partitions.py)
+    start_time: Mapped[datetime] = mapped_column(DateTime, nullable=False)
     paused_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     pause_duration: Mapped[int] = mapped_column(Integer, default=0)
     end_time: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
@@ -140,6 +152,10 @@ class FocusSession(BaseModel):
     # session scoring
     overall_satisfaction: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     would_repeat_setup: Mapped[Optional[bool]] = mapped_column(Boolean, nullable=True)
+    # Maintained by update_scores() whenever the session is saved, so sessions
+    # can be ranked and averaged in SQL
+    productivity_score: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    efficiency_ratio: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
 
     # context and categorization
     project_category: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
@@ -148,7 +164,11 @@ class FocusSession(BaseModel):
 
     # relationships
     user: Mapped[User] = relationship("User", back_populates="focus_sessions")
-    task: Mapped[Optional[Task]] = relationship("Task", back_populates="focus_sessions")
+    task: Mapped[Optional[Task]] = relationship(
+        "Task",
+        back_populates="focus_sessions",
+        primaryjoin="foreign(FocusSession.task_id) == Task.id",
+    )
 
     @property
     def is_active(self) -> bool:
@@ -169,8 +189,7 @@ class FocusSession(BaseModel):
             return self.actual_duration / 60.0
         return 0.0
 
-    @property
-    def productivity_score(self) -> Optional[float]:
+    def calculate_productivity_score(self) -> Optional[float]:
         if not any(
             [self.focus_intensity, self.overall_satisfaction, self.flow_state_achieved]
         ):
@@ -199,18 +218,22 @@ class FocusSession(BaseModel):
                 DistractionLevel.HIGH: 2,
                 DistractionLevel.OVERWHELMING: 1,
             }
-            score += distraction_scores[self.distraction_level] * 0.2
+            score += distraction_scores[DistractionLevel(self.distraction_level)] * 0.2
             weight_sum += 0.2
 
         return score / weight_sum if weight_sum > 0 else None
 
-    @property
-    def efficiency_ratio(self) -> Optional[float]:
-        if self.planned_duration and self.actual_duration > 0:
-            productive_time = self.actual_duration - self.pause_duration
+    def calculate_efficiency_ratio(self) -> Optional[float]:
+        if self.planned_duration and self.actual_duration and self.actual_duration > 0:
+            productive_time = self.actual_duration - (self.pause_duration or 0)
             return productive_time / self.actual_duration
         return None
 
+    def update_scores(self) -> None:
+        """Recompute the stored productivity_score and efficiency_ratio."""
+        self.productivity_score = self.calculate_productivity_score()
+        self.efficiency_ratio = self.calculate_efficiency_ratio()
+
     def to_dict(self) -> dict:
         return {
             "id": self.id,
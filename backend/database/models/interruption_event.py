@@ -0,0 +1,81 @@
+from datetime import datetime
+from enum import Enum
+from typing import Optional
+from sqlalchemy import (
+    CheckConstraint,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    Text,
+    Enum as SQLEnum,
+)
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import BaseModel
+from .pomodoro_session import InterruptionType
+
+
+class InterruptionSource(str, Enum):
+    POMODORO = "pomodoro"
+    FOCUS = "focus"
+
+
+class InterruptionEvent(BaseModel):
+    """
+    One interruption during a Pomodoro or focus session.
+
+    Append-only; exactly one of the session ids is set. The session tables
+    are partitioned on PostgreSQL, so the ids are not foreign keys; events
+    are removed together with their partition by partition retention.
+    """
+
+    __tablename__ = "interruption_events"
+    __table_args__ = (
+        Index("ix_interruption_events_user_id_occurred_at", "user_id", "occurred_at"),
+        CheckConstraint(
+            "(pomodoro_session_id IS NULL) <> (focus_session_id IS NULL)",
+            name="ck_interruption_events_one_session",
+        ),
+    )
+
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"))
+    pomodoro_session_id: Mapped[Optional[int]] = mapped_column(
+        Integer, nullable=True, index=True
+    )
+    focus_session_id: Mapped[Optional[int]] = mapped_column(
+        Integer, nullable=True, index=True
+    )
+
+    interruption_type: Mapped[InterruptionType] = mapped_column(
+        SQLEnum(
+            InterruptionType,
+            name="interruption_type",
+            values_callable=lambda enum: [e.value for e in enum],
+        ),
+    )
+    duration: Mapped[int] = mapped_column(Integer, default=0)  # seconds
+    occurred_at: Mapped[datetime] = mapped_column(DateTime)
+    note: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+
+    @property
+    def source(self) -> InterruptionSource:
+        if self.pomodoro_session_id is not None:
+            return InterruptionSource.POMODORO
+        return InterruptionSource.FOCUS
+
+    def __repr__(self) -> str:
+        return f"<InterruptionEvent {self.id} - {self.interruption_type}>"
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "user_id": self.user_id,
+            "source": self.source.value,
+            "pomodoro_session_id": self.pomodoro_session_id,
+            "focus_session_id": self.focus_session_id,
+            "interruption_type": self.interruption_type.value,
+            "duration": self.duration,
+            "occurred_at": self.occurred_at.isoformat() if self.occurred_at else None,
+            "note": self.note,
+        }
@@ -0,0 +1,69 @@
+from datetime import date, datetime
+from typing import Optional
+from sqlalchemy import (
+    Date,
+    DateTime,
+    ForeignKey,
+    Integer,
+    UniqueConstraint,
+    Enum as SQLEnum,
+)
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import BaseModel
+from .pomodoro_session import PomodoroSessionType
+
+
+class PomodoroDailyCounter(BaseModel):
+    """
+    Per-user, per-day Pomodoro counters.
+
+    Maintained with atomic upserts as sessions start and complete, so the
+    session sequence and next-session recommendation need one row instead of
+    the day's sessions. Rebuilt from pomodoro_sessions by
+    `flask pomodoro rebuild-counters`.
+    """
+
+    __tablename__ = "pomodoro_daily_counters"
+    __table_args__ = (
+        UniqueConstraint("user_id", "day", name="uq_pomodoro_daily_counters_user_day"),
+    )
+
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"))
+    day: Mapped[date] = mapped_column(Date)
+
+    # sessions started (all statuses) and completed, by type
+    work_started: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    work_completed: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    short_breaks_completed: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    long_breaks_completed: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+
+    # most recently started session
+    last_session_type: Mapped[Optional[PomodoroSessionType]] = mapped_column(
+        SQLEnum(
+            PomodoroSessionType,
+            name="pomodoro_session_type",
+            values_callable=lambda enum: [e.value for e in enum],
+        ),
+        nullable=True,
+    )
+    last_session_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+
+    def __repr__(self) -> str:
+        return f"<PomodoroDailyCounter {self.user_id} - {self.day}>"
+
+    def to_dict(self) -> dict:
+        return {
+            "user_id": self.user_id,
+            "day": self.day.isoformat(),
+            "work_started": self.work_started,
+            "work_completed": self.work_completed,
+            "short_breaks_completed": self.short_breaks_completed,
+            "long_breaks_completed": self.long_breaks_completed,
+            "last_session_type": (
+                self.last_session_type.value if self.last_session_type else None
+            ),
+            "last_session_at": (
+                self.last_session_at.isoformat() if self.last_session_at else None
+            ),
+        }
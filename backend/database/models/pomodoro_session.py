@@ -1,7 +1,7 @@
 import uuid
 from typing import Optional
 from datetime import datetime
-from sqlalchemy import String, Integer, DateTime, Enum as SQLEnum, Text, Boolean, values
+from sqlalchemy import String, Integer, DateTime, Enum as SQLEnum, Text, Boolean, Index, values
 from sqlalchemy.orm import mapped_column, relationship, Mapped
 from sqlalchemy.sql.schema import ForeignKey
 from enum import Enum
@@ -34,12 +34,19 @@ class InterruptionType(str, Enum):
 
 class PomodoroSession(BaseModel):
     __tablename__ = "pomodoro_sessions"
+    __table_args__ = (
+        Index("ix_pomodoro_sessions_user_id_start_time", "user_id", "start_time"),
+        # The session sweeper scans active sessions by start time
+        Index("ix_pomodoro_sessions_status_start_time", "status", "start_time"),
+    )
 
     uuid: Mapped[str] = mapped_column(
         String(36), default=lambda: str(uuid.uuid4()), unique=True
     )
     user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"))
-    task_id: Mapped[int] = mapped_column(Integer, ForeignKey("tasks.id"))
+    # Not a foreign key: sessions are history, and their task may move to the
+    # archive (keeping its id) and back
+    task_id: Mapped[int] = mapped_column(Integer, index=True)
 
     session_type: Mapped[PomodoroSessionType] = mapped_column(
         SQLEnum(
@@ -61,7 +68,8 @@ class PomodoroSession(BaseModel):
     actual_duration: Mapped[int] = mapped_column(Integer, nullable=True)
 
     # timing informations
-    start_time: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    # partition key on PostgreSQL, one partition per month (database/partitions.py)
+    start_time: Mapped[datetime] = mapped_column(DateTime, nullable=False)
     paused_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     resumed_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     end_time: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
@@ -116,7 +124,11 @@ class PomodoroSession(BaseModel):
 
     # relationships
     user: Mapped["User"] = relationship("User", back_populates="pomodoro_sessions")
-    task: Mapped["Task"] = relationship("Task", back_populates="pomodoro_sessions")
+    task: Mapped["Task"] = relationship(
+        "Task",
+        back_populates="pomodoro_sessions",
+        primaryjoin="foreign(PomodoroSession.task_id) == Task.id",
+    )
 
     @property
     def is_active(self) -> bool:
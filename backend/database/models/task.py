@@ -1,7 +1,7 @@
 from typing import Optional, List
 from enum import Enum
 from datetime import datetime
-from sqlalchemy import String, Integer, DateTime, ForeignKey, Enum as SqlEnum, Boolean
+from sqlalchemy import String, Integer, DateTime, ForeignKey, Enum as SqlEnum, Boolean, Index, text
 from sqlalchemy.orm import mapped_column, relationship, Mapped
 
 from .base import BaseModel
@@ -26,6 +26,18 @@ class TaskPriority(str, Enum):
 
 class Task(BaseModel):
     __tablename__ = "tasks"
+    __table_args__ = (
+        # Every task query is per user; counters also group by group_id
+        Index("ix_tasks_user_id_group_id", "user_id", "group_id"),
+        # The archiver looks for finished tasks by last update
+        Index("ix_tasks_status_updated_at", "status", "updated_at"),
+        # The reminder scheduler scans open tasks by due date
+        Index(
+            "ix_tasks_open_due_date",
+            "due_date",
+            postgresql_where=text("status IN ('pending', 'in_progress')"),
+        ),
+    )
 
     title: Mapped[str] = mapped_column(String(255))
     description: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
@@ -82,11 +94,16 @@ class Task(BaseModel):
     user: Mapped["User"] = relationship("User", back_populates="tasks")
     group: Mapped["Group"] = relationship("Group", back_populates="tasks")
     tags: Mapped[List["TaskTag"]] = relationship("TaskTag", back_populates="task")  # type: ignore
+    # Sessions reference tasks without a foreign key (see PomodoroSession.task_id)
     pomodoro_sessions: Mapped[List["PomodoroSession"]] = relationship(  # type: ignore
-        "PomodoroSession", back_populates="task"
+        "PomodoroSession",
+        back_populates="task",
+        primaryjoin="Task.id == foreign(PomodoroSession.task_id)",
     )
     focus_sessions: Mapped[List["FocusSession"]] = relationship(  # type: ignore
-        "FocusSession", back_populates="task"
+        "FocusSession",
+        back_populates="task",
+        primaryjoin="Task.id == foreign(FocusSession.task_id)",
     )
     subtasks: Mapped[List["Subtask"]] = relationship(  # type: ignore
         "Subtask", back_populates="task", cascade="all, delete-orphan"
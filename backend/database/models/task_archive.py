@@ -0,0 +1,118 @@
+from typing import Optional
+from datetime import datetime
+from sqlalchemy import String, Integer, DateTime, Enum as SqlEnum, Boolean, Index
+from sqlalchemy.orm import mapped_column, Mapped
+
+from .base import BaseModel
+from .task import TaskPriority, TaskStatus
+
+
+class ArchivedTask(BaseModel):
+    """
+    A finished task moved out of `tasks` by the archiver.
+
+    Keeps the task's original id, so restoring it brings back the same task.
+    Archive tables have no foreign keys; tags and groups deleted in the
+    meantime are dropped on restore.
+    """
+
+    __tablename__ = "archived_tasks"
+    __table_args__ = (
+        Index("ix_archived_tasks_user_id_archived_at", "user_id", "archived_at"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+
+    title: Mapped[str] = mapped_column(String(255))
+    description: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    priority: Mapped[TaskPriority] = mapped_column(
+        SqlEnum(
+            TaskPriority,
+            name="task_priority",
+            values_callable=lambda enum: [e.value for e in enum],
+        ),
+        nullable=False,
+    )
+    status: Mapped[TaskStatus] = mapped_column(
+        SqlEnum(
+            TaskStatus,
+            name="task_status",
+            values_callable=lambda enum: [e.value for e in enum],
+        ),
+        nullable=False,
+    )
+    due_date: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    completed_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    is_in_my_day: Mapped[bool] = mapped_column(Boolean, nullable=True)
+    starred: Mapped[bool] = mapped_column(Boolean, nullable=True)
+    estimated_pomodoros: Mapped[int] = mapped_column(Integer, nullable=True)
+    completed_pomodoros: Mapped[int] = mapped_column(Integer, nullable=True)
+    estimated_focus_time: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    actual_focus_time: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    complexity_level: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    requires_deep_focus: Mapped[bool] = mapped_column(Boolean, nullable=True)
+    optimal_session_length: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    user_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    group_id: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+
+    archived_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "title": self.title,
+            "description": self.description,
+            "priority": self.priority.value if self.priority else None,
+            "status": self.status.value if self.status else None,
+            "due_date": self.due_date.isoformat() if self.due_date else None,
+            "completed_at": (
+                self.completed_at.isoformat() if self.completed_at else None
+            ),
+            "starred": self.starred,
+            "user_id": self.user_id,
+            "group_id": self.group_id,
+            "estimated_focus_time": self.estimated_focus_time,
+            "actual_focus_time": self.actual_focus_time,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+            "archived_at": self.archived_at.isoformat() if self.archived_at else None,
+        }
+
+
+class ArchivedSubtask(BaseModel):
+    __tablename__ = "archived_subtasks"
+    __table_args__ = (
+        Index("ix_archived_subtasks_task_id", "task_id"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+
+    title: Mapped[str] = mapped_column(String(255), nullable=False)
+    description: Mapped[str] = mapped_column(String(255), nullable=True)
+    is_completed: Mapped[bool] = mapped_column(Boolean, default=False)
+    position: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    task_id: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    def to_dict(self) -> dict:
+        return {
+            'id': self.id,
+            'title': self.title,
+            'description': self.description,
+            'is_completed': self.is_completed,
+            'position': self.position,
+            'task_id': self.task_id,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+        }
+
+
+class ArchivedTaskTag(BaseModel):
+    __tablename__ = "archived_task_tags"
+    __table_args__ = (
+        Index("ix_archived_task_tags_task_id", "task_id"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+
+    task_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    tag_id: Mapped[int] = mapped_column(Integer, nullable=False)
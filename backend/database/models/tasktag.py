@@ -1,4 +1,4 @@
-from sqlalchemy import String, Integer
+from sqlalchemy import String, Integer, Index
 from sqlalchemy.orm import mapped_column, relationship, Mapped
 from sqlalchemy.sql.schema import ForeignKey
 from .base import BaseModel
@@ -7,6 +7,11 @@ from .tag import Tag
 
 class TaskTag(BaseModel):
     __tablename__ = "task_tags"
+    __table_args__ = (
+        # Tag filters group by task over a set of tags, and tasks load their tags
+        Index("ix_task_tags_tag_id_task_id", "tag_id", "task_id"),
+        Index("ix_task_tags_task_id_tag_id", "task_id", "tag_id"),
+    )
 
     task_id: Mapped[int] = mapped_column(Integer, ForeignKey("tasks.id"))
     tag_id: Mapped[int] = mapped_column(Integer, ForeignKey("tags.id"))
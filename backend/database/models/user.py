@@ -12,6 +12,8 @@ class User(BaseModel):
     display_name: Mapped[str] = mapped_column(String(30), index=True)
     psw_hash: Mapped[str] = mapped_column(String(255))
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
+    # Embedded in access tokens; bumping it revokes every access token issued before
+    token_epoch: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
 
     # pomodoro settings
     work_duration: Mapped[int] = mapped_column(Integer, nullable=True)
@@ -0,0 +1,80 @@
+from datetime import date, timedelta
+from enum import Enum
+from typing import Optional
+
+from sqlalchemy import (
+    Date,
+    ForeignKey,
+    Integer,
+    UniqueConstraint,
+    Enum as SQLEnum,
+)
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import BaseModel
+
+
+class StreakMetric(str, Enum):
+    TASK_COMPLETION = "task_completion"  # at least one task completed
+    POMODORO_GOAL = "pomodoro_goal"  # daily work-session goal met
+    FOCUS_GOAL = "focus_goal"  # daily focus-minutes goal met
+
+
+class UserStreak(BaseModel):
+    """
+    A user's streak of consecutive days meeting a daily goal.
+
+    Updated with one atomic upsert per completion event: `progress` counts
+    toward the goal on `progress_date`, and the first event that meets the
+    goal on a day extends or restarts the streak. Nothing runs at midnight;
+    a streak whose last active day is before yesterday reads as broken.
+    Rebuilt from history by `flask streaks backfill`.
+    """
+
+    __tablename__ = "user_streaks"
+    __table_args__ = (
+        UniqueConstraint("user_id", "metric", name="uq_user_streaks_user_metric"),
+    )
+
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"))
+    metric: Mapped[StreakMetric] = mapped_column(
+        SQLEnum(
+            StreakMetric,
+            name="streak_metric",
+            values_callable=lambda enum: [e.value for e in enum],
+        ),
+        nullable=False,
+    )
+
+    current_streak: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    longest_streak: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    # last day the goal was met
+    last_active_date: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
+
+    # progress toward the goal on progress_date (tasks, work sessions or minutes)
+    progress_date: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
+    progress: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+
+    def __repr__(self) -> str:
+        return f"<UserStreak {self.user_id} {self.metric.value}={self.current_streak}>"
+
+    def current_as_of(self, today: date) -> int:
+        """The current streak, or 0 if a whole day has passed without meeting the goal."""
+        if self.last_active_date and self.last_active_date >= today - timedelta(days=1):
+            return self.current_streak
+        return 0
+
+    def progress_on(self, day: date) -> int:
+        return self.progress if self.progress_date == day else 0
+
+    def to_dict(self, today: date) -> dict:
+        return {
+            "metric": self.metric.value,
+            "current_streak": self.current_as_of(today),
+            "longest_streak": self.longest_streak,
+            "last_active_date": (
+                self.last_active_date.isoformat() if self.last_active_date else None
+            ),
+            "active_today": self.last_active_date == today,
+            "today_progress": self.progress_on(today),
+        }
@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import String, Integer, DateTime, Boolean
+from sqlalchemy import String, Integer, DateTime, Boolean, Index
 from sqlalchemy.orm import mapped_column, Mapped
 from sqlalchemy.sql.schema import ForeignKey
 from sqlalchemy.orm import relationship
@@ -10,6 +10,8 @@ from .base import BaseModel
 
 class UserToken(BaseModel):
     __tablename__ = "user_tokens"
+    __table_args__ = (Index("ix_user_tokens_user_id_token_type", "user_id", "token_type"),)
+
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"))
     jti: Mapped[str] = mapped_column(String(36), unique=True, index=True)
@@ -0,0 +1,191 @@
+"""
+Monthly partitions for the session history tables.
+
+On PostgreSQL, ``pomodoro_sessions`` and ``focus_sessions`` are range
+partitioned on ``start_time`` with one partition per calendar month
+(``<table>_pYYYY_MM``) and a default partition for anything outside them.
+Queries bounded on ``start_time`` only scan the matching months, and old
+history is removed by dropping (or detaching) whole partitions instead of
+deleting rows one by one.
+
+Future partitions are created ahead of time at startup and by
+``flask --app wsgi sessions ensure-partitions``. On other databases the
+tables are plain and every helper here is a no-op.
+"""
+
+import re
+from datetime import UTC, date, datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+# Partitioned table -> interruption_events column referencing it
+PARTITIONED_TABLES: Dict[str, str] = {
+    "pomodoro_sessions": "pomodoro_session_id",
+    "focus_sessions": "focus_session_id",
+}
+
+# How far back to look for a user's in-progress or paused session, so the
+# lookup only touches the last couple of partitions
+ACTIVE_SESSION_LOOKBACK = timedelta(days=31)
+
+
+def add_months(month: date, count: int) -> date:
+    """First day of the month `count` months after `month`."""
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(table: str, month: date) -> str:
+    return f"{table}_p{month:%Y_%m}"
+
+
+def is_partitioned(session: Session, table: str) -> bool:
+    """True if `table` is a partitioned PostgreSQL table."""
+    if session.get_bind().dialect.name != "postgresql":
+        return False
+    relkind = session.execute(
+        text("SELECT relkind FROM pg_class WHERE oid = to_regclass(:table)"),
+        {"table": table},
+    ).scalar()
+    return relkind == "p"
+
+
+def list_partitions(session: Session, table: str) -> List[Tuple[str, date]]:
+    """Monthly partitions attached to `table` as (name, first day), oldest first."""
+    if not is_partitioned(session, table):
+        return []
+    names = session.execute(
+        text(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "WHERE i.inhparent = to_regclass(:table)"
+        ),
+        {"table": table},
+    ).scalars()
+    pattern = re.compile(rf"^{re.escape(table)}_p(\d{{4}})_(\d{{2}})$")
+    partitions = []
+    for name in names:
+        match = pattern.match(name)
+        if match:
+            partitions.append((name, date(int(match.group(1)), int(match.group(2)), 1)))
+    return sorted(partitions, key=lambda partition: partition[1])
+
+
+def _create_partition(session: Session, table: str, month: date) -> None:
+    """
+    Create the partition for `month`.
+
+    Rows that landed in the default partition because the month didn't
+    exist yet are moved into the new partition before it is attached.
+    """
+    name = partition_name(table, month)
+    bounds = {"lower": month, "upper": add_months(month, 1)}
+    bound_sql = f"FOR VALUES FROM ('{month.isoformat()}') TO ('{bounds['upper'].isoformat()}')"
+
+    stray = session.execute(
+        text(
+            f"SELECT 1 FROM {table}_default "
+            f"WHERE start_time >= :lower AND start_time < :upper LIMIT 1"
+        ),
+        bounds,
+    ).first()
+    if stray is None:
+        session.execute(text(f"CREATE TABLE {name} PARTITION OF {table} {bound_sql}"))
+        return
+
+    session.execute(text(f"CREATE TABLE {name} (LIKE {table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"))
+    moved = session.execute(
+        text(
+            f"WITH moved AS ("
+            f"  DELETE FROM {table}_default "
+            f"  WHERE start_time >= :lower AND start_time < :upper RETURNING *"
+            f") INSERT INTO {name} SELECT * FROM moved"
+        ),
+        bounds,
+    ).rowcount
+    session.execute(text(f"ALTER TABLE {table} ATTACH PARTITION {name} {bound_sql}"))
+    logger.warning(f"Moved {moved} rows from {table}_default into new partition {name}")
+
+
+def ensure_partitions(
+    session: Session, months_ahead: int = 3, today: Optional[date] = None
+) -> List[str]:
+    """
+    Create missing partitions from the current month to `months_ahead`.
+
+    Returns the names of the partitions created.
+    """
+    today = today or datetime.now(UTC).date()
+    current = date(today.year, today.month, 1)
+    created = []
+    for table in PARTITIONED_TABLES:
+        if not is_partitioned(session, table):
+            continue
+        existing = {month for _, month in list_partitions(session, table)}
+        for offset in range(months_ahead + 1):
+            month = add_months(current, offset)
+            if month not in existing:
+                _create_partition(session, table, month)
+                created.append(partition_name(table, month))
+    if created:
+        logger.info(f"Created session partitions: {', '.join(created)}")
+    return created
+
+
+def apply_retention(
+    session: Session, keep_months: int, detach: bool = False, today: Optional[date] = None
+) -> List[str]:
+    """
+    Remove monthly partitions older than `keep_months` full months.
+
+    The current month is always kept. Partitions are dropped, or detached
+    and left as standalone tables when `detach` is set (e.g. to dump them to
+    cold storage first). Interruption events of the removed sessions are
+    deleted too. Returns the names of the partitions removed.
+    """
+    if keep_months < 1:
+        raise ValueError("keep_months must be at least 1")
+
+    today = today or datetime.now(UTC).date()
+    cutoff = add_months(date(today.year, today.month, 1), -keep_months)
+    removed = []
+    for table, event_column in PARTITIONED_TABLES.items():
+        expired = [name for name, month in list_partitions(session, table) if month < cutoff]
+        for name in expired:
+            if detach:
+                session.execute(text(f"ALTER TABLE {table} DETACH PARTITION {name}"))
+            else:
+                session.execute(text(f"DROP TABLE {name}"))
+            removed.append(name)
+        if not expired:
+            continue
+
+        # Events happen during their session, so anything before the cutoff
+        # belongs to a removed month; sessions that ran across the boundary
+        # are matched against the table directly
+        session.execute(
+            text(
+                f"DELETE FROM interruption_events e "
+                f"WHERE e.{event_column} IS NOT NULL AND ("
+                f"  e.occurred_at < :cutoff OR ("
+                f"    e.occurred_at < :grace AND NOT EXISTS ("
+                f"      SELECT 1 FROM {table} s WHERE s.id = e.{event_column}"
+                f"      AND s.start_time >= :lookback AND s.start_time < :grace)))"
+            ),
+            {
+                "cutoff": cutoff,
+                "grace": cutoff + timedelta(days=1),
+                "lookback": cutoff - timedelta(days=1),
+            },
+        )
+
+    if removed:
+        action = "Detached" if detach else "Dropped"
+        logger.info(f"{action} session partitions before {cutoff}: {', '.join(removed)}")
+    return removed
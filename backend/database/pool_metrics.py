@@ -0,0 +1,270 @@
+"""
+Connection pool instrumentation.
+
+Records how long requests wait to check out a connection and how long they
+hold it, tracks concurrent checkouts, raises alerts when checkout waits cross
+a threshold and can suggest pool sizes from the concurrency actually observed.
+"""
+
+import math
+import threading
+import time
+from bisect import bisect_left
+from typing import Dict, Any, List, Optional
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+# Bucket upper bounds in milliseconds; the last bucket is unbounded
+LATENCY_BUCKETS_MS = [1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000]
+
+# Minimum seconds between two slow-checkout warnings for the same engine
+ALERT_INTERVAL_SECONDS = 10
+
+
+class Histogram:
+    """Fixed-bucket histogram, cheap enough to update on every checkout."""
+
+    def __init__(self, buckets: List[float]):
+        self.buckets = list(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        """Record one observation."""
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.count += 1
+            self.total += value
+            if value > self.max:
+                self.max = value
+
+    def percentile(self, fraction: float) -> float:
+        """Estimate a percentile as the upper bound of the bucket containing it."""
+        with self._lock:
+            if not self.count:
+                return 0.0
+            rank = math.ceil(self.count * fraction)
+            seen = 0
+            for index, bucket_count in enumerate(self.counts):
+                seen += bucket_count
+                if seen >= rank:
+                    return self.buckets[index] if index < len(self.buckets) else self.max
+            return self.max
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return counts and summary statistics."""
+        with self._lock:
+            count, total, maximum = self.count, self.total, self.max
+            labels = [f"le_{bound}" for bound in self.buckets] + ["le_inf"]
+            buckets = dict(zip(labels, self.counts))
+        return {
+            "count": count,
+            "avg": round(total / count, 3) if count else 0.0,
+            "max": round(maximum, 3),
+            "p50": self.percentile(0.50),
+            "p95": self.percentile(0.95),
+            "p99": self.percentile(0.99),
+            "buckets": buckets,
+        }
+
+
+class PoolMetrics:
+    """Checkout wait, hold time and concurrency metrics for one engine."""
+
+    def __init__(self, name: str, wait_alert_ms: float):
+        self.name = name
+        self.wait_alert_ms = wait_alert_ms
+        self.checkout_wait_ms = Histogram(LATENCY_BUCKETS_MS)
+        self.hold_time_ms = Histogram(LATENCY_BUCKETS_MS)
+        # Concurrency seen at each checkout (bucket per connection count)
+        self.concurrency = Histogram(list(range(1, 101)))
+        self.checked_out = 0
+        self.peak_checked_out = 0
+        self.slow_checkouts = 0
+        self.timeouts = 0
+        self._last_alert = 0.0
+        self._lock = threading.Lock()
+
+    def record_wait(self, wait_ms: float) -> None:
+        """Record a checkout wait and alert when it crosses the threshold."""
+        self.checkout_wait_ms.observe(wait_ms)
+        if wait_ms < self.wait_alert_ms:
+            return
+
+        now = time.monotonic()
+        with self._lock:
+            self.slow_checkouts += 1
+            should_log = now - self._last_alert >= ALERT_INTERVAL_SECONDS
+            if should_log:
+                self._last_alert = now
+        if should_log:
+            logger.warning(
+                f"Slow connection checkout on {self.name}: waited {wait_ms:.1f}ms "
+                f"(threshold {self.wait_alert_ms}ms, {self.checked_out} checked out, "
+                f"{self.slow_checkouts} slow checkouts so far)"
+            )
+
+    def record_timeout(self) -> None:
+        """Record a checkout that gave up after pool_timeout."""
+        with self._lock:
+            self.timeouts += 1
+        logger.error(f"Connection pool exhausted on {self.name}: checkout timed out")
+
+    def record_checkout(self) -> None:
+        """Track a connection leaving the pool."""
+        with self._lock:
+            self.checked_out += 1
+            current = self.checked_out
+            if current > self.peak_checked_out:
+                self.peak_checked_out = current
+        self.concurrency.observe(current)
+
+    def record_checkin(self, hold_ms: Optional[float]) -> None:
+        """Track a connection returning to the pool."""
+        with self._lock:
+            self.checked_out = max(0, self.checked_out - 1)
+        if hold_ms is not None:
+            self.hold_time_ms.observe(hold_ms)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return all metrics for this engine."""
+        return {
+            "checkout_wait_ms": self.checkout_wait_ms.snapshot(),
+            "hold_time_ms": self.hold_time_ms.snapshot(),
+            "checked_out": self.checked_out,
+            "peak_checked_out": self.peak_checked_out,
+            "concurrency_p95": self.concurrency.percentile(0.95),
+            "slow_checkouts": self.slow_checkouts,
+            "timeouts": self.timeouts,
+            "wait_alert_ms": self.wait_alert_ms,
+        }
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that times how long each checkout waits for a connection."""
+
+    metrics: Optional[PoolMetrics] = None
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            if self.metrics:
+                self.metrics.record_timeout()
+            raise
+        if self.metrics:
+            self.metrics.record_wait((time.perf_counter() - started) * 1000)
+        return connection
+
+    def recreate(self):
+        # engine.dispose() swaps in a fresh pool; keep recording into the same metrics
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+_registry: Dict[str, PoolMetrics] = {}
+
+
+def attach_metrics(engine, name: str, wait_alert_ms: float) -> PoolMetrics:
+    """Attach metrics to an engine's pool and register its checkout/checkin hooks."""
+    from sqlalchemy import event
+
+    metrics = PoolMetrics(name, wait_alert_ms)
+    _registry[name] = metrics
+    if isinstance(engine.pool, InstrumentedQueuePool):
+        engine.pool.metrics = metrics
+
+    @event.listens_for(engine, "checkout")
+    def record_checkout(dbapi_connection, connection_record, connection_proxy):
+        connection_record.info["checkout_at"] = time.perf_counter()
+        metrics.record_checkout()
+
+    @event.listens_for(engine, "checkin")
+    def record_checkin(dbapi_connection, connection_record):
+        started = connection_record.info.pop("checkout_at", None)
+        hold_ms = (time.perf_counter() - started) * 1000 if started else None
+        metrics.record_checkin(hold_ms)
+
+    return metrics
+
+
+def get_pool_metrics(name: str) -> Optional[PoolMetrics]:
+    """Get the metrics recorded for an engine by name."""
+    return _registry.get(name)
+
+
+def resolve_pool_settings(config) -> Dict[str, int]:
+    """
+    Work out per-process pool settings.
+
+    When DB_MAX_CONNECTIONS is set it is treated as the connection budget for
+    the whole app server and split across WEB_CONCURRENCY worker processes, so
+    adding workers never pushes the database past its connection limit.
+    """
+    pool_size = config.DB_POOL_SIZE
+    max_overflow = config.DB_MAX_OVERFLOW
+
+    if config.DB_MAX_CONNECTIONS > 0:
+        workers = max(1, config.WEB_CONCURRENCY)
+        per_worker = max(1, config.DB_MAX_CONNECTIONS // workers)
+        pool_size = min(pool_size, per_worker)
+        max_overflow = min(max_overflow, per_worker - pool_size)
+
+    return {
+        "pool_size": pool_size,
+        "max_overflow": max_overflow,
+        "pool_timeout": config.DB_POOL_TIMEOUT,
+        "pool_recycle": config.DB_POOL_RECYCLE,
+    }
+
+
+def suggest_pool_size(
+    metrics: PoolMetrics, pool_size: int, max_overflow: int
+) -> Dict[str, Any]:
+    """
+    Suggest pool settings from observed concurrency.
+
+    The steady pool should cover the 95th percentile of concurrent checkouts,
+    with overflow absorbing the observed peak plus some headroom.
+    """
+    snapshot = metrics.snapshot()
+    samples = snapshot["checkout_wait_ms"]["count"]
+    p95 = int(snapshot["concurrency_p95"])
+    peak = snapshot["peak_checked_out"]
+
+    suggested_size = max(2, p95 + 1)
+    suggested_overflow = max(2, math.ceil(peak * 1.25) - suggested_size)
+    capacity = pool_size + max_overflow
+
+    reasons = []
+    if samples < 100:
+        reasons.append("Not enough checkouts observed yet for a reliable suggestion")
+    if peak >= capacity * 0.9:
+        reasons.append(
+            f"Peak concurrency {peak} is close to pool capacity {capacity}; "
+            "requests will start waiting or timing out"
+        )
+    if snapshot["timeouts"]:
+        reasons.append(f"{snapshot['timeouts']} checkouts timed out")
+    if snapshot["checkout_wait_ms"]["p95"] >= metrics.wait_alert_ms:
+        reasons.append("95th percentile checkout wait exceeds the alert threshold")
+    if suggested_size + suggested_overflow < capacity * 0.5:
+        reasons.append("Pool is oversized for the observed load")
+
+    return {
+        "current": {"pool_size": pool_size, "max_overflow": max_overflow},
+        "suggested": {"pool_size": suggested_size, "max_overflow": suggested_overflow},
+        "observed": {"concurrency_p95": p95, "peak_checked_out": peak, "samples": samples},
+        "reasons": reasons,
+    }
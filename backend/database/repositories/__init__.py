@@ -5,27 +5,38 @@ This module provides repository objects for database operations.
 Each repository provides a standardized interface for CRUD operations on a specific model.
 """
 
-from .base_repository import BaseRepository
-from .user_repository import UserRepository
-from .user_token_repository import UserTokenRepository
-from .task_repository import TaskRepository
-from .tag_repository import TagRepository
-from .group_repository import GroupRepository
-from .subtask_repository import SubtaskRepository
-from .pomodoro_session_repository import PomodoroSessionRepository
-from .focus_session_repository import FocusSessionRepository
-from .pomodoro_stats_repository import PomodoroStatsRepository
-
-
-__all__ = [
-    "BaseRepository",
-    "UserRepository",
-    "UserTokenRepository",
-    "TaskRepository",
-    "TagRepository",
-    "GroupRepository",
-    "SubtaskRepository",
-    "PomodoroSessionRepository",
-    "FocusSessionRepository",
-    "PomodoroStatsRepository",
-]
+from importlib import import_module
+
+# Public name -> submodule. Submodules are imported on first access so that
+# importing one of them doesn't pull in the whole package.
+_EXPORTS = {
+    "BaseRepository": ".base_repository",
+    "UserRepository": ".user_repository",
+    "UserTokenRepository": ".user_token_repository",
+    "TaskRepository": ".task_repository",
+    "TagRepository": ".tag_repository",
+    "GroupRepository": ".group_repository",
+    "SubtaskRepository": ".subtask_repository",
+    "PomodoroSessionRepository": ".pomodoro_session_repository",
+    "FocusSessionRepository": ".focus_session_repository",
+    "PomodoroStatsRepository": ".pomodoro_stats_repository",
+    "PomodoroDailyCounterRepository": ".pomodoro_daily_counter_repository",
+    "InterruptionEventRepository": ".interruption_event_repository",
+    "ChangeLogRepository": ".change_log_repository",
+    "TaskArchiveRepository": ".task_archive_repository",
+    "StreakRepository": ".streak_repository",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
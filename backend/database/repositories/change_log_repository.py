@@ -0,0 +1,196 @@
+"""
+Repository for the per-user change log used by delta sync.
+"""
+
+from datetime import UTC, datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import and_, bindparam, delete, exists, func, insert, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session, aliased
+
+from database.models.change_log import (
+    ChangeEntityType,
+    ChangeLogEntry,
+    ChangeOperation,
+    SyncState,
+)
+from database.repositories.base_repository import BaseRepository
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+Change = Tuple[ChangeEntityType, int, ChangeOperation]
+
+
+class ChangeLogRepository(BaseRepository[ChangeLogEntry]):
+    def __init__(self, session: Session):
+        super().__init__(ChangeLogEntry, session)
+
+    def _allocate(self, user_id: int, count: int) -> int:
+        """
+        Reserve `count` sequence numbers and return the last one.
+
+        The upsert locks the user's sync_state row until the transaction
+        ends, so a user's changes commit in sequence order and a client can
+        never skip past a change that commits late.
+        """
+        dialect = self.session.get_bind().dialect.name
+        insert_ = sqlite.insert if dialect == "sqlite" else postgresql.insert
+        table = SyncState.__table__
+        now = datetime.now(UTC)
+
+        stmt = insert_(table).values(
+            user_id=user_id,
+            last_seq=count,
+            floor_seq=0,
+            created_at=now,
+            updated_at=now,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.user_id],
+            set_={"last_seq": table.c.last_seq + count, "updated_at": now},
+        ).returning(table.c.last_seq)
+        return self.session.execute(stmt).scalar_one()
+
+    def record_changes(self, user_id: int, changes: Iterable[Change]) -> Optional[int]:
+        """
+        Append changes for a user and return the new last sequence number.
+
+        Repeated changes to the same entity are collapsed to the last one.
+        Returns None when there is nothing to record.
+        """
+        latest: Dict[Tuple[ChangeEntityType, int], ChangeOperation] = {}
+        for entity_type, entity_id, operation in changes:
+            if entity_id is None:
+                continue
+            latest.pop((entity_type, entity_id), None)
+            latest[(entity_type, entity_id)] = operation
+        if not latest:
+            return None
+
+        last_seq = self._allocate(user_id, len(latest))
+        first_seq = last_seq - len(latest) + 1
+        now = datetime.now(UTC)
+        rows = [
+            {
+                "user_id": user_id,
+                "seq": first_seq + offset,
+                "entity_type": entity_type,
+                "entity_id": entity_id,
+                "operation": operation,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for offset, ((entity_type, entity_id), operation) in enumerate(latest.items())
+        ]
+        self.session.execute(insert(ChangeLogEntry), rows)
+        return last_seq
+
+    def record_change(
+        self,
+        user_id: int,
+        entity_type: ChangeEntityType,
+        entity_id: int,
+        operation: ChangeOperation = ChangeOperation.UPSERT,
+    ) -> Optional[int]:
+        """Append a single change for a user."""
+        return self.record_changes(user_id, [(entity_type, entity_id, operation)])
+
+    def get_state(self, user_id: int) -> Optional[SyncState]:
+        """Get a user's sequence state, or None if they have no changes yet."""
+        return (
+            self.session.query(SyncState)
+            .filter(SyncState.user_id == user_id)
+            .one_or_none()
+        )
+
+    def get_changes_since(self, user_id: int, since: int, limit: int) -> List[ChangeLogEntry]:
+        """Get up to `limit` changes after sequence number `since`, oldest first."""
+        return (
+            self.session.query(ChangeLogEntry)
+            .filter(ChangeLogEntry.user_id == user_id, ChangeLogEntry.seq > since)
+            .order_by(ChangeLogEntry.seq)
+            .limit(limit)
+            .all()
+        )
+
+    def get_last_id(self) -> int:
+        """Get the id of the newest entry across all users (0 when empty)."""
+        return self.session.execute(select(func.max(ChangeLogEntry.id))).scalar() or 0
+
+    def get_entity_changes_after(
+        self, after_id: int, entity_type: ChangeEntityType, limit: int
+    ) -> List[Tuple[int, int, ChangeOperation]]:
+        """
+        Get (id, entity_id, operation) of up to `limit` entries for one entity
+        type with an id above `after_id`, across all users, oldest first.
+        """
+        return self.session.execute(
+            select(ChangeLogEntry.id, ChangeLogEntry.entity_id, ChangeLogEntry.operation)
+            .where(ChangeLogEntry.id > after_id, ChangeLogEntry.entity_type == entity_type)
+            .order_by(ChangeLogEntry.id)
+            .limit(limit)
+        ).all()
+
+    def compact(self, user_id: Optional[int] = None) -> int:
+        """
+        Delete entries superseded by a later change to the same entity.
+
+        Safe for any cursor: whoever hasn't seen the old entry will see the
+        newer one. Returns the number of entries deleted.
+        """
+        newer = aliased(ChangeLogEntry)
+        stmt = delete(ChangeLogEntry).where(
+            exists().where(
+                newer.user_id == ChangeLogEntry.user_id,
+                newer.entity_type == ChangeLogEntry.entity_type,
+                newer.entity_id == ChangeLogEntry.entity_id,
+                newer.seq > ChangeLogEntry.seq,
+            )
+        )
+        if user_id is not None:
+            stmt = stmt.where(ChangeLogEntry.user_id == user_id)
+        result = self.session.execute(stmt.execution_options(synchronize_session=False))
+        logger.info(f"Compacted {result.rowcount} superseded change log entries")
+        return result.rowcount
+
+    def purge_tombstones(self, before: datetime, user_id: Optional[int] = None) -> int:
+        """
+        Delete tombstones older than `before`.
+
+        Each affected user's floor_seq is raised to their newest purged
+        tombstone, so clients with an older cursor are told to resync
+        instead of silently missing a delete. Returns the number deleted.
+        """
+        expired = and_(
+            ChangeLogEntry.operation == ChangeOperation.DELETE,
+            ChangeLogEntry.created_at < before,
+        )
+        if user_id is not None:
+            expired = and_(expired, ChangeLogEntry.user_id == user_id)
+        floors = self.session.execute(
+            select(ChangeLogEntry.user_id, func.max(ChangeLogEntry.seq))
+            .where(expired)
+            .group_by(ChangeLogEntry.user_id)
+        ).all()
+        if not floors:
+            return 0
+
+        self.session.execute(
+            update(SyncState.__table__)
+            .where(
+                SyncState.__table__.c.user_id == bindparam("b_user_id"),
+                SyncState.__table__.c.floor_seq < bindparam("b_floor_seq"),
+            )
+            .values(floor_seq=bindparam("b_floor_seq")),
+            [{"b_user_id": floor_user_id, "b_floor_seq": seq} for floor_user_id, seq in floors],
+        )
+        result = self.session.execute(
+            delete(ChangeLogEntry).where(expired).execution_options(synchronize_session=False)
+        )
+        logger.info(
+            f"Purged {result.rowcount} tombstones older than {before.isoformat()} "
+            f"for {len(floors)} users"
+        )
+        return result.rowcount
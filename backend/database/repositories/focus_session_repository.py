@@ -1,14 +1,64 @@
 from datetime import UTC, date, datetime, timedelta
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import and_, desc
-from typing import Any, Dict, List, Optional
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session, defer, joinedload, load_only, raiseload
+from sqlalchemy import and_, case, desc, func, or_, select, update
+from typing import Any, Dict, List, Optional, Tuple
 from database.models.focus_session import FocusMode, FocusSession, FocusSessionStatus
 from database.repositories.base_repository import BaseRepository
+from database.partitions import ACTIVE_SESSION_LOOKBACK
 
 from logger import get_logger
 
 logger = get_logger(__name__)
 
+# Columns the statistics and analysis methods read
+STATS_COLUMNS = (
+    FocusSession.id,
+    FocusSession.user_id,
+    FocusSession.task_id,
+    FocusSession.focus_mode,
+    FocusSession.status,
+    FocusSession.actual_duration,
+    FocusSession.start_time,
+    FocusSession.flow_state_achieved,
+    FocusSession.flow_state_duration,
+    FocusSession.focus_intensity,
+    FocusSession.overall_satisfaction,
+    FocusSession.location,
+)
+
+# Setup, break and output columns no session response includes
+UNSERIALIZED_COLUMNS = (
+    FocusSession.environment_settings,
+    FocusSession.apps_blocked,
+    FocusSession.websites_blocked,
+    FocusSession.break_intervals,
+    FocusSession.break_activities,
+    FocusSession.break_effectiveness,
+    FocusSession.words_written,
+    FocusSession.code_commits,
+    FocusSession.pages_read,
+    FocusSession.would_repeat_setup,
+    FocusSession.collaboration_involved,
+)
+
+# Stored scores sessions can be ranked by
+SCORE_COLUMNS = {
+    "productivity_score": FocusSession.productivity_score,
+    "efficiency_ratio": FocusSession.efficiency_ratio,
+}
+
+# Named load profiles for session queries:
+# - stats: STATS_COLUMNS only; reading any other attribute raises instead of
+#   issuing a query per row
+# - list: what session responses serialize; the rest is loaded on access
+# - detail: every column and the task
+LOAD_PROFILES = {
+    "stats": (load_only(*STATS_COLUMNS, raiseload=True), raiseload("*")),
+    "list": (*(defer(column) for column in UNSERIALIZED_COLUMNS), raiseload("*")),
+    "detail": (joinedload(FocusSession.task), raiseload(FocusSession.user)),
+}
+
 
 class FocusSessionRepository(BaseRepository[FocusSession]):
     """Repository for managing focus sessions in the database."""
@@ -17,14 +67,16 @@ class FocusSessionRepository(BaseRepository[FocusSession]):
         super().__init__(FocusSession, session)
 
     def create_session(self, session: FocusSession) -> FocusSession:
+        session.update_scores()
         self.session.add(session)
         self.session.flush()
         self.session.refresh(session)
         return session
 
     def update_session(self, session: FocusSession) -> FocusSession:
-        """Update an existing focus session."""
+        """Update an existing focus session and its stored scores."""
         session.updated_at = datetime.now(UTC)
+        session.update_scores()
         self.session.flush()
         self.session.refresh(session)
         return session
@@ -33,7 +85,7 @@ class FocusSessionRepository(BaseRepository[FocusSession]):
         """Get a focus session by its session UUID."""
         return (
             self.session.query(FocusSession)
-            .options(joinedload(FocusSession.task), joinedload(FocusSession.user))
+            .options(*LOAD_PROFILES["detail"])
             .filter(FocusSession.uuid == session_uuid)
             .first()
         )
@@ -42,7 +94,11 @@ class FocusSessionRepository(BaseRepository[FocusSession]):
         """Get the active focus session for a user."""
         return (
             self.session.query(FocusSession)
-            .filter(FocusSession.user_id == user_id, FocusSession.status == "ACTIVE")
+            .filter(
+                FocusSession.user_id == user_id,
+                FocusSession.start_time >= date.today() - ACTIVE_SESSION_LOOKBACK,
+                FocusSession.status == "ACTIVE",
+            )
             .first()
         )
 
@@ -56,11 +112,12 @@ class FocusSessionRepository(BaseRepository[FocusSession]):
         task_id: Optional[int] = None,
         minimum_duration: Optional[int] = None,
         limit: int = 50,
+        profile: str = "list",
     ) -> List[FocusSession]:
-        """Get focus sessions for a user with optional filters."""
+        """Get focus sessions for a user with optional filters, loaded per LOAD_PROFILES."""
         query = (
             self.session.query(FocusSession)
-            .options(joinedload(FocusSession.task), joinedload(FocusSession.user))
+            .options(*LOAD_PROFILES[profile])
             .filter(FocusSession.user_id == user_id)
         )
 
@@ -85,14 +142,16 @@ class FocusSessionRepository(BaseRepository[FocusSession]):
 
         return query.order_by(desc(FocusSession.start_time)).limit(limit).all()
 
-    def get_daily_sessions(self, user_id: int, target_date: date) -> List[FocusSession]:
+    def get_daily_sessions(
+        self, user_id: int, target_date: date, profile: str = "list"
+    ) -> List[FocusSession]:
         """Get all focus sessions for a specific day."""
         start_datetime = datetime.combine(target_date, datetime.min.time())
         end_datetime = datetime.combine(target_date, datetime.max.time())
 
         return (
             self.session.query(FocusSession)
-            .options(joinedload(FocusSession.task))
+            .options(*LOAD_PROFILES[profile])
             .filter(
                 and_(
                     FocusSession.user_id == user_id,
@@ -104,11 +163,13 @@ class FocusSessionRepository(BaseRepository[FocusSession]):
             .all()
         )
 
-    def get_longest_sessions(self, user_id: int, limit: int = 10) -> List[FocusSession]:
+    def get_longest_sessions(
+        self, user_id: int, limit: int = 10, profile: str = "list"
+    ) -> List[FocusSession]:
         """Get the longest focus sessions for a user."""
         return (
             self.session.query(FocusSession)
-            .options(joinedload(FocusSession.task))
+            .options(*LOAD_PROFILES[profile])
             .filter(
                 and_(
                     FocusSession.user_id == user_id,
@@ -121,14 +182,61 @@ class FocusSessionRepository(BaseRepository[FocusSession]):
             .all()
         )
 
+    def get_top_sessions(
+        self,
+        user_id: int,
+        metric: str = "productivity_score",
+        limit: int = 10,
+        days: Optional[int] = None,
+        profile: str = "list",
+    ) -> List[FocusSession]:
+        """Get a user's best scored sessions by a SCORE_COLUMNS metric, best first."""
+        score = SCORE_COLUMNS[metric]
+        query = (
+            self.session.query(FocusSession)
+            .options(*LOAD_PROFILES[profile])
+            .filter(FocusSession.user_id == user_id, score.isnot(None))
+        )
+        if days:
+            query = query.filter(FocusSession.start_time >= date.today() - timedelta(days=days))
+        return query.order_by(desc(score), desc(FocusSession.id)).limit(limit).all()
+
+    def get_score_averages(self, user_id: int, days: int = 30) -> Dict[str, Any]:
+        """Average the stored scores of a user's sessions over the last N days in SQL."""
+        start_date = date.today() - timedelta(days=days)
+        row = self.session.execute(
+            select(
+                func.avg(FocusSession.productivity_score).label("productivity_score"),
+                func.count(FocusSession.productivity_score).label("productivity_scored"),
+                func.avg(FocusSession.efficiency_ratio).label("efficiency_ratio"),
+                func.count(FocusSession.efficiency_ratio).label("efficiency_scored"),
+            ).where(
+                FocusSession.user_id == user_id,
+                FocusSession.start_time >= start_date,
+            )
+        ).one()
+        return {
+            "average_productivity_score": (
+                round(row.productivity_score, 2) if row.productivity_score is not None else None
+            ),
+            "productivity_scored_sessions": row.productivity_scored,
+            "average_efficiency_ratio": (
+                round(row.efficiency_ratio, 3) if row.efficiency_ratio is not None else None
+            ),
+            "efficiency_scored_sessions": row.efficiency_scored,
+            "days_analyzed": days,
+            "period_start": start_date.isoformat(),
+            "period_end": date.today().isoformat(),
+        }
+
     def get_flow_state_sessions(
-        self, user_id: int, days: int = 30
+        self, user_id: int, days: int = 30, profile: str = "list"
     ) -> List[FocusSession]:
         """Get sessions where flow state was achieved."""
         start_date = date.today() - timedelta(days=days)
         return (
             self.session.query(FocusSession)
-            .options(joinedload(FocusSession.task))
+            .options(*LOAD_PROFILES[profile])
             .filter(
                 and_(
                     FocusSession.user_id == user_id,
@@ -188,10 +296,93 @@ class FocusSessionRepository(BaseRepository[FocusSession]):
 
         return self.update_session(session)
 
+    def get_started_before(
+        self,
+        status: FocusSessionStatus,
+        before: datetime,
+        after: Optional[Tuple[datetime, int]] = None,
+        limit: int = 500,
+    ) -> List[Row]:
+        """
+        Get focus sessions of every user in `status` that started before
+        `before`, oldest first, resuming after the (start_time, id) `after`.
+
+        A range scan of ix_focus_sessions_status_start_time; only the columns
+        the session sweeper needs are read.
+        """
+        query = select(
+            FocusSession.id,
+            FocusSession.uuid,
+            FocusSession.user_id,
+            FocusSession.task_id,
+            FocusSession.start_time,
+            FocusSession.maximum_duration,
+            FocusSession.pause_duration,
+        ).where(FocusSession.status == status, FocusSession.start_time < before)
+        if after is not None:
+            query = query.where(
+                or_(
+                    FocusSession.start_time > after[0],
+                    and_(FocusSession.start_time == after[0], FocusSession.id > after[1]),
+                )
+            )
+        return self.session.execute(
+            query.order_by(FocusSession.start_time, FocusSession.id).limit(limit)
+        ).all()
+
+    def expire_sessions(
+        self,
+        session_ids: List[int],
+        status: FocusSessionStatus,
+        outcome: FocusSessionStatus,
+        before: datetime,
+        now: datetime,
+    ) -> List[int]:
+        """
+        Move focus sessions still in `status` to `outcome` in one UPDATE and
+        return the ids that changed. Completed sessions get their maximum
+        duration.
+        """
+        if not session_ids:
+            return []
+        values = {"status": outcome, "end_time": now, "updated_at": now}
+        if outcome == FocusSessionStatus.COMPLETED:
+            # Same rule as FocusSession.calculate_efficiency_ratio() for the credited duration
+            efficiency_ratio = case(
+                (
+                    and_(
+                        func.coalesce(FocusSession.planned_duration, 0) != 0,
+                        FocusSession.maximum_duration > 0,
+                    ),
+                    (FocusSession.maximum_duration - func.coalesce(FocusSession.pause_duration, 0))
+                    * 1.0
+                    / FocusSession.maximum_duration,
+                ),
+                else_=None,
+            )
+            values.update(
+                completed_at=now,
+                actual_duration=FocusSession.maximum_duration,
+                efficiency_ratio=efficiency_ratio,
+            )
+        stmt = (
+            update(FocusSession)
+            .where(
+                FocusSession.id.in_(session_ids),
+                FocusSession.status == status,
+                # lets PostgreSQL skip partitions newer than the scan
+                FocusSession.start_time < before,
+            )
+            .values(**values)
+            .returning(FocusSession.id)
+            .execution_options(synchronize_session=False)
+        )
+        return list(self.session.execute(stmt).scalars())
+
     def get_focus_statistics(self, user_id: int, days: int = 30) -> Dict[str, Any]:
         """Get focus session statistics for a user over the last N days."""
         start_date = date.today() - timedelta(days=days)
-        sessions = self.get_user_sessions(user_id, start_date=start_date)
+        sessions = self.get_user_sessions(user_id, start_date=start_date, profile="stats")
 
         if not sessions:
             return self._empty_focus_stats()
@@ -274,7 +465,7 @@ class FocusSessionRepository(BaseRepository[FocusSession]):
     def get_focus_mode_analysis(self, user_id: int, days: int = 30) -> Dict[str, Any]:
         """Analyze productivity by focus mode."""
         start_date = date.today() - timedelta(days=days)
-        sessions = self.get_user_sessions(user_id, start_date=start_date)
+        sessions = self.get_user_sessions(user_id, start_date=start_date, profile="stats")
 
         completed_sessions = [
             s for s in sessions if s.status == FocusSessionStatus.COMPLETED
@@ -0,0 +1,108 @@
+"""
+Repository for interruption events.
+"""
+
+from datetime import UTC, datetime
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import extract, func, insert
+from sqlalchemy.orm import Session
+
+from database.models.interruption_event import InterruptionEvent, InterruptionSource
+from database.repositories.base_repository import BaseRepository
+
+
+class InterruptionEventRepository(BaseRepository[InterruptionEvent]):
+    def __init__(self, session: Session):
+        super().__init__(InterruptionEvent, session)
+
+    def bulk_create(self, events: List[Dict[str, Any]]) -> int:
+        """Insert events in one multi-row statement. Returns the number inserted."""
+        if not events:
+            return 0
+        now = datetime.now(UTC)
+        rows = [{"created_at": now, "updated_at": now, **event} for event in events]
+        self.session.execute(insert(InterruptionEvent), rows)
+        return len(rows)
+
+    def _filtered(self, query, user_id: int, start: datetime, end: Optional[datetime], source: Optional[InterruptionSource]):
+        query = query.filter(
+            InterruptionEvent.user_id == user_id,
+            InterruptionEvent.occurred_at >= start,
+        )
+        if end is not None:
+            query = query.filter(InterruptionEvent.occurred_at < end)
+        if source == InterruptionSource.POMODORO:
+            query = query.filter(InterruptionEvent.pomodoro_session_id.isnot(None))
+        elif source == InterruptionSource.FOCUS:
+            query = query.filter(InterruptionEvent.focus_session_id.isnot(None))
+        return query
+
+    def get_session_events(
+        self, source: InterruptionSource, session_id: int
+    ) -> List[InterruptionEvent]:
+        """Get a session's interruptions in the order they happened."""
+        column = (
+            InterruptionEvent.pomodoro_session_id
+            if source == InterruptionSource.POMODORO
+            else InterruptionEvent.focus_session_id
+        )
+        return (
+            self.session.query(InterruptionEvent)
+            .filter(column == session_id)
+            .order_by(InterruptionEvent.occurred_at)
+            .all()
+        )
+
+    def get_counts_by_type(
+        self,
+        user_id: int,
+        start: datetime,
+        end: Optional[datetime] = None,
+        source: Optional[InterruptionSource] = None,
+    ) -> List[Dict[str, Any]]:
+        """Count interruptions and their total duration per type."""
+        query = self.session.query(
+            InterruptionEvent.interruption_type,
+            func.count(InterruptionEvent.id),
+            func.coalesce(func.sum(InterruptionEvent.duration), 0),
+        )
+        rows = (
+            self._filtered(query, user_id, start, end, source)
+            .group_by(InterruptionEvent.interruption_type)
+            .order_by(func.count(InterruptionEvent.id).desc())
+            .all()
+        )
+        return [
+            {
+                "interruption_type": interruption_type.value,
+                "count": count,
+                "total_duration": int(total_duration),
+            }
+            for interruption_type, count, total_duration in rows
+        ]
+
+    def get_counts_by_hour(
+        self,
+        user_id: int,
+        start: datetime,
+        end: Optional[datetime] = None,
+        source: Optional[InterruptionSource] = None,
+    ) -> List[Dict[str, Any]]:
+        """Count interruptions and their total duration per hour of day."""
+        hour = extract("hour", InterruptionEvent.occurred_at)
+        query = self.session.query(
+            hour,
+            func.count(InterruptionEvent.id),
+            func.coalesce(func.sum(InterruptionEvent.duration), 0),
+        )
+        rows = (
+            self._filtered(query, user_id, start, end, source)
+            .group_by(hour)
+            .order_by(hour)
+            .all()
+        )
+        return [
+            {"hour": int(row_hour), "count": count, "total_duration": int(total_duration)}
+            for row_hour, count, total_duration in rows
+        ]
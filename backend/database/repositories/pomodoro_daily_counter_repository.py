@@ -0,0 +1,207 @@
+"""
+Repository for per-user daily Pomodoro counters.
+"""
+
+from datetime import UTC, date, datetime
+from typing import Optional
+
+from sqlalchemy import DateTime, and_, case, delete, func, literal, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from database.models.pomodoro_daily_counter import PomodoroDailyCounter
+from database.models.pomodoro_session import (
+    PomodoroSession,
+    PomodoroSessionStatus,
+    PomodoroSessionType,
+)
+from database.repositories.base_repository import BaseRepository
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+COMPLETED_COLUMNS = {
+    PomodoroSessionType.WORK: "work_completed",
+    PomodoroSessionType.SHORT_BREAK: "short_breaks_completed",
+    PomodoroSessionType.LONG_BREAK: "long_breaks_completed",
+}
+
+
+class PomodoroDailyCounterRepository(BaseRepository[PomodoroDailyCounter]):
+    def __init__(self, session: Session):
+        super().__init__(PomodoroDailyCounter, session)
+
+    def _upsert(self, user_id: int, day: date, increments: dict, **values):
+        """
+        Insert the day's row or add `increments` to it, in one statement.
+
+        Concurrent session transitions for the same user and day can't lose
+        updates because the increment happens in the database.
+        """
+        dialect = self.session.get_bind().dialect.name
+        insert = sqlite.insert if dialect == "sqlite" else postgresql.insert
+        table = PomodoroDailyCounter.__table__
+        now = datetime.now(UTC)
+
+        stmt = insert(table).values(
+            user_id=user_id,
+            day=day,
+            created_at=now,
+            updated_at=now,
+            **increments,
+            **values,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.user_id, table.c.day],
+            set_={
+                **{column: table.c[column] + amount for column, amount in increments.items()},
+                **values,
+                "updated_at": now,
+            },
+        )
+        return stmt
+
+    def get_counter(self, user_id: int, day: date) -> Optional[PomodoroDailyCounter]:
+        """Get a user's counters for a day."""
+        return (
+            self.session.query(PomodoroDailyCounter)
+            .filter(
+                PomodoroDailyCounter.user_id == user_id,
+                PomodoroDailyCounter.day == day,
+            )
+            .one_or_none()
+        )
+
+    def record_session_started(
+        self,
+        user_id: int,
+        day: date,
+        session_type: PomodoroSessionType,
+        started_at: datetime,
+    ) -> int:
+        """Count a started session and return the day's work sessions started so far."""
+        increments = {"work_started": 1 if session_type == PomodoroSessionType.WORK else 0}
+        stmt = self._upsert(
+            user_id,
+            day,
+            increments,
+            last_session_type=session_type,
+            last_session_at=started_at,
+        ).returning(PomodoroDailyCounter.__table__.c.work_started)
+        return self.session.execute(stmt).scalar_one()
+
+    def record_session_completed(
+        self, user_id: int, day: date, session_type: PomodoroSessionType, count: int = 1
+    ) -> None:
+        """Count `count` completed sessions."""
+        self.session.execute(
+            self._upsert(user_id, day, {COMPLETED_COLUMNS[session_type]: count})
+        )
+
+    def rebuild(
+        self,
+        start_date: date,
+        end_date: date,
+        user_id: Optional[int] = None,
+    ) -> int:
+        """
+        Recompute counters for a date range from pomodoro_sessions.
+
+        Existing rows in the range are replaced; returns the number of rows
+        written.
+        """
+        day = func.date(PomodoroSession.start_time)
+        filters = [
+            PomodoroSession.start_time.isnot(None),
+            day >= start_date,
+            day <= end_date,
+        ]
+        if user_id is not None:
+            filters.append(PomodoroSession.user_id == user_id)
+
+        def count_where(*conditions):
+            return func.coalesce(func.sum(case((and_(*conditions), 1), else_=0)), 0)
+
+        completed = PomodoroSession.status == PomodoroSessionStatus.COMPLETED
+        ranked = (
+            select(
+                PomodoroSession.user_id,
+                day.label("day"),
+                PomodoroSession.session_type,
+                PomodoroSession.start_time,
+                func.row_number()
+                .over(
+                    partition_by=(PomodoroSession.user_id, day),
+                    order_by=PomodoroSession.start_time.desc(),
+                )
+                .label("position"),
+            )
+            .where(*filters)
+            .subquery()
+        )
+        totals = (
+            select(
+                PomodoroSession.user_id,
+                day.label("day"),
+                count_where(PomodoroSession.session_type == PomodoroSessionType.WORK).label("work_started"),
+                count_where(PomodoroSession.session_type == PomodoroSessionType.WORK, completed).label("work_completed"),
+                count_where(PomodoroSession.session_type == PomodoroSessionType.SHORT_BREAK, completed).label("short_breaks_completed"),
+                count_where(PomodoroSession.session_type == PomodoroSessionType.LONG_BREAK, completed).label("long_breaks_completed"),
+            )
+            .where(*filters)
+            .group_by(PomodoroSession.user_id, day)
+            .subquery()
+        )
+        now = datetime.now(UTC)
+        rows = select(
+            totals.c.user_id,
+            totals.c.day,
+            totals.c.work_started,
+            totals.c.work_completed,
+            totals.c.short_breaks_completed,
+            totals.c.long_breaks_completed,
+            ranked.c.session_type,
+            ranked.c.start_time,
+            literal(now, DateTime()),
+            literal(now, DateTime()),
+        ).join(
+            ranked,
+            and_(
+                ranked.c.user_id == totals.c.user_id,
+                ranked.c.day == totals.c.day,
+                ranked.c.position == 1,
+            ),
+        )
+
+        stale = delete(PomodoroDailyCounter).where(
+            PomodoroDailyCounter.day >= start_date,
+            PomodoroDailyCounter.day <= end_date,
+        )
+        if user_id is not None:
+            stale = stale.where(PomodoroDailyCounter.user_id == user_id)
+        self.session.execute(stale)
+
+        table = PomodoroDailyCounter.__table__
+        result = self.session.execute(
+            table.insert().from_select(
+                [
+                    table.c.user_id,
+                    table.c.day,
+                    table.c.work_started,
+                    table.c.work_completed,
+                    table.c.short_breaks_completed,
+                    table.c.long_breaks_completed,
+                    table.c.last_session_type,
+                    table.c.last_session_at,
+                    table.c.created_at,
+                    table.c.updated_at,
+                ],
+                rows,
+            )
+        )
+        self.session.flush()
+        logger.info(
+            f"Rebuilt {result.rowcount} Pomodoro daily counters for {start_date}..{end_date}"
+            + (f" (user {user_id})" if user_id is not None else "")
+        )
+        return result.rowcount
@@ -1,8 +1,10 @@
 from datetime import UTC, date, datetime, timedelta
-from typing import Any, Dict, List, Optional
-from sqlalchemy import and_, desc
-from sqlalchemy.orm import Session, joinedload
+from typing import Any, Dict, List, Optional, Tuple
+from sqlalchemy import and_, desc, or_, select, update
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session, defer, joinedload, load_only, raiseload
 from database.repositories.base_repository import BaseRepository
+from database.partitions import ACTIVE_SESSION_LOOKBACK
 from database.models.pomodoro_session import (
     PomodoroSession,
     PomodoroSessionStatus,
@@ -13,6 +15,37 @@ from logger import get_logger
 
 logger = get_logger(__name__)
 
+# Columns the statistics and pattern methods read
+STATS_COLUMNS = (
+    PomodoroSession.id,
+    PomodoroSession.user_id,
+    PomodoroSession.task_id,
+    PomodoroSession.session_type,
+    PomodoroSession.status,
+    PomodoroSession.actual_duration,
+    PomodoroSession.start_time,
+    PomodoroSession.focus_quality_rating,
+    PomodoroSession.interruption_count,
+)
+
+# Free-form columns no session response includes
+UNSERIALIZED_COLUMNS = (
+    PomodoroSession.distraction_log,
+    PomodoroSession.break_activity,
+    PomodoroSession.device_used,
+)
+
+# Named load profiles for session queries:
+# - stats: STATS_COLUMNS only; reading any other attribute raises instead of
+#   issuing a query per row
+# - list: what session responses serialize; the rest is loaded on access
+# - detail: every column and the task
+LOAD_PROFILES = {
+    "stats": (load_only(*STATS_COLUMNS, raiseload=True), raiseload("*")),
+    "list": (*(defer(column) for column in UNSERIALIZED_COLUMNS), raiseload("*")),
+    "detail": (joinedload(PomodoroSession.task), raiseload(PomodoroSession.user)),
+}
+
 
 class PomodoroSessionRepository(BaseRepository[PomodoroSession]):
     def __init__(self, session: Session):
@@ -38,7 +71,7 @@ class PomodoroSessionRepository(BaseRepository[PomodoroSession]):
         """Retrieve a session by its session_id (UUID)."""
         return (
             self.session.query(PomodoroSession)
-            .options(joinedload(PomodoroSession.task), joinedload(PomodoroSession.user))
+            .options(*LOAD_PROFILES["detail"])
             .filter(PomodoroSession.uuid == session_uuid)
             .first()
         )
@@ -47,10 +80,11 @@ class PomodoroSessionRepository(BaseRepository[PomodoroSession]):
         """Retrieve the active Pomodoro session for a user."""
         return (
             self.session.query(PomodoroSession)
-            .options(joinedload(PomodoroSession.task), joinedload(PomodoroSession.user))
+            .options(*LOAD_PROFILES["list"])
             .filter(
                 and_(
                     PomodoroSession.user_id == user_id,
+                    PomodoroSession.start_time >= date.today() - ACTIVE_SESSION_LOOKBACK,
                     PomodoroSession.status.in_(
                         [
                             PomodoroSessionStatus.IN_PROGRESS,
@@ -71,10 +105,12 @@ class PomodoroSessionRepository(BaseRepository[PomodoroSession]):
         status: Optional[PomodoroSessionStatus] = None,
         task_id: Optional[int] = None,
         limit: int = 100,
+        profile: str = "list",
     ) -> List[PomodoroSession]:
+        """Get a user's sessions with optional filters, loaded per LOAD_PROFILES."""
         query = (
             self.session.query(PomodoroSession)
-            .options(joinedload(PomodoroSession.task), joinedload(PomodoroSession.user))
+            .options(*LOAD_PROFILES[profile])
             .filter(PomodoroSession.user_id == user_id)
         )
 
@@ -97,14 +133,14 @@ class PomodoroSessionRepository(BaseRepository[PomodoroSession]):
         return query.order_by(desc(PomodoroSession.start_time)).limit(limit).all()
 
     def get_daily_sessions(
-        self, user_id: int, target_date: date
+        self, user_id: int, target_date: date, profile: str = "list"
     ) -> List[PomodoroSession]:
         """Get all sessions for a specific day."""
         start_datetime = datetime.combine(target_date, datetime.min.time())
         end_datetime = datetime.combine(target_date, datetime.max.time())
         return (
             self.session.query(PomodoroSession)
-            .options(joinedload(PomodoroSession.task))
+            .options(*LOAD_PROFILES[profile])
             .filter(
                 and_(
                     PomodoroSession.user_id == user_id,
@@ -176,10 +212,76 @@ class PomodoroSessionRepository(BaseRepository[PomodoroSession]):
 
         return self.update_session(session)
 
+    def get_started_before(
+        self,
+        status: PomodoroSessionStatus,
+        before: datetime,
+        after: Optional[Tuple[datetime, int]] = None,
+        limit: int = 500,
+    ) -> List[Row]:
+        """
+        Get sessions of every user in `status` that started before `before`,
+        oldest first, resuming after the (start_time, id) `after`.
+
+        A range scan of ix_pomodoro_sessions_status_start_time; only the
+        columns the session sweeper needs are read.
+        """
+        query = select(
+            PomodoroSession.id,
+            PomodoroSession.uuid,
+            PomodoroSession.user_id,
+            PomodoroSession.task_id,
+            PomodoroSession.session_type,
+            PomodoroSession.start_time,
+            PomodoroSession.planned_duration,
+            PomodoroSession.interruption_total_time,
+        ).where(PomodoroSession.status == status, PomodoroSession.start_time < before)
+        if after is not None:
+            query = query.where(
+                or_(
+                    PomodoroSession.start_time > after[0],
+                    and_(PomodoroSession.start_time == after[0], PomodoroSession.id > after[1]),
+                )
+            )
+        return self.session.execute(
+            query.order_by(PomodoroSession.start_time, PomodoroSession.id).limit(limit)
+        ).all()
+
+    def expire_sessions(
+        self,
+        session_ids: List[int],
+        status: PomodoroSessionStatus,
+        outcome: PomodoroSessionStatus,
+        before: datetime,
+        now: datetime,
+    ) -> List[int]:
+        """
+        Move sessions still in `status` to `outcome` in one UPDATE and return
+        the ids that changed. Completed sessions get their planned duration.
+        """
+        if not session_ids:
+            return []
+        values = {"status": outcome, "end_time": now, "updated_at": now}
+        if outcome == PomodoroSessionStatus.COMPLETED:
+            values.update(completed_at=now, actual_duration=PomodoroSession.planned_duration)
+        stmt = (
+            update(PomodoroSession)
+            .where(
+                PomodoroSession.id.in_(session_ids),
+                PomodoroSession.status == status,
+                # lets PostgreSQL skip partitions newer than the scan
+                PomodoroSession.start_time < before,
+            )
+            .values(**values)
+            .returning(PomodoroSession.id)
+            .execution_options(synchronize_session=False)
+        )
+        return list(self.session.execute(stmt).scalars())
+
     def get_session_statistics(self, user_id: int, days: int = 30) -> Dict[str, Any]:
         """Get basic session statistics for a user over the last N days."""
         start_date = date.today() - timedelta(days=days)
-        sessions = self.get_user_sessions(user_id, start_date=start_date)
+        sessions = self.get_user_sessions(user_id, start_date=start_date, profile="stats")
 
         if not sessions:
             return self._empty_stats()
@@ -236,7 +338,7 @@ class PomodoroSessionRepository(BaseRepository[PomodoroSession]):
     def get_productivity_patterns(self, user_id: int, days: int = 30) -> Dict[str, Any]:
         """Analyze productivity patterns by hour and day."""
         start_date = date.today() - timedelta(days=days)
-        sessions = self.get_user_sessions(user_id, start_date=start_date)
+        sessions = self.get_user_sessions(user_id, start_date=start_date, profile="stats")
 
         completed_work_sessions = [
             s
@@ -317,18 +317,14 @@ class PomodoroStatsRepository(BaseRepository[PomodoroStats]):
         else:
             return "9+"
 
-    def delete_old_stats(self, user_id: int, older_than_days: int = 365) -> int:
-        """Delete stats older than specified days (cleanup)."""
+    def delete_old_stats(
+        self, user_id: Optional[int] = None, older_than_days: int = 365
+    ) -> int:
+        """Delete stats older than specified days (cleanup), for all users by default."""
         cutoff_date = date.today() - timedelta(days=older_than_days)
-        deleted_count = (
-            self.session.query(PomodoroStats)
-            .filter(
-                and_(
-                    PomodoroStats.user_id == user_id,
-                    PomodoroStats.end_date < cutoff_date,
-                )
-            )
-            .delete()
-        )
+        query = self.session.query(PomodoroStats).filter(PomodoroStats.end_date < cutoff_date)
+        if user_id is not None:
+            query = query.filter(PomodoroStats.user_id == user_id)
+        deleted_count = query.delete(synchronize_session=False)
         self.session.flush()
         return deleted_count
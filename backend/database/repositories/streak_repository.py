@@ -0,0 +1,218 @@
+"""
+Repository for per-user streaks.
+
+Each completion event is one INSERT ... ON CONFLICT DO UPDATE that adds to
+the day's progress and, when that meets the goal for the first time that
+day, extends the streak (if the last active day was yesterday) or restarts
+it. The SET expressions all read the row as it was before the update, so
+concurrent events for the same user can't lose progress.
+"""
+
+from datetime import UTC, date, datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import and_, case, delete, func, or_, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from database.models.focus_session import FocusSession, FocusSessionStatus
+from database.models.pomodoro_session import (
+    PomodoroSession,
+    PomodoroSessionStatus,
+    PomodoroSessionType,
+)
+from database.models.task import Task
+from database.models.task_archive import ArchivedTask
+from database.models.user_streak import StreakMetric, UserStreak
+from database.repositories.base_repository import BaseRepository
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def _as_date(value) -> date:
+    # func.date() gives a date on PostgreSQL and an ISO string on SQLite
+    return value if isinstance(value, date) else date.fromisoformat(value)
+
+
+class StreakRepository(BaseRepository[UserStreak]):
+    def __init__(self, session: Session):
+        super().__init__(UserStreak, session)
+
+    def record(
+        self, user_id: int, metric: StreakMetric, day: date, amount: int, goal: int
+    ) -> None:
+        """Add `amount` to the user's progress on `day` and update the streak."""
+        dialect = self.session.get_bind().dialect.name
+        insert = sqlite.insert if dialect == "sqlite" else postgresql.insert
+        table = UserStreak.__table__
+        c = table.c
+        now = datetime.now(UTC)
+        met = amount >= goal
+
+        progress = case((c.progress_date == day, c.progress + amount), else_=amount)
+        newly_met = and_(
+            progress >= goal,
+            or_(c.last_active_date.is_(None), c.last_active_date < day),
+        )
+        extended = case(
+            (c.last_active_date == day - timedelta(days=1), c.current_streak + 1),
+            else_=1,
+        )
+
+        stmt = insert(table).values(
+            user_id=user_id,
+            metric=metric,
+            current_streak=1 if met else 0,
+            longest_streak=1 if met else 0,
+            last_active_date=day if met else None,
+            progress_date=day,
+            progress=amount,
+            created_at=now,
+            updated_at=now,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[c.user_id, c.metric],
+            set_={
+                "progress_date": day,
+                "progress": progress,
+                "current_streak": case((newly_met, extended), else_=c.current_streak),
+                "longest_streak": case(
+                    (and_(newly_met, extended > c.longest_streak), extended),
+                    else_=c.longest_streak,
+                ),
+                "last_active_date": case((newly_met, day), else_=c.last_active_date),
+                "updated_at": now,
+            },
+        )
+        self.session.execute(stmt)
+
+    def get_streaks(self, user_id: int) -> List[UserStreak]:
+        """Get all of a user's streaks."""
+        return self.session.query(UserStreak).filter(UserStreak.user_id == user_id).all()
+
+    def get_streak(self, user_id: int, metric: StreakMetric) -> Optional[UserStreak]:
+        return (
+            self.session.query(UserStreak)
+            .filter(UserStreak.user_id == user_id, UserStreak.metric == metric)
+            .one_or_none()
+        )
+
+    def _daily_totals(
+        self, metric: StreakMetric, user_id: Optional[int]
+    ) -> Iterable[Tuple[int, date, int]]:
+        """(user_id, day, amount) per day with any activity, oldest first per user."""
+        if metric == StreakMetric.TASK_COMPLETION:
+            # Archived tasks still count toward the history
+            parts = []
+            for model in (Task, ArchivedTask):
+                query = select(
+                    model.user_id.label("user_id"),
+                    func.date(model.completed_at).label("day"),
+                ).where(model.completed_at.isnot(None))
+                if user_id is not None:
+                    query = query.where(model.user_id == user_id)
+                parts.append(query)
+            completions = parts[0].union_all(parts[1]).subquery()
+            stmt = select(
+                completions.c.user_id, completions.c.day, func.count()
+            ).group_by(completions.c.user_id, completions.c.day)
+            return self.session.execute(
+                stmt.order_by(completions.c.user_id, completions.c.day)
+            ).all()
+
+        if metric == StreakMetric.POMODORO_GOAL:
+            day = func.date(PomodoroSession.completed_at)
+            stmt = select(PomodoroSession.user_id, day, func.count()).where(
+                PomodoroSession.status == PomodoroSessionStatus.COMPLETED,
+                PomodoroSession.session_type == PomodoroSessionType.WORK,
+                PomodoroSession.completed_at.isnot(None),
+            )
+            if user_id is not None:
+                stmt = stmt.where(PomodoroSession.user_id == user_id)
+            return self.session.execute(
+                stmt.group_by(PomodoroSession.user_id, day).order_by(PomodoroSession.user_id, day)
+            ).all()
+
+        # Focus minutes from Pomodoro work sessions and focus sessions
+        parts = []
+        for model, status, extra in (
+            (
+                PomodoroSession,
+                PomodoroSessionStatus.COMPLETED,
+                PomodoroSession.session_type == PomodoroSessionType.WORK,
+            ),
+            (FocusSession, FocusSessionStatus.COMPLETED, None),
+        ):
+            query = select(
+                model.user_id.label("user_id"),
+                func.date(model.completed_at).label("day"),
+                func.coalesce(model.actual_duration, 0).label("seconds"),
+            ).where(model.status == status, model.completed_at.isnot(None))
+            if extra is not None:
+                query = query.where(extra)
+            if user_id is not None:
+                query = query.where(model.user_id == user_id)
+            parts.append(query)
+        sessions = parts[0].union_all(parts[1]).subquery()
+        stmt = select(
+            sessions.c.user_id, sessions.c.day, func.sum(sessions.c.seconds) / 60
+        ).group_by(sessions.c.user_id, sessions.c.day)
+        return self.session.execute(stmt.order_by(sessions.c.user_id, sessions.c.day)).all()
+
+    def backfill(
+        self, goals: Dict[StreakMetric, int], today: date, user_id: Optional[int] = None
+    ) -> int:
+        """
+        Recompute streaks from task and session history.
+
+        Existing rows (for `user_id`, or everyone) are replaced; returns the
+        number of rows written.
+        """
+        rows = []
+        now = datetime.now(UTC)
+        for metric, goal in goals.items():
+            streaks: Dict[int, dict] = {}
+            for row_user_id, day, amount in self._daily_totals(metric, user_id):
+                day = _as_date(day)
+                amount = int(amount or 0)
+                streak = streaks.setdefault(
+                    row_user_id,
+                    {
+                        "user_id": row_user_id,
+                        "metric": metric,
+                        "current_streak": 0,
+                        "longest_streak": 0,
+                        "last_active_date": None,
+                        "progress_date": None,
+                        "progress": 0,
+                        "created_at": now,
+                        "updated_at": now,
+                    },
+                )
+                if day == today:
+                    streak["progress_date"] = day
+                    streak["progress"] = amount
+                if amount < goal:
+                    continue
+                last = streak["last_active_date"]
+                if last == day - timedelta(days=1):
+                    streak["current_streak"] += 1
+                else:
+                    streak["current_streak"] = 1
+                streak["last_active_date"] = day
+                streak["longest_streak"] = max(streak["longest_streak"], streak["current_streak"])
+            rows.extend(streaks.values())
+
+        stale = delete(UserStreak).where(UserStreak.metric.in_(list(goals)))
+        if user_id is not None:
+            stale = stale.where(UserStreak.user_id == user_id)
+        self.session.execute(stale)
+        if rows:
+            self.session.execute(UserStreak.__table__.insert(), rows)
+        self.session.flush()
+        logger.info(
+            f"Backfilled {len(rows)} streaks"
+            + (f" (user {user_id})" if user_id is not None else "")
+        )
+        return len(rows)
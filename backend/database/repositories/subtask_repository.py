@@ -1,8 +1,10 @@
 from datetime import datetime, UTC
 from typing import List, Any, Optional, Dict, Tuple
+from sqlalchemy import delete, select, update
 from sqlalchemy.orm import Session
 
 from database.models.subtask import Subtask
+from database.models.task import Task
 from database.repositories.base_repository import BaseRepository
 
 from logger import get_logger
@@ -14,6 +16,16 @@ class SubtaskRepository(BaseRepository[Subtask]):
     def __init__(self, session: Session):
         super().__init__(Subtask, session)
 
+    @staticmethod
+    def _owned_by(user_id: int, task_id: int) -> List[Any]:
+        """WHERE criteria for subtasks of `task_id` when that task belongs to `user_id`."""
+        return [
+            Subtask.task_id == task_id,
+            Subtask.task_id.in_(
+                select(Task.id).where(Task.id == task_id, Task.user_id == user_id)
+            ),
+        ]
+
     def create_subtask(self, subtask: Subtask) -> Subtask:
         self.session.add(subtask)
         self.session.flush()
@@ -41,35 +53,49 @@ class SubtaskRepository(BaseRepository[Subtask]):
         percentage = (completed_count / total_count) * 100 if total_count > 0 else 0
         return completed_count, total_count, percentage
 
-    def reorder_subtasks(self, subtask_positions: Dict[int, int]) -> Tuple[bool, int]:
+    def reorder_subtasks(
+        self, subtask_positions: Dict[int, int], user_id: int, task_id: int
+    ) -> List[int]:
+        """Set positions of the user's subtasks of a task; returns the ids updated."""
+        owned = self._owned_by(user_id, task_id)
+        updated = []
         for subtask_id, position in subtask_positions.items():
-            result = (
-                self.session.query(Subtask)
-                .filter(Subtask.id == subtask_id)
-                .update({"position": position})
+            result = self.session.execute(
+                update(Subtask)
+                .where(Subtask.id == subtask_id, *owned)
+                .values(position=position)
+                .execution_options(synchronize_session=False)
             )
-        self.session.flush()
-        return True, result
+            if result.rowcount:
+                updated.append(subtask_id)
+        return updated
 
     def bulk_toggle_completed(
-        self, subtask_ids: List[int], completed: bool
-    ) -> Tuple[bool, int]:
-        result = (
-            self.session.query(Subtask)
-            .filter(Subtask.id.in_(subtask_ids))
-            .update({"is_completed": completed}, synchronize_session=False)
+        self, subtask_ids: List[int], completed: bool, user_id: int, task_id: int
+    ) -> List[int]:
+        """Set completion of the user's subtasks of a task; returns the ids updated."""
+        return list(
+            self.session.execute(
+                update(Subtask)
+                .where(Subtask.id.in_(subtask_ids), *self._owned_by(user_id, task_id))
+                .values(is_completed=completed)
+                .returning(Subtask.id)
+                .execution_options(synchronize_session=False)
+            ).scalars()
         )
-        self.session.flush()
-        return True, result
 
     def delete_subtask(self, subtask: Subtask) -> None:
         self.session.delete(subtask)
 
-    def delete_subtasks_by_ids(self, subtask_ids: List[int]) -> Tuple[bool, int]:
-        result = (
-            self.session.query(Subtask)
-            .filter(Subtask.id.in_(subtask_ids))
-            .delete(synchronize_session=False)
+    def delete_subtasks_by_ids(
+        self, subtask_ids: List[int], user_id: int, task_id: int
+    ) -> List[int]:
+        """Delete the user's subtasks of a task; returns the ids deleted."""
+        return list(
+            self.session.execute(
+                delete(Subtask)
+                .where(Subtask.id.in_(subtask_ids), *self._owned_by(user_id, task_id))
+                .returning(Subtask.id)
+                .execution_options(synchronize_session=False)
+            ).scalars()
         )
-        self.session.flush()
-        return True, result
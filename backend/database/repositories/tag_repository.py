@@ -1,5 +1,5 @@
 from datetime import datetime, UTC
-from typing import List
+from typing import Dict, List
 from .base_repository import BaseRepository
 
 from sqlalchemy.orm import Session
@@ -30,5 +30,10 @@ class TagRepository(BaseRepository[Tag]):
     def get_all_tags_for_user(self, user_id: int) -> List[Tag]:
         return self.session.query(Tag).filter(Tag.user_id == user_id).all()
 
+    def get_tag_ids_by_name(self, user_id: int) -> Dict[str, int]:
+        """Map each of a user's tag names to its id."""
+        rows = self.session.query(Tag.name, Tag.id).filter(Tag.user_id == user_id).all()
+        return {name: tag_id for name, tag_id in rows}
+
     def delete_tag(self, tag: Tag) -> None:
         self.session.delete(tag)
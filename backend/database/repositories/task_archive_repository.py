@@ -0,0 +1,232 @@
+"""
+Repository for the cold task archive.
+
+Archiving moves finished tasks together with their subtasks and tag links
+from the hot tables into archived_tasks, archived_subtasks and
+archived_task_tags. The move uses set-based INSERT ... SELECT and DELETE
+statements, so a batch costs the same few statements however many rows it
+moves. Restoring does the reverse. Tasks keep their ids in the archive, so
+Pomodoro and focus sessions (which reference tasks without a foreign key)
+point at them again once restored.
+"""
+
+from datetime import UTC, datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import Table, delete, desc, exists, insert, literal, or_, select
+from sqlalchemy.orm import Session
+
+from database.models.group import Group
+from database.models.subtask import Subtask
+from database.models.tag import Tag
+from database.models.task import Task, TaskStatus
+from database.models.task_archive import ArchivedSubtask, ArchivedTask, ArchivedTaskTag
+from database.models.tasktag import TaskTag
+from database.repositories.base_repository import BaseRepository
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+ARCHIVABLE_STATUSES = (TaskStatus.COMPLETED, TaskStatus.ARCHIVED, TaskStatus.CANCELLED)
+
+# (user_id, task_id, subtask ids) for each task moved
+MovedTask = Tuple[int, int, List[int]]
+
+
+class TaskArchiveRepository(BaseRepository[ArchivedTask]):
+    def __init__(self, session: Session):
+        super().__init__(ArchivedTask, session)
+
+    def _copy(self, source: Table, target: Table, where, values: Optional[Dict[str, Any]] = None) -> int:
+        """INSERT INTO target the columns it shares with source, for rows matching `where`."""
+        values = values or {}
+        names = [c.name for c in target.columns if c.name in values or c.name in source.c]
+        columns = [values[name] if name in values else source.c[name] for name in names]
+        result = self.session.execute(
+            insert(target).from_select(names, select(*columns).where(where))
+        )
+        return result.rowcount
+
+    def _describe(self, task_model, subtask_model, task_ids: List[int]) -> List[MovedTask]:
+        rows = self.session.execute(
+            select(task_model.user_id, task_model.id, subtask_model.id)
+            .outerjoin(subtask_model, subtask_model.task_id == task_model.id)
+            .where(task_model.id.in_(task_ids))
+            .order_by(task_model.id)
+        ).all()
+        moved: Dict[int, MovedTask] = {}
+        for user_id, task_id, subtask_id in rows:
+            entry = moved.setdefault(task_id, (user_id, task_id, []))
+            if subtask_id is not None:
+                entry[2].append(subtask_id)
+        return list(moved.values())
+
+    def get_archivable_task_ids(
+        self, before: datetime, limit: int, user_id: Optional[int] = None
+    ) -> List[int]:
+        """
+        Get ids of finished tasks untouched since `before`, least recently updated first.
+
+        Tasks with a subtask updated since then stay in the hot table. The
+        rows are locked, skipping any already locked, so an edit in flight is
+        never archived under it.
+        """
+        stmt = (
+            select(Task.id)
+            .where(
+                Task.status.in_(ARCHIVABLE_STATUSES),
+                Task.updated_at < before,
+                ~exists().where(Subtask.task_id == Task.id, Subtask.updated_at >= before),
+            )
+            .order_by(Task.updated_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True, of=Task)
+        )
+        if user_id is not None:
+            stmt = stmt.where(Task.user_id == user_id)
+        return list(self.session.execute(stmt).scalars())
+
+    def archive_tasks(self, task_ids: List[int]) -> List[MovedTask]:
+        """Move tasks with their subtasks and tag links into the archive."""
+        if not task_ids:
+            return []
+        moved = self._describe(Task, Subtask, task_ids)
+        archived_at = literal(datetime.now(UTC), ArchivedTask.archived_at.type)
+
+        tasks, subtasks, task_tags = Task.__table__, Subtask.__table__, TaskTag.__table__
+        self._copy(tasks, ArchivedTask.__table__, tasks.c.id.in_(task_ids), {"archived_at": archived_at})
+        self._copy(subtasks, ArchivedSubtask.__table__, subtasks.c.task_id.in_(task_ids))
+        self._copy(task_tags, ArchivedTaskTag.__table__, task_tags.c.task_id.in_(task_ids))
+
+        for stmt in (
+            delete(TaskTag).where(TaskTag.task_id.in_(task_ids)),
+            delete(Subtask).where(Subtask.task_id.in_(task_ids)),
+            delete(Task).where(Task.id.in_(task_ids)),
+        ):
+            self.session.execute(stmt.execution_options(synchronize_session=False))
+        return moved
+
+    def restore_tasks(self, user_id: int, task_ids: List[int]) -> List[MovedTask]:
+        """
+        Move a user's archived tasks back into the hot tables.
+
+        Links to tags that no longer exist are dropped, and a group that no
+        longer exists is cleared. Restored tasks count as just updated, so the
+        archiver leaves them alone for another full period.
+        """
+        owned = list(
+            self.session.execute(
+                select(ArchivedTask.id).where(
+                    ArchivedTask.id.in_(task_ids), ArchivedTask.user_id == user_id
+                )
+            ).scalars()
+        )
+        if not owned:
+            return []
+        moved = self._describe(ArchivedTask, ArchivedSubtask, owned)
+
+        archived_tasks = ArchivedTask.__table__
+        archived_subtasks = ArchivedSubtask.__table__
+        archived_task_tags = ArchivedTaskTag.__table__
+        existing_group = (
+            select(Group.id)
+            .where(Group.id == archived_tasks.c.group_id, Group.user_id == user_id)
+            .scalar_subquery()
+        )
+        self._copy(
+            archived_tasks,
+            Task.__table__,
+            archived_tasks.c.id.in_(owned),
+            {
+                "group_id": existing_group,
+                "updated_at": literal(datetime.now(UTC), Task.updated_at.type),
+            },
+        )
+        self._copy(archived_subtasks, Subtask.__table__, archived_subtasks.c.task_id.in_(owned))
+        self._copy(
+            archived_task_tags,
+            TaskTag.__table__,
+            archived_task_tags.c.task_id.in_(owned)
+            & exists().where(Tag.id == archived_task_tags.c.tag_id),
+        )
+
+        for stmt in (
+            delete(ArchivedTaskTag).where(ArchivedTaskTag.task_id.in_(owned)),
+            delete(ArchivedSubtask).where(ArchivedSubtask.task_id.in_(owned)),
+            delete(ArchivedTask).where(ArchivedTask.id.in_(owned)),
+        ):
+            self.session.execute(stmt.execution_options(synchronize_session=False))
+        return moved
+
+    def get_archived_task(self, user_id: int, task_id: int) -> Optional[ArchivedTask]:
+        """Get one of a user's archived tasks."""
+        return (
+            self.session.query(ArchivedTask)
+            .filter(ArchivedTask.id == task_id, ArchivedTask.user_id == user_id)
+            .one_or_none()
+        )
+
+    def get_archived_subtasks(self, task_id: int) -> List[ArchivedSubtask]:
+        return (
+            self.session.query(ArchivedSubtask)
+            .filter(ArchivedSubtask.task_id == task_id)
+            .order_by(ArchivedSubtask.position)
+            .all()
+        )
+
+    def get_archived_tags(self, task_id: int) -> List[Tag]:
+        """Get the archived task's tags that still exist."""
+        return (
+            self.session.query(Tag)
+            .join(ArchivedTaskTag, ArchivedTaskTag.tag_id == Tag.id)
+            .filter(ArchivedTaskTag.task_id == task_id)
+            .order_by(Tag.name)
+            .all()
+        )
+
+    def search(
+        self,
+        user_id: int,
+        search: Optional[str] = None,
+        statuses: Optional[List[TaskStatus]] = None,
+        archived_from: Optional[datetime] = None,
+        archived_to: Optional[datetime] = None,
+        page: int = 1,
+        page_size: int = 25,
+    ) -> Dict[str, Any]:
+        """Search a user's archived tasks, most recently archived first."""
+        query = self.session.query(ArchivedTask).filter(ArchivedTask.user_id == user_id)
+
+        if search:
+            search_pattern = f"%{search.strip()}%"
+            query = query.filter(
+                or_(
+                    ArchivedTask.title.ilike(search_pattern),
+                    ArchivedTask.description.ilike(search_pattern),
+                )
+            )
+        if statuses:
+            query = query.filter(ArchivedTask.status.in_(statuses))
+        if archived_from:
+            query = query.filter(ArchivedTask.archived_at >= archived_from)
+        if archived_to:
+            query = query.filter(ArchivedTask.archived_at <= archived_to)
+
+        total_count = query.count()
+        tasks = (
+            query.order_by(desc(ArchivedTask.archived_at), desc(ArchivedTask.id))
+            .offset((page - 1) * page_size)
+            .limit(page_size)
+            .all()
+        )
+        total_pages = (total_count + page_size - 1) // page_size
+
+        return {
+            "tasks": tasks,
+            "total_count": total_count,
+            "page": page,
+            "page_size": page_size,
+            "total_pages": total_pages,
+            "has_next": page < total_pages,
+            "has_prev": page > 1,
+        }
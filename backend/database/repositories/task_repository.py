@@ -1,19 +1,34 @@
-from datetime import datetime, UTC, date, time, timezone
+from dataclasses import dataclass, field
+from datetime import datetime, UTC, date, time, timedelta, timezone
 from typing import List, Optional, Dict, Any, Union
 
-from sqlalchemy import asc, desc, or_, and_
+from sqlalchemy import asc, bindparam, desc, exists, or_, and_, false, func, literal, null, select, union_all, update
 
-from database.models.tag import Tag
 from database.repositories.base_repository import BaseRepository
-from database.models.task import Task
+from database.models.task import Task, TaskStatus
 from database.models.tasktag import TaskTag
 
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session, Query, joinedload
 
 from logger import get_logger
 
 logger = get_logger(__name__)
 
+# Statuses that still get due-date reminders
+OPEN_STATUSES = (TaskStatus.PENDING, TaskStatus.IN_PROGRESS)
+
+
+@dataclass
+class TagFilter:
+    """Tag ids a task must have all of, at least one of, and none of."""
+
+    all_of: List[int] = field(default_factory=list)
+    any_of: List[int] = field(default_factory=list)
+    none_of: List[int] = field(default_factory=list)
+    # Set when a required tag doesn't exist, so nothing can match
+    matches_nothing: bool = False
+
 
 class TaskRepository(BaseRepository[Task]):
     """Repository for Task model operations."""
@@ -115,16 +130,48 @@ class TaskRepository(BaseRepository[Task]):
                 and_(Task.due_date < current_date, Task.status != "completed")
             )
 
-        # Tags filter - fixed the relationship query
-        if tags := filters.get("tags"):
-            if not isinstance(tags, list):
-                tags = [tags]
+        # Tags filter - tag names are resolved to ids by the service
+        if tag_filter := filters.get("tag_filter"):
+            query = self._apply_tag_filter(query, tag_filter)
+
+        return query
 
-            # Filter by tag names using the relationship
-            for tag_name in tags:
-                query = query.filter(
-                    Task.tags.any(TaskTag.tag.has(Tag.name == tag_name))
+    def _apply_tag_filter(self, query: Query, tag_filter: TagFilter) -> Query:
+        """
+        Restrict to tasks matching a TagFilter.
+
+        All-of and any-of are answered by one grouped pass over task_tags
+        (tag_id, task_id); none-of is an anti-join on the same index.
+        """
+        if tag_filter.matches_nothing:
+            return query.filter(false())
+
+        all_of = sorted(set(tag_filter.all_of))
+        any_of = sorted(set(tag_filter.any_of))
+        if all_of or any_of:
+            having = []
+            if all_of:
+                having.append(
+                    func.count(func.distinct(TaskTag.tag_id)).filter(
+                        TaskTag.tag_id.in_(all_of)
+                    )
+                    == len(all_of)
                 )
+            if any_of:
+                having.append(func.count().filter(TaskTag.tag_id.in_(any_of)) > 0)
+            matching = (
+                select(TaskTag.task_id)
+                .where(TaskTag.tag_id.in_(set(all_of) | set(any_of)))
+                .group_by(TaskTag.task_id)
+                .having(and_(*having))
+            )
+            query = query.filter(Task.id.in_(matching))
+
+        if tag_filter.none_of:
+            excluded = select(TaskTag.task_id).where(
+                TaskTag.tag_id.in_(set(tag_filter.none_of))
+            )
+            query = query.filter(Task.id.not_in(excluded))
 
         return query
 
@@ -163,6 +210,14 @@ class TaskRepository(BaseRepository[Task]):
             .first()
         )
 
+    def is_owned_by(self, task_id: int, user_id: int) -> bool:
+        """Check that a task exists and belongs to a user without loading it."""
+        return bool(
+            self.session.execute(
+                select(exists().where(Task.id == task_id, Task.user_id == user_id))
+            ).scalar()
+        )
+
     def get_today_tasks(self, user_id: int) -> List[Task]:
         """Get all tasks for a user that are due today."""
         today = datetime.now(UTC).date()
@@ -227,10 +282,10 @@ class TaskRepository(BaseRepository[Task]):
         results = self.get_all_tasks_for_user(user_id, filters, page_size=100)
         return results["tasks"]
 
-    def get_tasks_by_tags(self, user_id: int, tags_list: List[str]) -> List[Task]:
-        """Get all tasks for a user by tag."""
+    def get_tasks_by_tags(self, user_id: int, tag_filter: TagFilter) -> List[Task]:
+        """Get all tasks for a user matching a tag filter."""
         filters = {
-            "tags": tags_list,
+            "tag_filter": tag_filter,
         }
         results = self.get_all_tasks_for_user(user_id, filters, page_size=100)
         return results["tasks"]
@@ -389,6 +444,104 @@ class TaskRepository(BaseRepository[Task]):
 
         return tasks
 
+    def get_open_due_between(self, start: datetime, end: datetime, limit: int) -> List[Row]:
+        """
+        Get (id, user_id, title, due_date) of open tasks due after `start` and
+        up to `end`, soonest first, for every user.
+
+        A range scan of ix_tasks_open_due_date; only the columns a reminder
+        needs are read.
+        """
+        return self.session.execute(
+            select(Task.id, Task.user_id, Task.title, Task.due_date)
+            .where(
+                Task.due_date > start,
+                Task.due_date <= end,
+                Task.status.in_(OPEN_STATUSES),
+            )
+            .order_by(Task.due_date, Task.id)
+            .limit(limit)
+        ).all()
+
+    def get_open_due_at(self, due_date: datetime) -> List[Row]:
+        """Get (id, user_id, title, due_date) of every open task due exactly at `due_date`."""
+        return self.session.execute(
+            select(Task.id, Task.user_id, Task.title, Task.due_date)
+            .where(Task.due_date == due_date, Task.status.in_(OPEN_STATUSES))
+            .order_by(Task.id)
+        ).all()
+
+    def get_open_due_by_ids(self, task_ids: List[int]) -> List[Row]:
+        """Get (id, user_id, title, due_date) of the given tasks that are open and have a due date."""
+        if not task_ids:
+            return []
+        return self.session.execute(
+            select(Task.id, Task.user_id, Task.title, Task.due_date).where(
+                Task.id.in_(task_ids),
+                Task.due_date.isnot(None),
+                Task.status.in_(OPEN_STATUSES),
+            )
+        ).all()
+
+    def add_completed_pomodoros(self, counts: Dict[int, int]) -> None:
+        """Add completed Pomodoros to tasks, as {task_id: count}, in one executemany UPDATE."""
+        if not counts:
+            return
+        table = Task.__table__
+        self.session.execute(
+            update(table)
+            .where(table.c.id == bindparam("b_task_id"))
+            .values(
+                completed_pomodoros=func.coalesce(table.c.completed_pomodoros, 0)
+                + bindparam("b_count"),
+                updated_at=datetime.now(UTC),
+            ),
+            [{"b_task_id": task_id, "b_count": count} for task_id, count in counts.items()],
+        )
+
+    def get_counters(self, user_id: int, today: date) -> Dict[str, Any]:
+        """
+        Count a user's tasks per sidebar view, group and tag in one statement.
+
+        Each view is a FILTER clause over the same scan; the overall, per-group
+        and per-tag rows are combined with UNION ALL.
+        """
+        day_start = datetime.combine(today, time.min)
+        day_end = datetime.combine(today + timedelta(days=1), time.min)
+        open_task = Task.status != TaskStatus.COMPLETED
+        columns = [
+            func.count().filter(open_task).label("open"),
+            func.count().filter(Task.due_date >= day_start, Task.due_date < day_end).label("today"),
+            func.count().filter(Task.due_date < day_start, open_task).label("overdue"),
+            func.count().filter(Task.starred.is_(True)).label("starred"),
+            func.count().filter(Task.is_in_my_day.is_(True), open_task).label("my_day"),
+            func.count().filter(Task.status == TaskStatus.COMPLETED).label("completed"),
+        ]
+        totals = select(literal("all").label("kind"), null().label("key"), *columns).where(
+            Task.user_id == user_id
+        )
+        by_group = (
+            select(literal("group").label("kind"), Task.group_id, *columns)
+            .where(Task.user_id == user_id, Task.group_id.isnot(None))
+            .group_by(Task.group_id)
+        )
+        by_tag = (
+            select(literal("tag").label("kind"), TaskTag.tag_id, *columns)
+            .join(TaskTag, TaskTag.task_id == Task.id)
+            .where(Task.user_id == user_id)
+            .group_by(TaskTag.tag_id)
+        )
+        rows = self.session.execute(union_all(totals, by_group, by_tag)).all()
+
+        counters: Dict[str, Any] = {"totals": {}, "groups": {}, "tags": {}}
+        for kind, key, *counts in rows:
+            values = {column.name: count for column, count in zip(columns, counts)}
+            if kind == "all":
+                counters["totals"] = values
+            else:
+                counters["groups" if kind == "group" else "tags"][key] = values
+        return counters
+
     def delete_task(self, task: Task) -> None:
         """Delete a task."""
         self.session.delete(task)
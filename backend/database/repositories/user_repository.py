@@ -4,12 +4,32 @@ User repository for database operations on the User model.
 
 from datetime import UTC, datetime
 from typing import List, Optional, Tuple
+from sqlalchemy import Row, select, update
 from sqlalchemy.orm import Session
 
 from database.repositories.base_repository import BaseRepository
 from database.models.user import User
 
 
+# Columns of a cached user profile snapshot (app.utils.profile_cache.UserProfile)
+PROFILE_COLUMNS = (
+    User.id,
+    User.email,
+    User.display_name,
+    User.is_active,
+    User.token_epoch,
+    User.work_duration,
+    User.short_break_duration,
+    User.long_break_duration,
+    User.sessions_until_long_break,
+    User.default_focu_mode,
+    User.auto_start_breaks,
+    User.distraction_blocking_enabled,
+    User.daily_pomodoro_goal,
+    User.daily_focus_time_goal,
+)
+
+
 class UserRepository(BaseRepository[User]):
     """Repository for User model operations."""
 
@@ -21,6 +41,30 @@ class UserRepository(BaseRepository[User]):
         """Get a user by email."""
         return self.session.query(User).filter(User.email == email).first()
 
+    def get_token_state(self, user_id: int) -> Optional[Tuple[int, bool]]:
+        """Get (token_epoch, is_active) for a user without loading the whole row."""
+        row = (
+            self.session.query(User.token_epoch, User.is_active)
+            .filter(User.id == user_id)
+            .first()
+        )
+        return (row.token_epoch, row.is_active) if row else None
+
+    def get_profile(self, user_id: int) -> Optional[Row]:
+        """Get a user's profile columns (no password hash) without loading the entity."""
+        return self.session.execute(
+            select(*PROFILE_COLUMNS).where(User.id == user_id)
+        ).first()
+
+    def bump_token_epoch(self, user_id: int) -> Optional[int]:
+        """Increment a user's token epoch atomically and return the new value."""
+        return self.session.execute(
+            update(User)
+            .where(User.id == user_id)
+            .values(token_epoch=User.token_epoch + 1, updated_at=datetime.now(UTC))
+            .returning(User.token_epoch)
+        ).scalar()
+
     def create_user(self, user: User) -> User:
         """Create a new user."""
         self.session.add(user)
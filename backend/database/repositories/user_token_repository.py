@@ -22,29 +22,21 @@ class UserTokenRepository(BaseRepository[UserToken]):
         """Initialize the repository with the UserToken model."""
         super().__init__(UserToken, session)
 
-    def create_access_token(self, user_id: int, expires_delta: int) -> str:
-        """Create an access token."""
-        # delete any existing token for user
-        self.delete_token_by_user_id(user_id)
-        token = jwt_create_access_token(
-            identity=str(user_id), expires_delta=timedelta(minutes=expires_delta)
-        )
-
-        jti = get_jti(token)
-
-        expires_at = datetime.now(UTC) + timedelta(minutes=expires_delta)
-
-        new_user_token = UserToken(
-            user_id=user_id, jti=jti, token_type="access", expires_at=expires_at
+    def create_access_token(self, user_id: int, expires_delta: int, token_epoch: int = 0) -> str:
+        """
+        Create an access token.
+
+        Access tokens are not stored; they carry the user's token epoch and
+        are revoked by bumping it.
+        """
+        return jwt_create_access_token(
+            identity=str(user_id),
+            expires_delta=timedelta(minutes=expires_delta),
+            additional_claims={"epoch": token_epoch},
         )
-        self.session.add(new_user_token)
-        self.session.flush()
-        self.session.refresh(new_user_token)
-
-        return token
 
     def create_refresh_token(self, user_id: int, expires_delta: int) -> str:
-        """Create a refresh token."""
+        """Create a refresh token and persist its JTI."""
         token = jwt_create_refresh_token(
             identity=str(user_id), expires_delta=timedelta(minutes=expires_delta)
         )
@@ -58,42 +50,47 @@ class UserTokenRepository(BaseRepository[UserToken]):
         )
         self.session.add(new_user_token)
         self.session.flush()
-        self.session.refresh(new_user_token)
 
         return token
 
     def revoke_token(self, token_value: str) -> bool:
-        """Revoke a token by its JTI."""
+        """Revoke a refresh token by deleting its row."""
         jti = get_jti(token_value)
-        user_token = (
-            self.session.query(UserToken).filter(UserToken.jti == jti).one_or_none()
-        )
-        if user_token:
-            user_token.revoked = True
-            self.session.flush()
-            return True
-        return False
-
-    def revoke_all_tokens(self, user_id: int, token_type: str) -> int:
-        """Revoke all tokens for a user. Returns count of revoked tokens."""
-        user_tokens = (
-            self.session.query(UserToken).filter(UserToken.user_id == user_id).all()
+        deleted = self.session.query(UserToken).filter(UserToken.jti == jti).delete()
+        self.session.flush()
+        return deleted > 0
+
+    def revoke_all_tokens(self, user_id: int, token_type: str = "refresh") -> int:
+        """Revoke all stored tokens of a type for a user. Returns count of revoked tokens."""
+        revoked_count = (
+            self.session.query(UserToken)
+            .filter(UserToken.user_id == user_id, UserToken.token_type == token_type)
+            .delete()
         )
-        revoked_count = 0
-        for user_token in user_tokens:
-            if user_token.token_type == token_type:
-                user_token.revoked = True
-                revoked_count += 1
         self.session.flush()
         return revoked_count
 
     def is_token_revoked(self, jti: str) -> bool:
-        """Check if a token is revoked."""
-        user_token = (
-            self.session.query(UserToken).filter(UserToken.jti == jti).one_or_none()
+        """Check if a refresh token is revoked (its row is missing or marked revoked)."""
+        revoked = (
+            self.session.query(UserToken.revoked)
+            .filter(UserToken.jti == jti)
+            .scalar()
         )
+        return revoked is None or bool(revoked)
 
-        return bool(user_token and getattr(user_token, "revoked", False))
+    def delete_expired_tokens(self) -> int:
+        """Delete expired and revoked token rows. Returns count of deleted rows."""
+        deleted = (
+            self.session.query(UserToken)
+            .filter(
+                (UserToken.expires_at <= datetime.now(UTC).replace(tzinfo=None))
+                | UserToken.revoked.is_(True)
+            )
+            .delete(synchronize_session=False)
+        )
+        self.session.flush()
+        return deleted
 
     def get_all_user_tokens(self, user_id: int) -> List[UserToken]:
         """Find all tokens for a user."""
@@ -0,0 +1,218 @@
+"""
+Read-replica routing for read-only database work.
+
+Write traffic always goes through ``get_db_session()`` on the primary engine.
+Read-only service calls (dashboards, statistics, insights, session history)
+can use ``get_read_session(user_id)`` instead, which picks a healthy replica
+when one is configured and falls back to the primary otherwise.
+
+Read-your-writes: any session that flushes changes marks the current user as
+a recent writer, and that user's reads stay on the primary for
+``DB_REPLICA_STICKY_SECONDS`` so they never observe replication lag on data
+they have just changed.  The mark is kept in process memory and mirrored in
+a short-lived cookie so it also holds when the next request lands on another
+worker.
+"""
+
+import itertools
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Any, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import DBAPIError
+
+from database.db import Session, get_engine, get_replica_engines, get_shared_session, config
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+STICKY_COOKIE_NAME = "db_primary_until"
+
+_lock = threading.Lock()
+_recent_writes: Dict[int, float] = {}
+_replica_down_until: Dict[str, float] = {}
+_replica_cycle = (
+    itertools.cycle([f"replica-{i}" for i in range(1, len(config.DB_REPLICA_URLS) + 1)])
+    if config.DB_REPLICA_URLS
+    else None
+)
+
+
+def _current_user_id() -> Optional[int]:
+    """Return the authenticated user id of the current request, if any."""
+    try:
+        from flask import has_request_context
+        from flask_jwt_extended import get_jwt_identity
+
+        if not has_request_context():
+            return None
+        identity = get_jwt_identity()
+        return int(identity) if identity is not None else None
+    except Exception:
+        return None
+
+
+def record_user_write(user_id: Optional[int] = None) -> None:
+    """Pin a user's reads to the primary for the configured sticky window."""
+    user_id = user_id if user_id is not None else _current_user_id()
+    if user_id is None:
+        return
+
+    until = time.time() + config.DB_REPLICA_STICKY_SECONDS
+    with _lock:
+        _recent_writes[user_id] = until
+        # Drop expired entries so the map stays bounded by active writers
+        if len(_recent_writes) > 10000:
+            now = time.time()
+            for uid in [u for u, t in _recent_writes.items() if t <= now]:
+                _recent_writes.pop(uid, None)
+
+    try:
+        from flask import g, has_request_context
+
+        if has_request_context():
+            g.db_primary_until = until
+    except Exception:
+        pass
+
+
+def _is_sticky(user_id: Optional[int]) -> bool:
+    """Check whether a user wrote recently enough to need primary reads."""
+    now = time.time()
+
+    if user_id is not None:
+        with _lock:
+            if _recent_writes.get(user_id, 0) > now:
+                return True
+
+    try:
+        from flask import request, has_request_context
+
+        if has_request_context():
+            cookie_value = request.cookies.get(STICKY_COOKIE_NAME)
+            if cookie_value and float(cookie_value) > now:
+                return True
+    except (TypeError, ValueError):
+        pass
+
+    return False
+
+
+def mark_replica_failed(name: str, error: Exception) -> None:
+    """Take a replica out of rotation for the configured retry interval."""
+    with _lock:
+        _replica_down_until[name] = time.time() + config.DB_REPLICA_RETRY_SECONDS
+    logger.warning(f"Replica {name} marked unhealthy, routing reads to primary: {error}")
+
+
+def _pick_replica() -> Optional[Tuple[str, Engine]]:
+    """Pick the next healthy replica in round-robin order."""
+    if not _replica_cycle:
+        return None
+
+    replicas = get_replica_engines()
+    now = time.time()
+    with _lock:
+        for _ in range(len(replicas)):
+            name = next(_replica_cycle)
+            if _replica_down_until.get(name, 0) <= now:
+                return name, replicas[name]
+    return None
+
+
+def get_replica_health() -> Dict[str, Dict[str, Any]]:
+    """Report routing health for each configured replica."""
+    now = time.time()
+    with _lock:
+        return {
+            name: {
+                "healthy": _replica_down_until.get(name, 0) <= now,
+                "retry_in_seconds": max(0, round(_replica_down_until.get(name, 0) - now)),
+            }
+            for name in sorted(get_replica_engines())
+        }
+
+
+@contextmanager
+def get_read_session(user_id: Optional[int] = None):
+    """
+    Get a session for read-only work, routed to a replica when possible.
+
+    Falls back to the primary when no replica is configured, when every
+    replica is unhealthy, or when the user wrote within the sticky window.
+    Inside a batch request the batch's shared session is used. The session
+    is never committed.
+
+    Usage:
+        with get_read_session(user_id) as session:
+            service = SomeService(session)
+            # ... read-only calls
+    """
+    shared = get_shared_session()
+    if shared is not None:
+        # Batches read through their own session so they see their writes
+        yield shared
+        return
+
+    if user_id is None:
+        user_id = _current_user_id()
+
+    engine = get_engine()
+    target_name, target = "primary", engine
+    if not _is_sticky(user_id):
+        picked = _pick_replica()
+        if picked:
+            target_name, target = picked
+
+    session = Session(bind=target)
+    if target is not engine:
+        try:
+            # Check out a connection now so a dead replica fails over up front
+            session.connection()
+        except DBAPIError as e:
+            session.close()
+            mark_replica_failed(target_name, e)
+            session = Session(bind=engine)
+
+    try:
+        yield session
+    finally:
+        session.rollback()
+        session.close()
+
+
+@event.listens_for(Session, "after_flush")
+def _track_flush(session, flush_context):
+    """Remember that this session wrote something."""
+    session.info["has_writes"] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _track_commit(session):
+    """Pin the writing user's reads to the primary once a write commits."""
+    if session.info.pop("has_writes", False) and config.DB_REPLICA_URLS:
+        record_user_write()
+
+
+def init_app(app):
+    """Mirror the read-your-writes pin into a cookie for other workers."""
+    if not config.DB_REPLICA_URLS:
+        return
+
+    @app.after_request
+    def set_sticky_cookie(response):
+        from flask import g
+
+        until = g.pop("db_primary_until", None)
+        if until:
+            response.set_cookie(
+                STICKY_COOKIE_NAME,
+                str(until),
+                max_age=config.DB_REPLICA_STICKY_SECONDS,
+                httponly=True,
+                samesite="Lax",
+            )
+        return response
@@ -0,0 +1,100 @@
+"""
+Gunicorn configuration for FlowDo.
+
+The app is preloaded in the master and workers are forked from it, so boot
+cost (imports, config, database checks) is paid once instead of per worker.
+Each worker then drops the database connections it inherited and opens its own.
+
+Background jobs (REMINDERS_ENABLED, SESSION_SWEEP_ENABLED) run in exactly one
+worker: threads started in the master would not survive the fork, so every
+worker waits on a file lock after fork and the holder starts the jobs. When
+that worker exits, the next one to take the lock starts them.
+
+Usage:
+    gunicorn -c gunicorn.conf.py wsgi:app
+
+Reloading:
+    kill -HUP <master>   restarts workers gracefully with the preloaded app
+                         (config changes only; code is not re-imported)
+    kill -USR2 <master>  starts a new master with fresh code, then
+    kill -TERM <old>     stops the old one once the new workers are up
+"""
+import fcntl
+import multiprocessing
+import os
+import tempfile
+import threading
+
+# Binding
+bind = os.environ.get("GUNICORN_BIND", f"0.0.0.0:{os.environ.get('PORT', 5000)}")
+
+# Worker model: a few processes, each with a thread pool. Requests mostly wait
+# on PostgreSQL, so threads keep throughput up without more processes.
+workers = int(os.environ.get("WEB_CONCURRENCY", min(multiprocessing.cpu_count() * 2 + 1, 8)))
+threads = int(os.environ.get("GUNICORN_THREADS", 4))
+worker_class = "gthread" if threads > 1 else "sync"
+
+# Keep DB_MAX_CONNECTIONS splitting in sync with the actual worker count
+os.environ.setdefault("WEB_CONCURRENCY", str(workers))
+
+# Build the app once in the master and fork workers from it
+preload_app = os.environ.get("GUNICORN_PRELOAD", "true").lower() == "true"
+
+# Start background jobs after fork in one worker (see post_fork)
+os.environ["BACKGROUND_JOBS_AFTER_FORK"] = "true"
+background_jobs_lock = os.environ.get(
+    "BACKGROUND_JOBS_LOCK", os.path.join(tempfile.gettempdir(), "flowdo-background-jobs.lock")
+)
+
+# Timeouts and graceful shutdown
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", 30))
+graceful_timeout = int(os.environ.get("GUNICORN_GRACEFUL_TIMEOUT", 30))
+keepalive = int(os.environ.get("GUNICORN_KEEPALIVE", 5))
+
+# Recycle workers periodically to bound memory growth
+max_requests = int(os.environ.get("GUNICORN_MAX_REQUESTS", 2000))
+max_requests_jitter = int(os.environ.get("GUNICORN_MAX_REQUESTS_JITTER", 200))
+
+# Logging (application logs go through the logger package)
+accesslog = os.environ.get("GUNICORN_ACCESS_LOG", "-")
+errorlog = "-"
+loglevel = os.environ.get("GUNICORN_LOG_LEVEL", "info")
+
+
+def _run_background_jobs(server, worker, app):
+    """Wait for the background jobs lock, then start the jobs in this worker."""
+    lock = open(background_jobs_lock, "a")
+    # Held until this worker exits; the file stays open for the process lifetime
+    fcntl.flock(lock, fcntl.LOCK_EX)
+    worker.background_jobs_lock = lock
+
+    from app import start_background_jobs
+
+    start_background_jobs(app)
+    server.log.info(f"Worker {worker.pid} runs the background jobs")
+
+
+def post_fork(server, worker):
+    """Give each worker its own database connections and queue it for the background jobs."""
+    from database.db import dispose_engines
+
+    dispose_engines()
+    app = server.app.wsgi()
+    if app.config.get("REMINDERS_ENABLED") or app.config.get("SESSION_SWEEP_ENABLED"):
+        threading.Thread(
+            target=_run_background_jobs,
+            args=(server, worker, app),
+            name="background-jobs-lock",
+            daemon=True,
+        ).start()
+    server.log.info(f"Worker {worker.pid} ready (threads={threads})")
+
+
+def on_reload(server):
+    """Log graceful reloads triggered by HUP."""
+    server.log.info("Reloading workers gracefully")
+
+
+def worker_int(worker):
+    """Log workers interrupted during shutdown."""
+    worker.log.info(f"Worker {worker.pid} interrupted")
@@ -3,6 +3,8 @@ Enhanced logging configuration for the FlowDo application.
 
 This module provides a centralized logging system with:
 - Colored console output using colorlog
+- Non-blocking, batched output through a log queue (LOG_ASYNC)
+- Per-logger sampling of noisy low-severity records (LOG_SAMPLE_RATES)
 - Structured logging with JSON formatting
 - Request correlation IDs
 - Database query logging
@@ -10,6 +12,8 @@ This module provides a centralized logging system with:
 - Performance metrics
 """
 import logging as _logging
+import atexit
+import queue
 import sys
 import os
 import json
@@ -25,43 +29,76 @@ except ImportError:
     HAS_COLORLOG = False
 
 from config.config import get_config
-
-config = get_config()
+from logger.handlers import (
+    BatchingQueueListener,
+    BatchingRotatingFileHandler,
+    BatchingStreamHandler,
+    DroppingQueueHandler,
+    SamplingFilter,
+    parse_sample_rates,
+)
 
 # Dictionary to track configured loggers
 _configured_loggers: Dict[str, _logging.Logger] = {}
 _setup_completed = False
+_deferred_handler_installed = False
+_queue_handler: Optional[DroppingQueueHandler] = None
+_queue_listener: Optional[BatchingQueueListener] = None
+_fork_hook_registered = False
 
 class JsonFormatter(_logging.Formatter):
-    """Custom JSON formatter for structured logging."""
+    """
+    JSON formatter for structured logging.
+    
+    Only whitelisted attributes are serialized: the standard fields below plus
+    known context/extra keys, looked up directly instead of scanning every
+    attribute of every record.
+    """
+    
+    # (output key, LogRecord attribute)
+    STANDARD_FIELDS = (
+        ('level', 'levelname'),
+        ('logger', 'name'),
+        ('module', 'module'),
+        ('function', 'funcName'),
+        ('line', 'lineno'),
+        ('file', 'filename'),
+        ('path', 'pathname'),
+    )
+    
+    # Extra attributes attached by filters or passed via `extra=`
+    EXTRA_FIELDS = (
+        'request_id', 'user_id', 'endpoint', 'method', 'remote_addr',
+        'event_type', 'security_event', 'execution_time', 'exception',
+        'attempted_import', 'error_message', 'caller_file', 'caller_line',
+        'traceback', 'import_error',
+    )
+    
+    def __init__(self, extra_fields=()):
+        super().__init__()
+        self.extra_fields = tuple(self.EXTRA_FIELDS) + tuple(extra_fields)
     
     def format(self, record: _logging.LogRecord) -> str:
         """Format the log record as JSON."""
         log_entry = {
             'timestamp': datetime.fromtimestamp(record.created).isoformat(),
-            'level': record.levelname,
-            'logger': record.name,
             'message': record.getMessage(),
-            'module': record.module,
-            'function': record.funcName,
-            'line': record.lineno,
-            'file': record.filename,
-            'path': record.pathname,
         }
+        for key, attribute in self.STANDARD_FIELDS:
+            log_entry[key] = getattr(record, attribute)
         
-        # Add exception information if present
+        record_dict = record.__dict__
+        for key in self.extra_fields:
+            if key in record_dict:
+                log_entry[key] = record_dict[key]
+        
+        # Add exception information if present (exc_text survives the log queue)
         if record.exc_info:
             log_entry['exception'] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            log_entry['exception'] = record.exc_text
         
-        # Add extra fields if present
-        for key, value in record.__dict__.items():
-            if key not in ['name', 'msg', 'args', 'levelname', 'levelno', 'pathname', 'filename',
-                          'module', 'lineno', 'funcName', 'created', 'msecs', 'relativeCreated',
-                          'thread', 'threadName', 'processName', 'process', 'message', 'exc_info',
-                          'exc_text', 'stack_info']:
-                log_entry[key] = value
-        
-        return json.dumps(log_entry)
+        return json.dumps(log_entry, default=str)
 
 class RequestContextFilter(_logging.Filter):
     """Filter to add request context to log records."""
@@ -82,6 +119,39 @@ class RequestContextFilter(_logging.Filter):
         
         return True
 
+class _DeferredSetupHandler(_logging.Handler):
+    """
+    Placeholder root handler that configures logging on the first record.
+
+    Importing a module that calls get_logger() no longer opens log files or
+    loads config; the first record actually emitted triggers setup_logging()
+    and is then replayed through the real handlers.
+    """
+    
+    def emit(self, record: _logging.LogRecord) -> None:
+        root = _logging.getLogger()
+        root.removeHandler(self)
+        setup_logging()
+        
+        if not _logging.getLogger(record.name).isEnabledFor(record.levelno):
+            return
+        for handler in root.handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+def _install_deferred_setup() -> None:
+    """Route records to _DeferredSetupHandler until logging is configured."""
+    global _deferred_handler_installed
+    
+    if _deferred_handler_installed or _setup_completed:
+        return
+    
+    root = _logging.getLogger()
+    root.addHandler(_DeferredSetupHandler())
+    # The configured level isn't known yet; let the first record through
+    root.setLevel(_logging.DEBUG)
+    _deferred_handler_installed = True
+
 def setup_logging() -> _logging.Logger:
     """
     Configure logging for the application.
@@ -92,6 +162,8 @@ def setup_logging() -> _logging.Logger:
     if _setup_completed:
         return _logging.getLogger('flowdo')
     
+    config = get_config()
+    
     # Check if we're in Flask's reloader process - if so, don't duplicate logging setup
     if os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
         # We're in the reloader process, just return the logger without setting up handlers again
@@ -106,8 +178,12 @@ def setup_logging() -> _logging.Logger:
     # Set level for root logger
     root.setLevel(_logging.getLevelName(config.LOG_LEVEL))
     
+    use_async = config.LOG_ASYNC and not config.TESTING
+    stream_handler_class = BatchingStreamHandler if use_async else _logging.StreamHandler
+    file_handler_class = BatchingRotatingFileHandler if use_async else RotatingFileHandler
+    
     # Create console handler with color support
-    console_handler = _logging.StreamHandler(sys.stdout)
+    console_handler = stream_handler_class(sys.stdout)
     
     if HAS_COLORLOG and not config.TESTING:
         # Use colorlog for colored output
@@ -131,11 +207,7 @@ def setup_logging() -> _logging.Logger:
         )
         console_handler.setFormatter(formatter)
     
-    # Add request context filter
-    request_filter = RequestContextFilter()
-    console_handler.addFilter(request_filter)
-    
-    root.addHandler(console_handler)
+    handlers = [console_handler]
     
     # Add file handler (except in testing mode)
     if not config.TESTING:
@@ -145,7 +217,7 @@ def setup_logging() -> _logging.Logger:
             os.makedirs(log_dir)
         
         # Regular file handler with standard format
-        file_handler = RotatingFileHandler(
+        file_handler = file_handler_class(
             config.LOG_FILE,
             maxBytes=10485760,  # 10 MB
             backupCount=10
@@ -155,27 +227,94 @@ def setup_logging() -> _logging.Logger:
             datefmt=config.LOG_DATE_FORMAT
         )
         file_handler.setFormatter(file_formatter)
-        file_handler.addFilter(request_filter)
-        root.addHandler(file_handler)
+        handlers.append(file_handler)
         
         # JSON file handler for structured logging
         json_log_file = str(config.LOG_FILE).replace('.log', '.json')
-        json_handler = RotatingFileHandler(
+        json_handler = file_handler_class(
             json_log_file,
             maxBytes=10485760,  # 10 MB
             backupCount=10
         )
         json_handler.setFormatter(JsonFormatter())
-        json_handler.addFilter(request_filter)
-        root.addHandler(json_handler)
+        handlers.append(json_handler)
+    
+    # Request context must be captured on the request thread, and sampling
+    # should happen before a record costs any queue or I/O work
+    request_filter = RequestContextFilter()
+    sampling_filter = SamplingFilter(parse_sample_rates(config.LOG_SAMPLE_RATES))
+    
+    if use_async:
+        _start_queue_pipeline(root, handlers, config, [request_filter, sampling_filter])
+    else:
+        for handler in handlers:
+            handler.addFilter(request_filter)
+            handler.addFilter(sampling_filter)
+            root.addHandler(handler)
     
     # Configure third-party loggers
-    _configure_third_party_loggers()
+    _configure_third_party_loggers(config)
     
     _setup_completed = True
     return _logging.getLogger('flowdo')
 
-def _configure_third_party_loggers():
+def _start_queue_pipeline(root, handlers, config, filters):
+    """Put a non-blocking queue handler on the root logger and drain it in the background."""
+    global _queue_handler, _queue_listener
+    
+    log_queue = queue.Queue(maxsize=config.LOG_QUEUE_SIZE)
+    _queue_handler = DroppingQueueHandler(log_queue)
+    for log_filter in filters:
+        _queue_handler.addFilter(log_filter)
+    root.addHandler(_queue_handler)
+    
+    _queue_listener = BatchingQueueListener(log_queue, *handlers, batch_size=config.LOG_BATCH_SIZE)
+    _queue_listener.start()
+    atexit.register(stop_logging)
+    
+    global _fork_hook_registered
+    if not _fork_hook_registered:
+        os.register_at_fork(after_in_child=_restart_listener_after_fork)
+        _fork_hook_registered = True
+
+def _restart_listener_after_fork():
+    """Threads don't survive fork: give the child a fresh queue and listener thread."""
+    global _queue_listener
+    
+    if _queue_handler is None or _queue_listener is None:
+        return
+    
+    log_queue = queue.Queue(maxsize=_queue_handler.queue.maxsize)
+    _queue_handler.queue = log_queue
+    _queue_listener = BatchingQueueListener(
+        log_queue, *_queue_listener.handlers, batch_size=_queue_listener.batch_size
+    )
+    _queue_listener.start()
+
+def stop_logging():
+    """Flush queued records and stop the background listener."""
+    global _queue_listener
+    
+    if _queue_listener is not None:
+        try:
+            _queue_listener.stop()
+        except Exception:
+            pass
+        _queue_listener = None
+
+def get_logging_stats() -> Dict[str, Any]:
+    """Report queue depth and dropped/sampled record counts."""
+    stats: Dict[str, Any] = {'async': _queue_handler is not None}
+    if _queue_handler is not None:
+        stats['queue_depth'] = _queue_handler.queue.qsize()
+        stats['dropped'] = _queue_handler.dropped
+    for handler in _logging.getLogger().handlers:
+        for log_filter in handler.filters:
+            if isinstance(log_filter, SamplingFilter):
+                stats['sampled_out'] = log_filter.sampled_out
+    return stats
+
+def _configure_third_party_loggers(config):
     """Configure logging levels for third-party libraries."""
     # SQLAlchemy logging levels
     _logging.getLogger('sqlalchemy.engine').setLevel(
@@ -211,9 +350,9 @@ def get_logger(name: str) -> _logging.Logger:
     if name in _configured_loggers:
         return _configured_loggers[name]
     
-    # Ensure logging is set up
+    # Logging is configured on first use rather than at import time
     if not _setup_completed:
-        setup_logging()
+        _install_deferred_setup()
     
     logger = _logging.getLogger(name)
     _configured_loggers[name] = logger
@@ -319,8 +458,5 @@ def log_context(**kwargs):
     finally:
         logger.makeRecord = old_makeRecord
 
-# Initialize logging
-root_logger = setup_logging()
-
 # Create a default logger
 logger = get_logger('flowdo')
\ No newline at end of file
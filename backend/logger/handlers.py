@@ -0,0 +1,174 @@
+"""
+Non-blocking logging pipeline.
+
+Request threads only put records on a bounded queue (``DroppingQueueHandler``);
+a single background thread (``BatchingQueueListener``) drains the queue in
+batches, writes them to the real handlers and flushes once per batch.
+``SamplingFilter`` thins out high-frequency, low-severity records before they
+reach the queue.
+"""
+import copy
+import logging as _logging
+import queue
+import random
+import threading
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Dict, Optional
+
+
+class DroppingQueueHandler(QueueHandler):
+    """QueueHandler that never blocks the caller; records are dropped when the queue is full."""
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: _logging.LogRecord) -> _logging.LogRecord:
+        """
+        Make the record safe to hand to another thread.
+
+        Unlike the base class, the traceback goes into ``exc_text`` rather than
+        being folded into the message, so downstream formatters still see it
+        as exception info.
+        """
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = _logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: _logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class BatchFlushMixin:
+    """Skip per-record flushes while a batch is being written."""
+
+    _in_batch = False
+
+    def flush(self):
+        if not self._in_batch:
+            super().flush()
+
+    def begin_batch(self):
+        self._in_batch = True
+
+    def end_batch(self):
+        self._in_batch = False
+        self.flush()
+
+
+class BatchingStreamHandler(BatchFlushMixin, _logging.StreamHandler):
+    """StreamHandler that flushes once per batch."""
+
+
+class BatchingRotatingFileHandler(BatchFlushMixin, RotatingFileHandler):
+    """RotatingFileHandler that flushes once per batch."""
+
+
+class BatchingQueueListener(QueueListener):
+    """
+    QueueListener that drains up to ``batch_size`` records at a time.
+
+    Handlers that support batching (``BatchFlushMixin``) write the whole batch
+    before flushing, turning one write syscall per record into one per batch.
+    """
+
+    def __init__(self, log_queue: queue.Queue, *handlers, batch_size: int = 100):
+        super().__init__(log_queue, *handlers, respect_handler_level=True)
+        self.batch_size = batch_size
+
+    def _monitor(self):
+        q = self.queue
+        has_task_done = hasattr(q, "task_done")
+        stopping = False
+
+        while not stopping:
+            try:
+                batch = [self.dequeue(True)]
+            except queue.Empty:
+                break
+
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.dequeue(False))
+                except queue.Empty:
+                    break
+
+            for handler in self.handlers:
+                if isinstance(handler, BatchFlushMixin):
+                    handler.begin_batch()
+            try:
+                for record in batch:
+                    if record is self._sentinel:
+                        stopping = True
+                        continue
+                    self.handle(record)
+            finally:
+                for handler in self.handlers:
+                    if isinstance(handler, BatchFlushMixin):
+                        handler.end_batch()
+                if has_task_done:
+                    for _ in batch:
+                        q.task_done()
+
+
+class SamplingFilter(_logging.Filter):
+    """
+    Keep only a fraction of low-severity records from noisy loggers.
+
+    Rates apply to a logger and its children (``"database.db": 0.05`` also
+    samples ``database.db.pool``) and only to records below WARNING.
+    """
+
+    def __init__(self, rates: Dict[str, float]):
+        super().__init__()
+        self.rates = rates
+        self._resolved: Dict[str, Optional[float]] = {}
+        self._lock = threading.Lock()
+        self.sampled_out = 0
+
+    def _rate_for(self, name: str) -> Optional[float]:
+        rate = self._resolved.get(name, -1)
+        if rate != -1:
+            return rate
+
+        rate = None
+        candidate = name
+        while candidate:
+            if candidate in self.rates:
+                rate = self.rates[candidate]
+                break
+            candidate = candidate.rpartition(".")[0]
+
+        with self._lock:
+            self._resolved[name] = rate
+        return rate
+
+    def filter(self, record: _logging.LogRecord) -> bool:
+        if record.levelno >= _logging.WARNING or not self.rates:
+            return True
+
+        rate = self._rate_for(record.name)
+        if rate is None or random.random() < rate:
+            return True
+
+        self.sampled_out += 1
+        return False
+
+
+def parse_sample_rates(value: str) -> Dict[str, float]:
+    """Parse ``"logger.a=0.1,logger.b=0.01"`` into a rate mapping."""
+    rates = {}
+    for item in value.split(","):
+        name, _, rate = item.partition("=")
+        if name.strip() and rate.strip():
+            rates[name.strip()] = min(1.0, max(0.0, float(rate)))
+    return rates
@@ -13,8 +13,7 @@ from pathlib import Path
 ROOT_DIR = Path(__file__).parent.absolute()
 sys.path.insert(0, str(ROOT_DIR))
 
-from app import create_app
-from config.config import configure_jwt, get_config
+from config.config import get_config
 from logger import get_logger
 
 # Get logger
@@ -49,7 +48,7 @@ def main():
         # Production warning
         if env == 'production':
             logger.warning("Running with Flask development server in production is not recommended!")
-            logger.warning("Consider using Gunicorn: gunicorn --bind 0.0.0.0:5000 run:app")
+            logger.warning("Use Gunicorn instead: gunicorn -c gunicorn.conf.py wsgi:app")
         
         # Start the Flask development server
         app.run(
@@ -79,15 +78,14 @@ def create_wsgi_app():
     Create WSGI application for production deployment.
     
     This function is used by WSGI servers like Gunicorn.
-    Usage: gunicorn --bind 0.0.0.0:5000 run:create_wsgi_app
+    Prefer the preloading setup in wsgi.py: gunicorn -c gunicorn.conf.py wsgi:app
     """
     try:
-        config = get_config()
-        app = create_app()
-        app.config.from_object(config)
-        app = configure_jwt(app, config)
+        from app import create_full_app
         
-        logger.info(f"WSGI application created with {config.__class__.__name__}")
+        app = create_full_app()
+        
+        logger.info(f"WSGI application created with {get_config().__class__.__name__}")
         return app
     except Exception as e:
         logger.error(f"Failed to create WSGI application: {e}", exc_info=True)
@@ -145,8 +143,13 @@ def print_banner():
     print(banner)
 
 
-# For WSGI deployment (e.g., with Gunicorn)
-app = create_wsgi_app()
+def __getattr__(name):
+    """Build `run:app` on first access so `python run.py` doesn't build it twice."""
+    if name == "app":
+        global app
+        app = create_wsgi_app()
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 if __name__ == "__main__":
     # Print banner
@@ -0,0 +1 @@
+from query_budget import api, budget_app, budget_engines, pytest_configure  # noqa: F401
@@ -0,0 +1,339 @@
+"""
+Pytest plugin: SQL statement budgets for API requests.
+
+Requests made through the ``api`` fixture run against the test database
+(``FLASK_ENV=testing``, ``TEST_DB_NAME``), which is reseeded before every
+test, and each statement they send is counted through engine events. A test
+marked ``query_budget(n)`` fails as soon as one of its requests issues more
+than ``n`` statements:
+
+    @query_budget(3)
+    def test_overview(api):
+        api.get("/api/dashboard/overview")
+
+Process caches are cleared before every request, so budgets hold for a cold
+cache. Tests using ``api`` are skipped when the test database is unreachable.
+"""
+import os
+from datetime import UTC, datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional
+
+import pytest
+
+# Must be set before the app's config is first imported
+os.environ.setdefault("FLASK_ENV", "testing")
+
+query_budget = pytest.mark.query_budget
+
+PASSWORD = "budget-password"
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "query_budget(n): fail when a request made through the `api` fixture "
+        "issues more than n SQL statements",
+    )
+
+
+class StatementCounter:
+    """Collects the SQL statements sent through a set of engines."""
+
+    def __init__(self, engines):
+        self.engines = list(engines)
+        self.statements: List[str] = []
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    def __enter__(self):
+        from sqlalchemy import event
+
+        for engine in self.engines:
+            event.listen(engine, "before_cursor_execute", self._record)
+        return self
+
+    def __exit__(self, *exc_info):
+        from sqlalchemy import event
+
+        for engine in self.engines:
+            event.remove(engine, "before_cursor_execute", self._record)
+
+
+def _seed(session) -> Dict[str, Any]:
+    """A small, fully linked dataset for one user."""
+    from app.services.auth_service import AuthService
+    from database.models import (
+        FocusSession,
+        Group,
+        PomodoroSession,
+        Subtask,
+        Tag,
+        Task,
+        TaskTag,
+        User,
+    )
+    from database.models.focus_session import FocusMode, FocusSessionStatus
+    from database.models.pomodoro_session import PomodoroSessionStatus, PomodoroSessionType
+    from database.models.task import TaskStatus
+
+    now = datetime.now(UTC).replace(tzinfo=None)
+    user = User(
+        email="budget@example.com",
+        display_name="Budget",
+        psw_hash=AuthService.hash_password(PASSWORD),
+    )
+    session.add(user)
+    session.flush()
+
+    group = Group(name="Work", user_id=user.id)
+    tag = Tag(name="focus", color="#3b82f6", user_id=user.id)
+    session.add_all([group, tag])
+    session.flush()
+
+    task = Task(title="Write report", user_id=user.id, group_id=group.id, due_date=now, starred=True)
+    done = Task(title="Plan week", user_id=user.id, status=TaskStatus.COMPLETED, completed_at=now)
+    session.add_all([task, done])
+    session.flush()
+
+    subtasks = [Subtask(title=f"Step {i}", position=i, task_id=task.id) for i in range(2)]
+    session.add_all(subtasks + [TaskTag(task_id=task.id, tag_id=tag.id)])
+
+    pomodoro = PomodoroSession(
+        user_id=user.id,
+        task_id=task.id,
+        session_type=PomodoroSessionType.WORK,
+        status=PomodoroSessionStatus.COMPLETED,
+        planned_duration=1500,
+        actual_duration=1500,
+        start_time=now - timedelta(hours=1),
+        end_time=now - timedelta(minutes=35),
+        completed_at=now - timedelta(minutes=35),
+    )
+    focus = FocusSession(
+        user_id=user.id,
+        task_id=task.id,
+        focus_mode=FocusMode.DEEP_WORK,
+        status=FocusSessionStatus.COMPLETED,
+        planned_duration=3600,
+        actual_duration=3600,
+        start_time=now - timedelta(hours=3),
+        end_time=now - timedelta(hours=2),
+        completed_at=now - timedelta(hours=2),
+        focus_intensity=4,
+    )
+    focus.update_scores()
+    session.add_all([pomodoro, focus])
+    session.flush()
+
+    return {
+        "user_id": user.id,
+        "group_id": group.id,
+        "tag_id": tag.id,
+        "task_id": task.id,
+        "completed_task_id": done.id,
+        "subtask_id": subtasks[0].id,
+        "subtask_ids": [s.id for s in subtasks],
+        "pomodoro_id": pomodoro.id,
+        "focus_id": focus.id,
+    }
+
+
+def _pomodoro_in(status_name: str) -> Callable:
+    def create(session, seed) -> int:
+        from database.models import PomodoroSession
+        from database.models.pomodoro_session import PomodoroSessionStatus, PomodoroSessionType
+
+        now = datetime.now(UTC).replace(tzinfo=None)
+        pomodoro = PomodoroSession(
+            user_id=seed["user_id"],
+            task_id=seed["task_id"],
+            session_type=PomodoroSessionType.WORK,
+            status=PomodoroSessionStatus[status_name],
+            planned_duration=1500,
+            start_time=now - timedelta(minutes=10),
+            paused_at=now if status_name == "PAUSED" else None,
+        )
+        session.add(pomodoro)
+        session.flush()
+        return pomodoro.id
+
+    return create
+
+
+def _focus_in(status_name: str) -> Callable:
+    def create(session, seed) -> int:
+        from database.models import FocusSession
+        from database.models.focus_session import FocusMode, FocusSessionStatus
+
+        now = datetime.now(UTC).replace(tzinfo=None)
+        focus = FocusSession(
+            user_id=seed["user_id"],
+            task_id=seed["task_id"],
+            focus_mode=FocusMode.DEEP_WORK,
+            status=FocusSessionStatus[status_name],
+            planned_duration=3600,
+            start_time=now - timedelta(minutes=45),
+            paused_at=now if status_name == "PAUSED" else None,
+        )
+        session.add(focus)
+        session.flush()
+        return focus.id
+
+    return create
+
+
+def _archived_task(session, seed) -> int:
+    from database.repositories.task_archive_repository import TaskArchiveRepository
+
+    TaskArchiveRepository(session).archive_tasks([seed["completed_task_id"]])
+    return seed["completed_task_id"]
+
+
+# Seed values created only for the tests whose path or body refers to them
+LAZY_SEEDS: Dict[str, Callable] = {
+    "active_pomodoro_id": _pomodoro_in("IN_PROGRESS"),
+    "paused_pomodoro_id": _pomodoro_in("PAUSED"),
+    "active_focus_id": _focus_in("IN_PROGRESS"),
+    "paused_focus_id": _focus_in("PAUSED"),
+    "archived_task_id": _archived_task,
+}
+
+
+class SeedData(dict):
+    """Seeded ids; entries of LAZY_SEEDS are created on first lookup."""
+
+    def __missing__(self, key):
+        from database.db import get_db_session
+
+        if key not in LAZY_SEEDS:
+            raise KeyError(key)
+        with get_db_session() as session:
+            value = LAZY_SEEDS[key](session, self)
+        self[key] = value
+        return value
+
+
+class BudgetClient:
+    """Flask test client that counts the statements issued by each request."""
+
+    def __init__(self, app, client, engines, seed: SeedData, budget: Optional[int]):
+        self.app = app
+        self.client = client
+        self.engines = engines
+        self.seed = seed
+        self.budget = budget
+        self.requests: List[Dict[str, Any]] = []
+
+    def open(self, method: str, path: str, **kwargs):
+        from app.services.auth_service import get_token_state_cache
+        from app.services.tag_service import get_tag_name_cache
+        from app.services.task_service import get_task_counters_cache
+        from app.utils.profile_cache import get_user_profile_cache
+
+        for cache in (
+            get_token_state_cache(),
+            get_tag_name_cache(),
+            get_task_counters_cache(),
+            get_user_profile_cache(),
+        ):
+            cache.clear()
+
+        with StatementCounter(self.engines) as counter:
+            response = self.client.open(path, method=method, **kwargs)
+        self.requests.append(
+            {"method": method, "path": path, "status": response.status_code, "statements": counter.statements}
+        )
+
+        count = len(counter.statements)
+        if self.budget is not None and count > self.budget:
+            listing = "\n".join(
+                f"  {i}. {' '.join(statement.split())[:200]}"
+                for i, statement in enumerate(counter.statements, start=1)
+            )
+            pytest.fail(
+                f"{method} {path} issued {count} SQL statements, budget is {self.budget}:\n{listing}",
+                pytrace=False,
+            )
+        return response
+
+    def get(self, path: str, **kwargs):
+        return self.open("GET", path, **kwargs)
+
+    def post(self, path: str, **kwargs):
+        return self.open("POST", path, **kwargs)
+
+    def put(self, path: str, **kwargs):
+        return self.open("PUT", path, **kwargs)
+
+    def patch(self, path: str, **kwargs):
+        return self.open("PATCH", path, **kwargs)
+
+    def delete(self, path: str, **kwargs):
+        return self.open("DELETE", path, **kwargs)
+
+
+@pytest.fixture(scope="session")
+def budget_app():
+    """The fully configured app; no database needed to build it."""
+    from app import create_full_app
+
+    return create_full_app()
+
+
+@pytest.fixture(scope="session")
+def budget_engines(budget_app):
+    """Engines of the test database, with fresh tables for this run."""
+    import database.models  # noqa: F401  registers every table
+    from database.db import Base, check_db_connection, get_engine, get_replica_engines
+
+    try:
+        available = check_db_connection()
+    except Exception:
+        available = False
+    if not available:
+        pytest.skip("query budgets need the test database (TEST_DB_NAME)")
+
+    engine = get_engine()
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    yield [engine, *get_replica_engines().values()]
+    Base.metadata.drop_all(engine)
+
+
+def _reset(engine) -> None:
+    from sqlalchemy import text
+
+    from database.db import Base
+
+    tables = Base.metadata.sorted_tables
+    with engine.begin() as conn:
+        if conn.dialect.name == "postgresql":
+            names = ", ".join(table.name for table in tables)
+            conn.execute(text(f"TRUNCATE {names} RESTART IDENTITY CASCADE"))
+        else:
+            for table in reversed(tables):
+                conn.execute(table.delete())
+
+
+@pytest.fixture
+def api(request, budget_app, budget_engines):
+    """Client logged in as the seeded user, enforcing the test's query_budget."""
+    from database.db import get_db_session
+    from database.repositories.user_token_repository import UserTokenRepository
+
+    _reset(budget_engines[0])
+    with budget_app.app_context():
+        with get_db_session() as session:
+            seed = SeedData(_seed(session))
+            tokens = UserTokenRepository(session)
+            access_token = tokens.create_access_token(seed["user_id"], 15, 0)
+            refresh_token = tokens.create_refresh_token(seed["user_id"], 60)
+
+        client = budget_app.test_client()
+        client.set_cookie(budget_app.config["JWT_ACCESS_COOKIE_NAME"], access_token)
+        client.set_cookie(budget_app.config["JWT_REFRESH_COOKIE_NAME"], refresh_token)
+
+        marker = request.node.get_closest_marker("query_budget")
+        budget = marker.args[0] if marker else None
+        yield BudgetClient(budget_app, client, budget_engines, seed, budget)
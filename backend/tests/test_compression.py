@@ -0,0 +1,61 @@
+import gzip
+
+from flask import Flask, Response, jsonify
+
+from app.utils.compression import ResponseCompressor, negotiate
+
+
+def make_app(min_size=100):
+    app = Flask(__name__)
+    app.after_request(
+        ResponseCompressor(
+            algorithms=["gzip"],
+            levels={"gzip": 6},
+            min_size=min_size,
+            mimetypes=["application/json", "text/event-stream"],
+        )
+    )
+
+    @app.route("/big")
+    def big():
+        return jsonify({"items": ["x" * 20] * 100})
+
+    @app.route("/small")
+    def small():
+        return jsonify({"ok": True})
+
+    @app.route("/stream")
+    def stream():
+        return Response((f"data: {i}\n\n" for i in range(50)), mimetype="text/event-stream")
+
+    return app
+
+
+def test_negotiate_respects_q_values_and_server_preference():
+    preferred = ["zstd", "br", "gzip"]
+    assert negotiate("gzip, br", preferred) == "br"
+    assert negotiate("gzip;q=1.0, br;q=0.5", preferred) == "gzip"
+    assert negotiate("*;q=0.1, gzip;q=0", preferred) == "zstd"
+    assert negotiate("identity", preferred) is None
+    assert negotiate(None, preferred) is None
+
+
+def test_compresses_only_above_threshold():
+    client = make_app().test_client()
+
+    response = client.get("/big", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["Vary"]
+    assert b'"items"' in gzip.decompress(response.data)
+
+    response = client.get("/small", headers={"Accept-Encoding": "gzip"})
+    assert "Content-Encoding" not in response.headers
+
+
+def test_streamed_response_is_compressed_incrementally():
+    client = make_app().test_client()
+
+    response = client.get("/stream", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "Content-Length" not in response.headers
+    assert gzip.decompress(response.data).decode().count("data:") == 50
@@ -0,0 +1,44 @@
+from app.utils.events import Event, SSESink
+
+
+def test_sse_sink_caps_open_streams():
+    sink = SSESink(max_subscribers=2)
+    first = sink.subscribe(1)
+    second = sink.subscribe(2)
+    assert sink.subscribe(1) is None
+    assert not sink.has_capacity()
+
+    sink.send(Event(type="task.due", user_id=1, data={}))
+    assert first.qsize() == 1 and second.qsize() == 0
+
+    sink.unsubscribe(1, first)
+    assert sink.has_capacity()
+    assert sink.subscribe(1) is not None
+
+
+def test_stream_is_refused_where_no_events_are_published(monkeypatch):
+    from flask import Flask
+    from flask_jwt_extended import JWTManager, create_access_token
+
+    from app.routers import events as events_router
+    from app.utils.events import EventDispatcher
+
+    dispatcher = EventDispatcher()
+    dispatcher.add_sink("sse", SSESink(max_subscribers=2))
+    monkeypatch.setattr(events_router, "get_event_dispatcher", lambda: dispatcher)
+
+    app = Flask(__name__)
+    app.config.update(JWT_SECRET_KEY="test-secret-key-for-event-streams", JWT_TOKEN_LOCATION=["headers"])
+    JWTManager(app)
+    app.register_blueprint(events_router.events_bp)
+    with app.app_context():
+        headers = {"Authorization": f"Bearer {create_access_token(identity='1')}"}
+    client = app.test_client()
+
+    assert client.get("/api/events/stream", headers=headers).status_code == 503
+
+    app.config["BACKGROUND_JOBS_RUNNING"] = True
+    response = client.get("/api/events/stream", headers=headers, buffered=False)
+    assert response.status_code == 200
+    assert response.mimetype == "text/event-stream"
+    response.close()
@@ -0,0 +1,22 @@
+from datetime import datetime
+
+from app.schemas.pomodoro import FocusInterruptionRequest, InterruptionLogRequest
+
+
+def test_mixed_batch_timestamps_are_naive_utc():
+    entries = [
+        {"interruption_type": "external", "interruption_duration": 60},
+        {"interruption_type": "internal", "interruption_duration": 30, "occurred_at": "2026-10-19T09:30:00"},
+        {"interruption_type": "external", "interruption_duration": 10, "occurred_at": "2026-10-19T12:00:00+02:00"},
+    ]
+    interruptions = [InterruptionLogRequest(**entry).model_dump() for entry in entries]
+
+    assert interruptions[0]["occurred_at"] is None
+    assert interruptions[1]["occurred_at"] == datetime(2026, 10, 19, 9, 30)
+    assert interruptions[2]["occurred_at"] == datetime(2026, 10, 19, 10, 0)
+    # The services pick the latest event of a batch this way
+    latest = max(interruptions[1:], key=lambda event: event["occurred_at"])
+    assert latest["interruption_type"] == "external"
+
+    focus = FocusInterruptionRequest(occurred_at="2026-10-19T10:00:00Z")
+    assert focus.occurred_at == datetime(2026, 10, 19, 10, 0)
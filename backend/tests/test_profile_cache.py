@@ -0,0 +1,44 @@
+import dataclasses
+from collections import namedtuple
+
+import pytest
+
+from app.utils.profile_cache import UserProfile, UserProfileCache
+
+FIELDS = [field.name for field in dataclasses.fields(UserProfile)]
+ProfileRow = namedtuple("ProfileRow", FIELDS)
+ProfileRow._mapping = property(lambda row: row._asdict())
+
+
+def make_row(user_id=1, work_duration=25):
+    values = dict.fromkeys(FIELDS)
+    values.update(id=user_id, email="a@example.com", display_name="A", is_active=True, token_epoch=0)
+    values["work_duration"] = work_duration
+    return ProfileRow(**values)
+
+
+def test_profile_is_loaded_once_and_immutable():
+    cache = UserProfileCache()
+    loads = []
+
+    def loader():
+        loads.append(1)
+        return make_row()
+
+    first = cache.get(1, loader)
+    assert cache.get(1, loader) is first
+    assert len(loads) == 1
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        first.work_duration = 50
+
+    # Unknown users are cached too
+    assert cache.get(2, lambda: None) is None
+    assert cache.get(2, loader) is None
+
+
+def test_invalidate_reloads_changed_settings():
+    cache = UserProfileCache()
+    assert cache.get(1, lambda: make_row(work_duration=25)).work_duration == 25
+
+    cache.invalidate(1)
+    assert cache.get(1, lambda: make_row(work_duration=50)).work_duration == 50
@@ -0,0 +1,404 @@
+"""
+SQL statement budgets for every API route.
+
+Each entry is one request made as the seeded user against a cold cache; the
+budget is the most statements that request may issue. Path placeholders and
+callable bodies are filled from the seeded ids (see ``query_budget.py``).
+When a change legitimately needs more statements, raise the budget in the
+same commit so the increase gets reviewed.
+"""
+from collections import defaultdict
+from datetime import date
+
+import pytest
+
+from query_budget import PASSWORD, query_budget
+
+
+# Routes whose response is currently broken still get a budget; their
+# status check (or the exception in `raises`) is expected to fail until the
+# bug named in `broken` is fixed. A budget overrun still fails the test, and
+# so does a broken route that starts passing.
+SESSION_RESPONSE_BUG = "session responses expect a session_id the models lack"
+
+
+def route(
+    method,
+    path,
+    budget,
+    expected_status=200,
+    json=None,
+    query=None,
+    broken=None,
+    raises=AssertionError,
+):
+    marks = [query_budget(budget)]
+    if broken:
+        marks.append(pytest.mark.xfail(raises=raises, strict=True, reason=broken))
+    return pytest.param(
+        method,
+        path,
+        json,
+        query,
+        expected_status,
+        marks=marks,
+        id=f"{method} {path}",
+    )
+
+
+def batch_body(seed):
+    return {
+        "requests": [
+            {"method": "GET", "path": "/api/tasks/counters"},
+            {"method": "PATCH", "path": f"/api/tasks/{seed['task_id']}/star"},
+        ]
+    }
+
+
+ROUTE_BUDGETS = [
+    # archive
+    route("GET", "/api/archive/tasks", 3, query={"search": "plan"}),
+    route("GET", "/api/archive/tasks/{archived_task_id}", 4),
+    route("POST", "/api/archive/tasks/{archived_task_id}/restore", 11),
+    # auth
+    route("POST", "/api/auth/login", 6, json={"email": "budget@example.com", "password": PASSWORD}),
+    route("POST", "/api/auth/logout", 4),
+    route("GET", "/api/auth/me", 2),
+    route(
+        "POST",
+        "/api/auth/password-reset/request",
+        0,
+        json={"email": "budget@example.com"},
+        broken="the reset service returns nothing for the route to unpack",
+    ),
+    route(
+        "POST",
+        "/api/auth/password-reset/confirm",
+        0,
+        expected_status=400,
+        json={"token": "not-a-token", "new_password": "another-password"},
+    ),
+    route("POST", "/api/auth/refresh", 3),
+    route(
+        "POST",
+        "/api/auth/register",
+        4,
+        expected_status=201,
+        json={"email": "new@example.com", "password": PASSWORD, "display_name": "New"},
+    ),
+    # batch
+    route("POST", "/api/batch", 10, json=batch_body),
+    # dashboard
+    route("GET", "/api/dashboard/comparison", 3),
+    route(
+        "GET",
+        "/api/dashboard/dashboard",
+        2,
+        broken="PomodoroSession has no effectiveness_score",
+    ),
+    route("GET", "/api/dashboard/goals", 4),
+    route(
+        "GET",
+        "/api/dashboard/insights",
+        7,
+        broken="insights compare unset ratings with numbers",
+    ),
+    route("GET", "/api/dashboard/overview", 3),
+    route("GET", "/api/dashboard/patterns", 4, broken="pattern analysis reads a list as a dict"),
+    route("GET", "/api/dashboard/trends", 1),
+    # events (the stream is off in testing, events go to the local sink)
+    route("GET", "/api/events/stream", 1, expected_status=404),
+    # focus
+    route("GET", "/api/focus/analysis/flow-state", 2),
+    route("GET", "/api/focus/analysis/modes", 2),
+    route("GET", "/api/focus/analysis/scores", 2),
+    route("GET", "/api/focus/insights/productivity", 3),
+    route("GET", "/api/focus/interruptions/analytics", 3),
+    route(
+        "GET",
+        "/api/focus/recommendations/break-activity",
+        1,
+        query={"session_duration": 3600, "energy_level": 3},
+    ),
+    route(
+        "GET",
+        "/api/focus/recommendations/session",
+        4,
+        broken="pattern analysis reads a list as a dict",
+    ),
+    route(
+        "POST",
+        "/api/focus/sessions",
+        6,
+        expected_status=201,
+        json=lambda seed: {"focus_mode": "deep_work", "task_id": seed["task_id"], "planned_duration": 3600},
+        broken=SESSION_RESPONSE_BUG,
+        raises=TypeError,
+    ),
+    route(
+        "GET",
+        "/api/focus/sessions",
+        2,
+        query=lambda seed: {
+            "start_date": date.today().isoformat(),
+            "end_date": date.today().isoformat(),
+            "focus_mode": "deep_work",
+        },
+        broken=SESSION_RESPONSE_BUG,
+        raises=TypeError,
+    ),
+    route("GET", "/api/focus/sessions/{focus_id}", 2, broken=SESSION_RESPONSE_BUG),
+    route(
+        "POST",
+        "/api/focus/sessions/{active_focus_id}/abandon",
+        4,
+        json={},
+        broken=SESSION_RESPONSE_BUG,
+    ),
+    route(
+        "POST",
+        "/api/focus/sessions/{active_focus_id}/complete",
+        2,
+        json={},
+        broken="completion mixes naive and aware datetimes",
+    ),
+    route(
+        "POST",
+        "/api/focus/sessions/{active_focus_id}/interruption",
+        5,
+        json={"is_self_interruption": False, "interruption_duration": 60},
+    ),
+    route(
+        "POST",
+        "/api/focus/sessions/{active_focus_id}/interruption",
+        5,
+        json=[
+            {"interruption_duration": 60},
+            {"interruption_duration": 30, "occurred_at": "2026-10-19T09:30:00"},
+            {"interruption_duration": 10, "occurred_at": "2026-10-19T12:00:00+02:00"},
+        ],
+    ),
+    route("POST", "/api/focus/sessions/{active_focus_id}/pause", 4, broken=SESSION_RESPONSE_BUG),
+    route("POST", "/api/focus/sessions/{paused_focus_id}/resume", 4, broken=SESSION_RESPONSE_BUG),
+    route("GET", "/api/focus/sessions/active", 2),
+    route("GET", "/api/focus/sessions/flow-state", 2),
+    route("GET", "/api/focus/sessions/longest", 2, broken=SESSION_RESPONSE_BUG),
+    route("GET", "/api/focus/sessions/today", 2, broken=SESSION_RESPONSE_BUG),
+    route("GET", "/api/focus/sessions/top", 2, query={"metric": "efficiency_ratio"}),
+    route("GET", "/api/focus/sessions/week", 2, broken=SESSION_RESPONSE_BUG),
+    route("GET", "/api/focus/statistics", 2),
+    route("GET", "/api/focus/summary/daily", 2),
+    # groups
+    route("GET", "/api/groups", 2),
+    route("DELETE", "/api/groups/{group_id}", 6),
+    route(
+        "POST",
+        "/api/groups/create",
+        5,
+        expected_status=201,
+        json=lambda seed: {"name": "Home", "user_id": seed["user_id"]},
+    ),
+    route(
+        "PUT",
+        "/api/groups/update",
+        1,
+        json=lambda seed: {"id": seed["group_id"], "name": "Office", "user_id": seed["user_id"]},
+        broken="the view takes a group_id the URL does not carry",
+        raises=TypeError,
+    ),
+    # health
+    route("GET", "/api/health/", 0),
+    route("GET", "/api/health/auth", 0),
+    route("GET", "/api/health/db", 1),
+    route("GET", "/api/health/events", 0),
+    route("GET", "/api/health/pool", 0),
+    route("GET", "/api/health/sessions", 0),
+    # pomodoro
+    route("GET", "/api/pomodoro/interruptions/analytics", 3),
+    route("GET", "/api/pomodoro/patterns/productivity", 2),
+    route("GET", "/api/pomodoro/recommendations/next-session", 3),
+    route(
+        "POST",
+        "/api/pomodoro/sessions",
+        5,
+        expected_status=201,
+        json=lambda seed: {"session_type": "work", "task_id": seed["task_id"], "planned_duration": 1500},
+        broken="start_session divides by an unset duration",
+    ),
+    route("GET", "/api/pomodoro/sessions", 2, broken=SESSION_RESPONSE_BUG, raises=TypeError),
+    route("GET", "/api/pomodoro/sessions/{pomodoro_id}", 2, broken=SESSION_RESPONSE_BUG),
+    route(
+        "POST",
+        "/api/pomodoro/sessions/{active_pomodoro_id}/abandon",
+        4,
+        json={},
+        broken=SESSION_RESPONSE_BUG,
+    ),
+    route(
+        "POST",
+        "/api/pomodoro/sessions/{active_pomodoro_id}/complete",
+        2,
+        json={},
+        broken="completion mixes naive and aware datetimes",
+    ),
+    route(
+        "POST",
+        "/api/pomodoro/sessions/{active_pomodoro_id}/interruption",
+        5,
+        json={"interruption_type": "external", "interruption_duration": 60},
+    ),
+    route(
+        "POST",
+        "/api/pomodoro/sessions/{active_pomodoro_id}/interruption",
+        5,
+        json=[
+            {"interruption_type": "external", "interruption_duration": 60},
+            {"interruption_type": "internal", "interruption_duration": 30, "occurred_at": "2026-10-19T09:30:00"},
+            {"interruption_type": "external", "interruption_duration": 10, "occurred_at": "2026-10-19T12:00:00+02:00"},
+        ],
+    ),
+    route(
+        "POST",
+        "/api/pomodoro/sessions/{active_pomodoro_id}/pause",
+        4,
+        broken=SESSION_RESPONSE_BUG,
+    ),
+    route(
+        "POST",
+        "/api/pomodoro/sessions/{paused_pomodoro_id}/resume",
+        4,
+        broken=SESSION_RESPONSE_BUG,
+    ),
+    route("GET", "/api/pomodoro/sessions/active", 2),
+    route("GET", "/api/pomodoro/sessions/today", 2, broken=SESSION_RESPONSE_BUG),
+    route("GET", "/api/pomodoro/sessions/week", 2, broken=SESSION_RESPONSE_BUG),
+    route("GET", "/api/pomodoro/statistics", 2),
+    route(
+        "GET",
+        "/api/pomodoro/summary/daily",
+        2,
+        broken="PomodoroSession has no effectiveness_score",
+    ),
+    # subtasks
+    route(
+        "POST",
+        "/api/subtasks",
+        6,
+        expected_status=201,
+        json=lambda seed: {"title": "Step 3", "position": 2, "task_id": seed["task_id"]},
+    ),
+    route(
+        "GET",
+        "/api/subtasks/{subtask_id}",
+        2,
+        broken="the route unpacks a Subtask as a result tuple",
+    ),
+    route("PATCH", "/api/subtasks/{subtask_id}", 7, json={"is_completed": True}),
+    route("DELETE", "/api/subtasks/{subtask_id}", 12),
+    route("GET", "/api/subtasks/task/{task_id}", 3),
+    route(
+        "PATCH",
+        "/api/subtasks/tasks/{task_id}/bulk-toggle",
+        11,
+        json=lambda seed: {"subtask_ids": seed["subtask_ids"], "task_id": seed["task_id"], "completed": True},
+    ),
+    route("GET", "/api/subtasks/tasks/{task_id}/completion-count", 4),
+    route(
+        "DELETE",
+        "/api/subtasks/tasks/{task_id}/delete",
+        4,
+        json=lambda seed: {"subtask_ids": seed["subtask_ids"]},
+    ),
+    route(
+        "PUT",
+        "/api/subtasks/tasks/{task_id}/reorder",
+        5,
+        json=lambda seed: {
+            "subtask_positions": {str(sid): i for i, sid in enumerate(reversed(seed["subtask_ids"]))}
+        },
+    ),
+    # sync
+    route("GET", "/api/sync", 3),
+    # tags
+    route("GET", "/api/tags", 2),
+    route(
+        "PUT",
+        "/api/tags/{tag_id}",
+        6,
+        json=lambda seed: {"id": seed["tag_id"], "name": "deep", "color": "#10b981", "user_id": seed["user_id"]},
+    ),
+    route(
+        "DELETE",
+        "/api/tags/{tag_id}",
+        6,
+        broken="deleting a tag nulls task_tags.tag_id instead of removing the links",
+    ),
+    route(
+        "POST",
+        "/api/tags/create",
+        5,
+        expected_status=201,
+        json=lambda seed: {"name": "errand", "color": "#f59e0b", "user_id": seed["user_id"]},
+    ),
+    # tasks
+    route("GET", "/api/tasks", 3),
+    route("PATCH", "/api/tasks/{task_id}", 6, json={"title": "Write the report"}),
+    route(
+        "DELETE",
+        "/api/tasks/{task_id}",
+        6,
+        broken="deleting a task nulls the task_id of its sessions",
+    ),
+    route("PATCH", "/api/tasks/{task_id}/star", 6),
+    route("PATCH", "/api/tasks/{task_id}/toggle", 15),
+    route("GET", "/api/tasks/by-group", 3, query=lambda seed: {"group_id": seed["group_id"]}),
+    route("GET", "/api/tasks/by-priorities", 3, query={"priority": "low,high"}),
+    route("GET", "/api/tasks/by-statuses", 3, query={"status": "pending,completed"}),
+    route("GET", "/api/tasks/by-tags", 5, query=lambda seed: {"tag": seed["tag_id"]}),
+    route("GET", "/api/tasks/counters", 3),
+    route(
+        "POST",
+        "/api/tasks/create",
+        8,
+        expected_status=201,
+        json=lambda seed: {"title": "Call back", "user_id": seed["user_id"], "tag_ids": [seed["tag_id"]]},
+    ),
+    route("GET", "/api/tasks/overdue", 3),
+    route("GET", "/api/tasks/search", 3, query={"q": "report"}),
+    route("GET", "/api/tasks/starred", 3),
+    route("GET", "/api/tasks/today", 3),
+]
+
+
+def _resolve(value, seed):
+    return value(seed) if callable(value) else value
+
+
+@pytest.mark.parametrize("method, path, json, query, expected_status", ROUTE_BUDGETS)
+def test_route_query_budget(api, method, path, json, query, expected_status):
+    response = api.open(
+        method,
+        path.format_map(api.seed),
+        json=_resolve(json, api.seed),
+        query_string=_resolve(query, api.seed),
+    )
+    assert response.status_code == expected_status, response.get_data(as_text=True)
+
+
+def test_every_route_has_budget(budget_app):
+    adapter = budget_app.url_map.bind("")
+    any_id = defaultdict(lambda: "1")
+
+    covered = set()
+    for param in ROUTE_BUDGETS:
+        method, path = param.values[:2]
+        endpoint, _ = adapter.match(path.format_map(any_id), method=method)
+        covered.add((endpoint, method))
+
+    routes = {
+        (rule.endpoint, method)
+        for rule in budget_app.url_map.iter_rules()
+        if rule.rule.startswith("/api/")
+        for method in rule.methods - {"HEAD", "OPTIONS"}
+    }
+    assert sorted(routes - covered) == []
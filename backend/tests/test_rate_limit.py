@@ -0,0 +1,206 @@
+from datetime import timedelta
+from types import SimpleNamespace
+
+import pytest
+from flask import Flask, jsonify, request
+
+from app.utils import rate_limit as rate_limit_module
+from app.utils.rate_limit import MemoryStore, RateLimiter, RateLimitStore, RedisStore, rate_limit
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def test_token_bucket_allows_burst_then_refills():
+    clock = FakeClock()
+    store = MemoryStore(clock=clock)
+
+    for _ in range(3):
+        assert store.token_bucket("ip", capacity=3, refill_per_second=1).allowed
+
+    rejected = store.token_bucket("ip", capacity=3, refill_per_second=1)
+    assert not rejected.allowed
+    assert 0 < rejected.retry_after <= 1
+
+    clock.now += 1
+    assert store.token_bucket("ip", capacity=3, refill_per_second=1).allowed
+
+
+def test_sliding_window_weights_previous_window():
+    clock = FakeClock(now=0.0)
+    store = MemoryStore(clock=clock)
+
+    for _ in range(4):
+        assert store.sliding_window("email", limit=4, window_seconds=60).allowed
+    assert not store.sliding_window("email", limit=4, window_seconds=60).allowed
+
+    # Halfway into the next window half of the previous count still applies
+    clock.now = 90.0
+    assert store.sliding_window("email", limit=4, window_seconds=60).allowed
+    assert store.sliding_window("email", limit=4, window_seconds=60).allowed
+    assert not store.sliding_window("email", limit=4, window_seconds=60).allowed
+
+
+def test_lockout_expires():
+    clock = FakeClock()
+    store = MemoryStore(clock=clock)
+
+    store.lock("email", 30)
+    assert store.locked_for("email") == 30
+
+    clock.now += 31
+    assert store.locked_for("email") == 0
+
+
+class FakeRedis:
+    """The Redis commands RedisStore uses, on a dict; expiry is ignored."""
+
+    def __init__(self):
+        self.data = {}
+
+    def register_script(self, script):
+        def token_bucket(keys, args):
+            capacity, rate, now = args
+            tokens, updated = self.data.get(keys[0], (capacity, now))
+            tokens = min(capacity, tokens + (now - updated) * rate)
+            allowed = tokens >= 1
+            if allowed:
+                tokens -= 1
+            self.data[keys[0]] = (tokens, now)
+            return int(allowed), str(tokens)
+
+        return token_bucket
+
+    def pipeline(self):
+        client, results = self, []
+
+        class Pipeline:
+            def __getattr__(self, name):
+                return lambda *args, **kwargs: results.append(getattr(client, name)(*args, **kwargs))
+
+            def execute(self):
+                return list(results)
+
+        return Pipeline()
+
+    def incr(self, name):
+        self.data[name] = int(self.data.get(name, 0)) + 1
+        return self.data[name]
+
+    def decr(self, name):
+        self.data[name] = int(self.data.get(name, 0)) - 1
+        return self.data[name]
+
+    def expire(self, name, seconds):
+        return True
+
+    def get(self, name):
+        return self.data.get(name)
+
+    def mget(self, *names):
+        return [self.data.get(name) for name in names]
+
+    def set(self, name, value, px=None):
+        self.data[name] = (value, px)
+
+    def pttl(self, name):
+        return self.data[name][1] if name in self.data else -2
+
+    def delete(self, *names):
+        return sum(self.data.pop(name, None) is not None for name in names)
+
+
+def test_redis_store_windows_and_lockout():
+    clock = FakeClock(now=0.0)
+    store = RedisStore("redis://test", clock=clock, client=FakeRedis())
+
+    for _ in range(3):
+        assert store.sliding_window("email", limit=3, window_seconds=60).allowed
+    assert not store.sliding_window("email", limit=3, window_seconds=60).allowed
+    assert not store.peek_window("email", limit=3, window_seconds=60).allowed
+
+    store.lock("email", 30)
+    assert store.locked_for("email") == 30
+
+    for _ in range(2):
+        assert store.token_bucket("ip", capacity=2, refill_per_second=1).allowed
+    assert not store.token_bucket("ip", capacity=2, refill_per_second=1).allowed
+
+
+def test_redis_reset_deletes_only_its_own_keys():
+    clock = FakeClock(now=0.0)
+    client = FakeRedis()
+    store = RedisStore("redis://test", clock=clock, client=client)
+
+    # Glob characters and shared prefixes are legal in emails
+    for email in ("a@b.co", "a@b.com", "*@b.co"):
+        store.sliding_window(f"login:email:{email}:failures", limit=5, window_seconds=60)
+
+    store.reset("login:email:*@b.co:failures", 60)
+    assert store.peek_window("login:email:*@b.co:failures", 5, 60).remaining == 5
+    assert store.peek_window("login:email:a@b.co:failures", 5, 60).remaining == 4
+    assert store.peek_window("login:email:a@b.com:failures", 5, 60).remaining == 4
+
+
+def test_store_interface_is_abstract():
+    with pytest.raises(TypeError):
+        RateLimitStore()
+
+
+@pytest.fixture
+def login_client(monkeypatch):
+    config = SimpleNamespace(
+        RATELIMIT_RULES={"login": (100, 1.0)},
+        AUTH_MAX_LOGIN_ATTEMPTS=3,
+        AUTH_LOCKOUT_DURATION=timedelta(minutes=15),
+    )
+    monkeypatch.setattr(rate_limit_module, "_limiter", RateLimiter(MemoryStore(), config))
+
+    app = Flask(__name__)
+    calls = []
+
+    @app.route("/login", methods=["POST"])
+    @rate_limit("login")
+    def login():
+        calls.append(request.json["email"])
+        password = request.json.get("password")
+        if password is None:
+            return jsonify({"error": "Password is required"}), 400
+        if password != "secret":
+            return jsonify({"error": "Invalid credentials"}), 401
+        return jsonify({"ok": True})
+
+    return app.test_client(), calls
+
+
+def test_failed_logins_lock_the_email_out(login_client):
+    client, calls = login_client
+
+    client.post("/login", json={"email": "a@b.co"})
+    client.post("/login", json={"email": "a@b.co", "password": "wrong"})
+    client.post("/login", json={"email": "A@b.co ", "password": "wrong"})
+
+    # Locked out before the view (and its password check) runs
+    response = client.post("/login", json={"email": "a@b.co", "password": "secret"})
+    assert response.status_code == 429
+    assert int(response.headers["Retry-After"]) > 0
+    assert len(calls) == 3
+
+    assert client.post("/login", json={"email": "a@b.com", "password": "secret"}).status_code == 200
+
+
+def test_successful_login_clears_failures(login_client):
+    client, _ = login_client
+
+    for _ in range(2):
+        client.post("/login", json={"email": "a@b.co", "password": "wrong"})
+    assert client.post("/login", json={"email": "a@b.co", "password": "secret"}).status_code == 200
+
+    for _ in range(2):
+        assert client.post("/login", json={"email": "a@b.co", "password": "wrong"}).status_code == 401
+    assert client.post("/login", json={"email": "a@b.co", "password": "secret"}).status_code == 200
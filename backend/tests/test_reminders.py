@@ -0,0 +1,113 @@
+from collections import namedtuple
+from datetime import timedelta
+
+from app.utils.events import EventDispatcher, LocalSink
+from app.utils.reminders import REMINDER_EVENT, ReminderScheduler
+
+
+def make_scheduler():
+    sink = LocalSink()
+    dispatcher = EventDispatcher()
+    dispatcher.add_sink("local", sink)
+    scheduler = ReminderScheduler(dispatcher, lead=timedelta(minutes=15))
+    return scheduler, dispatcher, sink
+
+
+def test_reminders_fire_in_due_order_once():
+    scheduler, dispatcher, sink = make_scheduler()
+    start = scheduler._fired_until
+    due = start + timedelta(minutes=30)
+    scheduler.fill(
+        [
+            (2, 1, "later", due + timedelta(minutes=5)),
+            (1, 1, "sooner", due),
+            (3, 2, "outside window", due + timedelta(hours=2)),
+        ],
+        horizon=start + timedelta(hours=1),
+    )
+
+    assert scheduler.fire_due(due - timedelta(minutes=16)) == 0
+    assert scheduler.fire_due(due - timedelta(minutes=15)) == 1
+    assert scheduler.fire_due(due) == 1
+    assert scheduler.fire_due(due + timedelta(hours=1)) == 0
+
+    dispatcher.flush()
+    assert [event.data["task_id"] for event in sink.events] == [1, 2]
+    assert {event.type for event in sink.events} == {REMINDER_EVENT}
+
+
+def test_rescheduled_and_cancelled_reminders():
+    scheduler, dispatcher, sink = make_scheduler()
+    start = scheduler._fired_until
+    due = start + timedelta(minutes=30)
+    scheduler.fill([(1, 1, "moved", due), (2, 1, "done", due)], horizon=start + timedelta(hours=1))
+
+    # Moved later inside the window, completed, and moved past the window
+    assert scheduler.schedule((1, 1, "moved", due + timedelta(minutes=10)))
+    scheduler.cancel(2)
+    assert not scheduler.schedule((3, 1, "far", due + timedelta(days=1)))
+
+    assert scheduler.fire_due(due - timedelta(minutes=10)) == 0
+    assert scheduler.fire_due(due - timedelta(minutes=5)) == 1
+
+    dispatcher.flush()
+    assert [event.data["task_id"] for event in sink.events] == [1]
+    assert sink.events[0].data["due_date"] == (due + timedelta(minutes=10)).isoformat()
+
+
+def test_window_keeps_every_task_tied_on_a_full_batch(monkeypatch):
+    from database.repositories.task_repository import TaskRepository
+
+    scheduler, dispatcher, sink = make_scheduler()
+    scheduler.batch_size = 10
+    due = scheduler._fired_until + timedelta(minutes=30)
+    TaskRow = namedtuple("TaskRow", ["id", "user_id", "title", "due_date"])
+    tasks = [TaskRow(task_id, 1, f"task {task_id}", due) for task_id in range(1, 26)]
+
+    def get_open_due_between(self, start, end, limit):
+        return [task for task in tasks if start < task.due_date <= end][:limit]
+
+    def get_open_due_at(self, due_date):
+        return [task for task in tasks if task.due_date == due_date]
+
+    monkeypatch.setattr(TaskRepository, "get_open_due_between", get_open_due_between)
+    monkeypatch.setattr(TaskRepository, "get_open_due_at", get_open_due_at)
+
+    # Same loop as tick(), without the change log
+    now = due + timedelta(hours=2)
+    while now >= scheduler._horizon:
+        scheduler.fire_due(now)
+        scheduler.load_window(None)
+    scheduler.fire_due(now)
+
+    dispatcher.flush()
+    assert sorted(event.data["task_id"] for event in sink.events) == list(range(1, 26))
+
+
+def test_changes_committed_behind_the_cursor_are_applied(monkeypatch):
+    from database.repositories.change_log_repository import ChangeLogRepository
+    from database.repositories.task_repository import TaskRepository
+
+    scheduler, dispatcher, sink = make_scheduler()
+    Change = namedtuple("Change", ["id", "entity_id", "operation"])
+    log = []
+    reread = []
+
+    monkeypatch.setattr(ChangeLogRepository, "get_last_id", lambda self: 10)
+    monkeypatch.setattr(
+        ChangeLogRepository,
+        "get_entity_changes_after",
+        lambda self, after_id, entity_type, limit: sorted(c for c in log if c.id > after_id)[:limit],
+    )
+    monkeypatch.setattr(
+        TaskRepository, "get_open_due_by_ids", lambda self, task_ids: reread.extend(task_ids) or []
+    )
+
+    assert scheduler.apply_changes(None) == 0
+    log.append(Change(12, 2, "update"))
+    assert scheduler.apply_changes(None) == 1
+    # Id 11 was allocated first but its transaction committed last
+    log.append(Change(11, 1, "update"))
+    assert scheduler.apply_changes(None) == 1
+    assert scheduler.apply_changes(None) == 0
+    assert reread == [2, 1]
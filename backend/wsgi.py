@@ -0,0 +1,24 @@
+"""
+FlowDo production WSGI entry point.
+
+Builds the fully initialized application (blueprints, JWT handlers, database
+setup) once at import time, so Gunicorn can preload it in the master process
+and fork workers that share the already-imported code.
+
+Usage:
+    gunicorn -c gunicorn.conf.py wsgi:app
+"""
+import sys
+from pathlib import Path
+
+# Add the project root to Python path for imports
+ROOT_DIR = Path(__file__).parent.absolute()
+sys.path.insert(0, str(ROOT_DIR))
+
+from app import create_full_app
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+app = create_full_app()
+logger.info("WSGI application created")